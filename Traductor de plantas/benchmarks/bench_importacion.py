@@ -0,0 +1,95 @@
+"""
+Benchmark del tiempo de importación de dashboard_plantas.
+
+Cada medición se hace en un proceso nuevo (la cache de módulos de Python
+haría que la segunda importación costara cero) y se informa la mediana de
+varias repeticiones de:
+
+- numpy: base común de todos los módulos del proyecto
+- matplotlib.pyplot + estilo: lo que antes se pagaba al importar el dashboard
+- dashboard_plantas: importación sola (no debe cargar matplotlib)
+- dashboard_plantas + primer dibujo: importación y un RenderizadorDashboard
+
+Uso:
+    python benchmarks/bench_importacion.py
+    python benchmarks/bench_importacion.py --repeticiones 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+
+CARPETA_SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# Código que se ejecuta en cada proceso hijo: mide con perf_counter e
+# imprime una línea JSON con los segundos y si matplotlib quedó cargado
+_PLANTILLA = """
+import json, sys, time
+sys.path.insert(0, {src!r})
+inicio = time.perf_counter()
+{codigo}
+segundos = time.perf_counter() - inicio
+print(json.dumps({{"segundos": segundos, "matplotlib": "matplotlib" in sys.modules}}))
+"""
+
+CASOS = {
+    "numpy": "import numpy",
+    "matplotlib.pyplot + estilo": ("import matplotlib\n"
+                                   "matplotlib.use('Agg')\n"
+                                   "import matplotlib.pyplot as plt\n"
+                                   "plt.style.use('seaborn-v0_8-darkgrid')"),
+    "dashboard_plantas": "import dashboard_plantas",
+    "dashboard_plantas + primer dibujo": ("import dashboard_plantas\n"
+                                          "dashboard_plantas.RenderizadorDashboard().cerrar()"),
+}
+
+
+def medir(codigo: str, repeticiones: int) -> Dict[str, object]:
+    """
+    Ejecuta `codigo` en procesos nuevos y devuelve la mediana de los tiempos.
+
+    Args:
+        codigo: Código Python a cronometrar
+        repeticiones: Número de procesos
+
+    Returns:
+        Diccionario con la mediana, el mínimo (s) y si se cargó matplotlib
+    """
+    programa = _PLANTILLA.format(src=CARPETA_SRC, codigo=codigo)
+    entorno = dict(os.environ, MPLBACKEND=os.environ.get("MPLBACKEND", "Agg"))
+    tiempos: List[float] = []
+    matplotlib_cargado = False
+    for _ in range(repeticiones):
+        salida = subprocess.run([sys.executable, "-c", programa], capture_output=True,
+                                text=True, check=True, env=entorno)
+        resultado = json.loads(salida.stdout.strip().splitlines()[-1])
+        tiempos.append(resultado["segundos"])
+        matplotlib_cargado = resultado["matplotlib"]
+    return {"mediana": statistics.median(tiempos), "minimo": min(tiempos),
+            "matplotlib": matplotlib_cargado}
+
+
+def main(argumentos: Optional[List[str]] = None) -> None:
+    """Mide todos los casos e imprime la tabla de resultados."""
+    parser = argparse.ArgumentParser(description="Mide el tiempo de importación del dashboard.")
+    parser.add_argument("--repeticiones", type=int, default=5, help="Procesos por caso")
+    args = parser.parse_args(argumentos)
+
+    print("=" * 70)
+    print(f"BENCHMARK DE IMPORTACIÓN ({args.repeticiones} procesos por caso)")
+    print("=" * 70)
+    print(f"{'Caso':<38s}{'Mediana':>10s}{'Mínimo':>10s}  matplotlib")
+    for nombre, codigo in CASOS.items():
+        r = medir(codigo, args.repeticiones)
+        print(f"{nombre:<38s}{r['mediana'] * 1000:>8.1f}ms{r['minimo'] * 1000:>8.1f}ms"
+              f"  {'sí' if r['matplotlib'] else 'no'}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""
+Benchmark de crecimiento de memoria de una flota de traductores.
+
+Simula una flota de TraductorPlantaInteligente (con un MotorAlertas
+compartido) procesando lecturas durante mucho tiempo y mide:
+
+- bytes por lectura: memoria que sigue ocupada al terminar, dividida por
+  las lecturas procesadas (con tracemalloc, tras gc.collect())
+- sitios de asignación: las líneas de código que retienen esa memoria
+- RSS: memoria del proceso antes y después de la fase larga, y su pico
+  (sin contar lo que añade tracemalloc)
+
+tracemalloc hace cada lectura ~5 veces más lenta, así que las lecturas se
+procesan por fases: un calentamiento (caches, bloques de la simulación),
+la fase larga sin trazar (se mide el RSS), una fase de ajuste trazada y
+una ventana final trazada, ya en régimen estacionario, de la que salen
+los bytes por lectura y los sitios de asignación.
+
+La fase de ajuste existe porque tracemalloc no ve los bloques creados
+antes de arrancar: una lista como `historial`, al crecer, se realoja
+entera y, si su bloque anterior no estaba trazado, la ventana contaría
+la lista completa como memoria nueva. Las listas crecen ~12,5% por
+realojo, así que se trazan antes 1/8 de las lecturas ya hechas; con eso
+todos los contenedores que crecen con las lecturas se han realojado al
+menos una vez bajo tracemalloc antes de la ventana.
+
+La memoria que retiene `historial` (una LecturaSensores con sus
+lecturas crudas y sus floats, ~270 B por lectura) se mide aparte: al cerrar la ventana se
+vacían las lecturas que añadió y lo que se libera es su parte.
+
+El proceso termina con código 1, para usarlo en CI, si:
+- los bytes por lectura superan --max-bytes-por-lectura, o
+- `historial` crece con cada lectura (memoria sin límite), salvo que se
+  acepte a propósito con --permitir-historial; entonces su parte se
+  descuenta antes de comparar con el umbral y solo falla si aparece otra
+  estructura que crezca con cada lectura.
+
+Uso:
+    python benchmarks/bench_memoria.py                        # 1.000.000 de lecturas
+    python benchmarks/bench_memoria.py --lecturas 100000 --plantas 50
+    python benchmarks/bench_memoria.py --lecturas 50000 --permitir-historial   # CI
+"""
+
+import argparse
+import gc
+import linecache
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")))
+
+try:
+    import resource
+    RESOURCE_DISPONIBLE = True
+except ImportError:
+    # Windows
+    RESOURCE_DISPONIBLE = False
+
+UMBRAL_BYTES_POR_LECTURA = 32
+
+
+def rss_actual() -> Optional[int]:
+    """RSS actual del proceso en bytes (solo Linux; None si no se puede leer)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def rss_pico() -> Optional[int]:
+    """RSS máximo del proceso en bytes (None sin el módulo resource)."""
+    if not RESOURCE_DISPONIBLE:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa en KiB y macOS en bytes
+    return pico if sys.platform == "darwin" else pico * 1024
+
+
+def crear_flota(plantas: int, semilla: int = 0) -> List[Any]:
+    """
+    Crea una flota de traductores con especies del catálogo.
+
+    Args:
+        plantas: Número de traductores
+        semilla: Semilla base (cada traductor usa semilla + i)
+
+    Returns:
+        Lista de TraductorPlantaInteligente que comparten un MotorAlertas
+    """
+    from alertas import MotorAlertas
+    from planta_config import cargar_plantas
+    from traductor_de_plantas import TraductorPlantaInteligente, obtener_planta_por_nombre
+
+    catalogo = cargar_plantas()
+    motor = MotorAlertas()
+    flota = []
+    for i in range(plantas):
+        nombre = catalogo[i % len(catalogo)].nombre
+        flota.append(TraductorPlantaInteligente(f"{nombre} #{i}",
+                                                config=obtener_planta_por_nombre(nombre),
+                                                semilla=semilla + i,
+                                                motor_alertas=motor))
+    return flota
+
+
+def procesar(flota: List[Any], lecturas: int, avisar_cada: int = 0) -> None:
+    """Procesa `lecturas` lecturas en total, repartidas por turnos entre la flota."""
+    hechas = 0
+    inicio = time.perf_counter()
+    while hechas < lecturas:
+        for traductor in flota[:lecturas - hechas]:
+            traductor.procesar_lectura()
+        hechas += min(len(flota), lecturas - hechas)
+        if avisar_cada and hechas % avisar_cada < len(flota):
+            segundos = time.perf_counter() - inicio
+            print(f"   {hechas:>12,} lecturas  {hechas / segundos:>8,.0f} lecturas/s", flush=True)
+
+
+def medir_memoria(plantas: int = 20, lecturas: int = 1_000_000, ventana: int = 20_000,
+                  calentamiento: int = 100, marcos: int = 1, top: int = 10) -> Dict[str, Any]:
+    """
+    Ejecuta el benchmark.
+
+    Args:
+        plantas: Traductores en la flota
+        lecturas: Lecturas totales (calentamiento aparte; el ajuste y la
+                  ventana trazados son parte del total)
+        ventana: Lecturas de la fase trazada con tracemalloc
+        calentamiento: Lecturas por planta antes de medir
+        marcos: Marcos de pila que guarda tracemalloc por asignación (más
+                marcos = sitios más precisos pero mucho más lento)
+        top: Sitios de asignación a informar
+
+    Returns:
+        Diccionario con lecturas, lecturas_sin_trazar, bytes_por_lectura,
+        bytes_historial_por_lectura (parte de bytes_por_lectura que retiene
+        `historial`), sitios (lista de (sitio, bytes, bloques)), rss_inicio,
+        rss_fin, rss_pico (de la fase sin trazar), segundos y
+        lecturas_por_segundo
+    """
+    # El ajuste debe ser >= 1/8 de las lecturas hechas antes de él:
+    # ajuste >= (previas - ajuste) / 8  <=>  ajuste >= previas / 9
+    previas = calentamiento * plantas + lecturas - ventana
+    ajuste = -(-previas // 9)
+    if ventana > lecturas or ajuste > lecturas - ventana:
+        raise ValueError("La ventana trazada es demasiado grande para las lecturas totales")
+
+    flota = crear_flota(plantas)
+    procesar(flota, calentamiento * plantas)
+    gc.collect()
+    rss_inicio = rss_actual()
+
+    # Fase larga, sin trazar
+    inicio = time.perf_counter()
+    procesar(flota, lecturas - ventana - ajuste, avisar_cada=max(lecturas // 10, 1))
+    segundos = time.perf_counter() - inicio
+    gc.collect()
+    rss_fin, pico = rss_actual(), rss_pico()
+
+    # Ajuste y ventana, trazados
+    tracemalloc.start(marcos)
+    procesar(flota, ajuste)
+    gc.collect()
+    largos = [len(traductor.historial) for traductor in flota]
+    antes = tracemalloc.take_snapshot()
+    procesar(flota, ventana)
+    gc.collect()
+    despues = tracemalloc.take_snapshot()
+    # Lo que libera vaciar las lecturas de la ventana es lo que retiene historial
+    con_historial = tracemalloc.get_traced_memory()[0]
+    for traductor, largo in zip(flota, largos):
+        del traductor.historial[largo:]
+    gc.collect()
+    retenido_historial = con_historial - tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    filtros = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    diferencias = despues.filter_traces(filtros).compare_to(
+        antes.filter_traces(filtros), "traceback" if marcos > 1 else "lineno")
+    retenidos = sum(d.size_diff for d in diferencias)
+    sitios = [(_describir(d.traceback), d.size_diff, d.count_diff)
+              for d in diferencias[:top] if d.size_diff > 0]
+
+    return {
+        "plantas": plantas,
+        "lecturas": lecturas,
+        "lecturas_sin_trazar": lecturas - ventana - ajuste,
+        "bytes_por_lectura": retenidos / ventana if ventana else 0.0,
+        "bytes_historial_por_lectura": retenido_historial / ventana if ventana else 0.0,
+        "sitios": sitios,
+        "rss_inicio": rss_inicio,
+        "rss_fin": rss_fin,
+        "rss_pico": pico,
+        "segundos": segundos,
+        "lecturas_por_segundo": (lecturas - ventana - ajuste) / segundos if segundos else 0.0,
+    }
+
+
+def _describir(traceback: tracemalloc.Traceback) -> str:
+    """'archivo:línea  código' del marco más reciente (y la cadena si hay más)."""
+    marco = traceback[0]
+    codigo = linecache.getline(marco.filename, marco.lineno).strip()
+    cadena = "".join(f" <- {os.path.basename(m.filename)}:{m.lineno}" for m in traceback[1:])
+    return f"{os.path.basename(marco.filename)}:{marco.lineno}{cadena}  {codigo}"
+
+
+def _mib(valor: Optional[int]) -> str:
+    """Formatea bytes en MiB (o 'n/d')."""
+    return "n/d" if valor is None else f"{valor / 1024 / 1024:.1f} MiB"
+
+
+def main(argumentos: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de la línea de comandos.
+
+    Returns:
+        0 si los bytes por lectura no superan el umbral y `historial` no
+        crece (o se permite con --permitir-historial), 1 en otro caso
+    """
+    parser = argparse.ArgumentParser(description="Mide el crecimiento de memoria de una flota de traductores.")
+    parser.add_argument("--plantas", type=int, default=20, help="Traductores en la flota")
+    parser.add_argument("--lecturas", type=int, default=1_000_000, help="Lecturas totales")
+    parser.add_argument("--ventana", type=int, default=20_000, help="Lecturas trazadas con tracemalloc")
+    parser.add_argument("--marcos", type=int, default=1, help="Marcos de pila por asignación")
+    parser.add_argument("--top", type=int, default=10, help="Sitios de asignación a mostrar")
+    parser.add_argument("--max-bytes-por-lectura", type=float, default=UMBRAL_BYTES_POR_LECTURA,
+                        help="Umbral para CI (default: %(default)s B)")
+    parser.add_argument("--permitir-historial", action="store_true",
+                        help="Acepta que historial crezca sin límite y descuenta su parte del umbral")
+    args = parser.parse_args(argumentos)
+
+    print("=" * 70)
+    print(f"BENCHMARK DE MEMORIA ({args.plantas} plantas, {args.lecturas:,} lecturas)")
+    print("=" * 70)
+    r = medir_memoria(args.plantas, args.lecturas, min(args.ventana, args.lecturas),
+                      marcos=args.marcos, top=args.top)
+
+    print(f"\nVelocidad sin trazar: {r['lecturas_por_segundo']:,.0f} lecturas/s")
+    print(f"RSS: {_mib(r['rss_inicio'])} -> {_mib(r['rss_fin'])} (pico {_mib(r['rss_pico'])})")
+    if r["rss_inicio"] is not None and r["rss_fin"] is not None:
+        print(f"RSS por lectura: {(r['rss_fin'] - r['rss_inicio']) / r['lecturas_sin_trazar']:.0f} B")
+    print(f"Retenido por lectura (tracemalloc): {r['bytes_por_lectura']:.0f} B"
+          f"  -> {r['bytes_por_lectura'] * 86400 / 1024 / 1024:.1f} MiB por planta y día a 1 lectura/s")
+
+    print(f"\nSitios que retienen memoria (ventana de {min(args.ventana, args.lecturas):,} lecturas):")
+    for sitio, tamano, bloques in r["sitios"]:
+        print(f"   {tamano / 1024:>9.1f} KiB {bloques:>9,} bloques  {sitio}")
+
+    codigo = 0
+    bytes_por_lectura = r["bytes_por_lectura"]
+    historial = r["bytes_historial_por_lectura"]
+    print()
+    if historial > 0 and args.permitir_historial:
+        print(f"⚠️  historial crece sin límite ({historial:.0f} B por lectura): "
+              f"permitido con --permitir-historial, se descuenta del umbral")
+        bytes_por_lectura -= historial
+    elif historial > 0:
+        print(f"❌ historial crece sin límite ({historial:.0f} B por lectura); "
+              f"usa --permitir-historial para aceptarlo")
+        codigo = 1
+    if bytes_por_lectura > args.max_bytes_por_lectura:
+        print(f"❌ {bytes_por_lectura:.0f} B por lectura supera el umbral de "
+              f"{args.max_bytes_por_lectura:.0f} B")
+        codigo = 1
+    else:
+        print(f"✅ Dentro del umbral ({bytes_por_lectura:.0f} de "
+              f"{args.max_bytes_por_lectura:.0f} B por lectura)")
+    print("=" * 70)
+    return codigo
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,376 @@
+"""
+Suite de benchmarks de los caminos críticos del proyecto.
+
+Casos:
+- catalogo_frio / catalogo_caliente: cargar_plantas() sin y con su lru_cache
+- buscar_planta: búsqueda por nombre en el catálogo de 960 especies
+- predecir_uno / predecir_lote: 1000 predicciones del modelo de riego,
+  una a una con predecir() o juntas con predecir_lote()
+- procesar_lectura: pipeline completo de TraductorPlantaInteligente
+- generar_dataset: dataset sintético de 960 especies × 30 días a CSV
+- csv_frio / csv_canonico / csv_memoria: cargar_dataset() parseando el
+  CSV, desde su .npz canónico y desde la cache en memoria
+- dashboard_png / dashboard_svg: un dashboard de 30 días con
+  RenderizadorDashboard (PNG a 100 dpi) y con dashboard_svg
+
+Cada caso se repite varias veces y se guarda la mediana y el mínimo. Los
+resultados se escriben en JSON y pueden compararse con una base guardada:
+un caso cuyo mínimo empeora más que su umbral cuenta como regresión y el
+proceso termina con código 1 (para CI). Se compara el mínimo porque el
+ruido de la máquina (otros procesos, frecuencia de la CPU) solo puede
+sumar tiempo: la mediana de los casos de microsegundos varía un 50% entre
+ejecuciones idénticas, el mínimo mucho menos.
+
+Uso:
+    python benchmarks/suite.py                                 # solo medir
+    python benchmarks/suite.py --salida resultados.json
+    python benchmarks/suite.py --guardar-base                  # actualizar base.json
+    python benchmarks/suite.py --comparar                      # contra base.json
+    python benchmarks/suite.py --comparar --umbral 0.3 --umbral-caso dashboard_png=0.5
+    python benchmarks/suite.py --casos predecir_uno predecir_lote
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+CARPETA_BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+CARPETA_SRC = os.path.join(CARPETA_BENCHMARKS, "..", "src")
+CARPETA_DATA = os.path.join(CARPETA_BENCHMARKS, "..", "data")
+sys.path.insert(0, CARPETA_SRC)
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+RUTA_BASE = os.path.join(CARPETA_BENCHMARKS, "base.json")
+VERSION_FORMATO = 1
+
+# Empeoramiento relativo del mínimo que se tolera (0.25 = 25% más lento)
+UMBRAL_DEFECTO = 0.25
+
+
+@dataclass
+class Caso:
+    """
+    Un benchmark.
+
+    Atributos:
+        nombre: Identificador del caso (clave en el JSON)
+        funcion: Código cronometrado
+        unidades: Operaciones que hace cada llamada (para el tiempo por unidad)
+        preparar: Se ejecuta antes de cada repetición, fuera del cronómetro
+        repeticiones: Repeticiones por defecto (los casos lentos usan menos)
+    """
+    nombre: str
+    funcion: Callable[[], Any]
+    unidades: int = 1
+    preparar: Optional[Callable[[], None]] = None
+    repeticiones: int = 20
+
+
+def medir(caso: Caso, repeticiones: Optional[int] = None) -> Dict[str, float]:
+    """
+    Cronometra un caso.
+
+    Args:
+        caso: Caso a medir
+        repeticiones: Repeticiones (None = las del caso)
+
+    Returns:
+        Diccionario con mediana_s, minimo_s, unidades, repeticiones y
+        mediana_por_unidad_us
+    """
+    repeticiones = repeticiones or caso.repeticiones
+    tiempos: List[float] = []
+    for _ in range(repeticiones):
+        if caso.preparar is not None:
+            caso.preparar()
+        inicio = time.perf_counter()
+        caso.funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    mediana = statistics.median(tiempos)
+    return {
+        "mediana_s": mediana,
+        "minimo_s": min(tiempos),
+        "unidades": caso.unidades,
+        "repeticiones": repeticiones,
+        "mediana_por_unidad_us": mediana / caso.unidades * 1e6,
+    }
+
+
+def construir_casos(carpeta_temporal: str) -> List[Caso]:
+    """
+    Crea los casos de la suite.
+
+    Args:
+        carpeta_temporal: Carpeta donde escribir datasets y copias del CSV
+                          (así la cache .npz de data/ no interfiere)
+
+    Returns:
+        Lista de casos en el orden en que se informan
+    """
+    import numpy as np
+    import cargador_datasets
+    from conversion_datasets import ruta_canonica
+    from dashboard_plantas import RenderizadorDashboard
+    from dashboard_svg import generar_svg_dashboard
+    from generador_dataset import generar_dataset
+    from planta_config import buscar_planta, cargar_plantas
+    from sintetizador_series import sintetizar_series_planta
+    from traductor_de_plantas import ModeloPrediccionRiego, TraductorPlantaInteligente
+
+    plantas = cargar_plantas()
+    nombres = [p.nombre for p in plantas]
+    # Nombres repartidos por el catálogo (la búsqueda es lineal)
+    buscados = nombres[::len(nombres) // 10][:10]
+
+    modelo = ModeloPrediccionRiego().entrenar()
+    humedades = np.random.default_rng(0).uniform(0, 100, 1000)
+    lista_humedades = humedades.tolist()
+
+    traductor = TraductorPlantaInteligente("Benchmark", semilla=0)
+    lecturas = 1000
+
+    def procesar() -> None:
+        for _ in range(lecturas):
+            traductor.procesar_lectura()
+        traductor.historial.clear()
+
+    ruta_generada = os.path.join(carpeta_temporal, "generado.csv")
+    ruta_csv = os.path.join(carpeta_temporal, "dataset_plantas_960.csv")
+    shutil.copyfile(os.path.join(CARPETA_DATA, "dataset_plantas_960.csv"), ruta_csv)
+
+    def sin_cache_csv() -> None:
+        cargador_datasets.limpiar_cache()
+        if os.path.exists(ruta_canonica(ruta_csv)):
+            os.remove(ruta_canonica(ruta_csv))
+
+    def csv_canonico() -> None:
+        cargador_datasets.limpiar_cache()
+        if not os.path.exists(ruta_canonica(ruta_csv)):
+            cargador_datasets.cargar_dataset(ruta_csv)
+            cargador_datasets.limpiar_cache()
+
+    series = [s.tolist() for s in sintetizar_series_planta(plantas[0], dias=30, semilla=0)]
+    renderizador = RenderizadorDashboard()
+    ruta_png = os.path.join(carpeta_temporal, "dashboard.png")
+
+    def dashboard_png() -> None:
+        renderizador.actualizar(*series, plantas[0].nombre, dpi=100)
+        renderizador.guardar(ruta_png, dpi=100)
+
+    return [
+        Caso("catalogo_frio", cargar_plantas, unidades=len(plantas),
+             preparar=cargar_plantas.cache_clear, repeticiones=10),
+        Caso("catalogo_caliente", lambda: [cargar_plantas() for _ in range(1000)],
+             unidades=1000),
+        Caso("buscar_planta", lambda: [buscar_planta(n) for n in buscados],
+             unidades=len(buscados)),
+        Caso("predecir_uno", lambda: [modelo.predecir(h) for h in lista_humedades],
+             unidades=len(lista_humedades), repeticiones=5),
+        Caso("predecir_lote", lambda: modelo.predecir_lote(humedades),
+             unidades=len(humedades), repeticiones=200),
+        Caso("procesar_lectura", procesar, unidades=lecturas, repeticiones=5),
+        Caso("generar_dataset",
+             lambda: generar_dataset(plantas, ruta_generada, dias=30, semilla=0),
+             unidades=len(plantas) * 30, repeticiones=5),
+        Caso("csv_frio", lambda: cargador_datasets.cargar_dataset(ruta_csv),
+             preparar=sin_cache_csv, repeticiones=5),
+        Caso("csv_canonico", lambda: cargador_datasets.cargar_dataset(ruta_csv),
+             preparar=csv_canonico, repeticiones=20),
+        Caso("csv_memoria", lambda: [cargador_datasets.cargar_dataset(ruta_csv)
+                                     for _ in range(100)],
+             unidades=100),
+        Caso("dashboard_png", dashboard_png, repeticiones=5),
+        Caso("dashboard_svg", lambda: generar_svg_dashboard(*series, plantas[0].nombre),
+             repeticiones=100),
+    ]
+
+
+def ejecutar(nombres: Optional[List[str]] = None,
+             factor_repeticiones: float = 1.0) -> Dict[str, Any]:
+    """
+    Ejecuta la suite (o los casos indicados) e imprime cada resultado.
+
+    Args:
+        nombres: Casos a ejecutar (None = todos)
+        factor_repeticiones: Multiplica las repeticiones de cada caso
+                             (p. ej. 0.2 para una pasada rápida)
+
+    Returns:
+        Documento JSON: {"version", "meta", "resultados": {caso: {...}}}
+
+    Raises:
+        ValueError: Si algún nombre no corresponde a un caso
+    """
+    from conversion_datasets import VARIABLE_CACHE
+
+    resultados: Dict[str, Dict[str, float]] = {}
+    cache_anterior = os.environ.get(VARIABLE_CACHE)
+    with tempfile.TemporaryDirectory() as carpeta:
+        # Los .npz de los casos se borran con la carpeta temporal
+        os.environ[VARIABLE_CACHE] = os.path.join(carpeta, "cache")
+        try:
+            casos = construir_casos(carpeta)
+            if nombres:
+                desconocidos = set(nombres) - {c.nombre for c in casos}
+                if desconocidos:
+                    raise ValueError(f"Casos desconocidos: {', '.join(sorted(desconocidos))}")
+                casos = [c for c in casos if c.nombre in nombres]
+
+            print(f"{'Caso':<20s}{'Mediana':>12s}{'Mínimo':>12s}{'Por unidad':>14s}")
+            print("-" * 58)
+            for caso in casos:
+                r = medir(caso, max(1, round(caso.repeticiones * factor_repeticiones)))
+                resultados[caso.nombre] = r
+                print(f"{caso.nombre:<20s}{_formatear(r['mediana_s']):>12s}"
+                      f"{_formatear(r['minimo_s']):>12s}"
+                      f"{_formatear(r['mediana_por_unidad_us'] / 1e6):>14s}")
+        finally:
+            if cache_anterior is None:
+                del os.environ[VARIABLE_CACHE]
+            else:
+                os.environ[VARIABLE_CACHE] = cache_anterior
+
+    return {
+        "version": VERSION_FORMATO,
+        "meta": {
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "procesador": platform.processor() or platform.machine(),
+        },
+        "resultados": resultados,
+    }
+
+
+def comparar(actual: Dict[str, Any], base: Dict[str, Any],
+             umbral: float = UMBRAL_DEFECTO,
+             umbrales_caso: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
+    """
+    Compara unos resultados con la base.
+
+    Solo se comparan los casos presentes en ambos documentos.
+
+    Args:
+        actual: Documento devuelto por ejecutar()
+        base: Documento de la base
+        umbral: Empeoramiento relativo tolerado del mínimo
+        umbrales_caso: Umbrales propios de algunos casos
+
+    Returns:
+        Una fila por caso con base_s, actual_s, cambio (relativo),
+        umbral y regresion (bool)
+    """
+    umbrales_caso = umbrales_caso or {}
+    filas = []
+    for nombre, r in actual["resultados"].items():
+        anterior = base.get("resultados", {}).get(nombre)
+        if anterior is None:
+            continue
+        cambio = r["minimo_s"] / anterior["minimo_s"] - 1
+        limite = umbrales_caso.get(nombre, umbral)
+        filas.append({
+            "caso": nombre,
+            "base_s": anterior["minimo_s"],
+            "actual_s": r["minimo_s"],
+            "cambio": cambio,
+            "umbral": limite,
+            "regresion": cambio > limite,
+        })
+    return filas
+
+
+def imprimir_comparacion(filas: List[Dict[str, Any]]) -> None:
+    """Imprime la tabla de comparar()."""
+    print(f"{'Caso (mínimo)':<20s}{'Base':>12s}{'Actual':>12s}{'Cambio':>10s}{'Umbral':>9s}")
+    print("-" * 66)
+    for f in filas:
+        marca = "  REGRESIÓN" if f["regresion"] else ""
+        print(f"{f['caso']:<20s}{_formatear(f['base_s']):>12s}{_formatear(f['actual_s']):>12s}"
+              f"{f['cambio']:>+9.0%}{f['umbral']:>+8.0%}{marca}")
+
+
+def _formatear(segundos: float) -> str:
+    """Formatea una duración con la unidad adecuada."""
+    if segundos >= 1:
+        return f"{segundos:.2f} s"
+    if segundos >= 1e-3:
+        return f"{segundos * 1e3:.2f} ms"
+    if segundos >= 1e-6:
+        return f"{segundos * 1e6:.2f} µs"
+    return f"{segundos * 1e9:.0f} ns"
+
+
+def _leer_umbrales(pares: List[str]) -> Dict[str, float]:
+    """Convierte ["caso=0.5", ...] en {"caso": 0.5}."""
+    umbrales = {}
+    for par in pares:
+        nombre, _, valor = par.partition("=")
+        if not valor:
+            raise ValueError(f"Umbral inválido '{par}' (formato: caso=0.5)")
+        umbrales[nombre] = float(valor)
+    return umbrales
+
+
+def main(argumentos: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de la línea de comandos.
+
+    Returns:
+        0 si no hay regresiones, 1 si alguna supera su umbral
+    """
+    parser = argparse.ArgumentParser(description="Suite de benchmarks del traductor de plantas.")
+    parser.add_argument("--casos", nargs="+", default=None, help="Casos a ejecutar (default: todos)")
+    parser.add_argument("--factor", type=float, default=1.0,
+                        help="Multiplica las repeticiones (ej: 0.2 para una pasada rápida)")
+    parser.add_argument("--salida", default=None, help="JSON donde guardar los resultados")
+    parser.add_argument("--base", default=RUTA_BASE, help="JSON de la base (default: benchmarks/base.json)")
+    parser.add_argument("--guardar-base", action="store_true", help="Guarda los resultados como nueva base")
+    parser.add_argument("--comparar", action="store_true", help="Compara con la base y falla si hay regresiones")
+    parser.add_argument("--umbral", type=float, default=UMBRAL_DEFECTO,
+                        help="Empeoramiento tolerado del mínimo (default: 0.25 = 25%%)")
+    parser.add_argument("--umbral-caso", nargs="+", default=[], metavar="CASO=UMBRAL",
+                        help="Umbrales por caso (ej: dashboard_png=0.5)")
+    args = parser.parse_args(argumentos)
+
+    print("=" * 70)
+    print("SUITE DE BENCHMARKS")
+    print("=" * 70)
+    resultados = ejecutar(args.casos, args.factor)
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(resultados, f, indent=2)
+        print(f"\nResultados guardados en {args.salida}")
+    if args.guardar_base:
+        with open(args.base, "w", encoding="utf-8") as f:
+            json.dump(resultados, f, indent=2)
+        print(f"\nBase actualizada: {args.base}")
+
+    codigo = 0
+    if args.comparar:
+        with open(args.base, "r", encoding="utf-8") as f:
+            base = json.load(f)
+        filas = comparar(resultados, base, args.umbral, _leer_umbrales(args.umbral_caso))
+        print(f"\nComparación con {args.base} ({base['meta']['fecha']}):")
+        imprimir_comparacion(filas)
+        regresiones = [f["caso"] for f in filas if f["regresion"]]
+        if regresiones:
+            print(f"\n❌ {len(regresiones)} regresión(es): {', '.join(regresiones)}")
+            codigo = 1
+        else:
+            print("\n✅ Sin regresiones")
+    print("=" * 70)
+    return codigo
+
+
+if __name__ == "__main__":
+    sys.exit(main())
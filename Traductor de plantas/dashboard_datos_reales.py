@@ -9,10 +9,11 @@ import os
 # Agregar el directorio src al path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-import pandas as pd
-import numpy as np
+from cargador_datasets import cargar_dataset_largo
 from dashboard_plantas import generar_dashboard
 from planta_config import buscar_planta
+from simulacion_rng import generador_planta
+from sintetizador_series import sintetizar_ambiente
 
 def generar_dashboard_datos_reales(nombre_planta: str, guardar: bool = False):
     """
@@ -29,24 +30,20 @@ def generar_dashboard_datos_reales(nombre_planta: str, guardar: bool = False):
     print(f"DASHBOARD CON DATOS REALES - {nombre_planta}")
     print(f"{'='*80}\n")
 
-    # Leer CSV con datos reales
+    # Leer CSV con datos reales (se parsea una sola vez y queda en cache)
     print(f"Leyendo datos desde: {archivo_csv}")
-    df = pd.read_csv(archivo_csv)
+    dataset = cargar_dataset_largo(archivo_csv)
 
-    # Filtrar datos de la planta específica
-    planta_data = df[df['planta'] == nombre_planta]
-
-    if planta_data.empty:
+    if nombre_planta not in dataset:
         print(f"\nERROR: Planta '{nombre_planta}' no encontrada en el dataset")
         print(f"\nPlantas disponibles (primeras 10):")
-        plantas_disponibles = df['planta'].unique()[:10]
-        for i, p in enumerate(plantas_disponibles, 1):
+        for i, p in enumerate(dataset.nombres[:10], 1):
             print(f"  {i}. {p}")
-        print(f"\n  ... y {len(df['planta'].unique()) - 10} mas")
+        print(f"\n  ... y {len(dataset) - 10} mas")
         return
 
     # Extraer datos reales de humedad
-    datos_humedad = (planta_data['humedad_pct'].values).tolist()
+    datos_humedad = dataset.serie(nombre_planta, 'humedad_pct').tolist()
     dias = len(datos_humedad)
 
     print(f"OK Planta encontrada: {nombre_planta}")
@@ -57,28 +54,11 @@ def generar_dashboard_datos_reales(nombre_planta: str, guardar: bool = False):
     try:
         planta_config = buscar_planta(nombre_planta)
 
-        # Generar datos realistas de temperatura y luz basados en la config
-        temp_promedio = (planta_config.temperatura_min + planta_config.temperatura_max) / 2
-        temp_rango = (planta_config.temperatura_max - planta_config.temperatura_min) / 2
-
-        luz_promedio = (planta_config.luz_min + planta_config.luz_max) / 2
-        luz_rango = (planta_config.luz_max - planta_config.luz_min) / 2
-
-        # Temperatura con variación semanal realista
-        datos_temperatura = []
-        for dia in range(dias):
-            variacion = np.sin(dia * 2 * np.pi / 7) * temp_rango * 0.6
-            ruido = np.random.normal(0, temp_rango * 0.2)
-            valor = temp_promedio + variacion + ruido
-            datos_temperatura.append(round(valor, 2))
-
-        # Luz con variación mensual realista
-        datos_luz = []
-        for dia in range(dias):
-            variacion = np.sin(dia * 2 * np.pi / 30) * luz_rango * 0.5
-            ruido = np.random.normal(0, luz_rango * 0.15)
-            valor = luz_promedio + variacion + ruido
-            datos_luz.append(round(valor, 2))
+        # Generar datos realistas de temperatura (variación semanal) y luz
+        # (variación mensual) basados en la config, con el generador propio
+        # de la planta y sin recortar a los rangos óptimos
+        rng = generador_planta(planta_config.nombre)
+        datos_temperatura, datos_luz = sintetizar_ambiente(planta_config, dias, rng, limitar=False)
 
         print(f"OK Tipo: {planta_config.tipo}")
         print(f"OK Humedad optima: {planta_config.humedad_min:.1f}% - {planta_config.humedad_max:.1f}%")
@@ -108,8 +88,9 @@ def generar_dashboard_datos_reales(nombre_planta: str, guardar: bool = False):
         print(f"\n   Generando dashboard solo con datos de humedad real...")
 
         # Fallback: generar con valores por defecto
-        datos_temperatura = np.random.uniform(18, 26, dias).tolist()
-        datos_luz = np.random.uniform(50, 80, dias).tolist()
+        rng = generador_planta(nombre_planta)
+        datos_temperatura = rng.uniform(18, 26, dias).tolist()
+        datos_luz = rng.uniform(50, 80, dias).tolist()
 
         generar_dashboard(
             datos_humedad=datos_humedad,
@@ -10,6 +10,7 @@ Ejemplos incluidos:
     2. Dashboard desde archivo CSV
     3. Integración con el traductor de plantas existente
     4. Dashboard con datos personalizados
+    5. Mapa de calor de toda la flota (960 plantas en una imagen)
 
 ================================================================================
 """
@@ -17,6 +18,7 @@ Ejemplos incluidos:
 from dashboard_plantas import (
     generar_dashboard,
     generar_dashboard_desde_csv,
+    generar_mapa_flota_con_datos,
     demo_dashboard
 )
 import numpy as np
@@ -186,6 +188,27 @@ def ejemplo_4_comparar_multiples_plantas():
     print("\nDashboards generados para todas las plantas")
 
 
+def ejemplo_5_mapa_flota():
+    """
+    Ejemplo 5: Vista general de toda la flota en una sola imagen.
+    En lugar de un dashboard por planta, un mapa de calor plantas × días.
+    """
+    print("\n" + "="*80)
+    print("EJEMPLO 5: Mapa de calor de la flota")
+    print("="*80)
+
+    # Humedad de las 960 plantas del catálogo, normalizada a su rango
+    # óptimo y ordenada de la planta más sana a la más crítica
+    generar_mapa_flota_con_datos(
+        dias=30,
+        semilla=42,
+        guardar=True,
+        nombre_archivo="mapa_flota.png"
+    )
+
+    print("\nMapa de la flota generado")
+
+
 def menu_interactivo():
     """
     Menú interactivo para elegir qué ejemplo ejecutar.
@@ -199,11 +222,12 @@ def menu_interactivo():
     print("  3. Dashboard con datos personalizados")
     print("  4. Comparar múltiples plantas")
     print("  5. Demo rápida")
+    print("  6. Mapa de calor de la flota")
     print("  0. Salir")
 
     while True:
         try:
-            opcion = input("\nIngresa tu opción (0-5): ").strip()
+            opcion = input("\nIngresa tu opción (0-6): ").strip()
 
             if opcion == "1":
                 ejemplo_1_datos_simulados()
@@ -220,6 +244,9 @@ def menu_interactivo():
             elif opcion == "5":
                 demo_dashboard()
                 break
+            elif opcion == "6":
+                ejemplo_5_mapa_flota()
+                break
             elif opcion == "0":
                 print("\nSaliendo...")
                 break
@@ -245,4 +272,5 @@ if __name__ == "__main__":
     # ejemplo_2_desde_csv()
     # ejemplo_3_datos_personalizados()
     # ejemplo_4_comparar_multiples_plantas()
+    # ejemplo_5_mapa_flota()
     # demo_dashboard()
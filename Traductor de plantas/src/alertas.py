@@ -0,0 +1,262 @@
+"""
+Motor de alertas con histéresis y agrupación por planta.
+
+Este módulo proporciona:
+- ReglaAlerta: banda de histéresis y tiempo de permanencia de un tipo de problema
+- EventoAlerta: transición de estado emitida hacia abajo (log, notificaciones)
+- MotorAlertas: capa con estado sobre TraductorPlantaInteligente.analizar_condiciones
+
+`analizar_condiciones` informa de un problema en CADA lectura que cae del
+lado malo de un umbral. Una planta cuya humedad oscila justo en el límite
+genera un mensaje nuevo cada pocos segundos. El motor convierte ese flujo
+en transiciones:
+    - Un problema se ACTIVA solo si se mantiene durante `permanencia_s`
+      (sin volver al lado bueno del umbral más allá del margen).
+    - Mientras está activo, las repeticiones se agrupan (solo se cuentan).
+    - Se RESUELVE cuando el valor vuelve al lado bueno del umbral con un
+      margen (`margen`) y se mantiene así durante `permanencia_s`.
+Solo las activaciones y resoluciones se emiten.
+
+Ejemplo:
+    >>> motor = MotorAlertas(al_emitir=print)
+    >>> traductor = TraductorPlantaInteligente("Monstera", motor_alertas=motor)
+    >>> for _ in range(1000):
+    ...     traductor.procesar_lectura()   # imprime solo las transiciones
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+
+@dataclass(frozen=True)
+class ReglaAlerta:
+    """
+    Parámetros de histéresis para un tipo de problema.
+
+    Atributos:
+        metrica (str): Valor a vigilar: "necesidad_agua_ml" (del diagnóstico)
+                       o un campo de LecturaSensores ("humedad_pct",
+                       "temperatura", "luz_pct")
+        limite (Union[str, float]): Umbral fijo o nombre del atributo de la
+                                    configuración de la planta (ej: "humedad_max")
+        sentido (int): +1 si el problema ocurre POR ENCIMA del límite,
+                       -1 si ocurre POR DEBAJO
+        margen (float): Distancia que el valor debe superar en el lado bueno
+                        del límite para considerar el problema resuelto
+        permanencia_s (float): Segundos que una condición debe mantenerse
+                               para activar o resolver la alerta
+    """
+    metrica: str
+    limite: Union[str, float]
+    sentido: int
+    margen: float
+    permanencia_s: float
+
+    def __post_init__(self):
+        """
+        Raises:
+            ValueError: Si el sentido, el margen o la permanencia son inválidos
+        """
+        if self.sentido not in (1, -1):
+            raise ValueError("sentido debe ser 1 o -1")
+        if self.margen < 0:
+            raise ValueError("margen no puede ser negativo")
+        if self.permanencia_s < 0:
+            raise ValueError("permanencia_s no puede ser negativa")
+
+    def valor_y_limite(self, diagnostico: Dict[str, Any], config: Any) -> Tuple[float, float]:
+        """
+        Extrae el valor vigilado y el límite vigente.
+
+        Args:
+            diagnostico: Diccionario retornado por analizar_condiciones()
+            config: Configuración de la planta
+
+        Returns:
+            Tupla (valor, limite)
+        """
+        if self.metrica in diagnostico:
+            valor = diagnostico[self.metrica]
+        else:
+            valor = getattr(diagnostico['lectura'], self.metrica)
+        limite = getattr(config, self.limite) if isinstance(self.limite, str) else self.limite
+        return float(valor), float(limite)
+
+    def despejada(self, valor: float, limite: float) -> bool:
+        """Indica si el valor está en el lado bueno del límite, fuera de la banda."""
+        if self.sentido > 0:
+            return valor <= limite - self.margen
+        return valor >= limite + self.margen
+
+
+# Reglas por defecto, una por cada código de analizar_condiciones
+REGLAS_POR_DEFECTO: Dict[str, ReglaAlerta] = {
+    'sed': ReglaAlerta('necesidad_agua_ml', 0.5, 1, 0.05, 300.0),
+    'exceso_agua': ReglaAlerta('humedad_pct', 'humedad_max', 1, 2.0, 300.0),
+    'calor': ReglaAlerta('temperatura', 'temperatura_max', 1, 0.5, 120.0),
+    'frio': ReglaAlerta('temperatura', 'temperatura_min', -1, 0.5, 120.0),
+    'oscuridad': ReglaAlerta('luz_pct', 'luz_min', -1, 3.0, 600.0),
+    'exceso_luz': ReglaAlerta('luz_pct', 'luz_max', 1, 3.0, 600.0),
+}
+
+
+@dataclass
+class EventoAlerta:
+    """
+    Transición de estado de una alerta.
+
+    Atributos:
+        planta (str): Nombre de la planta
+        codigo (str): Tipo de problema (ej: "sed")
+        tipo (str): "activada" o "resuelta"
+        timestamp (float): Momento de la transición (timestamp de la lectura)
+        mensaje (str): Último mensaje del problema
+        repeticiones (int): Lecturas con el problema agrupadas en esta alerta
+        duracion_s (float): Segundos que la alerta estuvo activa (0 al activarse)
+    """
+    planta: str
+    codigo: str
+    tipo: str
+    timestamp: float
+    mensaje: str
+    repeticiones: int
+    duracion_s: float = 0.0
+
+
+@dataclass
+class _EstadoAlerta:
+    """Estado interno de un tipo de problema para una planta."""
+    activa: bool = False
+    pendiente_desde: Optional[float] = None
+    inicio: float = 0.0
+    mensaje: str = ""
+    repeticiones: int = 0
+
+
+class MotorAlertas:
+    """
+    Capa de alertas con histéresis, tiempos de permanencia y agrupación.
+
+    Atributos:
+        reglas (Dict[str, ReglaAlerta]): Regla por código de problema
+        al_emitir (Callable): Función llamada con cada EventoAlerta emitido
+        problemas_recibidos (int): Mensajes de problema recibidos
+        eventos_emitidos (int): Transiciones emitidas
+    """
+
+    def __init__(self,
+                 reglas: Optional[Dict[str, ReglaAlerta]] = None,
+                 al_emitir: Optional[Callable[[EventoAlerta], None]] = None):
+        """
+        Args:
+            reglas: Reglas por código. Si es None, usa REGLAS_POR_DEFECTO.
+                    Los códigos sin regla se ignoran.
+            al_emitir: Función a llamar con cada evento emitido (opcional)
+        """
+        self.reglas = dict(REGLAS_POR_DEFECTO if reglas is None else reglas)
+        self.al_emitir = al_emitir
+        self.problemas_recibidos = 0
+        self.eventos_emitidos = 0
+        self._estados: Dict[str, Dict[str, _EstadoAlerta]] = {}
+
+    def procesar(self, planta: str, diagnostico: Dict[str, Any], config: Any) -> List[EventoAlerta]:
+        """
+        Actualiza el estado de una planta con un diagnóstico nuevo.
+
+        Args:
+            planta: Nombre de la planta
+            diagnostico: Diccionario retornado por analizar_condiciones()
+            config: Configuración de la planta (umbrales)
+
+        Returns:
+            Lista de eventos emitidos por esta lectura (normalmente vacía)
+        """
+        t = diagnostico['lectura'].timestamp
+        presentes = dict(zip(diagnostico['codigos'], diagnostico['problemas']))
+        self.problemas_recibidos += len(presentes)
+
+        estados = self._estados.setdefault(planta, {})
+        eventos: List[EventoAlerta] = []
+
+        for codigo in set(presentes) | set(estados):
+            regla = self.reglas.get(codigo)
+            if regla is None:
+                continue
+            estado = estados.get(codigo)
+            if estado is None:
+                estado = estados[codigo] = _EstadoAlerta()
+
+            if codigo in presentes:
+                estado.mensaje = presentes[codigo]
+                estado.repeticiones += 1
+                if estado.activa:
+                    # Problema repetido: se agrupa y se cancela cualquier resolución
+                    estado.pendiente_desde = None
+                    continue
+                if estado.pendiente_desde is None:
+                    estado.pendiente_desde = t
+                if t - estado.pendiente_desde >= regla.permanencia_s:
+                    estado.activa = True
+                    estado.inicio = estado.pendiente_desde
+                    estado.pendiente_desde = None
+                    eventos.append(EventoAlerta(
+                        planta, codigo, "activada", t, estado.mensaje, estado.repeticiones
+                    ))
+                continue
+
+            valor, limite = regla.valor_y_limite(diagnostico, config)
+            if not estado.activa:
+                if regla.despejada(valor, limite):
+                    # La condición desapareció antes de cumplir la permanencia
+                    del estados[codigo]
+                # Dentro de la banda la activación pendiente sigue contando
+                continue
+
+            if not regla.despejada(valor, limite):
+                # Dentro de la banda de histéresis: la alerta sigue activa
+                estado.pendiente_desde = None
+                continue
+            if estado.pendiente_desde is None:
+                estado.pendiente_desde = t
+            if t - estado.pendiente_desde >= regla.permanencia_s:
+                eventos.append(EventoAlerta(
+                    planta, codigo, "resuelta", t, estado.mensaje,
+                    estado.repeticiones, t - estado.inicio
+                ))
+                del estados[codigo]
+
+        if not estados:
+            del self._estados[planta]
+
+        self.eventos_emitidos += len(eventos)
+        if self.al_emitir is not None:
+            for evento in eventos:
+                self.al_emitir(evento)
+        return eventos
+
+    def alertas_activas(self, planta: Optional[str] = None) -> List[Tuple[str, str]]:
+        """
+        Lista las alertas activas.
+
+        Args:
+            planta: Si se indica, solo las de esa planta
+
+        Returns:
+            Lista de tuplas (planta, codigo)
+        """
+        plantas = [planta] if planta is not None else list(self._estados)
+        return [
+            (p, codigo)
+            for p in plantas
+            for codigo, estado in self._estados.get(p, {}).items()
+            if estado.activa
+        ]
+
+    def factor_reduccion(self) -> float:
+        """
+        Relación entre mensajes de problema recibidos y eventos emitidos.
+
+        Returns:
+            float: Cuántos mensajes se absorbieron por cada evento emitido
+        """
+        return self.problemas_recibidos / max(self.eventos_emitidos, 1)
@@ -0,0 +1,256 @@
+"""
+Almacén columnar en disco, solo de anexado, para el historial de lecturas.
+
+Este módulo proporciona:
+- COLUMNAS: columnas persistidas de LecturaSensores y su tipo binario
+- AlmacenHistorial: escritura por lotes y lectura con np.memmap
+
+`TraductorPlantaInteligente.historial` vive solo en memoria y se pierde al
+salir. El almacén guarda cada columna en su propio archivo binario tipado
+(`timestamp.f8`, `humedad_raw.u2`, ...) dentro de un directorio, más un
+pequeño índice JSON con el número de filas confirmadas. Las lecturas se
+acumulan en memoria y se escriben por lotes; al reabrir, cada columna se
+mapea con np.memmap, de modo que meses de historial se analizan sin copiar
+ni parsear nada.
+
+Estructura en disco:
+    historial_monstera/
+        indice.json          {"version": 1, "filas": N, "columnas": {...}}
+        timestamp.f8
+        humedad_raw.u2
+        ...
+
+Ejemplo:
+    >>> with AlmacenHistorial("historial_monstera") as almacen:
+    ...     almacen.agregar(lectura)
+    >>> columnas = AlmacenHistorial("historial_monstera").columnas()
+    >>> columnas["humedad_pct"].mean()
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+VERSION_FORMATO = 1
+ARCHIVO_INDICE = "indice.json"
+
+# Columnas persistidas (nombre de campo de LecturaSensores, tipo little-endian)
+COLUMNAS: Tuple[Tuple[str, str], ...] = (
+    ("timestamp", "<f8"),
+    ("humedad_raw", "<u2"),
+    ("luz_raw", "<u2"),
+    ("temperatura", "<f4"),
+    ("humedad_pct", "<f4"),
+    ("luz_pct", "<f4"),
+)
+
+
+class AlmacenHistorial:
+    """
+    Historial de lecturas persistente, columnar y solo de anexado.
+
+    Las filas se confirman en el índice DESPUÉS de escribir todas las
+    columnas, así que un corte a mitad de un lote deja el almacén en el
+    último estado confirmado (los bytes sobrantes se descartan al reabrir).
+
+    Atributos:
+        directorio (str): Carpeta del almacén
+        tam_lote (int): Lecturas acumuladas antes de escribir a disco
+        filas (int): Filas confirmadas en disco
+    """
+
+    def __init__(self, directorio: str, tam_lote: int = 1024):
+        """
+        Abre (o crea) un almacén.
+
+        Args:
+            directorio: Carpeta del almacén (se crea si no existe)
+            tam_lote: Lecturas acumuladas en memoria antes de escribir
+
+        Raises:
+            ValueError: Si tam_lote no es positivo o el índice es de otra versión
+        """
+        if tam_lote <= 0:
+            raise ValueError("tam_lote debe ser mayor que 0")
+
+        self.directorio = directorio
+        self.tam_lote = tam_lote
+        self.filas = 0
+        self._pendientes: Dict[str, List[Any]] = {nombre: [] for nombre, _ in COLUMNAS}
+
+        os.makedirs(directorio, exist_ok=True)
+        ruta_indice = os.path.join(directorio, ARCHIVO_INDICE)
+        if os.path.exists(ruta_indice):
+            with open(ruta_indice, "r", encoding="utf-8") as f:
+                indice = json.load(f)
+            if indice.get("version") != VERSION_FORMATO:
+                raise ValueError(
+                    f"Versión de almacén no soportada: {indice.get('version')}"
+                )
+            self.filas = int(indice["filas"])
+            self._descartar_bytes_sin_confirmar()
+        else:
+            self._escribir_indice()
+
+    # ------------------------------------------------------------------
+    # Rutas e índice
+    # ------------------------------------------------------------------
+
+    def _ruta_columna(self, nombre: str, tipo: str) -> str:
+        """Ruta del archivo de una columna (la extensión indica el tipo)."""
+        return os.path.join(self.directorio, f"{nombre}.{tipo[1:]}")
+
+    def _escribir_indice(self) -> None:
+        """Reemplaza el índice de forma atómica."""
+        indice = {
+            "version": VERSION_FORMATO,
+            "filas": self.filas,
+            "columnas": dict(COLUMNAS),
+        }
+        ruta = os.path.join(self.directorio, ARCHIVO_INDICE)
+        temporal = ruta + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as f:
+            json.dump(indice, f)
+        os.replace(temporal, ruta)
+
+    def _descartar_bytes_sin_confirmar(self) -> None:
+        """Recorta las columnas al número de filas confirmadas en el índice."""
+        for nombre, tipo in COLUMNAS:
+            ruta = self._ruta_columna(nombre, tipo)
+            esperado = self.filas * np.dtype(tipo).itemsize
+            if os.path.exists(ruta) and os.path.getsize(ruta) > esperado:
+                with open(ruta, "r+b") as f:
+                    f.truncate(esperado)
+
+    # ------------------------------------------------------------------
+    # Escritura
+    # ------------------------------------------------------------------
+
+    def agregar(self, lectura: Any) -> None:
+        """
+        Añade una lectura (LecturaSensores) al lote en memoria.
+
+        Args:
+            lectura: Objeto con los campos de COLUMNAS
+        """
+        for nombre, lista in self._pendientes.items():
+            lista.append(getattr(lectura, nombre))
+        if len(self._pendientes["timestamp"]) >= self.tam_lote:
+            self.flush()
+
+    def agregar_lote(self, columnas: Dict[str, Any]) -> None:
+        """
+        Escribe directamente un bloque de lecturas dado por columnas.
+
+        Args:
+            columnas: Diccionario nombre -> array, con todas las columnas
+                      de COLUMNAS y la misma longitud
+
+        Raises:
+            ValueError: Si faltan columnas o las longitudes no coinciden
+        """
+        self.flush()
+        self._escribir({nombre: columnas[nombre] for nombre, _ in COLUMNAS
+                        if nombre in columnas})
+
+    def flush(self) -> None:
+        """Escribe a disco las lecturas pendientes."""
+        if not self._pendientes["timestamp"]:
+            return
+        pendientes = self._pendientes
+        self._pendientes = {nombre: [] for nombre, _ in COLUMNAS}
+        self._escribir(pendientes)
+
+    def _escribir(self, columnas: Dict[str, Any]) -> None:
+        """Anexa un bloque a cada columna y confirma las filas en el índice."""
+        if len(columnas) != len(COLUMNAS):
+            faltan = [n for n, _ in COLUMNAS if n not in columnas]
+            raise ValueError(f"Faltan columnas: {', '.join(faltan)}")
+
+        arrays = {nombre: np.asarray(columnas[nombre], dtype=tipo) for nombre, tipo in COLUMNAS}
+        n = len(arrays["timestamp"])
+        if any(len(a) != n for a in arrays.values()):
+            raise ValueError("Todas las columnas deben tener la misma longitud")
+        if n == 0:
+            return
+
+        for nombre, tipo in COLUMNAS:
+            with open(self._ruta_columna(nombre, tipo), "ab") as f:
+                f.write(arrays[nombre].tobytes())
+
+        self.filas += n
+        self._escribir_indice()
+
+    def cerrar(self) -> None:
+        """Escribe las lecturas pendientes. El almacén puede seguir usándose."""
+        self.flush()
+
+    def __enter__(self) -> 'AlmacenHistorial':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.cerrar()
+
+    def __len__(self) -> int:
+        return self.filas + len(self._pendientes["timestamp"])
+
+    # ------------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------------
+
+    def columna(self, nombre: str) -> np.ndarray:
+        """
+        Mapea una columna confirmada en memoria (sin copiarla).
+
+        Args:
+            nombre: Nombre de la columna (ej: "humedad_pct")
+
+        Returns:
+            np.memmap de solo lectura con `filas` elementos
+
+        Raises:
+            KeyError: Si la columna no existe
+        """
+        tipos = dict(COLUMNAS)
+        if nombre not in tipos:
+            raise KeyError(f"Columna desconocida: '{nombre}'")
+        if self.filas == 0:
+            return np.empty(0, dtype=tipos[nombre])
+        return np.memmap(self._ruta_columna(nombre, tipos[nombre]),
+                         dtype=tipos[nombre], mode="r", shape=(self.filas,))
+
+    def columnas(self) -> Dict[str, np.ndarray]:
+        """
+        Mapea todas las columnas confirmadas.
+
+        Las lecturas pendientes se escriben antes para que estén incluidas.
+
+        Returns:
+            Diccionario nombre -> np.memmap
+        """
+        self.flush()
+        return {nombre: self.columna(nombre) for nombre, _ in COLUMNAS}
+
+    def entre(self, desde: Optional[float] = None, hasta: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Columnas de las lecturas con timestamp en [desde, hasta).
+
+        Supone que las lecturas se anexaron en orden cronológico, así que
+        el rango se localiza por búsqueda binaria y el resultado son
+        vistas del mapeo (sin copia).
+
+        Args:
+            desde: Timestamp inicial (None = desde el principio)
+            hasta: Timestamp final exclusivo (None = hasta el final)
+
+        Returns:
+            Diccionario nombre -> vista del np.memmap
+        """
+        columnas = self.columnas()
+        tiempos = columnas["timestamp"]
+        inicio = 0 if desde is None else int(np.searchsorted(tiempos, desde, side="left"))
+        fin = len(tiempos) if hasta is None else int(np.searchsorted(tiempos, hasta, side="left"))
+        return {nombre: valores[inicio:fin] for nombre, valores in columnas.items()}
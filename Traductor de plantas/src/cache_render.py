@@ -0,0 +1,216 @@
+"""
+Cache de imágenes de dashboards, direccionada por contenido.
+
+Este módulo proporciona:
+- VERSION_LAYOUT: versión del diseño del dashboard (forma parte de la clave)
+- clave_render(): hash de las series, los rangos, el nombre, el recorte y el diseño
+- CacheRender: PNGs en disco con límite de tamaño y expulsión LRU
+
+Volver a generar el dashboard de una planta cuyos datos no cambiaron
+cuesta lo mismo que la primera vez (casi todo es matplotlib). Aquí cada
+imagen se guarda como `<clave>.png`, donde la clave es el SHA-256 de todo
+lo que determina el dibujo; si se pide de nuevo el mismo dashboard se
+devuelve el archivo existente. La fecha de modificación de cada PNG se
+actualiza al usarlo y, cuando la carpeta supera `tam_max_bytes`, se
+borran primero los menos usados recientemente.
+
+Ejemplo:
+    >>> cache = CacheRender("cache_dashboards", tam_max_bytes=100 * 1024 * 1024)
+    >>> generar_dashboard(humedad, temp, luz, "Acacia", guardar=True,
+    ...                   nombre_archivo="acacia.png", cache=cache)
+"""
+
+import hashlib
+import os
+import shutil
+from typing import Any, Callable, Optional, Sequence
+
+import numpy as np
+
+
+# Incrementar cuando cambie el aspecto de RenderizadorDashboard, para que
+# las imágenes cacheadas con el diseño anterior dejen de usarse
+VERSION_LAYOUT = 2
+
+EXTENSION = ".png"
+
+
+def clave_render(
+    datos_humedad: Sequence[float],
+    datos_temperatura: Sequence[float],
+    datos_luz: Sequence[float],
+    nombre_planta: str,
+    humedad_optima: tuple,
+    temperatura_optima: tuple,
+    luz_optima: tuple,
+    dpi: int = 300,
+    recortar: bool = True,
+    version: int = VERSION_LAYOUT
+) -> str:
+    """
+    Calcula la clave de cache de un dashboard.
+
+    Las series se hashean como float64, así que una lista de Python y un
+    array de NumPy con los mismos valores dan la misma clave. `recortar`
+    forma parte de la clave porque el mismo dashboard guardado con y sin
+    recorte 'tight' (ver RenderizadorDashboard.guardar) son imágenes
+    distintas.
+
+    Returns:
+        SHA-256 en hexadecimal
+    """
+    sha = hashlib.sha256()
+    sha.update(f"v{version}|{nombre_planta}|{dpi}|{'tight' if recortar else 'completa'}|".encode("utf-8"))
+    for serie in (datos_humedad, datos_temperatura, datos_luz):
+        valores = np.ascontiguousarray(serie, dtype=np.float64)
+        sha.update(len(valores).to_bytes(8, "little"))
+        sha.update(valores.tobytes())
+    rangos = np.array([humedad_optima, temperatura_optima, luz_optima], dtype=np.float64)
+    sha.update(rangos.tobytes())
+    return sha.hexdigest()
+
+
+class CacheRender:
+    """
+    Carpeta de PNGs indexada por clave, con tamaño máximo y expulsión LRU.
+
+    El estado vive solo en el sistema de archivos (nombre = clave, fecha
+    de modificación = último uso), así que varios procesos pueden
+    compartir la misma carpeta.
+
+    Atributos:
+        directorio (str): Carpeta de la cache
+        tam_max_bytes (int): Tamaño total máximo de las imágenes
+        aciertos (int): Peticiones servidas desde la cache
+        fallos (int): Peticiones que tuvieron que renderizarse
+    """
+
+    def __init__(self, directorio: str, tam_max_bytes: int = 200 * 1024 * 1024):
+        """
+        Args:
+            directorio: Carpeta de la cache (se crea si no existe)
+            tam_max_bytes: Tamaño total máximo
+
+        Raises:
+            ValueError: Si tam_max_bytes no es positivo
+        """
+        if tam_max_bytes <= 0:
+            raise ValueError("tam_max_bytes debe ser mayor que 0")
+        self.directorio = directorio
+        self.tam_max_bytes = tam_max_bytes
+        self.aciertos = 0
+        self.fallos = 0
+        os.makedirs(directorio, exist_ok=True)
+
+    def ruta(self, clave: str) -> str:
+        """Ruta de la imagen de una clave (exista o no)."""
+        return os.path.join(self.directorio, clave + EXTENSION)
+
+    def obtener(self, clave: str) -> Optional[str]:
+        """
+        Busca una imagen y la marca como usada.
+
+        Args:
+            clave: Clave de clave_render()
+
+        Returns:
+            Ruta del PNG, o None si no está en la cache
+        """
+        ruta = self.ruta(clave)
+        try:
+            os.utime(ruta)
+        except FileNotFoundError:
+            return None
+        return ruta
+
+    def obtener_o_renderizar(self, clave: str, renderizar: Callable[[str], Any]) -> str:
+        """
+        Devuelve la imagen cacheada o la genera con `renderizar`.
+
+        Args:
+            clave: Clave de clave_render()
+            renderizar: Función que recibe una ruta y guarda ahí el PNG
+
+        Returns:
+            Ruta del PNG dentro de la cache
+        """
+        ruta = self.obtener(clave)
+        if ruta is not None:
+            self.aciertos += 1
+            return ruta
+
+        self.fallos += 1
+        ruta = self.ruta(clave)
+        # Se renderiza a un temporal para que otro proceso nunca lea un PNG a medias
+        temporal = f"{ruta}.{os.getpid()}.tmp{EXTENSION}"
+        try:
+            renderizar(temporal)
+            os.replace(temporal, ruta)
+        finally:
+            if os.path.exists(temporal):
+                os.remove(temporal)
+        # La imagen recién creada no se expulsa aunque ella sola supere el límite
+        self.recortar(conservar=ruta)
+        return ruta
+
+    def copiar_a(self, clave: str, renderizar: Callable[[str], Any], destino: str) -> None:
+        """
+        Copia a `destino` la imagen de una clave, renderizándola si hace falta.
+
+        Otro proceso que recorta la misma carpeta puede borrar la imagen
+        entre obtener_o_renderizar() y la copia; en ese caso se renderiza
+        directamente en `destino`.
+
+        Args:
+            clave: Clave de clave_render()
+            renderizar: Función que recibe una ruta y guarda ahí el PNG
+            destino: Archivo donde dejar la imagen
+        """
+        try:
+            shutil.copyfile(self.obtener_o_renderizar(clave, renderizar), destino)
+        except FileNotFoundError:
+            renderizar(destino)
+
+    def tam_total(self) -> int:
+        """Bytes ocupados por las imágenes de la cache."""
+        return sum(e.stat().st_size for e in os.scandir(self.directorio)
+                   if e.is_file() and e.name.endswith(EXTENSION) and ".tmp" not in e.name)
+
+    def recortar(self, conservar: Optional[str] = None) -> int:
+        """
+        Borra las imágenes menos usadas hasta quedar bajo tam_max_bytes.
+
+        Args:
+            conservar: Ruta de una imagen que no se borra (la que se va a
+                       devolver); su tamaño sí cuenta para el total
+
+        Returns:
+            Número de imágenes borradas
+        """
+        conservar = os.path.abspath(conservar) if conservar is not None else None
+        entradas = []
+        for entrada in os.scandir(self.directorio):
+            if entrada.is_file() and entrada.name.endswith(EXTENSION) and ".tmp" not in entrada.name:
+                estado = entrada.stat()
+                entradas.append((estado.st_mtime_ns, estado.st_size, entrada.path))
+
+        total = sum(tam for _, tam, _ in entradas)
+        borradas = 0
+        for _, tam, ruta in sorted(entradas):
+            if total <= self.tam_max_bytes:
+                break
+            if os.path.abspath(ruta) == conservar:
+                continue
+            try:
+                os.remove(ruta)
+            except FileNotFoundError:
+                pass  # Ya la borró otro proceso
+            total -= tam
+            borradas += 1
+        return borradas
+
+    def limpiar(self) -> None:
+        """Borra todas las imágenes de la cache."""
+        for entrada in os.scandir(self.directorio):
+            if entrada.is_file() and entrada.name.endswith(EXTENSION):
+                os.remove(entrada.path)
@@ -0,0 +1,237 @@
+"""
+Calibración de sensores analógicos con tablas de consulta precompiladas.
+
+Este módulo proporciona:
+- CurvaCalibracion: curva lineal por tramos (fracción del ADC -> porcentaje)
+- CalibradorSensores: registro de curvas por sensor compiladas a tablas
+  de consulta para ADC de 10 bits (Arduino) y 12 bits (ESP32)
+
+`TraductorPlantaInteligente.normalizar_sensor` asume que el sensor es
+lineal en todo el rango 0-1023. Las sondas capacitivas de humedad no lo
+son: su salida baja al aumentar la humedad y la curva se aplana en los
+extremos. Aquí cada sensor tiene su propia curva y, como un ADC solo
+puede devolver 2^bits códigos distintos, la curva se evalúa UNA vez para
+todos ellos (ya recortada a 0-100 y redondeada a 2 decimales). Convertir
+un array de lecturas crudas es entonces un solo acceso indexado.
+
+Ejemplo:
+    >>> calibrador = CalibradorSensores(bits=12)
+    >>> calibrador.registrar("humedad", CURVA_CAPACITIVA_TIPICA)
+    >>> calibrador.convertir("humedad", np.array([3480, 2600, 1650])).tolist()
+    [0.03, 43.3, 99.41]
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+BITS_SOPORTADOS = (10, 12)
+
+
+@dataclass(frozen=True)
+class CurvaCalibracion:
+    """
+    Curva de calibración lineal por tramos de un sensor.
+
+    Los puntos se expresan como fracción de la escala completa del ADC
+    (0.0 = código 0, 1.0 = código máximo), así la misma curva sirve para
+    un ADC de 10 o de 12 bits.
+
+    Atributos:
+        fracciones (Tuple[float, ...]): Puntos de la escala del ADC (0-1),
+                                        estrictamente crecientes
+        porcentajes (Tuple[float, ...]): Valor en porcentaje de cada punto
+
+    Fuera del primer y último punto la curva se mantiene constante.
+    """
+    fracciones: Tuple[float, ...]
+    porcentajes: Tuple[float, ...]
+
+    def __post_init__(self):
+        """
+        Valida la curva.
+
+        Raises:
+            ValueError: Si los puntos no forman una curva válida
+        """
+        if len(self.fracciones) != len(self.porcentajes):
+            raise ValueError("fracciones y porcentajes deben tener la misma longitud")
+        if len(self.fracciones) < 2:
+            raise ValueError("La curva necesita al menos 2 puntos")
+        if any(not 0.0 <= f <= 1.0 for f in self.fracciones):
+            raise ValueError("Las fracciones deben estar entre 0 y 1")
+        if any(b <= a for a, b in zip(self.fracciones, self.fracciones[1:])):
+            raise ValueError("Las fracciones deben ser estrictamente crecientes")
+
+    @classmethod
+    def desde_codigos(cls,
+                      codigos: Sequence[int],
+                      porcentajes: Sequence[float],
+                      bits: int = 10) -> 'CurvaCalibracion':
+        """
+        Crea una curva a partir de códigos medidos con un ADC concreto.
+
+        Args:
+            codigos: Lecturas crudas del ADC en los puntos de calibración
+                     (en cualquier orden, p.ej. seco -> húmedo)
+            porcentajes: Valor real (%) en cada punto
+            bits: Resolución del ADC con el que se midió
+
+        Returns:
+            CurvaCalibracion equivalente
+
+        Ejemplo:
+            >>> # Sonda capacitiva: 520 en aire (0%), 260 en agua (100%)
+            >>> CurvaCalibracion.desde_codigos([520, 260], [0, 100], bits=10)
+        """
+        maximo = (1 << bits) - 1
+        puntos = sorted(zip(codigos, porcentajes))
+        return cls(
+            fracciones=tuple(c / maximo for c, _ in puntos),
+            porcentajes=tuple(float(p) for _, p in puntos),
+        )
+
+    def compilar(self, bits: int = 10) -> np.ndarray:
+        """
+        Evalúa la curva para todos los códigos posibles de un ADC.
+
+        Args:
+            bits: Resolución del ADC (10 o 12)
+
+        Returns:
+            Array de 2^bits valores (%) recortados a 0-100 y redondeados
+            a 2 decimales, indexable directamente por el código crudo
+
+        Raises:
+            ValueError: Si la resolución no está soportada
+        """
+        if bits not in BITS_SOPORTADOS:
+            raise ValueError(f"bits debe ser uno de {BITS_SOPORTADOS}")
+
+        codigos = np.arange(1 << bits, dtype=np.float64)
+        fracciones = codigos / ((1 << bits) - 1)
+        tabla = np.interp(fracciones, self.fracciones, self.porcentajes)
+        tabla = np.round(np.clip(tabla, 0.0, 100.0), 2)
+        tabla.flags.writeable = False
+        return tabla
+
+
+# Curva equivalente a normalizar_sensor: f(x) = (x / x_max) × 100
+CURVA_LINEAL = CurvaCalibracion(fracciones=(0.0, 1.0), porcentajes=(0.0, 100.0))
+
+# Sonda capacitiva típica (v1.2 a 3.3V): ~85% de la escala en aire seco,
+# ~40% sumergida en agua, con la respuesta aplanada cerca de los extremos
+CURVA_CAPACITIVA_TIPICA = CurvaCalibracion(
+    fracciones=(0.40, 0.46, 0.55, 0.64, 0.74, 0.85),
+    porcentajes=(100.0, 88.0, 65.0, 42.0, 18.0, 0.0),
+)
+
+
+class CalibradorSensores:
+    """
+    Registro de curvas de calibración por sensor con tablas precompiladas.
+
+    Cada sensor (p.ej. "humedad", "luz") tiene una curva; la tabla de
+    consulta de cada combinación sensor/resolución se compila la primera
+    vez que se usa y se reutiliza después.
+
+    Atributos:
+        bits (int): Resolución por defecto del ADC (10 o 12)
+        curvas (Dict[str, CurvaCalibracion]): Curva registrada por sensor
+
+    Ejemplo:
+        >>> calibrador = CalibradorSensores()
+        >>> calibrador.convertir_uno("humedad", 512)
+        50.05
+    """
+
+    def __init__(self, bits: int = 10, curvas: Optional[Dict[str, CurvaCalibracion]] = None):
+        """
+        Args:
+            bits: Resolución por defecto del ADC (10 o 12)
+            curvas: Curvas iniciales por sensor. Si es None, "humedad" y
+                    "luz" usan la curva lineal (mismo resultado que
+                    normalizar_sensor).
+
+        Raises:
+            ValueError: Si la resolución no está soportada
+        """
+        if bits not in BITS_SOPORTADOS:
+            raise ValueError(f"bits debe ser uno de {BITS_SOPORTADOS}")
+
+        self.bits = bits
+        self.curvas: Dict[str, CurvaCalibracion] = (
+            dict(curvas) if curvas is not None
+            else {"humedad": CURVA_LINEAL, "luz": CURVA_LINEAL}
+        )
+        self._tablas: Dict[Tuple[str, int], np.ndarray] = {}
+
+    def registrar(self, sensor: str, curva: CurvaCalibracion) -> None:
+        """
+        Registra (o reemplaza) la curva de un sensor.
+
+        Args:
+            sensor: Nombre del sensor (ej: "humedad")
+            curva: Curva de calibración a usar
+        """
+        self.curvas[sensor] = curva
+        for clave in [c for c in self._tablas if c[0] == sensor]:
+            del self._tablas[clave]
+
+    def tabla(self, sensor: str, bits: Optional[int] = None) -> np.ndarray:
+        """
+        Devuelve la tabla de consulta de un sensor, compilándola si hace falta.
+
+        Args:
+            sensor: Nombre del sensor
+            bits: Resolución del ADC (default: la del calibrador)
+
+        Returns:
+            Array de solo lectura con 2^bits porcentajes
+
+        Raises:
+            KeyError: Si el sensor no tiene curva registrada
+        """
+        bits = self.bits if bits is None else bits
+        clave = (sensor, bits)
+        tabla = self._tablas.get(clave)
+        if tabla is None:
+            if sensor not in self.curvas:
+                raise KeyError(f"No hay curva de calibración para el sensor '{sensor}'")
+            tabla = self.curvas[sensor].compilar(bits)
+            self._tablas[clave] = tabla
+        return tabla
+
+    def convertir(self, sensor: str, codigos: np.ndarray, bits: Optional[int] = None) -> np.ndarray:
+        """
+        Convierte un array de códigos crudos a porcentajes.
+
+        Los códigos fuera del rango del ADC se recortan al extremo más
+        cercano, igual que el recorte 0-100 de normalizar_sensor.
+
+        Args:
+            sensor: Nombre del sensor
+            codigos: Array (de cualquier forma) de lecturas crudas
+            bits: Resolución del ADC (default: la del calibrador)
+
+        Returns:
+            Array de porcentajes con la misma forma que `codigos`
+        """
+        return np.take(self.tabla(sensor, bits), np.asarray(codigos), mode='clip')
+
+    def convertir_uno(self, sensor: str, codigo: int, bits: Optional[int] = None) -> float:
+        """
+        Convierte una sola lectura cruda a porcentaje.
+
+        Args:
+            sensor: Nombre del sensor
+            codigo: Lectura cruda del ADC
+            bits: Resolución del ADC (default: la del calibrador)
+
+        Returns:
+            float: Porcentaje calibrado entre 0.0 y 100.0
+        """
+        tabla = self.tabla(sensor, bits)
+        return float(tabla[min(max(int(codigo), 0), len(tabla) - 1)])
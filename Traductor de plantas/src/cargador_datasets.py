@@ -0,0 +1,302 @@
+"""
+Carga de datasets de lecturas con índice por planta y cache en memoria.
+
+Este módulo proporciona:
+- DatasetPorPlanta: filas agrupadas por planta en tramos contiguos
+- cargar_dataset_largo(): formato largo (dataset_plantas_960.csv)
+- cargar_dataset_ancho(): formato ancho (plantas_humedad_30dias.csv)
+- cargar_dataset_txt(): volcado de texto (plantas_humedad_30dias.txt)
+- cargar_dataset(): detecta el formato automáticamente (también .xlsx,
+  ver ingesta_excel)
+- limpiar_cache(): descarta los datasets cacheados
+
+Antes, cada dashboard leía el CSV completo con pandas y filtraba con una
+máscara booleana sobre las 48.000 filas. Aquí el archivo se parsea UNA
+vez, las filas se reordenan para que las de cada planta queden contiguas
+y se guarda el desplazamiento de inicio de cada planta. El resultado se
+cachea por ruta y se invalida cuando cambia la fecha de modificación o el
+tamaño del archivo, así que acceder a una planta es un `slice` sobre un
+array de NumPy (microsegundos).
+
+Además, cada archivo parseado se guarda en formato canónico binario
+(ver conversion_datasets), así que los procesos siguientes tampoco
+vuelven a parsear el texto mientras el archivo no cambie. Los archivos
+comprimidos (.gz, .xz, .bz2) se leen descomprimiendo al vuelo.
+
+Ejemplo:
+    >>> dataset = cargar_dataset("data/dataset_plantas_960.csv")
+    >>> humedad = dataset.serie("Acacia", "humedad_pct")
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from compresion import abrir, ruta_sin_compresion
+
+
+PREFIJO_DIA = "Día_"
+
+
+@dataclass
+class DatasetPorPlanta:
+    """
+    Dataset en formato largo con las filas de cada planta contiguas.
+
+    Atributos:
+        nombres (List[str]): Nombres de las plantas, en orden de aparición
+        inicios (np.ndarray): Desplazamientos de inicio (len(nombres) + 1);
+                              las filas de la planta i son inicios[i]:inicios[i+1]
+        columnas (Dict[str, np.ndarray]): Columnas numéricas reordenadas por planta
+    """
+    nombres: List[str]
+    inicios: np.ndarray
+    columnas: Dict[str, np.ndarray]
+    _posiciones: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        """
+        Construye el índice nombre -> posición.
+
+        Contiene cada nombre tal cual y en minúsculas (como buscar_planta
+        del catálogo). Si dos plantas solo difieren en mayúsculas, el nombre
+        exacto gana sobre la forma en minúsculas.
+        """
+        if not self._posiciones:
+            for i, n in enumerate(self.nombres):
+                self._posiciones.setdefault(n.lower(), i)
+            self._posiciones.update((n, i) for i, n in enumerate(self.nombres))
+
+    def __len__(self) -> int:
+        return len(self.nombres)
+
+    def __contains__(self, nombre: str) -> bool:
+        return nombre in self._posiciones or nombre.lower() in self._posiciones
+
+    def posicion(self, nombre: str) -> int:
+        """
+        Busca la posición de una planta, sin distinguir mayúsculas.
+
+        Raises:
+            ValueError: Si la planta no está en el dataset
+        """
+        if nombre in self._posiciones:
+            return self._posiciones[nombre]
+        try:
+            return self._posiciones[nombre.lower()]
+        except KeyError:
+            raise ValueError(f"No se encontró la planta '{nombre}' en el dataset.") from None
+
+    def tramo(self, nombre: str) -> slice:
+        """Devuelve el tramo de filas de una planta."""
+        i = self.posicion(nombre)
+        return slice(int(self.inicios[i]), int(self.inicios[i + 1]))
+
+    def serie(self, nombre: str, columna: str = "humedad_pct") -> np.ndarray:
+        """
+        Devuelve una columna de una planta como vista (sin copia).
+
+        Args:
+            nombre: Nombre de la planta
+            columna: Nombre de la columna (default: "humedad_pct")
+
+        Returns:
+            np.ndarray con las lecturas de esa planta
+        """
+        return self.columnas[columna][self.tramo(nombre)]
+
+    def filas(self, nombre: str) -> Dict[str, np.ndarray]:
+        """Devuelve todas las columnas de una planta."""
+        tramo = self.tramo(nombre)
+        return {columna: valores[tramo] for columna, valores in self.columnas.items()}
+
+    def matriz(self, columna: str = "humedad_pct") -> np.ndarray:
+        """
+        Devuelve una columna como matriz plantas × lecturas.
+
+        La fila i contiene las lecturas de nombres[i] en orden; las plantas
+        con menos lecturas se completan con NaN.
+
+        Args:
+            columna: Nombre de la columna (default: "humedad_pct")
+
+        Returns:
+            np.ndarray float64 (len(nombres), máximo de lecturas por planta)
+        """
+        repeticiones = np.diff(self.inicios)
+        valores = np.asarray(self.columnas[columna], dtype=np.float64)
+        matriz = np.full((len(self.nombres), int(repeticiones.max(initial=0))), np.nan)
+        filas = np.repeat(np.arange(len(self.nombres)), repeticiones)
+        posiciones = np.arange(len(valores)) - np.repeat(self.inicios[:-1], repeticiones)
+        matriz[filas, posiciones] = valores
+        return matriz
+
+
+# Cache: ruta absoluta -> ((mtime_ns, tamaño), dataset)
+_CACHE: Dict[str, Tuple[Tuple[int, int], DatasetPorPlanta]] = {}
+
+
+def _firma_archivo(ruta: str) -> Tuple[int, int]:
+    """Firma que cambia cuando el archivo se modifica."""
+    estado = os.stat(ruta)
+    return estado.st_mtime_ns, estado.st_size
+
+
+def _agrupar(plantas: np.ndarray, columnas: Dict[str, np.ndarray]) -> DatasetPorPlanta:
+    """
+    Reordena las filas para dejar contiguas las de cada planta.
+
+    Args:
+        plantas: Nombre de planta de cada fila
+        columnas: Columnas numéricas, en el mismo orden de filas
+
+    Returns:
+        DatasetPorPlanta con las filas agrupadas (orden estable dentro de cada planta)
+    """
+    codigos, nombres = pd.factorize(plantas)
+    orden = np.argsort(codigos, kind="stable")
+    inicios = np.zeros(len(nombres) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(codigos, minlength=len(nombres)), out=inicios[1:])
+    return DatasetPorPlanta(
+        nombres=[str(n) for n in nombres],
+        inicios=inicios,
+        columnas={nombre: np.ascontiguousarray(valores[orden])
+                  for nombre, valores in columnas.items()},
+    )
+
+
+def _parsear_largo(ruta: str) -> DatasetPorPlanta:
+    """Parsea un CSV largo (una fila por planta y día, columna 'planta')."""
+    with abrir(ruta) as f:
+        df = pd.read_csv(f)
+    columnas = {c: df[c].to_numpy() for c in df.columns if c != "planta"}
+    return _agrupar(df["planta"].to_numpy(), columnas)
+
+
+def _parsear_ancho(ruta: str) -> DatasetPorPlanta:
+    """Parsea un CSV ancho (una fila por planta, columnas Día_1 ... Día_N)."""
+    with abrir(ruta) as f:
+        df = pd.read_csv(f)
+    columnas_dias = [c for c in df.columns if c.startswith(PREFIJO_DIA)]
+    matriz = df[columnas_dias].to_numpy(dtype=np.float64)
+    n_plantas, n_dias = matriz.shape
+    # Las filas ya son una por planta: basta con aplanar la matriz
+    return _agrupar(
+        np.repeat(df["Planta"].to_numpy(), n_dias),
+        {
+            "dia": np.tile(np.arange(1, n_dias + 1), n_plantas),
+            "humedad_pct": matriz.ravel(),
+        },
+    )
+
+
+def _parsear_txt(ruta: str) -> DatasetPorPlanta:
+    """Parsea el volcado de texto de plantas.py."""
+    from conversion_datasets import parsear_txt
+    return parsear_txt(ruta)
+
+
+def _cargar_con_cache(ruta: str, parsear) -> DatasetPorPlanta:
+    """
+    Devuelve el dataset cacheado en memoria o, si el archivo cambió, lo
+    carga de su formato canónico en disco (o lo parsea y lo guarda).
+    """
+    from conversion_datasets import cargar_o_convertir
+
+    ruta_abs = os.path.abspath(ruta)
+    firma = _firma_archivo(ruta_abs)
+    en_cache = _CACHE.get(ruta_abs)
+    if en_cache is not None and en_cache[0] == firma:
+        return en_cache[1]
+    dataset = cargar_o_convertir(ruta_abs, parsear)
+    _CACHE[ruta_abs] = (firma, dataset)
+    return dataset
+
+
+def cargar_dataset_largo(ruta: str) -> DatasetPorPlanta:
+    """
+    Carga un dataset en formato largo (columnas: planta, dia, humedad_pct, ...).
+
+    Args:
+        ruta: Ruta del CSV
+
+    Returns:
+        DatasetPorPlanta (cacheado mientras el archivo no cambie)
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+    """
+    return _cargar_con_cache(ruta, _parsear_largo)
+
+
+def cargar_dataset_ancho(ruta: str) -> DatasetPorPlanta:
+    """
+    Carga un dataset en formato ancho (columnas: Planta, Día_1, ..., Día_N).
+
+    Las lecturas quedan en las columnas "dia" y "humedad_pct", igual que
+    en el formato largo.
+
+    Args:
+        ruta: Ruta del CSV
+
+    Returns:
+        DatasetPorPlanta (cacheado mientras el archivo no cambie)
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+    """
+    return _cargar_con_cache(ruta, _parsear_ancho)
+
+
+def cargar_dataset_txt(ruta: str) -> DatasetPorPlanta:
+    """
+    Carga el volcado de texto ("   1. Nombre | v1, v2, ...").
+
+    Args:
+        ruta: Ruta del TXT
+
+    Returns:
+        DatasetPorPlanta con columnas "dia" y "humedad_pct"
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+    """
+    return _cargar_con_cache(ruta, _parsear_txt)
+
+
+def cargar_dataset(ruta: str) -> DatasetPorPlanta:
+    """
+    Carga un dataset detectando su formato por la cabecera.
+
+    Args:
+        ruta: Ruta del CSV (largo o ancho), del TXT o de un libro .xlsx;
+              CSV y TXT pueden estar comprimidos (.gz, .xz, .bz2)
+
+    Returns:
+        DatasetPorPlanta
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+        ValueError: Si el formato no se reconoce
+    """
+    extension = os.path.splitext(ruta_sin_compresion(ruta))[1].lower()
+    if extension == ".xlsx":
+        from ingesta_excel import cargar_dataset_excel
+        return cargar_dataset_excel(ruta)
+    if extension == ".txt":
+        return cargar_dataset_txt(ruta)
+    with abrir(ruta) as f:
+        cabecera = f.readline().strip().split(",")
+    if "planta" in cabecera:
+        return cargar_dataset_largo(ruta)
+    if "Planta" in cabecera and any(c.startswith(PREFIJO_DIA) for c in cabecera):
+        return cargar_dataset_ancho(ruta)
+    raise ValueError(f"Formato de dataset no reconocido: {ruta}")
+
+
+def limpiar_cache() -> None:
+    """Descarta todos los datasets cacheados."""
+    _CACHE.clear()
@@ -0,0 +1,133 @@
+"""
+Apertura transparente de archivos comprimidos (gzip, lzma/xz, bz2).
+
+Este módulo proporciona:
+- formato_compresion(): detecta la compresión por extensión o por contenido
+- abrir(): como open(), pero descomprime/comprime al vuelo
+- ruta_sin_compresion(): quita la extensión de compresión (para detectar
+  si el archivo es .csv, .txt, ...)
+
+Los datasets de lecturas son texto muy repetitivo (el nombre de la planta
+y sus umbrales se repiten en cada fila), así que comprimidos ocupan una
+fracción del espacio. Todos los lectores y escritores de datasets del
+proyecto abren los archivos a través de `abrir()`: basta con nombrar el
+archivo `dataset.csv.gz` (o `.xz`, `.bz2`) y la compresión se aplica
+por bloques, sin descomprimir nunca el archivo completo a disco.
+
+Ejemplo:
+    >>> with abrir("dataset_plantas_960.csv.gz", "wt") as f:
+    ...     f.write("planta,dia,humedad_pct\\n")
+    >>> with abrir("dataset_plantas_960.csv.gz") as f:
+    ...     cabecera = f.readline()
+"""
+
+import bz2
+import gzip
+import lzma
+import os
+from typing import IO, Dict, Optional
+
+
+# Extensión -> formato
+EXTENSIONES: Dict[str, str] = {
+    ".gz": "gzip",
+    ".xz": "lzma",
+    ".lzma": "lzma",
+    ".bz2": "bz2",
+}
+
+# Bytes iniciales de cada formato, para archivos sin extensión reconocible
+FIRMAS: Dict[bytes, str] = {
+    b"\x1f\x8b": "gzip",
+    b"\xfd7zXZ\x00": "lzma",
+    b"BZh": "bz2",
+}
+
+_MODULOS = {"gzip": gzip, "lzma": lzma, "bz2": bz2}
+
+# gzip usa el nivel 9 por defecto: 3-4 veces más lento que el 6 y apenas
+# reduce más un CSV como los del proyecto
+NIVELES_POR_DEFECTO: Dict[str, int] = {"gzip": 6}
+
+
+def formato_compresion(ruta: str, leer_contenido: bool = True) -> Optional[str]:
+    """
+    Determina la compresión de un archivo.
+
+    La extensión tiene prioridad. Si no es de compresión y el archivo
+    existe, se comparan sus primeros bytes con las firmas conocidas.
+
+    Args:
+        ruta: Ruta del archivo
+        leer_contenido: Si False, solo se mira la extensión
+
+    Returns:
+        "gzip", "lzma", "bz2" o None si no está comprimido
+    """
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension in EXTENSIONES:
+        return EXTENSIONES[extension]
+    if leer_contenido and os.path.isfile(ruta):
+        with open(ruta, "rb") as f:
+            inicio = f.read(6)
+        for firma, formato in FIRMAS.items():
+            if inicio.startswith(firma):
+                return formato
+    return None
+
+
+def ruta_sin_compresion(ruta: str) -> str:
+    """
+    Quita la extensión de compresión: "datos.csv.gz" -> "datos.csv".
+
+    Args:
+        ruta: Ruta del archivo
+
+    Returns:
+        La ruta sin la extensión de compresión (o la misma si no tiene)
+    """
+    base, extension = os.path.splitext(ruta)
+    return base if extension.lower() in EXTENSIONES else ruta
+
+
+def abrir(ruta: str, modo: str = "rt", encoding: Optional[str] = "utf-8",
+          newline: Optional[str] = None, nivel: Optional[int] = None) -> IO:
+    """
+    Abre un archivo, comprimido o no, con la interfaz de open().
+
+    Al leer o anexar, la compresión se detecta por extensión o contenido;
+    al crear un archivo ("w"), solo por extensión. Los datos se
+    (des)comprimen por bloques a medida que se leen o escriben.
+
+    Args:
+        ruta: Ruta del archivo
+        modo: "rt", "wt", "at", "rb", "wb" o "ab" ("r", "w" y "a" equivalen a texto)
+        encoding: Codificación en modo texto (ignorada en modo binario)
+        newline: Como en open() (usar "" para escribir CSV)
+        nivel: Nivel de compresión (None = NIVELES_POR_DEFECTO o el del formato)
+
+    Returns:
+        Objeto archivo
+
+    Raises:
+        ValueError: Si el modo no es válido
+    """
+    if modo in ("r", "w", "a"):
+        modo += "t"
+    if modo not in ("rt", "wt", "at", "rb", "wb", "ab"):
+        raise ValueError(f"Modo no válido: '{modo}'")
+
+    binario = modo.endswith("b")
+    formato = formato_compresion(ruta, leer_contenido=not modo.startswith("w"))
+    if formato is None:
+        if binario:
+            return open(ruta, modo)
+        return open(ruta, modo, encoding=encoding, newline=newline)
+
+    opciones = {}
+    nivel = nivel if nivel is not None else NIVELES_POR_DEFECTO.get(formato)
+    if nivel is not None and not modo.startswith("r"):
+        opciones["preset" if formato == "lzma" else "compresslevel"] = nivel
+    if binario:
+        return _MODULOS[formato].open(ruta, modo, **opciones)
+    return _MODULOS[formato].open(ruta, modo, encoding=encoding, newline=newline, **opciones)
@@ -0,0 +1,381 @@
+"""
+Conversión entre los formatos de dataset y cache en formato canónico binario.
+
+Este módulo proporciona:
+- ancho_a_largo() / largo_a_ancho(): pivotes vectorizados entre DataFrames
+- dataset_a_largo() / dataset_a_ancho(): DataFrames a partir de un DatasetPorPlanta
+- parsear_txt(): lee el volcado de texto (plantas_humedad_30dias.txt)
+- carpeta_cache(): carpeta donde se guardan los .npz canónicos
+- guardar_canonico() / cargar_canonico(): formato .npz con índice por planta
+- cargar_o_convertir(): usa el .npz si está al día o lo regenera
+
+Los mismos datos de humedad existen en formato ancho (Planta, Día_1 ...
+Día_30), largo (planta, dia, humedad_pct, ...), TXT y Excel. Todos se
+reducen a la misma forma canónica, un DatasetPorPlanta (nombres, inicios,
+columnas), que se guarda como .npz junto con la firma (fecha de
+modificación y tamaño) del archivo de origen. La siguiente carga, incluso
+en otro proceso, lee los arrays binarios directamente en lugar de volver
+a parsear el texto.
+
+Los .npz se guardan en la cache del usuario (~/.cache/traductor_plantas,
+o $XDG_CACHE_HOME), no junto a los datos: leer un dataset no escribe
+nada en su carpeta, que puede ser de solo lectura o estar versionada. La
+variable de entorno TRADUCTOR_PLANTAS_CACHE elige otra carpeta.
+
+Uso desde la línea de comandos:
+    python conversion_datasets.py data/plantas_humedad_30dias.csv largo.csv --formato largo
+    python conversion_datasets.py data/dataset_plantas_960.csv ancho.csv --formato ancho
+"""
+
+import argparse
+import hashlib
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from cargador_datasets import DatasetPorPlanta, PREFIJO_DIA, _agrupar
+from compresion import abrir
+
+
+VERSION_CANONICA = 1
+VARIABLE_CACHE = "TRADUCTOR_PLANTAS_CACHE"
+PREFIJO_COLUMNA = "columna:"
+
+
+# ==========================================
+# PIVOTES ANCHO <-> LARGO
+# ==========================================
+
+def ancho_a_largo(df: pd.DataFrame, columna_valor: str = "humedad_pct") -> pd.DataFrame:
+    """
+    Convierte un DataFrame ancho (Planta, Día_1 ... Día_N) a formato largo.
+
+    Args:
+        df: DataFrame ancho
+        columna_valor: Nombre de la columna de lecturas en el resultado
+
+    Returns:
+        pd.DataFrame con columnas planta, dia y `columna_valor`
+
+    Raises:
+        ValueError: Si no hay columnas de días
+    """
+    columnas_dias = [c for c in df.columns if str(c).startswith(PREFIJO_DIA)]
+    if not columnas_dias:
+        raise ValueError(f"No se encontraron columnas '{PREFIJO_DIA}N'")
+
+    dias = np.array([int(str(c)[len(PREFIJO_DIA):]) for c in columnas_dias])
+    matriz = df[columnas_dias].to_numpy(dtype=np.float64)
+    n_plantas, n_dias = matriz.shape
+    return pd.DataFrame({
+        "planta": np.repeat(df["Planta"].to_numpy(), n_dias),
+        "dia": np.tile(dias, n_plantas),
+        columna_valor: matriz.ravel(),
+    })
+
+
+def largo_a_ancho(df: pd.DataFrame, columna_valor: str = "humedad_pct") -> pd.DataFrame:
+    """
+    Convierte un DataFrame largo (planta, dia, ...) a formato ancho.
+
+    Las plantas quedan en orden de primera aparición. Si a una planta le
+    falta algún día, su celda queda como NaN.
+
+    Args:
+        df: DataFrame largo
+        columna_valor: Columna que se reparte en Día_1 ... Día_N
+
+    Returns:
+        pd.DataFrame con columnas Planta, Día_1 ... Día_N
+
+    Raises:
+        ValueError: Si algún día es menor que 1
+    """
+    codigos, nombres = pd.factorize(df["planta"])
+    dias = df["dia"].to_numpy(dtype=np.int64)
+    # Con dia <= 0, `dias - 1` sería un índice negativo y la lectura
+    # acabaría en silencio en las últimas columnas
+    if len(dias) and dias.min() < 1:
+        raise ValueError(f"Los días deben empezar en 1 (hay un día {int(dias.min())})")
+    n_dias = int(dias.max()) if len(dias) else 0
+
+    # Cada lectura va directamente a su celda (planta, día)
+    matriz = np.full((len(nombres), n_dias), np.nan)
+    matriz[codigos, dias - 1] = df[columna_valor].to_numpy(dtype=np.float64)
+
+    ancho = pd.DataFrame(matriz, columns=[f"{PREFIJO_DIA}{d}" for d in range(1, n_dias + 1)])
+    ancho.insert(0, "Planta", np.asarray(nombres, dtype=object))
+    return ancho
+
+
+def dataset_a_largo(dataset: DatasetPorPlanta) -> pd.DataFrame:
+    """
+    Expande un DatasetPorPlanta a un DataFrame largo.
+
+    Args:
+        dataset: Dataset canónico
+
+    Returns:
+        pd.DataFrame con la columna planta seguida de todas las columnas
+    """
+    repeticiones = np.diff(dataset.inicios)
+    datos = {"planta": np.repeat(np.asarray(dataset.nombres, dtype=object), repeticiones)}
+    datos.update(dataset.columnas)
+    return pd.DataFrame(datos)
+
+
+def dataset_a_ancho(dataset: DatasetPorPlanta, columna_valor: str = "humedad_pct") -> pd.DataFrame:
+    """
+    Pivota una columna de un DatasetPorPlanta a formato ancho.
+
+    Cuando todas las plantas tienen los días 1..N en orden, el pivote es
+    un simple reshape (sin copia de índices).
+
+    Args:
+        dataset: Dataset canónico
+        columna_valor: Columna que se reparte en Día_1 ... Día_N
+
+    Returns:
+        pd.DataFrame con columnas Planta, Día_1 ... Día_N
+    """
+    repeticiones = np.diff(dataset.inicios)
+    valores = dataset.columnas[columna_valor]
+    dias = dataset.columnas.get("dia")
+    n_dias = int(repeticiones[0]) if len(repeticiones) else 0
+
+    regular = (
+        len(repeticiones) > 0
+        and np.all(repeticiones == n_dias)
+        and dias is not None
+        and np.array_equal(dias, np.tile(np.arange(1, n_dias + 1), len(repeticiones)))
+    )
+    if not regular:
+        return largo_a_ancho(dataset_a_largo(dataset), columna_valor)
+
+    ancho = pd.DataFrame(np.asarray(valores, dtype=np.float64).reshape(len(dataset), n_dias),
+                         columns=[f"{PREFIJO_DIA}{d}" for d in range(1, n_dias + 1)])
+    ancho.insert(0, "Planta", np.asarray(dataset.nombres, dtype=object))
+    return ancho
+
+
+# ==========================================
+# FORMATO TXT
+# ==========================================
+
+def parsear_txt(ruta: str) -> DatasetPorPlanta:
+    """
+    Parsea el volcado de texto de plantas.py.
+
+    Formato de cada línea de datos:
+        "   1. Nombre de Planta       | 51.11, 43.85, ..., 47.20"
+
+    Las líneas de cabecera (sin " | ") se ignoran.
+
+    Args:
+        ruta: Ruta del archivo TXT
+
+    Returns:
+        DatasetPorPlanta con columnas "dia" y "humedad_pct"
+
+    Raises:
+        ValueError: Si las plantas no tienen el mismo número de días
+    """
+    nombres: List[str] = []
+    valores: List[str] = []
+    with abrir(ruta) as f:
+        for linea in f:
+            izquierda, separador, derecha = linea.partition(" | ")
+            if not separador:
+                continue
+            numero, punto, nombre = izquierda.strip().partition(". ")
+            if not punto or not numero.isdigit():
+                continue
+            nombres.append(nombre.strip())
+            valores.append(derecha)
+
+    if not nombres:
+        return _agrupar(np.array([], dtype=object),
+                        {"dia": np.array([], dtype=np.int64),
+                         "humedad_pct": np.array([], dtype=np.float64)})
+
+    # Un solo parseo numérico para todas las líneas
+    planos = np.array(", ".join(v.strip() for v in valores).split(", "), dtype=np.float64)
+    n_dias, resto = divmod(len(planos), len(nombres))
+    if resto:
+        raise ValueError(f"Las plantas de '{ruta}' no tienen el mismo número de días")
+
+    return _agrupar(
+        np.repeat(np.array(nombres, dtype=object), n_dias),
+        {
+            "dia": np.tile(np.arange(1, n_dias + 1), len(nombres)),
+            "humedad_pct": planos,
+        },
+    )
+
+
+# ==========================================
+# FORMATO CANÓNICO (.npz)
+# ==========================================
+
+def carpeta_cache() -> str:
+    """
+    Carpeta de los .npz canónicos.
+
+    Returns:
+        $TRADUCTOR_PLANTAS_CACHE si está definida; si no,
+        $XDG_CACHE_HOME/traductor_plantas (~/.cache/traductor_plantas)
+    """
+    elegida = os.environ.get(VARIABLE_CACHE)
+    if elegida:
+        return os.path.abspath(os.path.expanduser(elegida))
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "traductor_plantas")
+
+
+def ruta_canonica(ruta: str) -> str:
+    """
+    Ruta del .npz canónico de un archivo: <carpeta_cache()>/<archivo>-<hash de la ruta>.npz
+
+    El hash de la ruta absoluta distingue archivos con el mismo nombre en
+    carpetas distintas.
+    """
+    ruta_abs = os.path.abspath(ruta)
+    huella = hashlib.sha1(ruta_abs.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(carpeta_cache(), f"{os.path.basename(ruta_abs)}-{huella}.npz")
+
+
+def guardar_canonico(dataset: DatasetPorPlanta, ruta_npz: str,
+                     firma: Optional[Tuple[int, int]] = None) -> None:
+    """
+    Guarda un dataset en formato canónico.
+
+    El archivo se escribe en un temporal y se renombra, así que un lector
+    nunca ve un .npz a medio escribir.
+
+    Args:
+        dataset: Dataset a guardar
+        ruta_npz: Archivo de destino
+        firma: (mtime_ns, tamaño) del archivo de origen, para invalidar
+    """
+    arrays: Dict[str, np.ndarray] = {
+        "version": np.array(VERSION_CANONICA),
+        "nombres": np.array(dataset.nombres, dtype=str),
+        "inicios": dataset.inicios,
+        "firma": np.array(firma if firma is not None else (-1, -1), dtype=np.int64),
+    }
+    for nombre, valores in dataset.columnas.items():
+        arrays[PREFIJO_COLUMNA + nombre] = valores
+
+    os.makedirs(os.path.dirname(os.path.abspath(ruta_npz)), exist_ok=True)
+    temporal = ruta_npz + ".tmp"
+    with open(temporal, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(temporal, ruta_npz)
+
+
+def cargar_canonico(ruta_npz: str,
+                    firma: Optional[Tuple[int, int]] = None) -> Optional[DatasetPorPlanta]:
+    """
+    Carga un dataset canónico.
+
+    Args:
+        ruta_npz: Archivo .npz
+        firma: Si se indica, el .npz solo es válido si fue creado con esta
+               firma del archivo de origen
+
+    Returns:
+        DatasetPorPlanta, o None si no existe, es de otra versión o está
+        desactualizado
+    """
+    if not os.path.exists(ruta_npz):
+        return None
+    try:
+        with np.load(ruta_npz, allow_pickle=False) as datos:
+            if int(datos["version"]) != VERSION_CANONICA:
+                return None
+            if firma is not None and tuple(int(v) for v in datos["firma"]) != tuple(firma):
+                return None
+            return DatasetPorPlanta(
+                nombres=datos["nombres"].tolist(),
+                inicios=datos["inicios"],
+                columnas={clave[len(PREFIJO_COLUMNA):]: datos[clave]
+                          for clave in datos.files if clave.startswith(PREFIJO_COLUMNA)},
+            )
+    except (OSError, ValueError, KeyError):
+        # Archivo corrupto o incompleto: se regenera
+        return None
+
+
+def cargar_o_convertir(ruta: str, parsear: Callable[[str], DatasetPorPlanta]) -> DatasetPorPlanta:
+    """
+    Carga el formato canónico de un archivo, regenerándolo si hace falta.
+
+    Args:
+        ruta: Archivo de origen (CSV, TXT, ...)
+        parsear: Función que lee el archivo de origen
+
+    Returns:
+        DatasetPorPlanta
+    """
+    estado = os.stat(ruta)
+    firma = (estado.st_mtime_ns, estado.st_size)
+    ruta_npz = ruta_canonica(ruta)
+
+    dataset = cargar_canonico(ruta_npz, firma)
+    if dataset is not None:
+        return dataset
+
+    dataset = parsear(ruta)
+    try:
+        guardar_canonico(dataset, ruta_npz, firma)
+    except OSError as e:
+        # Carpeta de solo lectura: se trabaja sin cache en disco
+        print(f"⚠️  No se pudo guardar el formato canónico de '{ruta}': {e}")
+    return dataset
+
+
+# ==========================================
+# LÍNEA DE COMANDOS
+# ==========================================
+
+def convertir_archivo(entrada: str, salida: str, formato: str,
+                      columna_valor: str = "humedad_pct") -> None:
+    """
+    Convierte un dataset de un formato a otro.
+
+    Args:
+        entrada: Dataset de origen (cualquier formato que lea cargar_dataset)
+        salida: Archivo de destino (.gz/.xz/.bz2 para comprimir el CSV)
+        formato: "largo", "ancho" o "npz"
+        columna_valor: Columna usada en el formato ancho
+
+    Raises:
+        ValueError: Si el formato no es válido
+    """
+    from cargador_datasets import cargar_dataset
+
+    dataset = cargar_dataset(entrada)
+    if formato in ("largo", "ancho"):
+        df = dataset_a_largo(dataset) if formato == "largo" else dataset_a_ancho(dataset, columna_valor)
+        with abrir(salida, "wt", newline="") as f:
+            df.to_csv(f, index=False)
+    elif formato == "npz":
+        guardar_canonico(dataset, salida)
+    else:
+        raise ValueError(f"Formato no válido: '{formato}'. Usa largo, ancho o npz.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convierte datasets de humedad entre formatos.")
+    parser.add_argument("entrada", help="Dataset de origen (CSV largo/ancho o TXT)")
+    parser.add_argument("salida", help="Archivo de destino")
+    parser.add_argument("--formato", choices=["largo", "ancho", "npz"], default="largo",
+                        help="Formato de salida")
+    parser.add_argument("--columna", default="humedad_pct",
+                        help="Columna de lecturas para el formato ancho")
+    args = parser.parse_args()
+
+    convertir_archivo(args.entrada, args.salida, args.formato, args.columna)
+    print(f"✅ {args.entrada} -> {args.salida} ({args.formato})")
@@ -12,9 +12,10 @@ Características:
     - Comparación con rangos óptimos
     - Distribución de estados de planta
     - Métricas de temperatura y luz
+    - Mapa de calor de toda la flota (plantas × días) en una sola imagen
 
 Requisitos:
-    - matplotlib
+    - matplotlib (solo al dibujar: se importa la primera vez que hace falta)
     - numpy
     - pandas (opcional)
 
@@ -25,33 +26,77 @@ Uso:
 ================================================================================
 """
 
-import matplotlib.pyplot as plt
 import numpy as np
+import os
 import random
-from typing import List, Dict, Optional, Any
+import sys
+from typing import List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 
 # Importar desde el módulo de configuración de plantas
 from planta_config import buscar_planta, cargar_plantas
+from cache_render import clave_render
+from simulacion_rng import crear_generador, generador_planta
+# Re-exportada aquí por compatibilidad (la implementación vectorizada
+# vive en estados_planta, junto con la versión para toda la flota)
+from estados_planta import calcular_distribucion_estados, calcular_distribucion_estados_flota
+from estados_planta import contar_siempre_en_rango, desviacion_rango, orden_por_estado
+from sintetizador_series import (eje_temporal, serie_senoidal, sintetizar_humedad_flota,
+                                 sintetizar_series_planta)
+from submuestreo import presupuesto_puntos, submuestrear
+from estilo_dashboard import COLORES
+
+# pyplot se importa (y el estilo se aplica) la primera vez que se dibuja:
+# importar este módulo solo por sus utilidades no inicializa matplotlib
+ESTILO = 'seaborn-v0_8-darkgrid'
+_PLT = None
+
+
+def _sin_pantalla() -> bool:
+    """True si no hay pantalla donde abrir ventanas (servidor, CI, SSH)."""
+    if sys.platform in ('win32', 'darwin'):
+        return False
+    return not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+
+
+def obtener_pyplot() -> Any:
+    """
+    Importa matplotlib.pyplot y aplica el estilo de los dashboards (una sola vez).
+
+    Sin pantalla y sin un backend elegido por el usuario (MPLBACKEND,
+    matplotlibrc o matplotlib.use() previo), se selecciona Agg para no intentar cargar
+    backends interactivos. Los demás módulos que dibujan (dashboard_vivo)
+    obtienen pyplot con esta función para compartir backend y estilo.
+
+    Returns:
+        El módulo matplotlib.pyplot
+    """
+    global _PLT
+    if _PLT is None:
+        import matplotlib
+        # Backend ya fijado por matplotlib.use(), MPLBACKEND o matplotlibrc
+        # (None = se resolvería automáticamente)
+        elegido = getattr(matplotlib.rcParams, '_get_backend_or_none', lambda: None)()
+        if elegido is None and 'matplotlib.pyplot' not in sys.modules and _sin_pantalla():
+            matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        plt.style.use(ESTILO)
+        _PLT = plt
+    return _PLT
+
 
-# Configuración de estilo para gráficos
-plt.style.use('seaborn-v0_8-darkgrid')
-COLORES = {
-    'primario': '#2ecc71',
-    'secundario': '#3498db',
-    'peligro': '#e74c3c',
-    'advertencia': '#f39c12',
-    'info': '#9b59b6',
-    'exito': '#27ae60',
-    'neutro': '#95a5a6'
-}
+# Con más puntos que esto los marcadores se solapan y solo ralentizan el dibujo
+MAX_PUNTOS_CON_MARCADOR = 120
 
 
 def generar_dashboard_con_datos(
     nombre: str,
     dias: int = 30,
     guardar: bool = False,
-    nombre_archivo: Optional[str] = None
+    nombre_archivo: Optional[str] = None,
+    semilla: Optional[int] = None,
+    dpi: int = 300,
+    cache: Optional[Any] = None
 ) -> None:
     """
     Genera un dashboard para una planta específica con datos simulados realistas.
@@ -64,6 +109,9 @@ def generar_dashboard_con_datos(
         dias: Número de días de datos a simular (default: 30)
         guardar: Si True, guarda la imagen en lugar de mostrarla
         nombre_archivo: Nombre del archivo a guardar (si guardar=True)
+        semilla: Semilla de la simulación (mismos datos para la misma semilla)
+        dpi: Resolución de la imagen guardada
+        cache: CacheRender opcional (ver generar_dashboard)
 
     Ejemplo:
         >>> generar_dashboard_con_datos("Acacia")
@@ -72,58 +120,8 @@ def generar_dashboard_con_datos(
     # Buscar configuración de la planta
     planta = buscar_planta(nombre)
 
-    # Generar datos realistas de humedad con variación y patrón de riego
-    humedad_promedio = planta.humedad_promedio
-    humedad_desv = planta.humedad_desviacion
-    frecuencia_riego = planta.frecuencia_riego_dias
-
-    datos_humedad = []
-    for dia in range(dias):
-        # Simular patrón de riego: pico cada N días, luego decaimiento
-        dias_desde_riego = dia % frecuencia_riego
-
-        if dias_desde_riego == 0:
-            # Día de riego: valor cercano al máximo
-            valor = np.random.normal(planta.humedad_max - 5, humedad_desv)
-        else:
-            # Decaimiento gradual hasta el próximo riego
-            factor_decaimiento = dias_desde_riego / frecuencia_riego
-            valor_base = planta.humedad_max - (planta.humedad_max - planta.humedad_min) * factor_decaimiento
-            valor = np.random.normal(valor_base, humedad_desv)
-
-        # Limitar a rango válido
-        valor = max(planta.humedad_min - 5, min(planta.humedad_max + 5, valor))
-        datos_humedad.append(round(valor, 2))
-
-    # Generar datos realistas de temperatura con variación diaria/semanal
-    temp_promedio = (planta.temperatura_min + planta.temperatura_max) / 2
-    temp_rango = (planta.temperatura_max - planta.temperatura_min) / 2
-
-    datos_temperatura = []
-    for dia in range(dias):
-        # Variación sinusoidal semanal + ruido diario
-        variacion_semanal = np.sin(dia * 2 * np.pi / 7) * temp_rango * 0.6
-        ruido = np.random.normal(0, temp_rango * 0.2)
-        valor = temp_promedio + variacion_semanal + ruido
-
-        # Limitar a rango válido
-        valor = max(planta.temperatura_min - 2, min(planta.temperatura_max + 2, valor))
-        datos_temperatura.append(round(valor, 2))
-
-    # Generar datos realistas de luz con variación estacional
-    luz_promedio = (planta.luz_min + planta.luz_max) / 2
-    luz_rango = (planta.luz_max - planta.luz_min) / 2
-
-    datos_luz = []
-    for dia in range(dias):
-        # Variación sinusoidal mensual (estacional) + ruido
-        variacion_estacional = np.sin(dia * 2 * np.pi / 30) * luz_rango * 0.5
-        ruido = np.random.normal(0, luz_rango * 0.15)
-        valor = luz_promedio + variacion_estacional + ruido
-
-        # Limitar a rango válido
-        valor = max(planta.luz_min - 5, min(planta.luz_max + 5, valor))
-        datos_luz.append(round(valor, 2))
+    # Series completas de una vez: riego/secado, ciclo semanal y mensual
+    datos_humedad, datos_temperatura, datos_luz = sintetizar_series_planta(planta, dias, semilla)
 
     # Generar dashboard con los datos simulados
     generar_dashboard(
@@ -135,10 +133,298 @@ def generar_dashboard_con_datos(
         temperatura_optima=(planta.temperatura_min, planta.temperatura_max),
         luz_optima=(planta.luz_min, planta.luz_max),
         guardar=guardar,
-        nombre_archivo=nombre_archivo
+        nombre_archivo=nombre_archivo,
+        dpi=dpi,
+        cache=cache
     )
 
 
+def limpiar_nombre_archivo(texto: str) -> str:
+    """
+    Convierte un nombre de planta en un fragmento válido de nombre de archivo.
+
+    Reemplaza espacios y caracteres inválidos (/, \\, :, *, ?, ", <, >, |)
+    por '_' y elimina los paréntesis.
+
+    Ejemplo:
+        >>> limpiar_nombre_archivo("Acacia (Árbol)")
+        'Acacia_Árbol'
+    """
+    for caracter in ' /\\:*?"<>|':
+        texto = texto.replace(caracter, '_')
+    return texto.replace('(', '').replace(')', '')
+
+
+def _mover_banda(banda: Any, minimo: float, maximo: float) -> None:
+    """Cambia los límites verticales de una banda creada con axhspan."""
+    if hasattr(banda, 'set_height'):
+        # matplotlib >= 3.9: Rectangle
+        banda.set_y(minimo)
+        banda.set_height(maximo - minimo)
+    else:
+        # matplotlib < 3.9: Polygon
+        banda.set_xy([[0, minimo], [0, maximo], [1, maximo], [1, minimo], [0, minimo]])
+
+
+class RenderizadorDashboard:
+    """
+    Dashboard de 4 gráficos que se construye una sola vez y se reutiliza.
+
+    Crear la figura, los subgráficos, el eje gemelo, las bandas, las
+    leyendas y las etiquetas es la parte más cara de generar_dashboard.
+    Este objeto crea todos esos elementos en el constructor y, para cada
+    planta, solo actualiza los datos de las líneas, los límites de las
+    bandas, la altura de las barras y los textos; el espaciado entre
+    gráficos solo se recalcula cuando cambian las etiquetas de los ejes Y.
+    Pensado para lotes (render_lotes) y vistas que se redibujan muchas veces.
+
+    Ejemplo:
+        >>> renderizador = RenderizadorDashboard()
+        >>> for planta in plantas:
+        ...     renderizador.actualizar(humedad, temp, luz, planta.nombre)
+        ...     renderizador.guardar(f"dashboard_{planta.nombre}.png", dpi=100)
+        >>> renderizador.cerrar()
+    """
+
+    def __init__(self, figsize: Tuple[float, float] = (16, 10), submuestreo: Optional[str] = 'lttb'):
+        """
+        Construye la figura y todos sus elementos (vacíos).
+
+        Args:
+            figsize: Tamaño de la figura en pulgadas
+            submuestreo: Método para reducir las series largas al ancho en
+                         píxeles de su gráfico ('lttb' o 'min_max', ver
+                         submuestreo); None dibuja todos los puntos
+        """
+        self.submuestreo = submuestreo
+        self._plt = plt = obtener_pyplot()
+        self.fig = plt.figure(figsize=figsize)
+        self._titulo = self.fig.suptitle('Dashboard de Monitoreo', fontsize=18, fontweight='bold', y=0.98)
+
+        # ===== GRÁFICO 1: Evolución de Humedad =====
+        ax1 = self.fig.add_subplot(2, 2, 1)
+        self._linea_humedad, = ax1.plot([], [], color=COLORES['primario'], linewidth=2.5,
+                                        marker='o', markersize=4, label='Humedad medida')
+        self._banda_humedad = ax1.axhspan(0, 1, alpha=0.2, color=COLORES['exito'], label='Rango óptimo')
+        self._limites_humedad = [
+            ax1.axhline(y=0, color=COLORES['advertencia'], linestyle='--', linewidth=1, alpha=0.6)
+            for _ in range(2)
+        ]
+        self._promedio_humedad = ax1.axhline(y=0, color=COLORES['info'], linestyle=':',
+                                             linewidth=2, label='Promedio')
+        ax1.set_xlabel('Días', fontsize=11, fontweight='bold')
+        ax1.set_ylabel('Humedad del Suelo (%)', fontsize=11, fontweight='bold')
+        self._titulo_humedad = ax1.set_title('Evolución de Humedad (30 días)', fontsize=13,
+                                             fontweight='bold', pad=10)
+        entradas = [self._linea_humedad, self._banda_humedad, self._promedio_humedad]
+        leyenda = ax1.legend(handles=entradas, labels=[e.get_label() for e in entradas],
+                             loc='best', framealpha=0.9)
+        self._texto_promedio = dict(zip(entradas, leyenda.get_texts()))[self._promedio_humedad]
+        ax1.grid(True, alpha=0.3)
+
+        # ===== GRÁFICO 2: Temperatura y Luz =====
+        ax2 = self.fig.add_subplot(2, 2, 2)
+        ax2_luz = ax2.twinx()
+        self._linea_temperatura, = ax2.plot([], [], color=COLORES['peligro'], linewidth=2.5,
+                                            marker='s', markersize=4, label='Temperatura')
+        self._linea_luz, = ax2_luz.plot([], [], color=COLORES['secundario'], linewidth=2.5,
+                                        marker='^', markersize=4, label='Luz')
+        self._banda_temperatura = ax2.axhspan(0, 1, alpha=0.15, color=COLORES['peligro'])
+        self._banda_luz = ax2_luz.axhspan(0, 1, alpha=0.15, color=COLORES['secundario'])
+        ax2.set_xlabel('Días', fontsize=11, fontweight='bold')
+        ax2.set_ylabel('Temperatura (°C)', fontsize=11, fontweight='bold', color=COLORES['peligro'])
+        ax2_luz.set_ylabel('Luz (%)', fontsize=11, fontweight='bold', color=COLORES['secundario'])
+        ax2.set_title('Temperatura y Niveles de Luz', fontsize=13, fontweight='bold', pad=10)
+        lineas = [self._linea_temperatura, self._linea_luz]
+        ax2.legend(handles=lineas, labels=[l.get_label() for l in lineas], loc='best', framealpha=0.9)
+        ax2.tick_params(axis='y', labelcolor=COLORES['peligro'])
+        ax2_luz.tick_params(axis='y', labelcolor=COLORES['secundario'])
+        ax2.grid(True, alpha=0.3)
+
+        # ===== GRÁFICO 3: Distribución de Estados =====
+        ax3 = self.fig.add_subplot(2, 2, 3)
+        self._barras_estados = ax3.bar(['Óptimo', 'Aceptable', 'Crítico'], [0, 0, 0],
+                                       color=[COLORES['exito'], COLORES['advertencia'], COLORES['peligro']],
+                                       edgecolor='black', linewidth=1.5, alpha=0.8)
+        self._textos_estados = [
+            ax3.text(barra.get_x() + barra.get_width() / 2., 0, '', ha='center', va='bottom',
+                     fontsize=10, fontweight='bold')
+            for barra in self._barras_estados
+        ]
+        ax3.set_ylabel('Número de Días', fontsize=11, fontweight='bold')
+        ax3.set_title('Distribución de Estados de Salud', fontsize=13, fontweight='bold', pad=10)
+        ax3.grid(True, axis='y', alpha=0.3)
+
+        # ===== GRÁFICO 4: Comparación con Rangos Óptimos =====
+        ax4 = self.fig.add_subplot(2, 2, 4)
+        categorias = ['Humedad\n(%)', 'Temperatura\n(°C)', 'Luz\n(%)']
+        x_pos = np.arange(len(categorias))
+        width = 0.35
+        self._barras_comparacion = [
+            ax4.bar(x_pos - width/2, [0, 0, 0], width, label='Promedio Real', color=COLORES['primario'],
+                    edgecolor='black', linewidth=1.5, alpha=0.8),
+            ax4.bar(x_pos + width/2, [0, 0, 0], width, label='Óptimo Ideal', color=COLORES['info'],
+                    edgecolor='black', linewidth=1.5, alpha=0.8),
+        ]
+        self._textos_comparacion = [
+            [ax4.text(barra.get_x() + barra.get_width() / 2., 0, '', ha='center', va='bottom',
+                      fontsize=9, fontweight='bold') for barra in barras]
+            for barras in self._barras_comparacion
+        ]
+        ax4.set_ylabel('Valor Promedio', fontsize=11, fontweight='bold')
+        ax4.set_title('Comparación: Real vs Óptimo', fontsize=13, fontweight='bold', pad=10)
+        ax4.set_xticks(x_pos)
+        ax4.set_xticklabels(categorias, fontsize=10)
+        ax4.legend(loc='upper right', framealpha=0.9)
+        ax4.grid(True, axis='y', alpha=0.3)
+
+        self._ejes = (ax1, ax2, ax2_luz, ax3, ax4)
+        self._marcadores = {linea: linea.get_marker() for linea in
+                            (self._linea_humedad, self._linea_temperatura, self._linea_luz)}
+
+        self._firma_layout: Optional[Tuple[Tuple[str, ...], ...]] = None
+        self._ajustar_layout()
+
+        self._marca_tiempo = self.fig.text(0.99, 0.01, '', ha='right', va='bottom',
+                                           fontsize=8, style='italic', alpha=0.6)
+
+    def actualizar(
+        self,
+        datos_humedad: List[float],
+        datos_temperatura: List[float],
+        datos_luz: List[float],
+        nombre_planta: str = "Planta",
+        humedad_optima: tuple = (40.0, 70.0),
+        temperatura_optima: tuple = (18.0, 26.0),
+        luz_optima: tuple = (50.0, 80.0),
+        dpi: Optional[float] = None
+    ) -> None:
+        """
+        Actualiza todos los gráficos con los datos de una planta.
+
+        Las líneas se dibujan con las series reducidas a los píxeles de su
+        gráfico, así que el tiempo de dibujo no crece con el historial; las
+        estadísticas (promedios y estados) usan siempre las series completas.
+
+        Args:
+            datos_humedad: Lecturas de humedad (%)
+            datos_temperatura: Lecturas de temperatura (°C)
+            datos_luz: Lecturas de luz (%)
+            nombre_planta: Nombre de la planta para el título
+            humedad_optima: Tupla (min, max) de humedad óptima
+            temperatura_optima: Tupla (min, max) de temperatura óptima
+            luz_optima: Tupla (min, max) de luz óptima
+            dpi: Resolución a la que se va a guardar (fija cuántos puntos
+                 caben en cada gráfico; None = la de la figura)
+        """
+        ax1, ax2, ax2_luz, ax3, ax4 = self._ejes
+        dias = len(datos_humedad)
+        dpi = self.fig.dpi if dpi is None else dpi
+        self._titulo.set_text(f'Dashboard de Monitoreo: {nombre_planta}')
+
+        # Gráfico 1: humedad, banda óptima y promedio
+        self._dibujar_serie(self._linea_humedad, datos_humedad, dpi)
+        _mover_banda(self._banda_humedad, *humedad_optima)
+        for linea, limite in zip(self._limites_humedad, humedad_optima):
+            linea.set_ydata([limite, limite])
+        promedio_humedad = float(np.mean(datos_humedad))
+        self._promedio_humedad.set_ydata([promedio_humedad, promedio_humedad])
+        self._texto_promedio.set_text(f'Promedio: {promedio_humedad:.1f}%')
+        self._titulo_humedad.set_text(f'Evolución de Humedad ({dias} días)')
+
+        # Gráfico 2: temperatura y luz
+        self._dibujar_serie(self._linea_temperatura, datos_temperatura, dpi)
+        self._dibujar_serie(self._linea_luz, datos_luz, dpi)
+        _mover_banda(self._banda_temperatura, *temperatura_optima)
+        _mover_banda(self._banda_luz, *luz_optima)
+
+        for eje in (ax1, ax2, ax2_luz):
+            eje.relim()
+            eje.autoscale_view(scalex=False)
+            eje.set_xlim(0, dias + 1)
+
+        # Gráfico 3: distribución de estados
+        estados = calcular_distribucion_estados(
+            datos_humedad, datos_temperatura, datos_luz,
+            humedad_optima, temperatura_optima, luz_optima
+        )
+        valores_estados = list(estados.values())
+        for barra, texto, valor in zip(self._barras_estados, self._textos_estados, valores_estados):
+            barra.set_height(valor)
+            texto.set_y(valor)
+            texto.set_text(f'{valor}\n({valor/max(dias, 1)*100:.0f}%)')
+        ax3.set_ylim(0, max(max(valores_estados), 1) * 1.2)
+
+        # Gráfico 4: promedios reales frente a óptimos
+        promedios = [
+            [np.mean(datos_humedad), np.mean(datos_temperatura), np.mean(datos_luz)],
+            [np.mean(humedad_optima), np.mean(temperatura_optima), np.mean(luz_optima)],
+        ]
+        for barras, textos, valores in zip(self._barras_comparacion, self._textos_comparacion, promedios):
+            for barra, texto, valor in zip(barras, textos, valores):
+                barra.set_height(valor)
+                texto.set_y(valor)
+                texto.set_text(f'{valor:.1f}')
+        ax4.relim()
+        ax4.autoscale_view()
+
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._marca_tiempo.set_text(f'Generado: {timestamp}')
+        self._ajustar_layout()
+
+    def _ajustar_layout(self) -> None:
+        """
+        Recalcula el espaciado (tight_layout) si cambian las etiquetas de los ejes Y.
+
+        El ancho de las etiquetas de las marcas decide cuánto margen
+        necesita cada gráfico. Plantas con rangos parecidos comparten
+        etiquetas y reutilizan el espaciado; cuando cambian (p. ej. de
+        "40" a "1000"), se recalcula para que no se corten ni se solapen.
+        """
+        firma = tuple(
+            tuple(eje.yaxis.get_major_formatter().format_ticks(eje.yaxis.get_major_locator()()))
+            for eje in self._ejes
+        )
+        if firma == self._firma_layout:
+            return
+        self._firma_layout = firma
+        self.fig.tight_layout(rect=(0, 0.03, 1, 0.96))
+        # tight_layout deja un motor de layout que obliga a savefig a dibujar
+        # la figura dos veces; el espaciado ya está fijado, así que se quita
+        self.fig.set_layout_engine(None)
+
+    def _dibujar_serie(self, linea: Any, valores: List[float], dpi: float) -> None:
+        """Asigna una serie a una línea, reducida al ancho de su gráfico."""
+        x = np.arange(1, len(valores) + 1)
+        if self.submuestreo is not None:
+            x, valores = submuestrear(x, valores, presupuesto_puntos(linea.axes, dpi),
+                                      self.submuestreo)
+        linea.set_data(x, valores)
+        linea.set_marker(self._marcadores[linea] if len(x) <= MAX_PUNTOS_CON_MARCADOR else 'None')
+
+    def guardar(self, nombre_archivo: str, dpi: int = 300, recortar: bool = True) -> None:
+        """
+        Guarda el estado actual del dashboard en un archivo.
+
+        Args:
+            nombre_archivo: Ruta de la imagen
+            dpi: Resolución
+            recortar: Si True, recorta los márgenes sobrantes (bbox 'tight'),
+                      lo que requiere dibujar la figura una vez más; False
+                      es bastante más rápido (para lotes)
+        """
+        self.fig.savefig(nombre_archivo, dpi=dpi, bbox_inches='tight' if recortar else None)
+
+    def mostrar(self) -> None:
+        """Muestra el dashboard en una ventana (bloquea hasta cerrarla)."""
+        self._plt.figure(self.fig.number)
+        self._plt.show()
+
+    def cerrar(self) -> None:
+        """Libera la figura."""
+        self._plt.close(self.fig)
+
+
 def generar_dashboard(
     datos_humedad: List[float],
     datos_temperatura: List[float],
@@ -149,12 +435,19 @@ def generar_dashboard(
     luz_optima: tuple = (50.0, 80.0),
     guardar: bool = False,
     nombre_archivo: Optional[str] = None,
+    dpi: int = 300,
+    cache: Optional[Any] = None,
 ) -> None:
     """
     Genera un dashboard completo con 4 gráficos de análisis de planta.
 
+    Para renderizar muchas plantas seguidas es más rápido reutilizar un
+    RenderizadorDashboard en lugar de llamar a esta función en un bucle.
+
     Args:
         datos_humedad: Lista de lecturas de humedad (%) de los últimos 30 días
+                       (o un historial largo: las series se submuestrean al
+                       ancho de cada gráfico antes de dibujarlas)
         datos_temperatura: Lista de lecturas de temperatura (°C)
         datos_luz: Lista de lecturas de luz (%)
         nombre_planta: Nombre de la planta para el título
@@ -163,6 +456,11 @@ def generar_dashboard(
         luz_optima: Tupla (min, max) de luz óptima
         guardar: Si True, guarda la imagen en lugar de mostrarla
         nombre_archivo: Nombre del archivo a guardar (si guardar=True)
+        dpi: Resolución de la imagen guardada (300 para imprimir; 100 basta
+             para pantalla y renderiza mucho más rápido)
+        cache: CacheRender (ver cache_render). Si se indica y el mismo
+               dashboard (series, rangos, nombre, dpi y diseño) ya se
+               generó, se copia la imagen guardada sin volver a dibujar.
 
     Ejemplo:
         >>> humedad = [55.2, 54.8, 53.9, ..., 52.1]  # 30 valores
@@ -180,246 +478,37 @@ def generar_dashboard(
         datos_temperatura = datos_temperatura[:dias]
         datos_luz = datos_luz[:dias]
 
-    # Crear figura con 4 subgráficos (2x2)
-    fig = plt.figure(figsize=(16, 10))
-    fig.suptitle(f'Dashboard de Monitoreo: {nombre_planta}',
-                 fontsize=18, fontweight='bold', y=0.98)
-
-    # ===== GRÁFICO 1: Evolución de Humedad (30 días) =====
-    ax1 = plt.subplot(2, 2, 1)
-    dias_eje = list(range(1, dias + 1))
-
-    # Línea de humedad real
-    ax1.plot(dias_eje, datos_humedad,
-             color=COLORES['primario'],
-             linewidth=2.5,
-             marker='o',
-             markersize=4,
-             label='Humedad medida')
-
-    # Banda de rango óptimo
-    ax1.axhspan(humedad_optima[0], humedad_optima[1],
-                alpha=0.2, color=COLORES['exito'],
-                label='Rango óptimo')
-
-    # Líneas de referencia
-    ax1.axhline(y=humedad_optima[0], color=COLORES['advertencia'],
-                linestyle='--', linewidth=1, alpha=0.6)
-    ax1.axhline(y=humedad_optima[1], color=COLORES['advertencia'],
-                linestyle='--', linewidth=1, alpha=0.6)
-
-    # Promedio
-    promedio_humedad = np.mean(datos_humedad)
-    ax1.axhline(y=float(promedio_humedad), color=COLORES['info'],
-                linestyle=':', linewidth=2, label=f'Promedio: {promedio_humedad:.1f}%')
-
-    ax1.set_xlabel('Días', fontsize=11, fontweight='bold')
-    ax1.set_ylabel('Humedad del Suelo (%)', fontsize=11, fontweight='bold')
-    ax1.set_title('Evolución de Humedad (30 días)', fontsize=13, fontweight='bold', pad=10)
-    ax1.legend(loc='best', framealpha=0.9)
-    ax1.grid(True, alpha=0.3)
-    ax1.set_xlim(0, dias + 1)
-
-    # ===== GRÁFICO 2: Temperatura y Luz =====
-    ax2 = plt.subplot(2, 2, 2)
-
-    # Crear eje secundario para luz
-    ax2_luz = ax2.twinx()
-
-    # Temperatura
-    linea_temp = ax2.plot(dias_eje, datos_temperatura,
-                          color=COLORES['peligro'],
-                          linewidth=2.5,
-                          marker='s',
-                          markersize=4,
-                          label='Temperatura')
-
-    # Luz
-    linea_luz = ax2_luz.plot(dias_eje, datos_luz,
-                             color=COLORES['secundario'],
-                             linewidth=2.5,
-                             marker='^',
-                             markersize=4,
-                             label='Luz')
-
-    # Bandas óptimas
-    ax2.axhspan(temperatura_optima[0], temperatura_optima[1],
-                alpha=0.15, color=COLORES['peligro'])
-    ax2_luz.axhspan(luz_optima[0], luz_optima[1],
-                    alpha=0.15, color=COLORES['secundario'])
-
-    # Configuración de ejes
-    ax2.set_xlabel('Días', fontsize=11, fontweight='bold')
-    ax2.set_ylabel('Temperatura (°C)', fontsize=11, fontweight='bold', color=COLORES['peligro'])
-    ax2_luz.set_ylabel('Luz (%)', fontsize=11, fontweight='bold', color=COLORES['secundario'])
-    ax2.set_title('Temperatura y Niveles de Luz', fontsize=13, fontweight='bold', pad=10)
-
-    # Combinar leyendas
-    lineas = linea_temp + linea_luz
-    etiquetas = [l.get_label() for l in lineas]
-    ax2.legend(handles=lineas, labels=etiquetas, loc='best', framealpha=0.9)
-
-    ax2.tick_params(axis='y', labelcolor=COLORES['peligro'])
-    ax2_luz.tick_params(axis='y', labelcolor=COLORES['secundario'])
-    ax2.grid(True, alpha=0.3)
-    ax2.set_xlim(0, dias + 1)
-
-    # ===== GRÁFICO 3: Distribución de Estados =====
-    ax3 = plt.subplot(2, 2, 3)
-
-    # Calcular estados basados en los rangos
-    estados = calcular_distribucion_estados(
-        datos_humedad, datos_temperatura, datos_luz,
-        humedad_optima, temperatura_optima, luz_optima
-    )
-
-    # Crear gráfico de barras
-    nombres_estados = list(estados.keys())
-    valores_estados = list(estados.values())
-    colores_barras = [COLORES['exito'], COLORES['advertencia'], COLORES['peligro']]
-
-    barras = ax3.bar(nombres_estados, valores_estados,
-                     color=colores_barras,
-                     edgecolor='black',
-                     linewidth=1.5,
-                     alpha=0.8)
-
-    # Añadir valores en las barras
-    for i, (barra, valor) in enumerate(zip(barras, valores_estados)):
-        height = barra.get_height()
-        ax3.text(barra.get_x() + barra.get_width()/2., height,
-                f'{valor}\n({valor/dias*100:.0f}%)',
-                ha='center', va='bottom', fontsize=10, fontweight='bold')
-
-    ax3.set_ylabel('Número de Días', fontsize=11, fontweight='bold')
-    ax3.set_title('Distribución de Estados de Salud', fontsize=13, fontweight='bold', pad=10)
-    ax3.set_ylim(0, max(valores_estados) * 1.2)
-    ax3.grid(True, axis='y', alpha=0.3)
-
-    # ===== GRÁFICO 4: Comparación con Rangos Óptimos =====
-    ax4 = plt.subplot(2, 2, 4)
-
-    # Calcular promedios
-    promedios_reales = [
-        np.mean(datos_humedad),
-        np.mean(datos_temperatura),
-        np.mean(datos_luz)
-    ]
-
-    promedios_optimos = [
-        np.mean(humedad_optima),
-        np.mean(temperatura_optima),
-        np.mean(luz_optima)
-    ]
-
-    # Categorías
-    categorias = ['Humedad\n(%)', 'Temperatura\n(°C)', 'Luz\n(%)']
-    x_pos = np.arange(len(categorias))
-    width = 0.35
-
-    # Barras comparativas
-    barras1 = ax4.bar(x_pos - width/2, promedios_reales, width,
-                      label='Promedio Real',
-                      color=COLORES['primario'],
-                      edgecolor='black',
-                      linewidth=1.5,
-                      alpha=0.8)
-
-    barras2 = ax4.bar(x_pos + width/2, promedios_optimos, width,
-                      label='Óptimo Ideal',
-                      color=COLORES['info'],
-                      edgecolor='black',
-                      linewidth=1.5,
-                      alpha=0.8)
-
-    # Añadir valores en las barras
-    for barras in [barras1, barras2]:
-        for barra in barras:
-            height = barra.get_height()
-            ax4.text(barra.get_x() + barra.get_width()/2., height,
-                    f'{height:.1f}',
-                    ha='center', va='bottom', fontsize=9, fontweight='bold')
-
-    ax4.set_ylabel('Valor Promedio', fontsize=11, fontweight='bold')
-    ax4.set_title('Comparación: Real vs Óptimo', fontsize=13, fontweight='bold', pad=10)
-    ax4.set_xticks(x_pos)
-    ax4.set_xticklabels(categorias, fontsize=10)
-    ax4.legend(loc='upper right', framealpha=0.9)
-    ax4.grid(True, axis='y', alpha=0.3)
-
-    # Ajustar espaciado
-    plt.tight_layout(rect=(0, 0.03, 1, 0.96))
-
-    # Añadir timestamp
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    fig.text(0.99, 0.01, f'Generado: {timestamp}',
-             ha='right', va='bottom', fontsize=8, style='italic', alpha=0.6)
-
-    # Guardar o mostrar
-    if guardar:
-        if nombre_archivo is None:
-            # Limpiar caracteres inválidos en nombres de archivo (/, \, :, *, ?, ", <, >, |)
-            nombre_limpio = nombre_planta.replace(' ', '_').replace('/', '_').replace('\\', '_')
-            nombre_limpio = nombre_limpio.replace(':', '_').replace('*', '_').replace('?', '_')
-            nombre_limpio = nombre_limpio.replace('"', '_').replace('<', '_').replace('>', '_').replace('|', '_')
-            nombre_limpio = nombre_limpio.replace('(', '').replace(')', '')  # Eliminar paréntesis
-            nombre_archivo = f"dashboard_{nombre_limpio}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        plt.savefig(nombre_archivo, dpi=300, bbox_inches='tight')
-        print(f"Dashboard guardado exitosamente: {nombre_archivo}")
-    else:
-        plt.show()
-
-    plt.close()
-
-
-def calcular_distribucion_estados(
-    humedad: List[float],
-    temperatura: List[float],
-    luz: List[float],
-    humedad_optima: tuple,
-    temperatura_optima: tuple,
-    luz_optima: tuple
-) -> Dict[str, int]:
-    """
-    Calcula la distribución de estados de salud de la planta.
-
-    Args:
-        humedad: Lista de lecturas de humedad
-        temperatura: Lista de lecturas de temperatura
-        luz: Lista de lecturas de luz
-        humedad_optima: Rango óptimo de humedad
-        temperatura_optima: Rango óptimo de temperatura
-        luz_optima: Rango óptimo de luz
-
-    Returns:
-        Diccionario con conteo de días en cada estado
-    """
-    estados = {'Óptimo': 0, 'Aceptable': 0, 'Crítico': 0}
-
-    for h, t, l in zip(humedad, temperatura, luz):
-        problemas = 0
-
-        # Verificar humedad
-        if not (humedad_optima[0] <= h <= humedad_optima[1]):
-            problemas += 1
-
-        # Verificar temperatura
-        if not (temperatura_optima[0] <= t <= temperatura_optima[1]):
-            problemas += 1
+    def dibujar() -> RenderizadorDashboard:
+        renderizador = RenderizadorDashboard()
+        renderizador.actualizar(datos_humedad, datos_temperatura, datos_luz, nombre_planta,
+                                humedad_optima, temperatura_optima, luz_optima,
+                                dpi=dpi if guardar else None)
+        return renderizador
+
+    # Mostrar en pantalla
+    if not guardar:
+        renderizador = dibujar()
+        renderizador.mostrar()
+        renderizador.cerrar()
+        return
 
-        # Verificar luz
-        if not (luz_optima[0] <= l <= luz_optima[1]):
-            problemas += 1
+    # Guardar (desde la cache si el mismo dashboard ya se generó)
+    if nombre_archivo is None:
+        nombre_limpio = limpiar_nombre_archivo(nombre_planta)
+        nombre_archivo = f"dashboard_{nombre_limpio}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
 
-        # Clasificar estado
-        if problemas == 0:
-            estados['Óptimo'] += 1
-        elif problemas == 1:
-            estados['Aceptable'] += 1
-        else:
-            estados['Crítico'] += 1
+    def guardar_en(ruta: str) -> None:
+        renderizador = dibujar()
+        renderizador.guardar(ruta, dpi=dpi)
+        renderizador.cerrar()
 
-    return estados
+    if cache is None:
+        guardar_en(nombre_archivo)
+    else:
+        clave = clave_render(datos_humedad, datos_temperatura, datos_luz, nombre_planta,
+                             humedad_optima, temperatura_optima, luz_optima, dpi, recortar=True)
+        cache.copiar_a(clave, guardar_en, nombre_archivo)
+    print(f"Dashboard guardado exitosamente: {nombre_archivo}")
 
 
 def generar_dashboard_desde_csv(
@@ -443,31 +532,29 @@ def generar_dashboard_desde_csv(
         ... )
     """
     try:
-        import pandas as pd
+        from cargador_datasets import cargar_dataset_ancho
     except ImportError:
         print("ERROR: pandas no esta instalado.")
         print("   Instala con: pip install pandas")
         return
 
-    # Leer CSV
-    df = pd.read_csv(archivo_csv)
+    # Leer CSV (se parsea una sola vez y queda en cache)
+    dataset = cargar_dataset_ancho(archivo_csv)
 
     # Buscar la planta
-    planta_data = df[df['Planta'] == nombre_planta]
-
-    if planta_data.empty:
+    if nombre_planta not in dataset:
         print(f"ERROR: Planta '{nombre_planta}' no encontrada en {archivo_csv}")
-        print(f"   Plantas disponibles: {', '.join(df['Planta'].head(10).tolist())}...")
+        print(f"   Plantas disponibles: {', '.join(dataset.nombres[:10])}...")
         return
 
     # Extraer datos de humedad (columnas Día_1 a Día_30)
-    columnas_dias = [col for col in df.columns if col.startswith('Día_')]
-    datos_humedad = planta_data[columnas_dias].values[0].tolist()
+    datos_humedad = dataset.serie(nombre_planta, 'humedad_pct').tolist()
 
     # Generar datos simulados de temperatura y luz (si no están en CSV)
     dias = len(datos_humedad)
-    datos_temperatura = np.random.uniform(18, 26, dias).tolist()
-    datos_luz = np.random.uniform(50, 80, dias).tolist()
+    rng = generador_planta(nombre_planta)
+    datos_temperatura = rng.uniform(18, 26, dias).tolist()
+    datos_luz = rng.uniform(50, 80, dias).tolist()
 
     print(f"Generando dashboard para: {nombre_planta}")
     print(f"   Dias de datos: {dias}")
@@ -482,9 +569,122 @@ def generar_dashboard_desde_csv(
     )
 
 
-def demo_dashboard():
+def generar_mapa_flota(
+    humedad: Any,
+    humedad_min: Any,
+    humedad_max: Any,
+    nombres: Optional[List[str]] = None,
+    ordenar: bool = True,
+    titulo: str = "Humedad de la flota",
+    guardar: bool = False,
+    nombre_archivo: Optional[str] = None,
+    dpi: int = 150
+) -> None:
+    """
+    Genera un mapa de calor con la humedad diaria de muchas plantas.
+
+    Una sola imagen (un imshow) resume toda la flota: cada fila es una
+    planta y cada columna un día. El color es la desviación respecto al
+    rango óptimo de esa planta (ver estados_planta.desviacion_rango): claro
+    dentro del rango, marrón si está más seca y verde azulado si está más
+    húmeda, así que plantas con rangos muy distintos comparten escala. Las
+    plantas con días sin dato no cuentan como "siempre en rango óptimo".
+
+    Args:
+        humedad: Matriz plantas × días de humedad (%); NaN = sin dato
+        humedad_min: Humedad mínima óptima de cada planta (o escalar)
+        humedad_max: Humedad máxima óptima de cada planta (o escalar)
+        nombres: Nombres de las plantas (se muestran si hay 60 o menos)
+        ordenar: Si True, ordena las filas de la planta más sana a la más
+                 crítica (ver estados_planta.orden_por_estado)
+        titulo: Título de la figura
+        guardar: Si True, guarda la imagen en lugar de mostrarla
+        nombre_archivo: Nombre del archivo a guardar (si guardar=True)
+        dpi: Resolución de la imagen guardada
+
+    Ejemplo:
+        >>> plantas = cargar_plantas()
+        >>> humedad = sintetizar_humedad_flota(plantas, dias=30)
+        >>> generar_mapa_flota(humedad, [p.humedad_min for p in plantas],
+        ...                    [p.humedad_max for p in plantas], guardar=True)
+    """
+    desviacion = desviacion_rango(humedad, humedad_min, humedad_max)
+    if desviacion.ndim != 2:
+        raise ValueError("humedad debe ser una matriz plantas × días")
+    n_plantas, dias = desviacion.shape
+    orden = orden_por_estado(desviacion) if ordenar else np.arange(n_plantas)
+
+    plt = obtener_pyplot()
+    fig, ax = plt.subplots(figsize=(14, max(6, min(n_plantas * 0.25, 12))))
+    imagen = ax.imshow(desviacion[orden], aspect='auto', interpolation='nearest',
+                       cmap='BrBG', vmin=-1, vmax=1,
+                       extent=(0.5, dias + 0.5, n_plantas - 0.5, -0.5))
+    barra = fig.colorbar(imagen, ax=ax, pad=0.02)
+    barra.set_label('Desviación del rango óptimo (anchos de rango)', fontsize=10)
+    barra.set_ticks([-1, -0.5, 0, 0.5, 1])
+    barra.set_ticklabels(['≤ -1 (seca)', '-0.5', '0 (óptimo)', '0.5', '≥ 1 (húmeda)'])
+
+    if nombres is not None and n_plantas <= 60:
+        ax.set_yticks(np.arange(n_plantas))
+        ax.set_yticklabels([nombres[i] for i in orden], fontsize=8)
+    else:
+        ax.set_ylabel('Plantas (ordenadas por estado)' if ordenar else 'Plantas', fontsize=11,
+                      fontweight='bold')
+    ax.set_xlabel('Días', fontsize=11, fontweight='bold')
+    ax.grid(False)
+
+    sanas = contar_siempre_en_rango(desviacion)
+    ax.set_title(f'{titulo}: {n_plantas} plantas × {dias} días '
+                 f'({sanas} siempre en rango óptimo)', fontsize=14, fontweight='bold', pad=10)
+    fig.tight_layout()
+
+    if guardar:
+        if nombre_archivo is None:
+            nombre_archivo = f"mapa_flota_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        fig.savefig(nombre_archivo, dpi=dpi)
+        print(f"Mapa de la flota guardado exitosamente: {nombre_archivo}")
+    else:
+        plt.show()
+    plt.close(fig)
+
+
+def generar_mapa_flota_con_datos(
+    dias: int = 30,
+    semilla: Optional[int] = None,
+    plantas: Optional[List[Any]] = None,
+    **kwargs
+) -> None:
+    """
+    Genera el mapa de calor de la flota con datos simulados.
+
+    Args:
+        dias: Días simulados por planta
+        semilla: Semilla (la humedad de cada planta coincide con la de su
+                 dashboard individual para la misma semilla)
+        plantas: Lista de PlantaConfig (default: las 960 del catálogo)
+        **kwargs: Argumentos adicionales para generar_mapa_flota()
+
+    Ejemplo:
+        >>> generar_mapa_flota_con_datos(dias=60, guardar=True)
+    """
+    if plantas is None:
+        plantas = cargar_plantas()
+    humedad = sintetizar_humedad_flota(plantas, dias, semilla)
+    generar_mapa_flota(
+        humedad,
+        np.array([p.humedad_min for p in plantas]),
+        np.array([p.humedad_max for p in plantas]),
+        nombres=[p.nombre for p in plantas],
+        **kwargs
+    )
+
+
+def demo_dashboard(semilla: Optional[int] = None):
     """
     Función de demostración con datos simulados realistas.
+
+    Args:
+        semilla: Semilla de la simulación (mismos datos para la misma semilla)
     """
     print("="*80)
     print("Dashboard de Visualización de Plantas")
@@ -492,32 +692,28 @@ def demo_dashboard():
 
     # Generar datos simulados de 30 días
     dias = 30
+    rng = crear_generador(semilla)
+    ruido_riego = rng.uniform(10, 15, dias)
+    ruido_humedad = rng.uniform(-2, 2, dias)
+    ruido_temperatura = rng.uniform(-1.5, 1.5, dias)
+    ruido_luz = rng.uniform(-5, 5, dias)
 
-    # Humedad: Simular patrón de riego cada 7 días
+    t = eje_temporal(dias)
+
+    # Humedad: Simular patrón de riego cada 7 días (pico el día de riego,
+    # luego decaimiento de 3% diario)
     humedad_base = 55
-    datos_humedad = []
-    for dia in range(dias):
-        if dia % 7 == 0:  # Día de riego
-            humedad = humedad_base + np.random.uniform(10, 15)
-        else:
-            # Decaimiento gradual
-            dias_desde_riego = dia % 7
-            humedad = humedad_base - (dias_desde_riego * 3) + np.random.uniform(-2, 2)
-        datos_humedad.append(max(30, min(80, humedad)))
+    dias_desde_riego = np.mod(t, 7)
+    datos_humedad = np.where(dias_desde_riego == 0,
+                             humedad_base + ruido_riego,
+                             humedad_base - dias_desde_riego * 3 + ruido_humedad)
+    datos_humedad = np.clip(datos_humedad, 30, 80)
 
     # Temperatura: Variación diaria con patrón semanal
-    datos_temperatura = []
-    for dia in range(dias):
-        temp_base = 22 + np.sin(dia * 2 * np.pi / 7) * 3
-        temp = temp_base + np.random.uniform(-1.5, 1.5)
-        datos_temperatura.append(temp)
+    datos_temperatura = serie_senoidal(t, 22, 3, 7, ruido_temperatura)
 
     # Luz: Variación estacional
-    datos_luz = []
-    for dia in range(dias):
-        luz_base = 65 + np.sin(dia * 2 * np.pi / 30) * 10
-        luz = luz_base + np.random.uniform(-5, 5)
-        datos_luz.append(max(40, min(90, luz)))
+    datos_luz = serie_senoidal(t, 65, 10, 30, ruido_luz, limites=(40, 90))
 
     # Generar dashboard
     generar_dashboard(
@@ -0,0 +1,362 @@
+"""
+Dashboard ligero en SVG/HTML, sin matplotlib.
+
+Este módulo proporciona:
+- generar_svg_dashboard(): los mismos 4 gráficos que generar_dashboard, como SVG
+- generar_html_dashboard(): página HTML autocontenida con el SVG
+- guardar_dashboard_svg(): escribe el SVG o el HTML según la extensión
+
+Importar matplotlib y dibujar una figura de 16×10 pulgadas por cada
+petición es demasiado para un servidor. Aquí el dashboard se escribe
+directamente como texto SVG a partir de las series y los rangos, con
+plantillas de cadena: no se importa matplotlib y un dashboard de 30 días
+se genera en menos de un milisegundo. Las series largas se reducen al
+ancho en píxeles de su gráfico (ver submuestreo).
+
+Para imágenes de alta calidad (PNG para imprimir) sigue usándose
+dashboard_plantas.generar_dashboard.
+
+Ejemplo:
+    >>> svg = generar_svg_dashboard(humedad, temp, luz, "Acacia",
+    ...                             (40, 70), (18, 26), (50, 80))
+    >>> guardar_dashboard_svg("acacia.html", humedad, temp, luz, "Acacia")
+"""
+
+from datetime import datetime
+from html import escape
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from estados_planta import ESTADOS, calcular_distribucion_estados
+from estilo_dashboard import COLORES
+from submuestreo import min_max
+
+
+ANCHO = 960
+ALTO = 600
+
+# Márgenes de cada gráfico dentro de su cuarto de la figura
+MARGEN_IZQ, MARGEN_DER, MARGEN_SUP, MARGEN_INF = 52, 52, 34, 34
+
+_PLANTILLA_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="{ancho}" height="{alto}" '
+    'viewBox="0 0 {ancho} {alto}" font-family="sans-serif" font-size="11">'
+    '<rect width="100%" height="100%" fill="#ffffff"/>'
+    '<text x="{centro}" y="24" text-anchor="middle" font-size="18" font-weight="bold">'
+    'Dashboard de Monitoreo: {nombre}</text>'
+    '{paneles}'
+    '<text x="{ancho_marca}" y="{alto_marca}" text-anchor="end" font-size="8" '
+    'font-style="italic" fill-opacity="0.6">Generado: {timestamp}</text>'
+    '</svg>'
+)
+
+_PLANTILLA_HTML = """<!DOCTYPE html>
+<html lang="es">
+<head>
+<meta charset="utf-8">
+<title>Dashboard: {nombre}</title>
+</head>
+<body style="margin:0;background:#f4f6f7">
+{svg}
+</body>
+</html>
+"""
+
+_PLANTILLA_PANEL = (
+    '<g transform="translate({x},{y})">'
+    '<rect x="{izq}" y="{sup}" width="{ancho}" height="{alto}" fill="#eaeaf2"/>'
+    '<text x="{centro}" y="{y_titulo}" text-anchor="middle" font-size="13" '
+    'font-weight="bold">{titulo}</text>'
+    '{contenido}'
+    '</g>'
+)
+
+_PLANTILLA_LINEA = ('<polyline fill="none" stroke="{color}" stroke-width="{grosor}"{estilo} '
+                    'points="{puntos}"/>')
+_PLANTILLA_BANDA = ('<rect x="{x}" y="{y}" width="{ancho}" height="{alto}" '
+                    'fill="{color}" fill-opacity="{opacidad}"/>')
+_PLANTILLA_TEXTO = '<text x="{x:.1f}" y="{y:.1f}" text-anchor="{ancla}"{extra}>{texto}</text>'
+
+
+class _Panel:
+    """Área de dibujo de uno de los 4 gráficos, con sus conversiones a píxeles."""
+
+    def __init__(self, columna: int, fila: int):
+        ancho_panel, alto_panel = ANCHO / 2, (ALTO - 40) / 2
+        self.x = columna * ancho_panel
+        self.y = 40 + fila * alto_panel
+        self.izq, self.sup = MARGEN_IZQ, MARGEN_SUP
+        self.ancho = ancho_panel - MARGEN_IZQ - MARGEN_DER
+        self.alto = alto_panel - MARGEN_SUP - MARGEN_INF
+        self.partes: List[str] = []
+
+    # Funcionan igual con un float que con un array de NumPy (las marcas,
+    # barras y textos son escalares: sin NumPy son mucho más baratos)
+    def px_x(self, valores, minimo: float, maximo: float):
+        """Convierte valores del eje X en píxeles."""
+        return self.izq + (valores - minimo) / (maximo - minimo) * self.ancho
+
+    def px_y(self, valores, minimo: float, maximo: float):
+        """Convierte valores del eje Y en píxeles (crecen hacia arriba)."""
+        return self.sup + self.alto - (valores - minimo) / (maximo - minimo) * self.alto
+
+    def texto(self, x: float, y: float, texto: str, ancla: str = 'middle', extra: str = '') -> None:
+        self.partes.append(_PLANTILLA_TEXTO.format(x=x, y=y, ancla=ancla, extra=extra, texto=texto))
+
+    def renderizar(self, titulo: str) -> str:
+        return _PLANTILLA_PANEL.format(
+            x=self.x, y=self.y, izq=self.izq, sup=self.sup, ancho=self.ancho, alto=self.alto,
+            centro=self.izq + self.ancho / 2, y_titulo=self.sup - 10,
+            titulo=escape(titulo), contenido=''.join(self.partes),
+        )
+
+
+def _limites_eje(serie: np.ndarray, rango: Tuple[float, float]) -> Tuple[float, float]:
+    """Mínimo y máximo de una serie (sin NaN) y su rango óptimo, con un 5% de margen."""
+    minimo = min(float(np.nanmin(serie)), rango[0])
+    maximo = max(float(np.nanmax(serie)), rango[1])
+    margen = (maximo - minimo) * 0.05 or 1.0
+    return minimo - margen, maximo + margen
+
+
+def _eje_y(panel: _Panel, minimo: float, maximo: float, derecha: bool = False,
+           color: str = '#333333', cuadricula: bool = True) -> None:
+    """Marcas y, opcionalmente, cuadrícula horizontal del eje Y."""
+    for i in range(1, 5):
+        valor = minimo + (maximo - minimo) * i / 5
+        y = panel.px_y(valor, minimo, maximo)
+        if cuadricula:
+            panel.partes.append(f'<line x1="{panel.izq}" y1="{y:.1f}" x2="{panel.izq + panel.ancho}" '
+                                f'y2="{y:.1f}" stroke="#ffffff"/>')
+        x = panel.izq + panel.ancho + 4 if derecha else panel.izq - 4
+        panel.texto(x, y + 4, f'{valor:.0f}', 'start' if derecha else 'end', f' fill="{color}"')
+
+
+def _polilinea(panel: _Panel, x: np.ndarray, y: np.ndarray, limites_x: Tuple[float, float],
+               limites_y: Tuple[float, float], color: str, grosor: float = 2, estilo: str = '') -> None:
+    """
+    Añade una serie como <polyline>, reducida al ancho del gráfico.
+
+    Las lecturas NaN cortan la línea: cada tramo sin huecos es una
+    <polyline> propia y se reduce con su parte del ancho.
+    """
+    presupuesto = max(int(panel.ancho), 2)
+    validos = ~np.isnan(y)
+    if validos.all():
+        tramos = [(x, y)]
+    else:
+        cortes = np.flatnonzero(np.diff(validos.view(np.int8))) + 1
+        tramos = [(tx, ty) for tx, ty, tv in zip(np.split(x, cortes), np.split(y, cortes),
+                                                 np.split(validos, cortes)) if tv[0]]
+    for tx, ty in tramos:
+        tx, ty = min_max(tx, ty, max(presupuesto * len(tx) // len(x), 2))
+        px = panel.px_x(tx, *limites_x)
+        py = panel.px_y(ty, *limites_y)
+        puntos = ' '.join(f'{a:.1f},{b:.1f}' for a, b in zip(px.tolist(), py.tolist()))
+        panel.partes.append(_PLANTILLA_LINEA.format(color=color, grosor=grosor, estilo=estilo, puntos=puntos))
+
+
+def _linea_horizontal(panel: _Panel, valor: float, limites_y: Tuple[float, float],
+                      color: str, estilo: str) -> None:
+    """Línea horizontal de lado a lado del gráfico."""
+    y = panel.px_y(valor, *limites_y)
+    panel.partes.append(f'<line x1="{panel.izq}" y1="{y:.1f}" x2="{panel.izq + panel.ancho}" '
+                        f'y2="{y:.1f}" stroke="{color}"{estilo}/>')
+
+
+def _banda(panel: _Panel, rango: Tuple[float, float], limites_y: Tuple[float, float],
+           color: str, opacidad: float) -> None:
+    """Banda horizontal con el rango óptimo."""
+    superior, inferior = panel.px_y(rango[1], *limites_y), panel.px_y(rango[0], *limites_y)
+    panel.partes.append(_PLANTILLA_BANDA.format(
+        x=panel.izq, y=f'{superior:.1f}', ancho=panel.ancho, alto=f'{inferior - superior:.1f}',
+        color=color, opacidad=opacidad))
+
+
+def _eje_x_dias(panel: _Panel, dias: int) -> None:
+    """Marcas de días bajo el gráfico."""
+    marcas = min(dias, 6)
+    for dia in sorted({round(1 + (dias - 1) * i / max(marcas - 1, 1)) for i in range(marcas)}):
+        panel.texto(panel.px_x(dia, 0, dias + 1), panel.sup + panel.alto + 14, str(dia))
+    panel.texto(panel.izq + panel.ancho / 2, panel.sup + panel.alto + 28, 'Días',
+                extra=' font-weight="bold"')
+
+
+def _barras(panel: _Panel, grupos: List[List[float]], colores: List[Any],
+            etiquetas: List[str], textos: List[List[str]]) -> None:
+    """
+    Barras agrupadas: una lista de valores por serie, una barra por categoría.
+
+    Cada serie tiene un color, o una lista con un color por categoría.
+    Las barras salen de la línea del cero, hacia abajo si el valor es
+    negativo, con el texto en el extremo exterior.
+    """
+    todos = [v for valores in grupos for v in valores]
+    minimo = min(min(todos), 0) * 1.2
+    maximo = max(max(todos), 0 if minimo < 0 else 1) * 1.2
+    categorias = len(etiquetas)
+    ancho_categoria = panel.ancho / categorias
+    ancho_barra = ancho_categoria * 0.7 / len(grupos)
+    cero = panel.px_y(0, minimo, maximo)
+    for i, etiqueta in enumerate(etiquetas):
+        inicio = panel.izq + i * ancho_categoria + ancho_categoria * 0.15
+        for j, (valores, color) in enumerate(zip(grupos, colores)):
+            x = inicio + j * ancho_barra
+            y = panel.px_y(valores[i], minimo, maximo)
+            panel.partes.append(
+                f'<rect x="{x:.1f}" y="{min(y, cero):.1f}" width="{ancho_barra:.1f}" '
+                f'height="{abs(cero - y):.1f}" fill="{color[i] if isinstance(color, list) else color}" '
+                f'fill-opacity="0.8" stroke="#000000" stroke-width="1.5"/>')
+            y_texto = y - 4 if valores[i] >= 0 else y + 12
+            panel.texto(x + ancho_barra / 2, y_texto, textos[j][i], extra=' font-weight="bold" font-size="10"')
+        panel.texto(inicio + ancho_barra * len(grupos) / 2, panel.sup + panel.alto + 14, etiqueta)
+    if minimo < 0:
+        _linea_horizontal(panel, 0, (minimo, maximo), '#000000', '')
+    _eje_y(panel, minimo, maximo, cuadricula=False)
+
+
+def generar_svg_dashboard(
+    datos_humedad: Sequence[float],
+    datos_temperatura: Sequence[float],
+    datos_luz: Sequence[float],
+    nombre_planta: str = "Planta",
+    humedad_optima: tuple = (40.0, 70.0),
+    temperatura_optima: tuple = (18.0, 26.0),
+    luz_optima: tuple = (50.0, 80.0),
+    timestamp: Optional[str] = None
+) -> str:
+    """
+    Genera el dashboard de 4 gráficos como un documento SVG.
+
+    Mismos gráficos que generar_dashboard: evolución de humedad con su
+    rango óptimo y promedio, temperatura y luz (dos escalas), distribución
+    de estados de salud y promedios reales frente a los óptimos.
+
+    Args:
+        datos_humedad: Lecturas de humedad (%)
+        datos_temperatura: Lecturas de temperatura (°C)
+        datos_luz: Lecturas de luz (%)
+        nombre_planta: Nombre de la planta para el título
+        humedad_optima: Tupla (min, max) de humedad óptima
+        temperatura_optima: Tupla (min, max) de temperatura óptima
+        luz_optima: Tupla (min, max) de luz óptima
+        timestamp: Texto de la marca de tiempo (None = ahora)
+
+    Las lecturas NaN (días sin datos) se ignoran en ejes y promedios y
+    cortan las líneas de evolución.
+
+    Returns:
+        Texto SVG
+
+    Raises:
+        ValueError: Si no hay datos o una serie no tiene ninguna lectura válida
+    """
+    dias = min(len(datos_humedad), len(datos_temperatura), len(datos_luz))
+    if dias == 0:
+        raise ValueError("No hay datos para generar el dashboard")
+    humedad = np.asarray(datos_humedad, dtype=np.float64)[:dias]
+    temperatura = np.asarray(datos_temperatura, dtype=np.float64)[:dias]
+    luz = np.asarray(datos_luz, dtype=np.float64)[:dias]
+    if any(np.isnan(serie).all() for serie in (humedad, temperatura, luz)):
+        raise ValueError("Una de las series no tiene lecturas válidas")
+    x = np.arange(1, dias + 1, dtype=np.float64)
+    limites_x = (0, dias + 1)
+    paneles = []
+
+    # ===== GRÁFICO 1: Evolución de Humedad =====
+    panel = _Panel(0, 0)
+    limites = _limites_eje(humedad, humedad_optima)
+    _eje_y(panel, *limites)
+    _banda(panel, humedad_optima, limites, COLORES['exito'], 0.2)
+    for limite in humedad_optima:
+        _linea_horizontal(panel, limite, limites, COLORES['advertencia'], ' stroke-dasharray="6 4"')
+    promedio_humedad = float(np.nanmean(humedad))
+    _linea_horizontal(panel, promedio_humedad, limites, COLORES['info'],
+                      ' stroke-width="2" stroke-dasharray="2 3"')
+    _polilinea(panel, x, humedad, limites_x, limites, COLORES['primario'], 2.5)
+    _eje_x_dias(panel, dias)
+    panel.texto(panel.izq + panel.ancho - 4, panel.sup + 14, f'Promedio: {promedio_humedad:.1f}%',
+                'end', f' fill="{COLORES["info"]}"')
+    panel.texto(14, panel.sup + panel.alto / 2, 'Humedad del Suelo (%)',
+                extra=f' font-weight="bold" transform="rotate(-90 14 {panel.sup + panel.alto / 2:.1f})"')
+    paneles.append(panel.renderizar(f'Evolución de Humedad ({dias} días)'))
+
+    # ===== GRÁFICO 2: Temperatura y Luz =====
+    panel = _Panel(1, 0)
+    limites_t = _limites_eje(temperatura, temperatura_optima)
+    limites_l = _limites_eje(luz, luz_optima)
+    _eje_y(panel, *limites_t, color=COLORES['peligro'])
+    _eje_y(panel, *limites_l, derecha=True, color=COLORES['secundario'], cuadricula=False)
+    _banda(panel, temperatura_optima, limites_t, COLORES['peligro'], 0.15)
+    _banda(panel, luz_optima, limites_l, COLORES['secundario'], 0.15)
+    _polilinea(panel, x, temperatura, limites_x, limites_t, COLORES['peligro'], 2.5)
+    _polilinea(panel, x, luz, limites_x, limites_l, COLORES['secundario'], 2.5)
+    _eje_x_dias(panel, dias)
+    panel.texto(panel.izq + 6, panel.sup + 14, 'Temperatura (°C)', 'start',
+                f' fill="{COLORES["peligro"]}" font-weight="bold"')
+    panel.texto(panel.izq + panel.ancho - 6, panel.sup + 14, 'Luz (%)', 'end',
+                f' fill="{COLORES["secundario"]}" font-weight="bold"')
+    paneles.append(panel.renderizar('Temperatura y Niveles de Luz'))
+
+    # ===== GRÁFICO 3: Distribución de Estados =====
+    panel = _Panel(0, 1)
+    estados = calcular_distribucion_estados(humedad, temperatura, luz,
+                                            humedad_optima, temperatura_optima, luz_optima)
+    valores = [estados[estado] for estado in ESTADOS]
+    _barras(panel, [valores], [[COLORES['exito'], COLORES['advertencia'], COLORES['peligro']]],
+            list(ESTADOS), [[f'{v} ({v / dias * 100:.0f}%)' for v in valores]])
+    paneles.append(panel.renderizar('Distribución de Estados de Salud'))
+
+    # ===== GRÁFICO 4: Comparación con Rangos Óptimos =====
+    panel = _Panel(1, 1)
+    promedios = [
+        [promedio_humedad, float(np.nanmean(temperatura)), float(np.nanmean(luz))],
+        [sum(rango) / 2 for rango in (humedad_optima, temperatura_optima, luz_optima)],
+    ]
+    _barras(panel, promedios, [COLORES['primario'], COLORES['info']],
+            ['Humedad (%)', 'Temperatura (°C)', 'Luz (%)'],
+            [[f'{v:.1f}' for v in fila] for fila in promedios])
+    panel.texto(panel.izq + panel.ancho - 4, panel.sup + 14, 'Promedio Real', 'end',
+                f' fill="{COLORES["primario"]}" font-weight="bold"')
+    panel.texto(panel.izq + panel.ancho - 4, panel.sup + 28, 'Óptimo Ideal', 'end',
+                f' fill="{COLORES["info"]}" font-weight="bold"')
+    paneles.append(panel.renderizar('Comparación: Real vs Óptimo'))
+
+    if timestamp is None:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return _PLANTILLA_SVG.format(
+        ancho=ANCHO, alto=ALTO, centro=ANCHO / 2, nombre=escape(nombre_planta),
+        paneles=''.join(paneles), ancho_marca=ANCHO - 6, alto_marca=ALTO - 6,
+        timestamp=timestamp,
+    )
+
+
+def generar_html_dashboard(*args, **kwargs) -> str:
+    """
+    Genera una página HTML autocontenida con el dashboard SVG.
+
+    Acepta los mismos argumentos que generar_svg_dashboard().
+
+    Returns:
+        Texto HTML
+    """
+    nombre = kwargs.get('nombre_planta', args[3] if len(args) > 3 else "Planta")
+    return _PLANTILLA_HTML.format(nombre=escape(nombre), svg=generar_svg_dashboard(*args, **kwargs))
+
+
+def guardar_dashboard_svg(nombre_archivo: str, *args, **kwargs) -> None:
+    """
+    Guarda el dashboard como .svg o, si la extensión es .html/.htm, como página HTML.
+
+    Args:
+        nombre_archivo: Ruta de destino
+        *args, **kwargs: Argumentos de generar_svg_dashboard()
+    """
+    if nombre_archivo.lower().endswith(('.html', '.htm')):
+        contenido = generar_html_dashboard(*args, **kwargs)
+    else:
+        contenido = generar_svg_dashboard(*args, **kwargs)
+    with open(nombre_archivo, 'w', encoding='utf-8') as f:
+        f.write(contenido)
+    print(f"Dashboard guardado exitosamente: {nombre_archivo}")
@@ -0,0 +1,330 @@
+"""
+Dashboard en vivo: se actualiza con cada lectura sin volver a construirse.
+
+Este módulo proporciona:
+- BufferCircular: últimas N lecturas de una variable, en un array fijo
+- DashboardVivo: un gráfico pequeño por planta, redibujado con blitting
+- monitorear_en_vivo(): bucle que lee de varios traductores y actualiza
+
+generar_dashboard construye la figura completa cada vez. Para una
+pantalla que muestra lecturas a medida que llegan, aquí la figura se crea
+una sola vez: el fondo de cada gráfico (ejes, rejilla, banda óptima,
+etiquetas) se guarda como mapa de bits y, en cada actualización, solo se
+restaura ese fondo y se dibujan encima las líneas y textos de las plantas
+que recibieron lecturas nuevas (blitting). Agregar una lectura solo
+escribe en un buffer circular; el dibujo se limita a `fps_max` veces por
+segundo, así que muchas lecturas por segundo no disparan la CPU.
+
+Ejemplo:
+    >>> traductores = [TraductorPlantaInteligente(n, config=obtener_planta_por_nombre(n))
+    ...                for n in ("Acacia", "Monstera", "Airplant")]
+    >>> monitorear_en_vivo(traductores, lecturas_por_segundo=20)
+"""
+
+import math
+import time
+from dataclasses import replace
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from dashboard_plantas import obtener_pyplot
+from estilo_dashboard import COLORES
+
+
+# Lecturas que conserva el historial de cada traductor en monitorear_en_vivo
+MAX_HISTORIAL = 10_000
+
+
+class BufferCircular:
+    """
+    Últimas `capacidad` lecturas de una variable.
+
+    Cada valor se escribe dos veces (en i y en i + capacidad) dentro de un
+    array del doble de tamaño, así que las lecturas en orden cronológico
+    son siempre un tramo contiguo: valores() devuelve una vista sin copia.
+
+    Atributos:
+        capacidad (int): Número máximo de lecturas guardadas
+        total (int): Lecturas agregadas desde el inicio
+    """
+
+    def __init__(self, capacidad: int):
+        """
+        Args:
+            capacidad: Número máximo de lecturas guardadas
+
+        Raises:
+            ValueError: Si capacidad no es positiva
+        """
+        if capacidad <= 0:
+            raise ValueError("capacidad debe ser mayor que 0")
+        self.capacidad = capacidad
+        self.total = 0
+        self._datos = np.zeros(2 * capacidad)
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacidad)
+
+    def agregar(self, valor: float) -> None:
+        """Agrega una lectura (descarta la más antigua si está lleno)."""
+        i = self.total % self.capacidad
+        self._datos[i] = self._datos[i + self.capacidad] = valor
+        self.total += 1
+
+    def valores(self) -> np.ndarray:
+        """Lecturas guardadas, de la más antigua a la más reciente (vista)."""
+        fin = self.total % self.capacidad + self.capacidad
+        return self._datos[fin - len(self):fin]
+
+    def ultimo(self) -> float:
+        """Lectura más reciente (NaN si está vacío)."""
+        if self.total == 0:
+            return float('nan')
+        return float(self._datos[(self.total - 1) % self.capacidad])
+
+
+class DashboardVivo:
+    """
+    Figura con un gráfico por planta que se actualiza con blitting.
+
+    Cada gráfico muestra la humedad y la luz (%) de las últimas `capacidad`
+    lecturas sobre la banda de humedad óptima, más un texto con los
+    últimos valores. Los ejes son fijos (0-100 %), así que el fondo nunca
+    cambia y puede reutilizarse.
+
+    Atributos:
+        nombres (List[str]): Plantas mostradas, en orden
+        capacidad (int): Lecturas visibles por planta
+        fps_max (float): Redibujados máximos por segundo
+        redibujados (int): Veces que se dibujó algún gráfico
+    """
+
+    def __init__(self, plantas: Sequence[Any], capacidad: int = 300,
+                 fps_max: float = 20.0, columnas: Optional[int] = None):
+        """
+        Construye la figura (una sola vez).
+
+        Args:
+            plantas: Configuraciones con nombre, humedad_min y humedad_max
+                     (ConfiguracionPlanta o PlantaConfig)
+            capacidad: Lecturas visibles por planta
+            fps_max: Redibujados máximos por segundo
+            columnas: Gráficos por fila (default: cuadrícula casi cuadrada)
+
+        Raises:
+            ValueError: Si no hay plantas o hay nombres repetidos
+        """
+        if not plantas:
+            raise ValueError("Se necesita al menos una planta")
+        self.nombres = [p.nombre for p in plantas]
+        if len(set(self.nombres)) != len(self.nombres):
+            raise ValueError("Los nombres de las plantas deben ser únicos")
+
+        self.capacidad = capacidad
+        self.fps_max = fps_max
+        self.redibujados = 0
+        self._posiciones = {nombre: i for i, nombre in enumerate(self.nombres)}
+        self._buffers = [
+            {'humedad': BufferCircular(capacidad), 'luz': BufferCircular(capacidad),
+             'temperatura': BufferCircular(capacidad)}
+            for _ in plantas
+        ]
+        self._pendientes = set()
+        self._ultimo_dibujo = 0.0
+        self._x = np.arange(capacidad)
+
+        plt = obtener_pyplot()
+        self._plt = plt
+        columnas = columnas or math.ceil(math.sqrt(len(plantas)))
+        filas = math.ceil(len(plantas) / columnas)
+        self.fig, ejes = plt.subplots(filas, columnas, figsize=(4 * columnas, 2.6 * filas),
+                                      squeeze=False, sharex=True, sharey=True)
+        self.fig.suptitle('Monitoreo en vivo', fontsize=14, fontweight='bold')
+        self._ejes = list(ejes.ravel()[:len(plantas)])
+        for eje in ejes.ravel()[len(plantas):]:
+            eje.set_visible(False)
+
+        # Elementos que cambian en cada actualización (animated: no forman
+        # parte del fondo y solo se dibujan con draw_artist)
+        self._artistas: List[Dict[str, Any]] = []
+        for eje, planta in zip(self._ejes, plantas):
+            eje.axhspan(planta.humedad_min, planta.humedad_max, alpha=0.2, color=COLORES['exito'])
+            eje.set_xlim(0, capacidad - 1)
+            eje.set_ylim(0, 100)
+            eje.set_title(planta.nombre, fontsize=10, fontweight='bold')
+            eje.tick_params(labelsize=7)
+            self._artistas.append({
+                'humedad': eje.plot([], [], color=COLORES['primario'], linewidth=1.5, animated=True)[0],
+                'luz': eje.plot([], [], color=COLORES['secundario'], linewidth=1, animated=True)[0],
+                'texto': eje.text(0.02, 0.95, '', transform=eje.transAxes, fontsize=8, va='top',
+                                  animated=True),
+            })
+
+        self.fig.tight_layout(rect=(0, 0, 1, 0.95))
+        self.fig.set_layout_engine(None)
+        self._fondos: Optional[List[Any]] = None
+        # Tras cualquier dibujo completo (primera vez, cambio de tamaño de la
+        # ventana) hay que volver a capturar los fondos
+        self.fig.canvas.mpl_connect('draw_event', self._capturar_fondos)
+
+    def _capturar_fondos(self, evento: Any = None) -> None:
+        """Guarda el mapa de bits de cada gráfico sin los elementos animados."""
+        lienzo = self.fig.canvas
+        self._fondos = [lienzo.copy_from_bbox(eje.bbox) for eje in self._ejes]
+        # El dibujo completo borró las líneas: se vuelven a pintar todas
+        self._pendientes.update(range(len(self._ejes)))
+        self._pintar(sorted(self._pendientes))
+
+    def agregar(self, lectura: Any, planta: str) -> None:
+        """
+        Agrega una lectura (LecturaSensores) de una planta; no dibuja.
+
+        Args:
+            lectura: Objeto con humedad_pct, luz_pct y temperatura
+            planta: Nombre de la planta
+
+        Raises:
+            ValueError: Si la planta no está en el dashboard
+        """
+        try:
+            i = self._posiciones[planta]
+        except KeyError:
+            raise ValueError(f"La planta '{planta}' no está en el dashboard") from None
+        buffers = self._buffers[i]
+        buffers['humedad'].agregar(lectura.humedad_pct)
+        buffers['luz'].agregar(lectura.luz_pct)
+        buffers['temperatura'].agregar(lectura.temperatura)
+        self._pendientes.add(i)
+
+    def _pintar(self, indices: List[int]) -> None:
+        """Restaura el fondo de los gráficos indicados y dibuja sus datos."""
+        lienzo = self.fig.canvas
+        for i in indices:
+            buffers, artistas, eje = self._buffers[i], self._artistas[i], self._ejes[i]
+            humedad = buffers['humedad'].valores()
+            # Las lecturas más recientes quedan siempre a la derecha
+            x = self._x[self.capacidad - len(humedad):]
+            artistas['humedad'].set_data(x, humedad)
+            artistas['luz'].set_data(x, buffers['luz'].valores())
+            if len(humedad):
+                # Texto corto a propósito: cada carácter se rasteriza en cada
+                # actualización y el texto es lo más caro del redibujado
+                artistas['texto'].set_text(f"H {buffers['humedad'].ultimo():.0f}%  "
+                                           f"L {buffers['luz'].ultimo():.0f}%  "
+                                           f"{buffers['temperatura'].ultimo():.1f}°C")
+            lienzo.restore_region(self._fondos[i])
+            for artista in artistas.values():
+                eje.draw_artist(artista)
+            lienzo.blit(eje.bbox)
+        self._pendientes.clear()
+        if indices:
+            self.redibujados += 1
+
+    def actualizar(self, forzar: bool = False) -> bool:
+        """
+        Redibuja los gráficos de las plantas con lecturas nuevas.
+
+        Args:
+            forzar: Si True, ignora el límite de fps_max
+
+        Returns:
+            True si se dibujó algo
+        """
+        if self._fondos is None:
+            # Primer dibujo completo: draw_event captura los fondos y pinta
+            self.fig.canvas.draw()
+            self._ultimo_dibujo = time.perf_counter()
+            return True
+        if not self._pendientes:
+            return False
+        ahora = time.perf_counter()
+        if not forzar and ahora - self._ultimo_dibujo < 1.0 / self.fps_max:
+            return False
+        self._pintar(sorted(self._pendientes))
+        self._ultimo_dibujo = ahora
+        self.fig.canvas.flush_events()
+        return True
+
+    def mostrar(self) -> None:
+        """Abre la ventana sin bloquear."""
+        self._plt.show(block=False)
+        self.actualizar(forzar=True)
+
+    def guardar(self, nombre_archivo: str, dpi: int = 100) -> None:
+        """Guarda el estado actual (dibujo completo, incluidos los datos)."""
+        artistas = [a for grupo in self._artistas for a in grupo.values()]
+        for artista in artistas:
+            artista.set_animated(False)
+        try:
+            self.fig.savefig(nombre_archivo, dpi=dpi)
+        finally:
+            for artista in artistas:
+                artista.set_animated(True)
+
+    def cerrar(self) -> None:
+        """Libera la figura."""
+        self._plt.close(self.fig)
+
+
+def monitorear_en_vivo(traductores: Sequence[Any], lecturas_por_segundo: float = 10.0,
+                       duracion_s: Optional[float] = None, capacidad: int = 300,
+                       fps_max: float = 20.0,
+                       max_historial: Optional[int] = MAX_HISTORIAL) -> DashboardVivo:
+    """
+    Lee de varios traductores y muestra sus lecturas en un DashboardVivo.
+
+    Cada traductor guarda todas sus lecturas en `historial`; en un
+    monitoreo sin fin esa lista crecería sin límite. Aquí se recorta a las
+    `max_historial` lecturas más recientes (al llegar al doble, para no
+    mover la lista en cada lectura).
+
+    Args:
+        traductores: TraductorPlantaInteligente (uno por planta)
+        lecturas_por_segundo: Lecturas por segundo de cada traductor
+        duracion_s: Segundos de monitoreo (None = hasta cerrar la ventana o Ctrl+C)
+        capacidad: Lecturas visibles por planta
+        fps_max: Redibujados máximos por segundo
+        max_historial: Lecturas que conserva el historial de cada traductor
+                       (None = todas, crece sin límite)
+
+    Returns:
+        El DashboardVivo (abierto; llamar a cerrar() al terminar)
+    """
+    # Cada gráfico se titula con el nombre del traductor, no el de la especie
+    configuraciones = [replace(t.config, nombre=t.nombre) for t in traductores]
+    dashboard = DashboardVivo(configuraciones, capacidad=capacidad, fps_max=fps_max)
+    dashboard.mostrar()
+
+    periodo = 1.0 / lecturas_por_segundo
+    inicio = siguiente = time.perf_counter()
+    try:
+        while duracion_s is None or time.perf_counter() - inicio < duracion_s:
+            if not dashboard._plt.fignum_exists(dashboard.fig.number):
+                break
+            for traductor in traductores:
+                lectura, _ = traductor.procesar_lectura()
+                dashboard.agregar(lectura, traductor.nombre)
+                if max_historial is not None and len(traductor.historial) >= 2 * max_historial:
+                    del traductor.historial[:-max_historial]
+            dashboard.actualizar()
+            siguiente += periodo
+            espera = siguiente - time.perf_counter()
+            if espera > 0:
+                # pause() atiende los eventos de la ventana mientras espera
+                dashboard._plt.pause(espera)
+    except KeyboardInterrupt:
+        print("\nMonitoreo detenido por el usuario.")
+    return dashboard
+
+
+if __name__ == "__main__":
+    from traductor_de_plantas import TraductorPlantaInteligente, obtener_planta_por_nombre
+
+    nombres = ["Acacia", "Monstera", "Airplant", "Aloe Vera"]
+    traductores = []
+    for nombre in nombres:
+        config = obtener_planta_por_nombre(nombre)
+        if config is not None:
+            traductores.append(TraductorPlantaInteligente(nombre, config=config, semilla=1))
+    monitorear_en_vivo(traductores, lecturas_por_segundo=20).cerrar()
@@ -0,0 +1,221 @@
+"""
+Clasificación vectorizada del estado de salud de una o muchas plantas.
+
+Este módulo proporciona:
+- ESTADOS: nombres de los estados, en orden de gravedad
+- clasificar_estados(): estado de cada lectura (0, 1, 2; -1 si falta un dato)
+- calcular_distribucion_estados(): conteo para una planta (dict, como antes)
+- calcular_distribucion_estados_flota(): conteos plantas × estados
+- desviacion_rango(): distancia de cada lectura a su rango óptimo
+- orden_por_estado(): orden de las plantas de la más sana a la más crítica
+- contar_siempre_en_rango(): plantas con todos sus días dentro del rango
+
+Cada lectura (día) se clasifica según cuántas de sus tres variables
+(humedad, temperatura, luz) están fuera del rango óptimo:
+0 problemas = Óptimo, 1 = Aceptable, 2 o más = Crítico.
+
+Los datos pueden ser 1-D (una planta) o 2-D (plantas × días). Los rangos
+son tuplas (min, max) de escalares o de arrays con un valor por planta,
+así que toda la flota se clasifica con unas pocas operaciones de arrays.
+
+Ejemplo:
+    >>> conteos = calcular_distribucion_estados_flota(
+    ...     humedad, temperatura, luz,            # arrays (960, 365)
+    ...     (hum_min, hum_max), (t_min, t_max), (luz_min, luz_max))
+    >>> conteos.shape
+    (960, 3)
+"""
+
+from typing import Any, Dict, Sequence, Tuple
+
+import numpy as np
+
+
+ESTADOS = ('Óptimo', 'Aceptable', 'Crítico')
+SIN_DATO = -1
+
+
+def _limites(rango: Tuple[Any, Any], ndim: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Convierte un rango (min, max) en arrays que se emparejan con los datos."""
+    minimo = np.asarray(rango[0], dtype=np.float64)
+    maximo = np.asarray(rango[1], dtype=np.float64)
+    if ndim == 2 and minimo.ndim == 1:
+        # Un rango por planta: columna para emparejar con plantas × días
+        minimo, maximo = minimo[:, None], maximo[:, None]
+    return minimo, maximo
+
+
+def clasificar_estados(
+    humedad: Any,
+    temperatura: Any,
+    luz: Any,
+    humedad_optima: Tuple[Any, Any],
+    temperatura_optima: Tuple[Any, Any],
+    luz_optima: Tuple[Any, Any]
+) -> np.ndarray:
+    """
+    Estado de cada lectura: 0 = Óptimo, 1 = Aceptable, 2 = Crítico.
+
+    Los rangos son inclusivos. Una lectura con algún valor NaN (dato
+    faltante) se marca con SIN_DATO (-1).
+
+    Args:
+        humedad: Lecturas de humedad (1-D o plantas × días)
+        temperatura: Lecturas de temperatura (misma forma)
+        luz: Lecturas de luz (misma forma)
+        humedad_optima: (min, max), escalares o un valor por planta
+        temperatura_optima: (min, max), escalares o un valor por planta
+        luz_optima: (min, max), escalares o un valor por planta
+
+    Returns:
+        np.ndarray int8 con la forma de los datos
+
+    Raises:
+        ValueError: Si las series no tienen la misma forma
+    """
+    series = [np.asarray(s, dtype=np.float64) for s in (humedad, temperatura, luz)]
+    if not (series[0].shape == series[1].shape == series[2].shape):
+        raise ValueError("humedad, temperatura y luz deben tener la misma forma")
+
+    problemas = np.zeros(series[0].shape, dtype=np.int8)
+    faltantes = np.zeros(series[0].shape, dtype=bool)
+    for valores, rango in zip(series, (humedad_optima, temperatura_optima, luz_optima)):
+        minimo, maximo = _limites(rango, valores.ndim)
+        # NaN no cumple ninguna comparación: cuenta como fuera de rango y
+        # se descarta después con la máscara
+        problemas += ~((valores >= minimo) & (valores <= maximo))
+        faltantes |= np.isnan(valores)
+
+    estados = np.minimum(problemas, 2)
+    estados[faltantes] = SIN_DATO
+    return estados
+
+
+def calcular_distribucion_estados_flota(
+    humedad: Any,
+    temperatura: Any,
+    luz: Any,
+    humedad_optima: Tuple[Any, Any],
+    temperatura_optima: Tuple[Any, Any],
+    luz_optima: Tuple[Any, Any]
+) -> np.ndarray:
+    """
+    Cuenta los días en cada estado para todas las plantas a la vez.
+
+    Args:
+        humedad: Lecturas de humedad (plantas × días; NaN = sin dato)
+        temperatura: Lecturas de temperatura (misma forma)
+        luz: Lecturas de luz (misma forma)
+        humedad_optima: (min, max) con un valor por planta (o escalares)
+        temperatura_optima: (min, max) con un valor por planta (o escalares)
+        luz_optima: (min, max) con un valor por planta (o escalares)
+
+    Returns:
+        np.ndarray (plantas, 3) con los conteos en el orden de ESTADOS;
+        los días sin dato no se cuentan
+    """
+    estados = clasificar_estados(humedad, temperatura, luz,
+                                 humedad_optima, temperatura_optima, luz_optima)
+    if estados.ndim == 1:
+        estados = estados[None, :]
+    return np.stack([(estados == i).sum(axis=1) for i in range(len(ESTADOS))], axis=1)
+
+
+def calcular_distribucion_estados(
+    humedad: Sequence[float],
+    temperatura: Sequence[float],
+    luz: Sequence[float],
+    humedad_optima: tuple,
+    temperatura_optima: tuple,
+    luz_optima: tuple
+) -> Dict[str, int]:
+    """
+    Calcula la distribución de estados de salud de la planta.
+
+    Los días en los que falta alguna lectura (NaN) no se cuentan en
+    ningún estado, así que la suma puede ser menor que el número de días.
+    La versión anterior, con bucles, contaba cada variable sin dato como
+    fuera de rango (NaN no cumple ninguna comparación).
+
+    Args:
+        humedad: Lista de lecturas de humedad
+        temperatura: Lista de lecturas de temperatura
+        luz: Lista de lecturas de luz
+        humedad_optima: Rango óptimo de humedad
+        temperatura_optima: Rango óptimo de temperatura
+        luz_optima: Rango óptimo de luz
+
+    Returns:
+        Diccionario con conteo de días en cada estado
+    """
+    # Como zip(), se usan solo los días presentes en las tres series
+    dias = min(len(humedad), len(temperatura), len(luz))
+    conteos = calcular_distribucion_estados_flota(
+        np.asarray(humedad, dtype=np.float64)[:dias],
+        np.asarray(temperatura, dtype=np.float64)[:dias],
+        np.asarray(luz, dtype=np.float64)[:dias],
+        humedad_optima, temperatura_optima, luz_optima
+    )[0]
+    return {estado: int(n) for estado, n in zip(ESTADOS, conteos)}
+
+
+def desviacion_rango(valores: Any, minimo: Any, maximo: Any) -> np.ndarray:
+    """
+    Distancia de cada lectura a su rango óptimo, en anchos de rango.
+
+    0 dentro del rango; negativa por debajo (-1 = un ancho de rango por
+    debajo del mínimo) y positiva por encima. Normalizar así permite
+    comparar en una misma escala plantas con rangos muy distintos.
+
+    Args:
+        valores: Lecturas (1-D o plantas × días)
+        minimo: Mínimo óptimo (escalar o uno por planta)
+        maximo: Máximo óptimo (escalar o uno por planta)
+
+    Returns:
+        np.ndarray float64 con la forma de los datos (NaN se conserva)
+    """
+    valores = np.asarray(valores, dtype=np.float64)
+    minimo, maximo = _limites((minimo, maximo), valores.ndim)
+    ancho = np.maximum(maximo - minimo, 1e-9)
+    return (np.minimum(valores - minimo, 0) + np.maximum(valores - maximo, 0)) / ancho
+
+
+def orden_por_estado(desviacion: Any) -> np.ndarray:
+    """
+    Ordena las plantas de la más sana a la más crítica.
+
+    Las plantas se agrupan por días fuera de rango (menos primero); a
+    igualdad, primero las que tienen menos días sin dato (NaN) y después
+    las de desviación media más cercana a 0, estén secas o húmedas.
+
+    Args:
+        desviacion: Matriz plantas × días de desviacion_rango()
+
+    Returns:
+        np.ndarray con los índices de fila ordenados
+    """
+    desviacion = np.asarray(desviacion, dtype=np.float64)
+    fuera = np.sum(np.abs(desviacion) > 0, axis=1)
+    sin_dato = np.sum(np.isnan(desviacion), axis=1)
+    # Media sin contar los días sin dato (y sin avisos si una fila está vacía)
+    validos = np.maximum(desviacion.shape[1] - sin_dato, 1)
+    media = np.nansum(desviacion, axis=1) / validos
+    return np.lexsort((np.abs(media), sin_dato, fuera))
+
+
+def contar_siempre_en_rango(desviacion: Any) -> int:
+    """
+    Cuenta las plantas con todos sus días dentro del rango óptimo.
+
+    Un día sin dato (NaN) no cuenta como dentro del rango: una planta con
+    la serie incompleta (p. ej. rellenada con NaN) no se da por sana.
+
+    Args:
+        desviacion: Matriz plantas × días de desviacion_rango()
+
+    Returns:
+        Número de plantas
+    """
+    desviacion = np.asarray(desviacion, dtype=np.float64)
+    return int(np.sum(np.all(desviacion == 0, axis=1)))
@@ -0,0 +1,16 @@
+"""
+Paleta de colores común a todos los dashboards (matplotlib y SVG).
+
+Este módulo no importa matplotlib, así que pueden usarlo los backends
+ligeros (dashboard_svg) sin pagar su importación.
+"""
+
+COLORES = {
+    'primario': '#2ecc71',
+    'secundario': '#3498db',
+    'peligro': '#e74c3c',
+    'advertencia': '#f39c12',
+    'info': '#9b59b6',
+    'exito': '#27ae60',
+    'neutro': '#95a5a6'
+}
@@ -0,0 +1,192 @@
+"""
+Exportación de lecturas en vivo a CSV, con buffer y escritura en segundo plano.
+
+Este módulo proporciona:
+- COLUMNAS_EXPORTACION: columnas del CSV exportado
+- ExportadorCSV: acumula lecturas en memoria y las escribe por lotes
+
+Escribir cada lectura en cuanto llega cuesta una llamada al sistema por
+lectura y bloquea el bucle de monitoreo cada vez que el disco tarda. Aquí
+cada lectura se convierte a una línea de texto y se añade a una lista; un
+hilo en segundo plano vuelca la lista completa con UNA escritura cuando
+alcanza `tam_lote` lecturas o cuando pasan `intervalo_s` segundos desde
+el último volcado. Al cerrar (o al terminar el programa) se escriben las
+lecturas pendientes.
+
+Ejemplo:
+    >>> exportador = ExportadorCSV("lecturas_monstera.csv")
+    >>> traductor = TraductorPlantaInteligente("Monstera", exportador=exportador)
+    >>> for _ in range(1000):
+    ...     traductor.procesar_lectura()
+    >>> exportador.cerrar()
+"""
+
+import atexit
+import os
+import threading
+from typing import Any, List
+
+from compresion import abrir
+
+
+COLUMNAS_EXPORTACION = ["timestamp", "planta", "humedad_raw", "luz_raw",
+                        "temperatura", "humedad_pct", "luz_pct"]
+
+
+class ExportadorCSV:
+    """
+    Exportador de lecturas a un CSV, solo de anexado.
+
+    `agregar()` nunca toca el disco: solo formatea la fila y la añade al
+    buffer. Las escrituras las hace un hilo daemon.
+
+    Atributos:
+        ruta (str): CSV de destino (.gz/.xz/.bz2 para comprimirlo)
+        tam_lote (int): Lecturas en el buffer que disparan un volcado
+        intervalo_s (float): Segundos máximos entre volcados con lecturas pendientes
+        filas_escritas (int): Lecturas ya escritas en el archivo
+        escrituras (int): Volcados realizados
+    """
+
+    def __init__(self, ruta: str, tam_lote: int = 500, intervalo_s: float = 5.0):
+        """
+        Abre (o crea) el CSV y arranca el hilo de escritura.
+
+        Args:
+            ruta: CSV de destino; si ya existe, las filas se anexan
+            tam_lote: Lecturas acumuladas que disparan un volcado
+            intervalo_s: Segundos máximos que una lectura espera en el buffer
+
+        Raises:
+            ValueError: Si tam_lote o intervalo_s no son positivos
+        """
+        if tam_lote <= 0:
+            raise ValueError("tam_lote debe ser mayor que 0")
+        if intervalo_s <= 0:
+            raise ValueError("intervalo_s debe ser mayor que 0")
+
+        self.ruta = ruta
+        self.tam_lote = tam_lote
+        self.intervalo_s = intervalo_s
+        self.filas_escritas = 0
+        self.escrituras = 0
+
+        self._buffer: List[str] = []
+        self._cerrojo = threading.Lock()        # Protege el buffer
+        self._cerrojo_archivo = threading.Lock()  # Serializa las escrituras
+        self._lote_lleno = threading.Event()
+        self._detener = False
+
+        nuevo = not os.path.exists(ruta) or os.path.getsize(ruta) == 0
+        self._archivo = abrir(ruta, "at", newline="")
+        if nuevo:
+            self._archivo.write(",".join(COLUMNAS_EXPORTACION) + "\n")
+            self._archivo.flush()
+
+        self._hilo = threading.Thread(target=self._bucle, name="ExportadorCSV", daemon=True)
+        self._hilo.start()
+        atexit.register(self.cerrar)
+
+    @property
+    def pendientes(self) -> int:
+        """Lecturas en el buffer todavía sin escribir."""
+        with self._cerrojo:
+            return len(self._buffer)
+
+    def agregar(self, lectura: Any, planta: str = "") -> None:
+        """
+        Añade una lectura (LecturaSensores) al buffer.
+
+        Args:
+            lectura: Objeto con los campos de COLUMNAS_EXPORTACION (salvo planta)
+            planta: Nombre de la planta de la lectura
+
+        Raises:
+            ValueError: Si el exportador ya está cerrado
+        """
+        # Las comas o comillas del nombre se escapan como en csv.writer
+        if any(c in planta for c in ',"\n'):
+            planta = '"' + planta.replace('"', '""') + '"'
+        fila = (f"{lectura.timestamp:.3f},{planta},{lectura.humedad_raw},{lectura.luz_raw},"
+                f"{lectura.temperatura:.2f},{lectura.humedad_pct:.2f},{lectura.luz_pct:.2f}\n")
+
+        # La comprobación y el anexado van bajo el mismo cerrojo que usa
+        # cerrar(): ninguna fila puede llegar después del volcado final
+        with self._cerrojo:
+            if self._detener:
+                raise ValueError("El exportador está cerrado")
+            self._buffer.append(fila)
+            lleno = len(self._buffer) >= self.tam_lote
+        if lleno:
+            self._lote_lleno.set()
+
+    def _volcar(self) -> None:
+        """
+        Escribe el buffer completo con una sola escritura.
+
+        Si la escritura falla, las filas vuelven al principio del buffer
+        (antes de las que llegaron mientras tanto) y se relanza el error;
+        el siguiente volcado las reintenta.
+
+        Raises:
+            ValueError: Si el archivo ya está cerrado y quedan filas en el
+                        buffer (las filas se conservan en el buffer)
+        """
+        with self._cerrojo_archivo:
+            with self._cerrojo:
+                if self._archivo.closed:
+                    if self._buffer:
+                        raise ValueError(f"El exportador está cerrado: {len(self._buffer)} "
+                                         f"lecturas sin escribir en '{self.ruta}'")
+                    return
+                filas, self._buffer = self._buffer, []
+            if not filas:
+                return
+            try:
+                self._archivo.write("".join(filas))
+                self._archivo.flush()
+            except BaseException:
+                with self._cerrojo:
+                    self._buffer[:0] = filas
+                raise
+            self.filas_escritas += len(filas)
+            self.escrituras += 1
+
+    def _bucle(self) -> None:
+        """Hilo de escritura: vuelca por tamaño de lote o por tiempo."""
+        while not self._detener:
+            self._lote_lleno.wait(self.intervalo_s)
+            self._lote_lleno.clear()
+            try:
+                self._volcar()
+            except Exception as e:
+                # Las lecturas siguen en el buffer y el hilo sigue vivo para
+                # reintentar en el próximo volcado
+                print(f"⚠️  Error al exportar lecturas a '{self.ruta}': {e}")
+
+    def flush(self) -> None:
+        """Escribe ya las lecturas pendientes (bloquea hasta terminar)."""
+        self._volcar()
+
+    def cerrar(self) -> None:
+        """Detiene el hilo, escribe las lecturas pendientes y cierra el archivo."""
+        with self._cerrojo:
+            if self._detener:
+                return
+            self._detener = True
+        self._lote_lleno.set()
+        self._hilo.join()
+        try:
+            self._volcar()
+        finally:
+            # Si el último volcado falla, el error se propaga y sus filas
+            # quedan en el buffer (ver `pendientes`)
+            with self._cerrojo_archivo:
+                self._archivo.close()
+            atexit.unregister(self.cerrar)
+
+    def __enter__(self) -> 'ExportadorCSV':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.cerrar()
@@ -0,0 +1,237 @@
+"""
+Generador vectorizado de datasets de humedad, escrito a disco por bloques.
+
+Este módulo proporciona:
+- ampliar_catalogo(): repite el catálogo de plantas hasta N especies sintéticas
+- iterar_bloques_dataset(): produce el dataset como DataFrames por bloques de especies
+- escribir_dataset_csv(): vuelca los bloques a un CSV y mide filas por segundo
+- generar_dataset(): las dos cosas juntas (usado por generar_dataset_csv)
+
+El formato es el de `generar_dataset_csv` (planta, dia, humedad,
+humedad_pct, umbral_sequia, frecuencia_riego), pero en lugar de crear un
+diccionario por fila se generan columnas completas con NumPy para un
+bloque de especies a la vez y cada bloque se escribe en cuanto está listo.
+La memoria depende del tamaño de bloque, no de especies × días.
+Si la ruta termina en .gz, .xz o .bz2 el CSV se comprime al vuelo.
+
+Uso desde la línea de comandos:
+    python generador_dataset.py --especies 100000 --dias 365 --salida grande.csv.gz
+"""
+
+import argparse
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from compresion import abrir
+from simulacion_rng import crear_generador
+
+
+COLUMNAS_DATASET = ["planta", "dia", "humedad", "humedad_pct",
+                    "umbral_sequia", "frecuencia_riego"]
+
+
+def _parametros(plantas: Sequence[Any]) -> Dict[str, np.ndarray]:
+    """Extrae de las configuraciones los parámetros que usa el generador."""
+    return {
+        "nombre": np.array([p.nombre for p in plantas], dtype=object),
+        "humedad_min": np.array([p.humedad_min for p in plantas], dtype=np.float64),
+        "humedad_max": np.array([p.humedad_max for p in plantas], dtype=np.float64),
+        "umbral_sequia": np.array([p.umbral_sequia for p in plantas], dtype=np.float64),
+        "frecuencia_riego": np.array([p.frecuencia_riego_dias for p in plantas], dtype=np.int64),
+    }
+
+
+def ampliar_catalogo(plantas: Sequence[Any], especies: int) -> Dict[str, np.ndarray]:
+    """
+    Construye los parámetros de `especies` especies repitiendo el catálogo.
+
+    Las copias reciben un sufijo numérico ("Acacia #2", "Acacia #3", ...)
+    para que cada especie sintética tenga un nombre único.
+
+    Args:
+        plantas: Configuraciones base (PlantaConfig o ConfiguracionPlanta)
+        especies: Número total de especies a generar
+
+    Returns:
+        Diccionario de parámetros por especie (arrays de longitud `especies`;
+        vacíos si especies es 0)
+
+    Raises:
+        ValueError: Si especies es negativo, o mayor que 0 con el catálogo vacío
+    """
+    if especies < 0:
+        raise ValueError("especies no puede ser negativo")
+    if especies == 0:
+        return _parametros([])
+    if not plantas:
+        raise ValueError("El catálogo de plantas está vacío")
+
+    base = _parametros(plantas)
+    indices = np.arange(especies) % len(plantas)
+    ampliado = {clave: valores[indices] for clave, valores in base.items()}
+
+    if especies > len(plantas):
+        copia = np.arange(especies) // len(plantas)
+        ampliado["nombre"] = np.array(
+            [n if c == 0 else f"{n} #{c + 1}" for n, c in zip(ampliado["nombre"], copia)],
+            dtype=object,
+        )
+    return ampliado
+
+
+def iterar_bloques_dataset(
+    parametros: Dict[str, np.ndarray],
+    dias: int = 50,
+    especies_por_bloque: int = 1000,
+    semilla: Optional[int] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Genera el dataset como una secuencia de DataFrames, uno por bloque de especies.
+
+    Los valores de humedad de cada especie se sortean de forma uniforme
+    dentro de su rango óptimo, como en generar_dataset_csv. Se usa un único
+    generador, así que el resultado para una semilla no depende del tamaño
+    de bloque.
+
+    Args:
+        parametros: Parámetros por especie (ver ampliar_catalogo o _parametros)
+        dias: Días de lecturas por especie
+        especies_por_bloque: Especies generadas y escritas a la vez
+        semilla: Semilla para resultados reproducibles
+
+    Yields:
+        pd.DataFrame con las columnas de COLUMNAS_DATASET (sin especies, un
+        único bloque vacío para que el CSV conserve la cabecera)
+    """
+    if dias <= 0:
+        raise ValueError("dias debe ser mayor que 0")
+    if especies_por_bloque <= 0:
+        raise ValueError("especies_por_bloque debe ser mayor que 0")
+
+    rng = crear_generador(semilla)
+    total = len(parametros["nombre"])
+    dias_bloque = np.arange(1, dias + 1)
+    if total == 0:
+        yield pd.DataFrame(columns=COLUMNAS_DATASET)
+        return
+
+    for inicio in range(0, total, especies_por_bloque):
+        fin = min(inicio + especies_por_bloque, total)
+        n = fin - inicio
+
+        # Una matriz especies × días por bloque, normalizada a 0-1
+        minimo = parametros["humedad_min"][inicio:fin, None] / 100.0
+        maximo = parametros["humedad_max"][inicio:fin, None] / 100.0
+        humedad = rng.uniform(minimo, maximo, (n, dias)).ravel()
+
+        yield pd.DataFrame({
+            "planta": np.repeat(parametros["nombre"][inicio:fin], dias),
+            "dia": np.tile(dias_bloque, n),
+            "humedad": np.round(humedad, 3),
+            "humedad_pct": np.round(humedad * 100, 2),
+            "umbral_sequia": np.repeat(parametros["umbral_sequia"][inicio:fin], dias),
+            "frecuencia_riego": np.repeat(parametros["frecuencia_riego"][inicio:fin], dias),
+        }, columns=COLUMNAS_DATASET)
+
+
+def escribir_dataset_csv(ruta_archivo: str, bloques: Iterator[pd.DataFrame]) -> Dict[str, float]:
+    """
+    Escribe los bloques en un CSV a medida que se generan.
+
+    Args:
+        ruta_archivo: Ruta del CSV de salida (se sobrescribe; .gz/.xz/.bz2
+                      para comprimirlo)
+        bloques: Iterador de DataFrames con las mismas columnas
+
+    Returns:
+        Diccionario con "filas", "segundos", "filas_por_segundo" y "bytes"
+        (tamaño en disco, ya comprimido)
+    """
+    inicio = time.perf_counter()
+    filas = 0
+    with abrir(ruta_archivo, "wt", newline="") as f:
+        for i, bloque in enumerate(bloques):
+            bloque.to_csv(f, header=(i == 0), index=False)
+            filas += len(bloque)
+    segundos = time.perf_counter() - inicio
+
+    return {
+        "filas": filas,
+        "segundos": segundos,
+        "filas_por_segundo": filas / segundos if segundos > 0 else float("inf"),
+        "bytes": os.path.getsize(ruta_archivo),
+    }
+
+
+def generar_dataset(
+    plantas: Sequence[Any],
+    ruta_archivo: str,
+    dias: int = 50,
+    especies: Optional[int] = None,
+    especies_por_bloque: int = 1000,
+    semilla: Optional[int] = None,
+    devolver_dataframe: bool = False
+) -> Dict[str, Any]:
+    """
+    Genera y escribe el dataset completo por bloques.
+
+    Args:
+        plantas: Catálogo de plantas (PlantaConfig o ConfiguracionPlanta)
+        ruta_archivo: Ruta del CSV de salida
+        dias: Días de lecturas por especie
+        especies: Número de especies (default: las del catálogo; si es mayor,
+                  el catálogo se repite con ampliar_catalogo)
+        especies_por_bloque: Especies generadas y escritas a la vez
+        semilla: Semilla para resultados reproducibles
+        devolver_dataframe: Si True, además conserva los bloques y devuelve
+                            el DataFrame completo en "dataframe" (la memoria
+                            deja de estar acotada)
+
+    Returns:
+        Estadísticas de escribir_dataset_csv más "especies", "dias" y,
+        si se pidió, "dataframe"
+    """
+    parametros = ampliar_catalogo(plantas, especies if especies is not None else len(plantas))
+    bloques = iterar_bloques_dataset(parametros, dias, especies_por_bloque, semilla)
+
+    conservados: List[pd.DataFrame] = []
+    if devolver_dataframe:
+        def _conservar(iterador):
+            for bloque in iterador:
+                conservados.append(bloque)
+                yield bloque
+        bloques = _conservar(bloques)
+
+    estadisticas: Dict[str, Any] = escribir_dataset_csv(ruta_archivo, bloques)
+    estadisticas["especies"] = len(parametros["nombre"])
+    estadisticas["dias"] = dias
+    if devolver_dataframe:
+        estadisticas["dataframe"] = pd.concat(conservados, ignore_index=True)
+    return estadisticas
+
+
+if __name__ == "__main__":
+    from planta_config import cargar_plantas
+
+    parser = argparse.ArgumentParser(description="Genera un dataset sintético de humedad por bloques.")
+    parser.add_argument("--salida", default="dataset_plantas_generado.csv", help="CSV de salida")
+    parser.add_argument("--especies", type=int, default=None,
+                        help="Número de especies (default: las 960 del catálogo)")
+    parser.add_argument("--dias", type=int, default=50, help="Días por especie")
+    parser.add_argument("--bloque", type=int, default=1000, help="Especies por bloque")
+    parser.add_argument("--semilla", type=int, default=None, help="Semilla aleatoria")
+    args = parser.parse_args()
+
+    resultado = generar_dataset(cargar_plantas(), args.salida, dias=args.dias,
+                                especies=args.especies, especies_por_bloque=args.bloque,
+                                semilla=args.semilla)
+
+    print(f"Dataset generado: {args.salida}")
+    print(f"   Especies: {resultado['especies']:,} | Días: {resultado['dias']}")
+    print(f"   Filas: {resultado['filas']:,} en {resultado['segundos']:.2f} s "
+          f"({resultado['filas_por_segundo']:,.0f} filas/s)")
+    print(f"   Tamaño: {resultado['bytes'] / 1024 / 1024:.1f} MB")
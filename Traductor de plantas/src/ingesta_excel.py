@@ -0,0 +1,277 @@
+"""
+Ingesta de los datasets en Excel (.xlsx) al formato canónico binario.
+
+Este módulo proporciona:
+- hash_archivo(): SHA-256 de un archivo, leído por bloques
+- parsear_excel(): lee un libro largo (Planta, Dia, Humedad_pct, ...) o
+  ancho (Planta, Dia 1 ... Dia N) con openpyxl
+- ingerir_excel(): convierte el libro UNA vez y guarda el .npz canónico
+- cargar_dataset_excel(): carga usada por cargador_datasets.cargar_dataset
+
+Leer dataset_plantas_960.xlsx con openpyxl tarda varios segundos. Aquí
+el libro se convierte una sola vez a `<sha256>.npz` en la carpeta de cache
+(el formato de conversion_datasets). La clave es el hash del CONTENIDO,
+así que una copia o un renombrado del mismo libro reutiliza la conversión.
+Para no recalcular el hash en cada carga, un manifiesto JSON recuerda el
+hash de cada ruta junto con su fecha de modificación y tamaño.
+
+Uso desde la línea de comandos:
+    python ingesta_excel.py "../data/dataset_plantas_960.xlsx" "../data/plantas_humedad_30dias (TEST).xlsx"
+
+Requiere openpyxl solo para la primera conversión:
+    pip install openpyxl
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from cargador_datasets import DatasetPorPlanta, _agrupar
+from conversion_datasets import cargar_canonico, carpeta_cache, guardar_canonico
+
+
+ARCHIVO_MANIFIESTO = "manifiesto_excel.json"
+TAM_BLOQUE_HASH = 1024 * 1024
+
+# Cache en memoria: ruta absoluta -> ((mtime_ns, tamaño), dataset)
+_CACHE: Dict[str, tuple] = {}
+
+
+def hash_archivo(ruta: str) -> str:
+    """
+    Calcula el SHA-256 de un archivo sin cargarlo entero en memoria.
+
+    Args:
+        ruta: Ruta del archivo
+
+    Returns:
+        Hash en hexadecimal
+    """
+    sha = hashlib.sha256()
+    with open(ruta, "rb") as f:
+        for bloque in iter(lambda: f.read(TAM_BLOQUE_HASH), b""):
+            sha.update(bloque)
+    return sha.hexdigest()
+
+
+# ==========================================
+# LECTURA DEL LIBRO
+# ==========================================
+
+def _numero_dia(columna: str) -> Optional[int]:
+    """Devuelve N para cabeceras 'Dia N', 'Día N' o 'Día_N'; None si no lo es."""
+    texto = columna.strip().lower().replace("í", "i").replace("_", " ")
+    if texto.startswith("dia "):
+        numero = texto[4:].strip()
+        if numero.isdigit():
+            return int(numero)
+    return None
+
+
+def parsear_excel(ruta: str) -> DatasetPorPlanta:
+    """
+    Lee la primera hoja de un libro de lecturas.
+
+    Formatos reconocidos (por la cabecera):
+        - Largo: Planta, Dia, Humedad, Humedad_pct, ... (una fila por día)
+        - Ancho: Planta, Dia 1, ..., Dia N (una fila por planta)
+
+    Args:
+        ruta: Ruta del .xlsx
+
+    Returns:
+        DatasetPorPlanta con las columnas en minúsculas ("dia", "humedad_pct", ...)
+
+    Raises:
+        ImportError: Si openpyxl no está instalado
+        ValueError: Si la hoja no tiene una columna 'Planta'
+    """
+    try:
+        import openpyxl
+    except ImportError:
+        raise ImportError("Se requiere openpyxl para leer archivos Excel. "
+                          "Instala con: pip install openpyxl") from None
+
+    libro = openpyxl.load_workbook(ruta, read_only=True, data_only=True)
+    try:
+        filas = libro.worksheets[0].iter_rows(values_only=True)
+        cabecera = [str(c).strip() if c is not None else "" for c in next(filas, ())]
+        datos = [fila for fila in filas if fila and fila[0] is not None]
+    finally:
+        libro.close()
+
+    if not cabecera or cabecera[0].lower() != "planta":
+        raise ValueError(f"'{ruta}' no tiene una columna 'Planta' en la primera hoja")
+
+    plantas = np.array([str(fila[0]) for fila in datos], dtype=object)
+    valores = np.array([fila[1:len(cabecera)] for fila in datos], dtype=np.float64)
+    if valores.size == 0:
+        valores = valores.reshape(0, len(cabecera) - 1)
+
+    dias = [_numero_dia(c) for c in cabecera[1:]]
+    if all(d is not None for d in dias):
+        # Ancho: aplanar la matriz plantas × días
+        n_plantas, n_dias = valores.shape
+        return _agrupar(
+            np.repeat(plantas, n_dias),
+            {
+                "dia": np.tile(np.array(dias, dtype=np.int64), n_plantas),
+                "humedad_pct": valores.ravel(),
+            },
+        )
+
+    columnas = {}
+    for i, nombre in enumerate(cabecera[1:]):
+        columna = valores[:, i]
+        # Enteros guardados como número en Excel (Dia, Frecuencia_riego)
+        if np.all(np.mod(columna, 1) == 0):
+            columna = columna.astype(np.int64)
+        columnas[nombre.lower()] = columna
+    return _agrupar(plantas, columnas)
+
+
+# ==========================================
+# CONVERSIÓN ÚNICA Y MANIFIESTO
+# ==========================================
+
+def _leer_manifiesto(carpeta_cache: str) -> Dict[str, Dict[str, object]]:
+    ruta = os.path.join(carpeta_cache, ARCHIVO_MANIFIESTO)
+    try:
+        with open(ruta, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _actualizar_manifiesto(carpeta_cache: str, ruta_libro: str, entrada: Dict[str, object]) -> None:
+    """
+    Añade la entrada de un libro al manifiesto.
+
+    El manifiesto se vuelve a leer justo antes del reemplazo atómico, así
+    que las entradas que otro proceso escribió mientras este convertía su
+    libro se conservan.
+    """
+    ruta = os.path.join(carpeta_cache, ARCHIVO_MANIFIESTO)
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    os.makedirs(carpeta_cache, exist_ok=True)
+    try:
+        manifiesto = _leer_manifiesto(carpeta_cache)
+        manifiesto[ruta_libro] = entrada
+        with open(temporal, "w", encoding="utf-8") as f:
+            json.dump(manifiesto, f, indent=2, ensure_ascii=False)
+        os.replace(temporal, ruta)
+    finally:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+
+
+def ingerir_excel(ruta: str, forzar: bool = False) -> DatasetPorPlanta:
+    """
+    Convierte un libro al formato canónico (solo si hace falta) y lo carga.
+
+    Pasos:
+        1. Si el manifiesto tiene la misma fecha y tamaño para esta ruta,
+           se usa su hash sin releer el archivo.
+        2. Si no, se calcula el SHA-256 y se actualiza el manifiesto.
+        3. Si existe `<sha256>.npz` en carpeta_cache() se carga; si no, se parsea el
+           libro con openpyxl y se guarda.
+
+    Si la cache no se puede escribir (carpeta de solo lectura, disco
+    lleno), se avisa y se devuelve el libro parseado, como
+    conversion_datasets.cargar_o_convertir.
+
+    Args:
+        ruta: Ruta del .xlsx
+        forzar: Si True, vuelve a parsear el libro aunque exista la conversión
+
+    Returns:
+        DatasetPorPlanta
+    """
+    ruta_abs = os.path.abspath(ruta)
+    carpeta = carpeta_cache()
+    estado = os.stat(ruta_abs)
+
+    manifiesto = _leer_manifiesto(carpeta)
+    entrada = manifiesto.get(ruta_abs)
+    if (entrada is not None and entrada.get("mtime_ns") == estado.st_mtime_ns
+            and entrada.get("tamano") == estado.st_size):
+        sha256 = str(entrada["sha256"])
+    else:
+        sha256 = hash_archivo(ruta_abs)
+        entrada = None
+
+    ruta_npz = os.path.join(carpeta, f"{sha256}.npz")
+    dataset = None if forzar else cargar_canonico(ruta_npz)
+    if dataset is None:
+        dataset = parsear_excel(ruta_abs)
+        try:
+            guardar_canonico(dataset, ruta_npz)
+        except OSError as e:
+            # Carpeta de solo lectura o disco lleno: se trabaja sin cache en disco
+            print(f"⚠️  No se pudo guardar el formato canónico de '{ruta}': {e}")
+            return dataset
+
+    if entrada is None:
+        try:
+            _actualizar_manifiesto(carpeta, ruta_abs, {
+                "sha256": sha256,
+                "mtime_ns": estado.st_mtime_ns,
+                "tamano": estado.st_size,
+            })
+        except OSError as e:
+            print(f"⚠️  No se pudo actualizar el manifiesto de '{carpeta}': {e}")
+    return dataset
+
+
+def cargar_dataset_excel(ruta: str) -> DatasetPorPlanta:
+    """
+    Carga un libro Excel, desde memoria o desde su conversión en disco.
+
+    Args:
+        ruta: Ruta del .xlsx
+
+    Returns:
+        DatasetPorPlanta (cacheado mientras el archivo no cambie)
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+    """
+    ruta_abs = os.path.abspath(ruta)
+    estado = os.stat(ruta_abs)
+    firma = (estado.st_mtime_ns, estado.st_size)
+    en_cache = _CACHE.get(ruta_abs)
+    if en_cache is not None and en_cache[0] == firma:
+        return en_cache[1]
+    dataset = ingerir_excel(ruta_abs)
+    _CACHE[ruta_abs] = (firma, dataset)
+    return dataset
+
+
+def main(argumentos: Optional[List[str]] = None) -> None:
+    """Convierte uno o más libros y muestra cuánto tarda cada carga."""
+    parser = argparse.ArgumentParser(description="Convierte libros .xlsx al formato canónico.")
+    parser.add_argument("libros", nargs="+", help="Archivos .xlsx a convertir")
+    parser.add_argument("--forzar", action="store_true", help="Reconvertir aunque exista la cache")
+    args = parser.parse_args(argumentos)
+
+    for libro in args.libros:
+        inicio = time.perf_counter()
+        dataset = ingerir_excel(libro, forzar=args.forzar)
+        conversion = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        ingerir_excel(libro)
+        recarga = time.perf_counter() - inicio
+
+        print(f"✅ {libro}")
+        print(f"   Plantas: {len(dataset)} | Filas: {int(dataset.inicios[-1]):,}")
+        print(f"   Conversión: {conversion:.2f} s | Carga desde cache: {recarga * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+Medición de tiempos por etapa con histogramas de cubetas fijas.
+
+Este módulo proporciona:
+- ETAPAS: etapas de TraductorPlantaInteligente.procesar_lectura()
+- LIMITES_NS: límites de las cubetas (escala logarítmica, de 100 ns a 10 s)
+- Histograma: conteos por cubeta, con media y percentiles
+- Instrumentacion: un histograma por etapa
+
+Guardar cada duración en una lista crece sin límite y obliga a ordenar
+para calcular percentiles. Aquí cada duración solo incrementa el contador
+de su cubeta (búsqueda binaria sobre límites fijos), así que la memoria
+es constante y registrar cuesta lo mismo tras mil o mil millones de
+lecturas. Los percentiles se estiman dentro de la cubeta (error menor
+que el ancho de una cubeta, ~19%).
+
+Ejemplo:
+    >>> instrumentacion = Instrumentacion()
+    >>> traductor = TraductorPlantaInteligente("Monstera", instrumentacion=instrumentacion)
+    >>> for _ in range(1000):
+    ...     traductor.procesar_lectura()
+    >>> instrumentacion.imprimir_resumen()
+"""
+
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+
+ETAPAS = (
+    'lectura_sensores',  # Paso 1: leer sensores (simulados o reales)
+    'normalizacion',     # Pasos 2-3: ADC -> porcentaje y LecturaSensores
+    'prediccion_ml',     # Paso 4a: modelo de riego
+    'reglas',            # Paso 4b: rangos, prioridades y motor de alertas
+    'mensaje',           # Paso 5: traducción a lenguaje natural
+    'historial',         # Paso 6: historial, almacén y exportador
+)
+
+# 12 cubetas por década entre 100 ns y 10 s (límites superiores, en ns)
+CUBETAS_POR_DECADA = 12
+LIMITES_NS: List[int] = [round(100 * 10 ** (i / CUBETAS_POR_DECADA))
+                         for i in range(8 * CUBETAS_POR_DECADA + 1)]
+
+
+class Histograma:
+    """
+    Histograma de duraciones con cubetas fijas (LIMITES_NS).
+
+    La última cubeta acumula todo lo que supera el último límite.
+
+    Atributos:
+        conteos (List[int]): Conteo por cubeta (len(LIMITES_NS) + 1)
+        total (int): Número de duraciones registradas
+        suma_ns (int): Suma de las duraciones
+        minimo_ns (Optional[int]): Duración mínima
+        maximo_ns (Optional[int]): Duración máxima
+    """
+
+    def __init__(self):
+        self.conteos = [0] * (len(LIMITES_NS) + 1)
+        self.total = 0
+        self.suma_ns = 0
+        self.minimo_ns: Optional[int] = None
+        self.maximo_ns: Optional[int] = None
+
+    def registrar(self, duracion_ns: int) -> None:
+        """Agrega una duración en nanosegundos."""
+        self.conteos[bisect_left(LIMITES_NS, duracion_ns)] += 1
+        self.total += 1
+        self.suma_ns += duracion_ns
+        if self.minimo_ns is None or duracion_ns < self.minimo_ns:
+            self.minimo_ns = duracion_ns
+        if self.maximo_ns is None or duracion_ns > self.maximo_ns:
+            self.maximo_ns = duracion_ns
+
+    def media_ns(self) -> float:
+        """Duración media (0 si no hay datos)."""
+        return self.suma_ns / self.total if self.total else 0.0
+
+    def percentil(self, p: float) -> float:
+        """
+        Estima un percentil interpolando dentro de su cubeta.
+
+        Args:
+            p: Percentil entre 0 y 100
+
+        Returns:
+            Duración estimada en nanosegundos (0 si no hay datos)
+
+        Raises:
+            ValueError: Si p no está entre 0 y 100
+        """
+        if not 0 <= p <= 100:
+            raise ValueError("El percentil debe estar entre 0 y 100")
+        if self.total == 0:
+            return 0.0
+        objetivo = p / 100 * self.total
+        acumulado = 0
+        for i, conteo in enumerate(self.conteos):
+            if conteo and acumulado + conteo >= objetivo:
+                inferior = LIMITES_NS[i - 1] if i > 0 else 0
+                superior = LIMITES_NS[i] if i < len(LIMITES_NS) else self.maximo_ns
+                # Los extremos reales acotan la estimación
+                inferior = max(inferior, self.minimo_ns)
+                superior = min(superior, self.maximo_ns)
+                return inferior + (superior - inferior) * (objetivo - acumulado) / conteo
+            acumulado += conteo
+        return float(self.maximo_ns)
+
+    def combinar(self, otro: 'Histograma') -> None:
+        """Suma los conteos de otro histograma (p. ej. de otro traductor)."""
+        self.conteos = [a + b for a, b in zip(self.conteos, otro.conteos)]
+        self.total += otro.total
+        self.suma_ns += otro.suma_ns
+        for valor in (otro.minimo_ns, otro.maximo_ns):
+            if valor is not None:
+                self.minimo_ns = valor if self.minimo_ns is None else min(self.minimo_ns, valor)
+                self.maximo_ns = valor if self.maximo_ns is None else max(self.maximo_ns, valor)
+
+
+class Instrumentacion:
+    """
+    Tiempos por etapa de un traductor (un Histograma por etapa).
+
+    Se pasa a TraductorPlantaInteligente(instrumentacion=...). Sin ella el
+    traductor no toma ningún tiempo.
+
+    Ejemplo:
+        >>> instrumentacion.resumen()['prediccion_ml']['p99_us']
+        61.3
+    """
+
+    def __init__(self):
+        self.histogramas: Dict[str, Histograma] = {etapa: Histograma() for etapa in ETAPAS}
+
+    def marcar(self, etapa: str, inicio_ns: int) -> int:
+        """
+        Registra el tiempo transcurrido desde `inicio_ns` en una etapa.
+
+        Args:
+            etapa: Nombre de la etapa (se crea si no existe)
+            inicio_ns: time.perf_counter_ns() al empezar la etapa
+
+        Returns:
+            time.perf_counter_ns() actual, para usarlo como inicio de la siguiente etapa
+        """
+        ahora = time.perf_counter_ns()
+        histograma = self.histogramas.get(etapa)
+        if histograma is None:
+            histograma = self.histogramas[etapa] = Histograma()
+        histograma.registrar(ahora - inicio_ns)
+        return ahora
+
+    @contextmanager
+    def medir(self, etapa: str) -> Iterator[None]:
+        """Mide un bloque de código: `with instrumentacion.medir("etapa"): ...`."""
+        inicio = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.marcar(etapa, inicio)
+
+    def resumen(self) -> Dict[str, Dict[str, float]]:
+        """
+        Estadísticas por etapa, en microsegundos.
+
+        Returns:
+            {etapa: {'n', 'media_us', 'p50_us', 'p90_us', 'p99_us', 'max_us'}}
+            (solo etapas con datos)
+        """
+        resumen = {}
+        for etapa, h in self.histogramas.items():
+            if h.total:
+                resumen[etapa] = {
+                    'n': h.total,
+                    'media_us': h.media_ns() / 1000,
+                    'p50_us': h.percentil(50) / 1000,
+                    'p90_us': h.percentil(90) / 1000,
+                    'p99_us': h.percentil(99) / 1000,
+                    'max_us': h.maximo_ns / 1000,
+                }
+        return resumen
+
+    def reiniciar(self) -> None:
+        """Borra todas las mediciones."""
+        for etapa in self.histogramas:
+            self.histogramas[etapa] = Histograma()
+
+    def imprimir_resumen(self) -> None:
+        """Imprime la tabla de tiempos por etapa."""
+        resumen = self.resumen()
+        total = sum(e['media_us'] * e['n'] for e in resumen.values()) or 1.0
+        print("=" * 78)
+        print(f"{'Etapa':<18s}{'n':>8s}{'media':>10s}{'p50':>10s}{'p90':>10s}{'p99':>10s}{'%':>8s}")
+        print("-" * 78)
+        for etapa, e in resumen.items():
+            print(f"{etapa:<18s}{e['n']:>8d}{e['media_us']:>8.1f}µs{e['p50_us']:>8.1f}µs"
+                  f"{e['p90_us']:>8.1f}µs{e['p99_us']:>8.1f}µs"
+                  f"{e['media_us'] * e['n'] / total * 100:>7.1f}%")
+        print("=" * 78)
@@ -2,10 +2,30 @@
 Generador de Dataset: Plantas con 30 días de lecturas de humedad
 Ordenadas alfabéticamente
 Basado en el archivo Excel proporcionado
+
+Uso como script (genera los archivos TXT y CSV y muestra una vista previa):
+    python plantas.py [--dias 30] [--semilla 42] [--procesos 4]
+
+Uso como módulo:
+    >>> from plantas import plantas_ordenadas, generar_matriz_humedad, exportar_dataset
+    >>> matriz = generar_matriz_humedad(plantas_ordenadas, dias=30, semilla=42)
+    >>> exportar_dataset(plantas_ordenadas, [EscritorCSV("humedad.csv")], semilla=42)
+
+La serie de cada planta se calcula UNA sola vez (vectorizada con NumPy,
+por bloques de plantas) y el mismo bloque se envía a todos los escritores
+(TXT, CSV, vista previa...) en una sola pasada, así que todos los archivos
+contienen exactamente los mismos datos. Las rutas terminadas en .gz, .xz
+o .bz2 se escriben comprimidas.
 """
 
-import random
+import argparse
 import csv
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from compresion import abrir
 
 # Lista COMPLETA de plantas del archivo Excel
 plantas = """Aaron's Beard
@@ -969,95 +989,333 @@ Yerba De Cabra
 Yerba De Jicotea
 Yew Plum Pine""".strip().split('\n')
 
+
 # Ordenar alfabéticamente y eliminar duplicados
 plantas_ordenadas = sorted(set(plantas))
 
-print(f"="*100)
-print(f"GENERADOR DE DATASET: PLANTAS CON 30 DÍAS DE LECTURAS DE HUMEDAD")
-print(f"="*100)
-print(f"\nTotal de plantas: {len(plantas_ordenadas)}")
-print(f"Días por planta: 30")
-print(f"Total de lecturas: {len(plantas_ordenadas) * 30:,}\n")
-
-def generar_lecturas_humedad(planta_nombre):
-    """Genera 30 días de lecturas de humedad para una planta"""
-    # Determinar rango según tipo
-    nombre_lower = planta_nombre.lower()
-    
-    if any(word in nombre_lower for word in ['cactus', 'desert', 'succulent', 'cholla']):
-        humedad_base = random.uniform(20, 35)
-    elif any(word in nombre_lower for word in ['fern', 'moss', 'lichen']):
-        humedad_base = random.uniform(60, 80)
-    elif any(word in nombre_lower for word in ['water', 'aquatic', 'hyacinth', 'papyrus']):
-        humedad_base = random.uniform(70, 85)
+DIAS_POR_DEFECTO = 30
+
+# Rango de humedad base según palabras clave del nombre (la primera que coincide)
+CATEGORIAS_HUMEDAD: List[Tuple[Tuple[str, ...], Tuple[float, float]]] = [
+    (('cactus', 'desert', 'succulent', 'cholla'), (20.0, 35.0)),
+    (('fern', 'moss', 'lichen'), (60.0, 80.0)),
+    (('water', 'aquatic', 'hyacinth', 'papyrus'), (70.0, 85.0)),
+]
+RANGO_HUMEDAD_GENERAL = (40.0, 65.0)
+
+VARIACION_DIARIA = 3.0       # Desviación del ruido gaussiano diario (%)
+HUMEDAD_LIMITES = (10.0, 90.0)
+
+
+def rangos_humedad_base(nombres: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Determina el rango de la humedad base de cada planta según su nombre.
+
+    Args:
+        nombres: Nombres de las plantas
+
+    Returns:
+        Tupla (minimos, maximos) de arrays con un valor por planta
+    """
+    minimos = np.full(len(nombres), RANGO_HUMEDAD_GENERAL[0])
+    maximos = np.full(len(nombres), RANGO_HUMEDAD_GENERAL[1])
+    for i, nombre in enumerate(nombres):
+        nombre_lower = nombre.lower()
+        for palabras, (minimo, maximo) in CATEGORIAS_HUMEDAD:
+            if any(palabra in nombre_lower for palabra in palabras):
+                minimos[i], maximos[i] = minimo, maximo
+                break
+    return minimos, maximos
+
+
+def _generar_bloque(argumentos: Tuple[Sequence[str], int, np.random.SeedSequence]) -> np.ndarray:
+    """
+    Genera la matriz plantas × días de un bloque (función de nivel de
+    módulo para poder ejecutarse en otro proceso).
+    """
+    nombres, dias, secuencia = argumentos
+    rng = np.random.default_rng(secuencia)
+    minimos, maximos = rangos_humedad_base(nombres)
+    humedad_base = rng.uniform(minimos, maximos)
+    variacion = rng.normal(0.0, VARIACION_DIARIA, (len(nombres), dias))
+    return np.round(np.clip(humedad_base[:, None] + variacion, *HUMEDAD_LIMITES), 2)
+
+
+def iterar_bloques_humedad(
+    nombres: Sequence[str],
+    dias: int = DIAS_POR_DEFECTO,
+    semilla: Optional[int] = None,
+    procesos: int = 1,
+    plantas_por_bloque: int = 256
+) -> Iterator[Tuple[int, Sequence[str], np.ndarray]]:
+    """
+    Genera las series de humedad por bloques de plantas, en orden.
+
+    Cada bloque recibe su propia SeedSequence hija, así que el resultado
+    para una semilla es el mismo con 1 proceso o con varios.
+
+    Args:
+        nombres: Nombres de las plantas
+        dias: Días de lecturas por planta
+        semilla: Semilla para resultados reproducibles
+        procesos: Procesos en paralelo (1 = en el proceso actual)
+        plantas_por_bloque: Plantas por bloque
+
+    Yields:
+        Tupla (indice_inicial, nombres_del_bloque, matriz plantas × días)
+    """
+    if plantas_por_bloque <= 0:
+        raise ValueError("plantas_por_bloque debe ser mayor que 0")
+
+    inicios = range(0, len(nombres), plantas_por_bloque)
+    secuencias = np.random.SeedSequence(semilla).spawn(len(inicios))
+    tareas = [(nombres[i:i + plantas_por_bloque], dias, s) for i, s in zip(inicios, secuencias)]
+
+    if procesos > 1 and len(tareas) > 1:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            for inicio, tarea, matriz in zip(inicios, tareas, ejecutor.map(_generar_bloque, tareas)):
+                yield inicio, tarea[0], matriz
     else:
-        humedad_base = random.uniform(40, 65)
-    
-    # Generar 30 días con variación gaussiana
-    lecturas = []
-    for _ in range(30):
-        variacion = random.gauss(0, 3)
-        humedad = round(max(10, min(90, humedad_base + variacion)), 2)
-        lecturas.append(humedad)
-    
-    return lecturas
-
-# Generar archivo TXT
-print("Generando archivo TXT...")
-with open('plantas_humedad_30dias.txt', 'w', encoding='utf-8') as f:
-    f.write("="*100 + "\n")
-    f.write("DATASET: PLANTAS CON 30 DÍAS DE LECTURAS DE HUMEDAD (ORDENADAS ALFABÉTICAMENTE)\n")
-    f.write("="*100 + "\n")
-    f.write(f"Total de plantas: {len(plantas_ordenadas)}\n")
-    f.write(f"Días por planta: 30\n")
-    f.write(f"Formato: [Número]. Nombre de Planta | Día1, Día2, ..., Día30 (% humedad)\n")
-    f.write("="*100 + "\n\n")
-    
-    for i, planta in enumerate(plantas_ordenadas, 1):
-        lecturas = generar_lecturas_humedad(planta)
-        lecturas_str = ", ".join([f"{h:.2f}" for h in lecturas])
-        f.write(f"{i:4d}. {planta:<50s} | {lecturas_str}\n")
-
-print(f"✅ Archivo TXT generado: plantas_humedad_30dias.txt")
-
-# Generar archivo CSV
-print("Generando archivo CSV...")
-with open('plantas_humedad_30dias.csv', 'w', newline='', encoding='utf-8') as csvfile:
-    writer = csv.writer(csvfile)
-    
-    # Encabezados
-    headers = ['Planta'] + [f'Día_{i}' for i in range(1, 31)]
-    writer.writerow(headers)
-    
-    # Datos
-    for planta in plantas_ordenadas:
-        lecturas = generar_lecturas_humedad(planta)
-        fila = [planta] + lecturas
-        writer.writerow(fila)
-
-print(f"✅ Archivo CSV generado: plantas_humedad_30dias.csv")
-
-# Mostrar vista previa de las primeras 5 plantas
-print(f"\n{'='*100}")
-print("VISTA PREVIA - PRIMERAS 5 PLANTAS:")
-print(f"{'='*100}\n")
-
-for i, planta in enumerate(plantas_ordenadas[:5], 1):
-    lecturas = generar_lecturas_humedad(planta)
-    lecturas_str = ", ".join([f"{h:.2f}" for h in lecturas[:10]])  # Solo primeros 10 días
-    print(f"{i}. {planta}")
-    print(f"   Primeros 10 días: {lecturas_str}... (+ 20 días más)")
-    print()
-
-print(f"{'='*100}")
-print("PROCESO COMPLETADO EXITOSAMENTE")
-print(f"{'='*100}")
-print(f"\n📊 Resumen:")
-print(f"   • Total de plantas: {len(plantas_ordenadas)}")
-print(f"   • Días por planta: 30")
-print(f"   • Total de lecturas generadas: {len(plantas_ordenadas) * 30:,}")
-print(f"   • Archivos creados:")
-print(f"     - plantas_humedad_30dias.txt (formato legible)")
-print(f"     - plantas_humedad_30dias.csv (para Excel/análisis)")
-print(f"\n✅ Los archivos están listos para usar!")
-print(f"{'='*100}\n")
\ No newline at end of file
+        for inicio, tarea in zip(inicios, tareas):
+            yield inicio, tarea[0], _generar_bloque(tarea)
+
+
+def generar_matriz_humedad(
+    nombres: Sequence[str],
+    dias: int = DIAS_POR_DEFECTO,
+    semilla: Optional[int] = None,
+    procesos: int = 1,
+    plantas_por_bloque: int = 256
+) -> np.ndarray:
+    """
+    Genera la matriz completa de lecturas (plantas × días).
+
+    Args:
+        nombres: Nombres de las plantas
+        dias: Días de lecturas por planta
+        semilla: Semilla para resultados reproducibles
+        procesos: Procesos en paralelo (útil para listas enormes)
+        plantas_por_bloque: Plantas por bloque
+
+    Returns:
+        np.ndarray de forma (len(nombres), dias) con humedad en %
+    """
+    bloques = [m for _, _, m in iterar_bloques_humedad(nombres, dias, semilla,
+                                                        procesos, plantas_por_bloque)]
+    return np.vstack(bloques) if bloques else np.empty((0, dias))
+
+
+def generar_lecturas_humedad(planta_nombre: str, dias: int = DIAS_POR_DEFECTO,
+                             semilla: Optional[int] = None) -> List[float]:
+    """Genera `dias` días de lecturas de humedad para una planta"""
+    return generar_matriz_humedad([planta_nombre], dias, semilla)[0].tolist()
+
+
+# ==========================================
+# ESCRITORES (reciben los mismos bloques)
+# ==========================================
+
+def ruta_dataset(dias: int, extension: str) -> str:
+    """Nombre por defecto del dataset: plantas_humedad_<dias>dias.<extension>"""
+    return f'plantas_humedad_{dias}dias.{extension}'
+
+
+class EscritorTXT:
+    """Archivo de texto legible: [Número]. Nombre | Día1, ..., DíaN"""
+
+    def __init__(self, ruta: Optional[str] = None):
+        """
+        Args:
+            ruta: Archivo de salida (default: ruta_dataset(dias, 'txt'),
+                  resuelta al iniciar con los días pedidos)
+        """
+        self.ruta = ruta
+        self._archivo = None
+
+    def iniciar(self, total_plantas: int, dias: int) -> None:
+        if self.ruta is None:
+            self.ruta = ruta_dataset(dias, 'txt')
+        self._archivo = abrir(self.ruta, 'wt')
+        f = self._archivo
+        f.write("="*100 + "\n")
+        f.write(f"DATASET: PLANTAS CON {dias} DÍAS DE LECTURAS DE HUMEDAD (ORDENADAS ALFABÉTICAMENTE)\n")
+        f.write("="*100 + "\n")
+        f.write(f"Total de plantas: {total_plantas}\n")
+        f.write(f"Días por planta: {dias}\n")
+        f.write(f"Formato: [Número]. Nombre de Planta | Día1, Día2, ..., Día{dias} (% humedad)\n")
+        f.write("="*100 + "\n\n")
+
+    def escribir_bloque(self, inicio: int, nombres: Sequence[str], matriz: np.ndarray) -> None:
+        lineas = [
+            f"{i:4d}. {planta:<50s} | " + ", ".join([f"{h:.2f}" for h in lecturas])
+            for i, planta, lecturas in zip(range(inicio + 1, inicio + len(nombres) + 1),
+                                           nombres, matriz.tolist())
+        ]
+        self._archivo.write("\n".join(lineas) + "\n")
+
+    def finalizar(self) -> None:
+        self.cerrar()
+        print(f"✅ Archivo TXT generado: {self.ruta}")
+
+    def cerrar(self) -> None:
+        """Cierra el archivo si sigue abierto (también tras un error)."""
+        if self._archivo is not None:
+            self._archivo.close()
+            self._archivo = None
+
+
+class EscritorCSV:
+    """Archivo CSV para Excel/análisis: Planta, Día_1, ..., Día_N"""
+
+    def __init__(self, ruta: Optional[str] = None):
+        """
+        Args:
+            ruta: Archivo de salida (default: ruta_dataset(dias, 'csv'),
+                  resuelta al iniciar con los días pedidos)
+        """
+        self.ruta = ruta
+        self._archivo = None
+        self._writer = None
+
+    def iniciar(self, total_plantas: int, dias: int) -> None:
+        if self.ruta is None:
+            self.ruta = ruta_dataset(dias, 'csv')
+        self._archivo = abrir(self.ruta, 'wt', newline='')
+        self._writer = csv.writer(self._archivo)
+        self._writer.writerow(['Planta'] + [f'Día_{i}' for i in range(1, dias + 1)])
+
+    def escribir_bloque(self, inicio: int, nombres: Sequence[str], matriz: np.ndarray) -> None:
+        self._writer.writerows([planta] + lecturas for planta, lecturas in zip(nombres, matriz.tolist()))
+
+    def finalizar(self) -> None:
+        self.cerrar()
+        print(f"✅ Archivo CSV generado: {self.ruta}")
+
+    def cerrar(self) -> None:
+        """Cierra el archivo si sigue abierto (también tras un error)."""
+        if self._archivo is not None:
+            self._archivo.close()
+            self._archivo = None
+            self._writer = None
+
+
+class VistaPrevia:
+    """Muestra por pantalla las primeras plantas (primeros 10 días, o todos si hay menos)."""
+
+    def __init__(self, plantas: int = 5, dias: int = 10):
+        self.plantas = plantas
+        self.dias = dias
+        self._total_dias = 0
+
+    def iniciar(self, total_plantas: int, dias: int) -> None:
+        self._total_dias = dias
+        print(f"\n{'='*100}")
+        print(f"VISTA PREVIA - PRIMERAS {self.plantas} PLANTAS:")
+        print(f"{'='*100}\n")
+
+    def escribir_bloque(self, inicio: int, nombres: Sequence[str], matriz: np.ndarray) -> None:
+        mostrados = min(self.dias, self._total_dias)
+        restantes = max(0, self._total_dias - mostrados)
+        for i in range(max(0, min(len(nombres), self.plantas - inicio))):
+            lecturas_str = ", ".join([f"{h:.2f}" for h in matriz[i, :mostrados]])
+            print(f"{inicio + i + 1}. {nombres[i]}")
+            if restantes:
+                print(f"   Primeros {mostrados} días: {lecturas_str}... (+ {restantes} días más)")
+            else:
+                print(f"   Los {mostrados} días: {lecturas_str}")
+            print()
+
+    def finalizar(self) -> None:
+        pass
+
+
+def exportar_dataset(
+    nombres: Sequence[str],
+    escritores: Sequence,
+    dias: int = DIAS_POR_DEFECTO,
+    semilla: Optional[int] = None,
+    procesos: int = 1,
+    plantas_por_bloque: int = 256
+) -> int:
+    """
+    Genera las series una sola vez y las envía a todos los escritores.
+
+    Args:
+        nombres: Nombres de las plantas (en el orden de salida)
+        escritores: Objetos con iniciar(), escribir_bloque() y finalizar()
+                    (EscritorTXT, EscritorCSV, VistaPrevia o propios). Si
+                    tienen cerrar(), se llama siempre al terminar, también
+                    cuando la generación o un escritor fallan
+        dias: Días de lecturas por planta
+        semilla: Semilla para resultados reproducibles
+        procesos: Procesos en paralelo para generar los bloques
+        plantas_por_bloque: Plantas por bloque
+
+    Returns:
+        int: Total de lecturas generadas
+    """
+    iniciados = []
+    try:
+        for escritor in escritores:
+            escritor.iniciar(len(nombres), dias)
+            iniciados.append(escritor)
+
+        for inicio, nombres_bloque, matriz in iterar_bloques_humedad(
+                nombres, dias, semilla, procesos, plantas_por_bloque):
+            for escritor in escritores:
+                escritor.escribir_bloque(inicio, nombres_bloque, matriz)
+
+        for escritor in escritores:
+            escritor.finalizar()
+    finally:
+        # Ningún archivo queda abierto aunque falle un bloque o un escritor
+        for escritor in iniciados:
+            cerrar = getattr(escritor, 'cerrar', None)
+            if cerrar is not None:
+                cerrar()
+
+    return len(nombres) * dias
+
+
+def main() -> None:
+    """Genera los archivos TXT y CSV del dataset y muestra una vista previa."""
+    parser = argparse.ArgumentParser(description="Genera el dataset de humedad de las plantas.")
+    parser.add_argument("--dias", type=int, default=DIAS_POR_DEFECTO, help="Días por planta")
+    parser.add_argument("--semilla", type=int, default=None, help="Semilla aleatoria")
+    parser.add_argument("--procesos", type=int, default=1, help="Procesos en paralelo")
+    args = parser.parse_args()
+
+    dias = args.dias
+
+    print(f"="*100)
+    print(f"GENERADOR DE DATASET: PLANTAS CON {dias} DÍAS DE LECTURAS DE HUMEDAD")
+    print(f"="*100)
+    print(f"\nTotal de plantas: {len(plantas_ordenadas)}")
+    print(f"Días por planta: {dias}")
+    print(f"Total de lecturas: {len(plantas_ordenadas) * dias:,}\n")
+
+    print("Generando archivos TXT y CSV (una sola pasada)...")
+    txt, csv_ = EscritorTXT(), EscritorCSV()
+    total = exportar_dataset(
+        plantas_ordenadas,
+        [txt, csv_, VistaPrevia()],
+        dias=dias,
+        semilla=args.semilla,
+        procesos=args.procesos,
+    )
+
+    print(f"{'='*100}")
+    print("PROCESO COMPLETADO EXITOSAMENTE")
+    print(f"{'='*100}")
+    print(f"\n📊 Resumen:")
+    print(f"   • Total de plantas: {len(plantas_ordenadas)}")
+    print(f"   • Días por planta: {dias}")
+    print(f"   • Total de lecturas generadas: {total:,}")
+    print(f"   • Archivos creados:")
+    print(f"     - {txt.ruta} (formato legible)")
+    print(f"     - {csv_.ruta} (para Excel/análisis)")
+    print(f"\n✅ Los archivos están listos para usar!")
+
+
+if __name__ == "__main__":
+    main()
@@ -320,27 +320,38 @@ def listar_plantas_disponibles() -> None:
     print(f"Pendientes: {960 - len(BASE_DATOS_PLANTAS)} plantas\n")
 
 
-def generar_dataset_csv(ruta_archivo: str = "dataset_plantas_960.csv") -> Optional[Any]:
+def generar_dataset_csv(ruta_archivo: str = "dataset_plantas_960.csv",
+                        dias_por_planta: int = 50,
+                        semilla: Optional[int] = None,
+                        devolver_dataframe: bool = True) -> Optional[Any]:
     """
     Genera un archivo CSV con datos simulados de todas las plantas.
 
-    Para cada planta, genera 50 días de lecturas simuladas de humedad
-    basadas en los rangos óptimos de cada especie.
+    Para cada planta, genera `dias_por_planta` días de lecturas simuladas
+    de humedad basadas en los rangos óptimos de cada especie. Los datos se generan
+    vectorizados por bloques de plantas y se escriben a disco a medida que
+    se producen (ver generador_dataset).
 
     Args:
         ruta_archivo: Ruta donde se guardará el archivo CSV
                      (default: "dataset_plantas_960.csv")
+        dias_por_planta: Días de lecturas por planta (default: 50)
+        semilla: Semilla para resultados reproducibles
+        devolver_dataframe: Si True (default), además se conserva el dataset
+                            completo en memoria y se retorna como DataFrame.
+                            Con False solo se escribe el CSV y la memoria
+                            queda acotada, útil para datasets grandes
 
     Returns:
-        DataFrame de pandas con los datos generados, o None si las
-        librerías no están disponibles
+        DataFrame de pandas con los datos generados, o None si
+        devolver_dataframe es False o las librerías no están disponibles
 
     Raises:
         ImportError: Si numpy o pandas no están instalados (capturado internamente)
 
     Estructura del CSV generado:
         - planta: Nombre de la planta
-        - dia: Día de la lectura (1-50)
+        - dia: Día de la lectura (1-dias_por_planta)
         - humedad: Humedad normalizada (0-1)
         - humedad_pct: Humedad en porcentaje (0-100)
         - umbral_sequia: Umbral crítico de la planta
@@ -356,49 +367,27 @@ def generar_dataset_csv(ruta_archivo: str = "dataset_plantas_960.csv") -> Option
         print("   Instala con: pip install numpy pandas")
         return None
 
-    import numpy as np
-    import pandas as pd
+    from generador_dataset import generar_dataset
 
     print(f"📊 Generando dataset de {len(BASE_DATOS_PLANTAS)} plantas...")
 
-    data = []
-    dias_por_planta = 50
-
-    for planta_config in BASE_DATOS_PLANTAS:
-        # Normalizar rangos de humedad a escala 0-1
-        humedad_min_norm = planta_config.humedad_min / 100.0
-        humedad_max_norm = planta_config.humedad_max / 100.0
-
-        # Generar valores aleatorios dentro del rango óptimo
-        humedad_valores = np.random.uniform(
-            humedad_min_norm, humedad_max_norm, dias_por_planta
-        )
-
-        # Crear registros para cada día
-        for dia, humedad in enumerate(humedad_valores, 1):
-            data.append(
-                {
-                    "planta": planta_config.nombre,
-                    "dia": dia,
-                    "humedad": round(humedad, 3),
-                    "humedad_pct": round(humedad * 100, 2),
-                    "umbral_sequia": planta_config.umbral_sequia,
-                    "frecuencia_riego": planta_config.frecuencia_riego_dias,
-                }
-            )
-
-    # Crear DataFrame y guardar
-    df = pd.DataFrame(data)
-    df.to_csv(ruta_archivo, index=False)
+    resultado = generar_dataset(
+        BASE_DATOS_PLANTAS,
+        ruta_archivo,
+        dias=dias_por_planta,
+        semilla=semilla,
+        devolver_dataframe=devolver_dataframe
+    )
 
     print(f"✅ Dataset generado exitosamente: {ruta_archivo}")
     print(f"   📋 Estadísticas:")
-    print(f"      • Total de registros: {len(df):,}")
+    print(f"      • Total de registros: {resultado['filas']:,}")
     print(f"      • Plantas incluidas: {len(BASE_DATOS_PLANTAS)}")
     print(f"      • Días por planta: {dias_por_planta}")
-    print(f"      • Tamaño del archivo: ~{len(df) * 50 / 1024:.1f} KB")
+    print(f"      • Tamaño del archivo: {resultado['bytes'] / 1024:.1f} KB")
+    print(f"      • Velocidad: {resultado['filas_por_segundo']:,.0f} filas/s")
 
-    return df
+    return resultado.get("dataframe")
 
 
 # ==========================================
@@ -1313,7 +1302,7 @@ if __name__ == "__main__":
             )
 
             if generar_csv.lower() == "s":
-                generar_dataset_csv()
+                generar_dataset_csv(devolver_dataframe=False)
 
             # Ejemplo de uso de TraductorPlantaInteligente
             print("\nEjemplo de uso de TraductorPlantaInteligente:")
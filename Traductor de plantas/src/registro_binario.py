@@ -0,0 +1,308 @@
+"""
+Registro binario de lecturas con registros de ancho fijo.
+
+Este módulo proporciona:
+- TIPO_REGISTRO: formato empaquetado de una lectura (16 bytes)
+- EscritorRegistro: anexa lecturas por lotes a un archivo de registro
+- leer_registro(): expone el archivo como array estructurado con np.memmap
+- iterar_bloques(): recorre el registro por bloques (también comprimido)
+- resumen_registro(): estadísticas tipo generar_reporte_estadistico sobre el array
+- resumen_registro_archivo(): las mismas estadísticas, bloque a bloque
+
+Formato del archivo:
+    - Cabecera de 16 bytes: b"TPREG", versión (1 byte) y relleno
+    - Registros consecutivos de 16 bytes, little-endian:
+        timestamp    float64  (8 bytes)
+        humedad_raw  uint16   (2 bytes)
+        luz_raw      uint16   (2 bytes)
+        temperatura  float32  (4 bytes)
+
+Solo se guardan los valores crudos del ADC: los porcentajes se derivan al
+leer. Una pasarela puede volcar millones de lecturas y analizarlas después
+sin parsear texto ni crear un objeto Python por lectura.
+
+Si la ruta termina en .gz, .xz o .bz2 el registro se escribe comprimido
+(cada lote anexado es un nuevo miembro del flujo) y se lee con
+iterar_bloques(), que descomprime por bloques; np.memmap solo es posible
+sobre registros sin comprimir.
+
+Ejemplo:
+    >>> with EscritorRegistro("lecturas.reg") as escritor:
+    ...     escritor.escribir(lectura)
+    >>> registros = leer_registro("lecturas.reg")
+    >>> registros["temperatura"].mean()
+"""
+
+import os
+from typing import Any, Dict, Iterator
+
+import numpy as np
+
+from compresion import abrir, formato_compresion
+
+
+VERSION_FORMATO = 1
+MAGIA = b"TPREG"
+CABECERA = MAGIA + bytes([VERSION_FORMATO]) + b"\x00" * 10
+
+TIPO_REGISTRO = np.dtype([
+    ("timestamp", "<f8"),
+    ("humedad_raw", "<u2"),
+    ("luz_raw", "<u2"),
+    ("temperatura", "<f4"),
+])
+
+assert TIPO_REGISTRO.itemsize == len(CABECERA) == 16
+
+
+def _validar_cabecera(cabecera: bytes, ruta: str) -> None:
+    """
+    Raises:
+        ValueError: Si la cabecera no corresponde a un registro soportado
+    """
+    if len(cabecera) < len(CABECERA) or not cabecera.startswith(MAGIA):
+        raise ValueError(f"'{ruta}' no es un registro binario de lecturas")
+    if cabecera[len(MAGIA)] != VERSION_FORMATO:
+        raise ValueError(f"Versión de registro no soportada en '{ruta}': {cabecera[len(MAGIA)]}")
+
+
+class EscritorRegistro:
+    """
+    Escritor de lecturas a un registro binario, solo de anexado.
+
+    Las lecturas se copian a un bloque preasignado de `tam_lote`
+    registros y el bloque completo se escribe con una sola llamada.
+
+    Atributos:
+        ruta (str): Archivo de registro
+        tam_lote (int): Registros acumulados antes de escribir a disco
+    """
+
+    def __init__(self, ruta: str, tam_lote: int = 4096):
+        """
+        Abre un registro existente para anexar, o lo crea con su cabecera.
+
+        Args:
+            ruta: Archivo de registro
+            tam_lote: Registros acumulados en memoria antes de escribir
+
+        Raises:
+            ValueError: Si tam_lote no es positivo o el archivo no es un registro
+        """
+        if tam_lote <= 0:
+            raise ValueError("tam_lote debe ser mayor que 0")
+
+        self.ruta = ruta
+        self.tam_lote = tam_lote
+        self._lote = np.zeros(tam_lote, dtype=TIPO_REGISTRO)
+        self._n = 0
+
+        if os.path.exists(ruta) and os.path.getsize(ruta) > 0:
+            with abrir(ruta, "rb") as f:
+                _validar_cabecera(f.read(len(CABECERA)), ruta)
+            if formato_compresion(ruta) is None:
+                # Descartar un registro a medio escribir al final del archivo
+                sobrante = (os.path.getsize(ruta) - len(CABECERA)) % TIPO_REGISTRO.itemsize
+                if sobrante:
+                    with open(ruta, "r+b") as f:
+                        f.truncate(os.path.getsize(ruta) - sobrante)
+        else:
+            with abrir(ruta, "wb") as f:
+                f.write(CABECERA)
+
+        self._archivo = abrir(ruta, "ab")
+
+    def escribir(self, lectura: Any) -> None:
+        """
+        Añade una lectura (LecturaSensores) al lote.
+
+        Args:
+            lectura: Objeto con timestamp, humedad_raw, luz_raw y temperatura
+        """
+        self._lote[self._n] = (lectura.timestamp, lectura.humedad_raw,
+                               lectura.luz_raw, lectura.temperatura)
+        self._n += 1
+        if self._n == self.tam_lote:
+            self.flush()
+
+    def escribir_lote(self, registros: np.ndarray) -> None:
+        """
+        Anexa directamente un array estructurado de lecturas.
+
+        Args:
+            registros: Array con los campos de TIPO_REGISTRO
+        """
+        self.flush()
+        self._archivo.write(np.asarray(registros).astype(TIPO_REGISTRO, copy=False).tobytes())
+
+    def flush(self) -> None:
+        """Escribe a disco los registros pendientes."""
+        if self._n:
+            self._archivo.write(self._lote[:self._n].tobytes())
+            self._n = 0
+        self._archivo.flush()
+
+    def cerrar(self) -> None:
+        """Escribe los registros pendientes y cierra el archivo."""
+        if not self._archivo.closed:
+            self.flush()
+            self._archivo.close()
+
+    def __enter__(self) -> 'EscritorRegistro':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.cerrar()
+
+
+def leer_registro(ruta: str) -> np.ndarray:
+    """
+    Expone un registro binario como array estructurado (sin copiarlo).
+
+    Un registro incompleto al final del archivo (escritura interrumpida)
+    se ignora. Un registro comprimido no se puede mapear: se descomprime
+    en memoria (para archivos grandes, usar iterar_bloques()).
+
+    Args:
+        ruta: Archivo de registro
+
+    Returns:
+        np.memmap de solo lectura con dtype TIPO_REGISTRO (np.ndarray si
+        el archivo está comprimido)
+
+    Raises:
+        ValueError: Si el archivo no es un registro binario de lecturas
+    """
+    if formato_compresion(ruta) is not None:
+        bloques = list(iterar_bloques(ruta))
+        return np.concatenate(bloques) if bloques else np.empty(0, dtype=TIPO_REGISTRO)
+
+    with open(ruta, "rb") as f:
+        _validar_cabecera(f.read(len(CABECERA)), ruta)
+
+    n = (os.path.getsize(ruta) - len(CABECERA)) // TIPO_REGISTRO.itemsize
+    if n == 0:
+        return np.empty(0, dtype=TIPO_REGISTRO)
+    return np.memmap(ruta, dtype=TIPO_REGISTRO, mode="r",
+                     offset=len(CABECERA), shape=(n,))
+
+
+def iterar_bloques(ruta: str, tam_bloque: int = 65536) -> Iterator[np.ndarray]:
+    """
+    Recorre un registro (comprimido o no) por bloques de lecturas.
+
+    La memoria usada depende de `tam_bloque`, no del tamaño del archivo.
+
+    Args:
+        ruta: Archivo de registro (.reg, .reg.gz, .reg.xz, .reg.bz2)
+        tam_bloque: Registros por bloque
+
+    Yields:
+        np.ndarray con dtype TIPO_REGISTRO (el último bloque puede ser menor)
+
+    Raises:
+        ValueError: Si el archivo no es un registro o tam_bloque no es positivo
+    """
+    if tam_bloque <= 0:
+        raise ValueError("tam_bloque debe ser mayor que 0")
+
+    tam_registro = TIPO_REGISTRO.itemsize
+    with abrir(ruta, "rb") as f:
+        _validar_cabecera(f.read(len(CABECERA)), ruta)
+        sobrante = b""
+        while True:
+            datos = f.read(tam_bloque * tam_registro)
+            if not datos:
+                break
+            datos = sobrante + datos
+            completos = len(datos) - len(datos) % tam_registro
+            sobrante = datos[completos:]
+            if completos:
+                yield np.frombuffer(datos[:completos], dtype=TIPO_REGISTRO)
+
+
+def resumen_registro(registros: np.ndarray, rango_max: int = 1023) -> Dict[str, Any]:
+    """
+    Calcula las estadísticas de generar_reporte_estadistico sobre un registro.
+
+    Los porcentajes se derivan de los valores crudos con la misma fórmula
+    que normalizar_sensor: (x / rango_max) × 100, recortado a 0-100.
+
+    Args:
+        registros: Array estructurado (p.ej. de leer_registro())
+        rango_max: Valor máximo del ADC (1023 para 10 bits, 4095 para 12 bits)
+
+    Returns:
+        Diccionario {"humedad", "temperatura", "luz"} -> {"promedio", "minimo", "maximo"},
+        más "total" con el número de lecturas
+
+    Raises:
+        ValueError: Si el registro está vacío
+    """
+    if len(registros) == 0:
+        raise ValueError("El registro no contiene lecturas")
+
+    escala = 100.0 / rango_max
+    series = {
+        "humedad": registros["humedad_raw"],
+        "temperatura": registros["temperatura"],
+        "luz": registros["luz_raw"],
+    }
+
+    resumen: Dict[str, Any] = {"total": len(registros)}
+    for nombre, valores in series.items():
+        factor = 1.0 if nombre == "temperatura" else escala
+        # min/max sobre los crudos y solo 3 valores escalados: sin copias del array
+        minimo, maximo = float(valores.min()) * factor, float(valores.max()) * factor
+        promedio = float(valores.mean(dtype=np.float64)) * factor
+        if factor != 1.0:
+            minimo, maximo, promedio = (min(100.0, v) for v in (minimo, maximo, promedio))
+        resumen[nombre] = {"promedio": promedio, "minimo": minimo, "maximo": maximo}
+    return resumen
+
+
+def resumen_registro_archivo(ruta: str, rango_max: int = 1023,
+                             tam_bloque: int = 65536) -> Dict[str, Any]:
+    """
+    Calcula resumen_registro() recorriendo el archivo por bloques.
+
+    Sirve para registros comprimidos o más grandes que la memoria: solo
+    se acumulan sumas, mínimos y máximos.
+
+    Args:
+        ruta: Archivo de registro (comprimido o no)
+        rango_max: Valor máximo del ADC
+        tam_bloque: Registros por bloque
+
+    Returns:
+        El mismo diccionario que resumen_registro()
+
+    Raises:
+        ValueError: Si el registro está vacío
+    """
+    campos = {"humedad": "humedad_raw", "temperatura": "temperatura", "luz": "luz_raw"}
+    total = 0
+    sumas = {nombre: 0.0 for nombre in campos}
+    minimos = {nombre: float("inf") for nombre in campos}
+    maximos = {nombre: float("-inf") for nombre in campos}
+
+    for bloque in iterar_bloques(ruta, tam_bloque):
+        total += len(bloque)
+        for nombre, campo in campos.items():
+            valores = bloque[campo]
+            sumas[nombre] += float(valores.sum(dtype=np.float64))
+            minimos[nombre] = min(minimos[nombre], float(valores.min()))
+            maximos[nombre] = max(maximos[nombre], float(valores.max()))
+
+    if total == 0:
+        raise ValueError("El registro no contiene lecturas")
+
+    escala = 100.0 / rango_max
+    resumen: Dict[str, Any] = {"total": total}
+    for nombre in campos:
+        factor = 1.0 if nombre == "temperatura" else escala
+        valores = (sumas[nombre] / total * factor, minimos[nombre] * factor, maximos[nombre] * factor)
+        if factor != 1.0:
+            valores = tuple(min(100.0, v) for v in valores)
+        resumen[nombre] = {"promedio": valores[0], "minimo": valores[1], "maximo": valores[2]}
+    return resumen
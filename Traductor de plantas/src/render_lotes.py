@@ -0,0 +1,292 @@
+"""
+Renderizado por lotes de dashboards, sin ventana y en paralelo.
+
+Este módulo proporciona:
+- ResultadoRender: resultado de renderizar el dashboard de una planta
+- seleccionar_plantas(): filtra el catálogo por nombre o tipo
+- renderizar_lote(): genera un PNG por planta con un pool de procesos
+- main(): comando de línea con informe de tiempos
+
+generar_dashboard_con_datos() está pensado para una planta y una ventana
+interactiva. Aquí se usa el backend Agg (sin interfaz gráfica) y un
+ProcessPoolExecutor para repartir las plantas entre procesos. Cada proceso
+construye un RenderizadorDashboard una sola vez y lo reutiliza; cada imagen
+se guarda como `dashboard_<Planta>.png` en la carpeta de salida, junto a
+un `dashboard_<Planta>.png.json` con los parámetros con que se dibujó
+(días, dpi, semilla y VERSION_LAYOUT). Una imagen se considera al día (y
+se omite) si es más reciente que el catálogo (data/plantas.json) y que
+los módulos de MODULOS_DIBUJO, y si se generó con los mismos parámetros.
+
+Uso desde la línea de comandos:
+    python render_lotes.py --salida dashboards --procesos 4 --dpi 100
+    python render_lotes.py --salida dashboards --filtro cactus --forzar
+"""
+
+import matplotlib
+matplotlib.use("Agg")  # Antes de importar pyplot (también en los procesos hijos)
+
+import argparse
+import importlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from cache_render import VERSION_LAYOUT, CacheRender, clave_render
+from planta_config import PlantaConfig, cargar_plantas
+
+
+@dataclass
+class ResultadoRender:
+    """
+    Resultado del renderizado de una planta.
+
+    Atributos:
+        planta (str): Nombre de la planta
+        ruta (str): Archivo PNG de destino
+        segundos (float): Tiempo de renderizado (0 si se omitió)
+        omitido (bool): True si la imagen ya estaba al día
+        error (Optional[str]): Mensaje de error, si falló
+    """
+    planta: str
+    ruta: str
+    segundos: float = 0.0
+    omitido: bool = False
+    error: Optional[str] = None
+
+
+def _ruta_catalogo() -> str:
+    """Ruta de data/plantas.json (la misma que usa cargar_plantas)."""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "plantas.json")
+
+
+# Módulos cuyo código cambia la imagen: el dibujo, las series sintéticas,
+# su submuestreo, los colores y la clasificación de estados
+MODULOS_DIBUJO = ("dashboard_plantas", "sintetizador_series", "submuestreo", "estilo_dashboard",
+                  "estados_planta", "simulacion_rng", "planta_config")
+
+
+def _fecha_dependencias() -> float:
+    """Fecha de modificación más reciente entre el catálogo y el código de dibujo."""
+    rutas = [_ruta_catalogo(), os.path.abspath(__file__)]
+    rutas += [importlib.import_module(modulo).__file__ for modulo in MODULOS_DIBUJO]
+    return max(os.path.getmtime(r) for r in rutas if os.path.exists(r))
+
+
+def ruta_dashboard(carpeta: str, nombre_planta: str) -> str:
+    """Ruta del PNG de una planta dentro de la carpeta de salida."""
+    from dashboard_plantas import limpiar_nombre_archivo
+    return os.path.join(carpeta, f"dashboard_{limpiar_nombre_archivo(nombre_planta)}.png")
+
+
+def _parametros_render(dias: int, dpi: int, semilla: Optional[int]) -> Dict[str, Any]:
+    """Parámetros que determinan la imagen, tal como se guardan junto a ella."""
+    return {"dias": dias, "dpi": dpi, "semilla": semilla, "version_layout": VERSION_LAYOUT}
+
+
+def _ruta_parametros(ruta: str) -> str:
+    """Archivo de parámetros de una imagen: <imagen>.json"""
+    return ruta + ".json"
+
+
+def _esta_al_dia(ruta: str, fecha_dependencias: float, parametros: Dict[str, Any]) -> bool:
+    """True si la imagen existe, es más reciente que sus dependencias y se
+    dibujó con los mismos parámetros."""
+    if not os.path.exists(ruta) or os.path.getmtime(ruta) < fecha_dependencias:
+        return False
+    try:
+        with open(_ruta_parametros(ruta), "r", encoding="utf-8") as f:
+            return json.load(f) == parametros
+    except (OSError, ValueError):
+        # Sin archivo de parámetros (o ilegible): no se sabe cómo se dibujó
+        return False
+
+
+def seleccionar_plantas(filtro: Optional[str] = None, tipo: Optional[str] = None,
+                        limite: Optional[int] = None) -> List[PlantaConfig]:
+    """
+    Selecciona plantas del catálogo.
+
+    Args:
+        filtro: Texto que debe aparecer en el nombre (sin distinguir mayúsculas)
+        tipo: Tipo exacto de planta (sin distinguir mayúsculas)
+        limite: Número máximo de plantas
+
+    Returns:
+        Lista de PlantaConfig en el orden del catálogo
+    """
+    plantas = cargar_plantas()
+    if filtro:
+        plantas = [p for p in plantas if filtro.lower() in p.nombre.lower()]
+    if tipo:
+        plantas = [p for p in plantas if p.tipo.lower() == tipo.lower()]
+    return plantas[:limite] if limite is not None else plantas
+
+
+# Un renderizador por proceso: la figura se construye una vez y se
+# reutiliza para todas las plantas que le toquen a ese proceso
+_RENDERIZADOR = None
+
+
+def _renderizar_planta(nombre: str, ruta: str, dias: int, dpi: int,
+                       semilla: Optional[int], directorio_cache: Optional[str] = None) -> ResultadoRender:
+    """Renderiza una planta en el proceso actual (se ejecuta en el pool)."""
+    global _RENDERIZADOR
+    from dashboard_plantas import RenderizadorDashboard
+    from sintetizador_series import sintetizar_series_planta
+    from planta_config import buscar_planta
+
+    inicio = time.perf_counter()
+    try:
+        if _RENDERIZADOR is None:
+            _RENDERIZADOR = RenderizadorDashboard()
+        planta = buscar_planta(nombre)
+        humedad, temperatura, luz = sintetizar_series_planta(planta, dias, semilla)
+        datos = (humedad, temperatura, luz, f"{planta.nombre} ({planta.tipo})",
+                 (planta.humedad_min, planta.humedad_max),
+                 (planta.temperatura_min, planta.temperatura_max),
+                 (planta.luz_min, planta.luz_max))
+
+        def guardar_en(destino: str) -> None:
+            _RENDERIZADOR.actualizar(*datos, dpi=dpi)
+            # Sin recorte 'tight': el renderizador recalcula tight_layout cuando
+            # cambian las etiquetas de los ejes, así que la figura ya está ajustada
+            # y así cada imagen se dibuja una sola vez
+            _RENDERIZADOR.guardar(destino, dpi=dpi, recortar=False)
+
+        if directorio_cache is None:
+            guardar_en(ruta)
+        else:
+            cache = CacheRender(directorio_cache)
+            cache.copiar_a(clave_render(*datos, dpi=dpi, recortar=False), guardar_en, ruta)
+        with open(_ruta_parametros(ruta), "w", encoding="utf-8") as f:
+            json.dump(_parametros_render(dias, dpi, semilla), f)
+    except Exception as e:
+        return ResultadoRender(nombre, ruta, time.perf_counter() - inicio, error=str(e))
+    return ResultadoRender(nombre, ruta, time.perf_counter() - inicio)
+
+
+def renderizar_lote(
+    plantas: Sequence[PlantaConfig],
+    carpeta: str,
+    dias: int = 30,
+    dpi: int = 100,
+    semilla: Optional[int] = None,
+    procesos: Optional[int] = None,
+    forzar: bool = False,
+    al_terminar=None,
+    directorio_cache: Optional[str] = None
+) -> List[ResultadoRender]:
+    """
+    Renderiza el dashboard de cada planta en un PNG.
+
+    Args:
+        plantas: Plantas a renderizar
+        carpeta: Carpeta de salida (se crea si no existe)
+        dias: Días de datos simulados por dashboard
+        dpi: Resolución de las imágenes
+        semilla: Semilla de la simulación (cada planta usa su propio flujo)
+        procesos: Procesos del pool (None = número de CPUs; 1 = sin pool)
+        forzar: Si True, renderiza también las imágenes que están al día
+                (sin forzar, una imagen dibujada con otros días, dpi o
+                semilla no está al día)
+        al_terminar: Función opcional llamada con cada ResultadoRender
+        directorio_cache: Carpeta de una CacheRender compartida por los
+                          procesos (útil con semilla fija: los dashboards
+                          ya generados se copian sin dibujar)
+
+    Returns:
+        Lista de ResultadoRender (omitidos primero, luego en orden de finalización)
+    """
+    os.makedirs(carpeta, exist_ok=True)
+    fecha_dependencias = _fecha_dependencias()
+    parametros = _parametros_render(dias, dpi, semilla)
+
+    resultados: List[ResultadoRender] = []
+    pendientes = []
+    for planta in plantas:
+        ruta = ruta_dashboard(carpeta, planta.nombre)
+        if not forzar and _esta_al_dia(ruta, fecha_dependencias, parametros):
+            resultados.append(ResultadoRender(planta.nombre, ruta, omitido=True))
+            if al_terminar is not None:
+                al_terminar(resultados[-1])
+        else:
+            pendientes.append((planta.nombre, ruta, dias, dpi, semilla, directorio_cache))
+
+    if procesos == 1 or len(pendientes) <= 1:
+        completados = (_renderizar_planta(*tarea) for tarea in pendientes)
+        for resultado in completados:
+            resultados.append(resultado)
+            if al_terminar is not None:
+                al_terminar(resultado)
+        return resultados
+
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        futuros = [ejecutor.submit(_renderizar_planta, *tarea) for tarea in pendientes]
+        for futuro in as_completed(futuros):
+            resultado = futuro.result()
+            resultados.append(resultado)
+            if al_terminar is not None:
+                al_terminar(resultado)
+    return resultados
+
+
+def main(argumentos: Optional[List[str]] = None) -> None:
+    """Renderiza los dashboards seleccionados e informa de los tiempos."""
+    parser = argparse.ArgumentParser(description="Renderiza dashboards de muchas plantas en paralelo.")
+    parser.add_argument("--salida", default="dashboards", help="Carpeta de salida")
+    parser.add_argument("--filtro", default=None, help="Texto que debe contener el nombre")
+    parser.add_argument("--tipo", default=None, help="Tipo de planta")
+    parser.add_argument("--limite", type=int, default=None, help="Número máximo de plantas")
+    parser.add_argument("--dias", type=int, default=30, help="Días simulados por dashboard")
+    parser.add_argument("--dpi", type=int, default=100, help="Resolución de las imágenes")
+    parser.add_argument("--semilla", type=int, default=None, help="Semilla de la simulación")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos (default: CPUs)")
+    parser.add_argument("--forzar", action="store_true", help="Renderizar aunque estén al día")
+    parser.add_argument("--cache", default=None, help="Carpeta de cache de imágenes")
+    args = parser.parse_args(argumentos)
+
+    plantas = seleccionar_plantas(args.filtro, args.tipo, args.limite)
+    if not plantas:
+        print("No hay plantas que coincidan con el filtro.")
+        return
+
+    print("=" * 70)
+    print(f"RENDERIZADO POR LOTES: {len(plantas)} plantas -> {args.salida}/")
+    print("=" * 70)
+
+    def informar(resultado: ResultadoRender) -> None:
+        if resultado.omitido:
+            print(f"  ⏭️  {resultado.planta:<45s} al día")
+        elif resultado.error:
+            print(f"  ❌ {resultado.planta:<45s} ERROR: {resultado.error}")
+        else:
+            print(f"  ✅ {resultado.planta:<45s} {resultado.segundos:6.2f} s")
+
+    inicio = time.perf_counter()
+    resultados = renderizar_lote(plantas, args.salida, dias=args.dias, dpi=args.dpi,
+                                 semilla=args.semilla, procesos=args.procesos,
+                                 forzar=args.forzar, al_terminar=informar,
+                                 directorio_cache=args.cache)
+    total = time.perf_counter() - inicio
+
+    renderizados = [r for r in resultados if not r.omitido and not r.error]
+    omitidos = sum(1 for r in resultados if r.omitido)
+    errores = sum(1 for r in resultados if r.error)
+    suma = sum(r.segundos for r in renderizados)
+
+    print("\n" + "=" * 70)
+    print(f"Renderizados: {len(renderizados)} | Omitidos (al día): {omitidos} | Errores: {errores}")
+    if renderizados:
+        print(f"Tiempo por imagen: {suma / len(renderizados):.2f} s de media "
+              f"(mín {min(r.segundos for r in renderizados):.2f} s, "
+              f"máx {max(r.segundos for r in renderizados):.2f} s)")
+    print(f"Tiempo total: {total:.2f} s"
+          + (f" ({len(renderizados) / total:.2f} imágenes/s)" if renderizados and total > 0 else ""))
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
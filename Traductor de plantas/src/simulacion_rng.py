@@ -0,0 +1,201 @@
+"""
+Capa de generación aleatoria para la simulación de sensores.
+
+Este módulo proporciona:
+- crear_generador(): Generator de NumPy reproducible a partir de una semilla
+- generador_planta(): Generator independiente por planta (SeedSequence)
+- generadores_por_planta(): un Generator por cada planta de una lista
+- FlujoLecturas: lecturas de sensores simuladas, sorteadas por bloques
+
+Todas las simulaciones del proyecto (traductor y dashboards) deben sacar
+sus números aleatorios de aquí en lugar del módulo global `random` o de
+`np.random.normal` escalar: los valores se sortean en bloques completos
+(mucho más rápido) y con la misma semilla se obtienen los mismos datos.
+
+Ejemplo:
+    >>> flujo = FlujoLecturas(generador_planta("Acacia", semilla=42))
+    >>> humedad_raw, luz_raw, temperatura = flujo.siguiente()
+"""
+
+import zlib
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+
+# Parámetros por defecto de los sensores simulados (Arduino, ADC de 10 bits)
+ADC_MAX_POR_DEFECTO = 1023
+TEMPERATURA_MIN_SIMULADA = 18.0
+TEMPERATURA_MAX_SIMULADA = 30.0
+RUIDO_TEMPERATURA = 0.5  # Desviación del ruido gaussiano (°C)
+
+
+def crear_generador(semilla: Optional[int] = None) -> np.random.Generator:
+    """
+    Crea un Generator de NumPy.
+
+    Args:
+        semilla: Semilla entera. Si es None, se usa entropía del sistema
+                 (resultados no reproducibles).
+
+    Returns:
+        np.random.Generator listo para usar.
+    """
+    return np.random.default_rng(np.random.SeedSequence(semilla))
+
+
+def _clave_planta(nombre: str) -> int:
+    """Convierte el nombre de una planta en una clave entera estable."""
+    return zlib.crc32(nombre.strip().lower().encode("utf-8"))
+
+
+def secuencia_planta(nombre: str, semilla: Optional[int] = None) -> np.random.SeedSequence:
+    """
+    Deriva la SeedSequence hija correspondiente a una planta.
+
+    La hija se identifica por el nombre de la planta (no por su posición
+    en una lista), así que una planta recibe siempre el mismo flujo de
+    números para una semilla dada, sin importar qué otras plantas se
+    simulen ni en qué orden.
+
+    Args:
+        nombre: Nombre de la planta (no distingue mayúsculas)
+        semilla: Semilla raíz de la simulación
+
+    Returns:
+        np.random.SeedSequence de la planta
+    """
+    raiz = np.random.SeedSequence(semilla)
+    return np.random.SeedSequence(
+        entropy=raiz.entropy,
+        spawn_key=raiz.spawn_key + (_clave_planta(nombre),),
+    )
+
+
+def generador_planta(nombre: str, semilla: Optional[int] = None) -> np.random.Generator:
+    """
+    Crea el Generator independiente de una planta.
+
+    Args:
+        nombre: Nombre de la planta
+        semilla: Semilla raíz de la simulación
+
+    Returns:
+        np.random.Generator exclusivo de esa planta
+
+    Ejemplo:
+        >>> rng = generador_planta("Acacia", semilla=7)
+        >>> ruido = rng.normal(0, 2.5, 30)  # 30 días de una sola vez
+    """
+    return np.random.default_rng(secuencia_planta(nombre, semilla))
+
+
+def generadores_por_planta(
+    nombres: Iterable[str],
+    semilla: Optional[int] = None
+) -> Dict[str, np.random.Generator]:
+    """
+    Crea un Generator independiente para cada planta de una lista.
+
+    Args:
+        nombres: Nombres de las plantas
+        semilla: Semilla raíz de la simulación
+
+    Returns:
+        Diccionario nombre -> np.random.Generator
+    """
+    return {nombre: generador_planta(nombre, semilla) for nombre in nombres}
+
+
+class FlujoLecturas:
+    """
+    Fuente de lecturas simuladas de sensores sorteadas por bloques.
+
+    En lugar de llamar cuatro veces al módulo `random` por lectura, sortea
+    `tam_bloque` lecturas de una sola vez con NumPy y las va entregando
+    una a una. Las lecturas siguen la misma distribución que
+    `TraductorPlantaInteligente.leer_sensores_simulados`:
+        - humedad_raw y luz_raw: enteros uniformes entre 0 y adc_max
+        - temperatura: uniforme(18, 30) + ruido gaussiano(0, 0.5), 2 decimales
+
+    Atributos:
+        rng (np.random.Generator): Generador usado para los bloques
+        tam_bloque (int): Lecturas sorteadas en cada bloque
+        adc_max (int): Valor máximo del ADC simulado
+    """
+
+    def __init__(self,
+                 rng: Optional[np.random.Generator] = None,
+                 tam_bloque: int = 4096,
+                 adc_max: int = ADC_MAX_POR_DEFECTO):
+        """
+        Args:
+            rng: Generator a usar. Si es None, se crea uno sin semilla.
+            tam_bloque: Número de lecturas sorteadas por bloque
+            adc_max: Valor máximo del ADC (1023 para 10 bits, 4095 para 12 bits)
+
+        Raises:
+            ValueError: Si tam_bloque o adc_max no son positivos
+        """
+        if tam_bloque <= 0:
+            raise ValueError("tam_bloque debe ser mayor que 0")
+        if adc_max <= 0:
+            raise ValueError("adc_max debe ser mayor que 0")
+
+        self.rng = rng if rng is not None else crear_generador()
+        self.tam_bloque = tam_bloque
+        self.adc_max = adc_max
+        self._humedad = np.empty(0, dtype=np.int64)
+        self._luz = np.empty(0, dtype=np.int64)
+        self._temperatura = np.empty(0, dtype=np.float64)
+        self._posicion = 0
+
+    def bloque(self, n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sortea `n` lecturas completas como arrays.
+
+        Args:
+            n: Número de lecturas
+
+        Returns:
+            Tupla (humedad_raw, luz_raw, temperatura) de arrays de longitud n
+        """
+        humedad_raw = self.rng.integers(0, self.adc_max + 1, n)
+        luz_raw = self.rng.integers(0, self.adc_max + 1, n)
+        temperatura = self.rng.uniform(
+            TEMPERATURA_MIN_SIMULADA, TEMPERATURA_MAX_SIMULADA, n
+        ) + self.rng.normal(0.0, RUIDO_TEMPERATURA, n)
+        return humedad_raw, luz_raw, np.round(temperatura, 2)
+
+    def _rellenar(self) -> None:
+        """
+        Sortea un bloque nuevo y lo guarda como arrays de NumPy.
+
+        Como listas de Python, cada valor sería un objeto int/float aparte
+        (~100 KB por variable y bloque de 4096); como arrays ocupan 8 bytes
+        por valor y siguiente() convierte solo la lectura que entrega. A
+        partir del segundo bloque se reescriben los mismos arrays, así que
+        la memoria del flujo no cambia de un bloque a otro.
+        """
+        bloque = self.bloque(self.tam_bloque)
+        if len(self._humedad) != self.tam_bloque:
+            self._humedad, self._luz, self._temperatura = bloque
+        else:
+            for destino, valores in zip((self._humedad, self._luz, self._temperatura), bloque):
+                destino[:] = valores
+        self._posicion = 0
+
+    def siguiente(self) -> Tuple[int, int, float]:
+        """
+        Entrega la siguiente lectura del bloque actual.
+
+        Returns:
+            Tupla (humedad_raw, luz_raw, temperatura) con tipos nativos
+        """
+        if self._posicion >= len(self._humedad):
+            self._rellenar()
+
+        i = self._posicion
+        self._posicion += 1
+        # item() devuelve int/float nativos (más rápido que indexar y convertir)
+        return self._humedad.item(i), self._luz.item(i), self._temperatura.item(i)
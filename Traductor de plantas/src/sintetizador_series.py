@@ -0,0 +1,241 @@
+"""
+Síntesis vectorizada de series de humedad, temperatura y luz.
+
+Este módulo proporciona:
+- eje_temporal(): instantes de muestreo en días (diario, horario, ...)
+- serie_humedad_riego(): patrón de riego y secado gradual
+- serie_senoidal(): variación periódica (semanal, mensual) con ruido
+- sintetizar_humedad(): humedad de una planta
+- sintetizar_ambiente(): temperatura y luz de una planta
+- sintetizar_series_planta(): las tres series de una planta
+- sintetizar_humedad_flota(): matriz plantas × días de humedad
+
+Los dashboards rellenaban cada serie día a día en bucles de Python, con
+un max/min y un round por valor. Aquí cada serie se calcula de una vez
+sobre arrays completos y se limita con np.clip, así que un año con
+resolución horaria (8.760 muestras) se genera en microsegundos.
+
+Con `muestras_por_dia=1` los valores son exactamente los que producían
+los bucles originales de generar_dashboard_con_datos para la misma semilla.
+
+Ejemplo:
+    >>> planta = buscar_planta("Acacia")
+    >>> humedad, temperatura, luz = sintetizar_series_planta(planta, dias=365,
+    ...                                                      muestras_por_dia=24)
+"""
+
+from typing import Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+from simulacion_rng import generador_planta
+
+
+def eje_temporal(dias: int, muestras_por_dia: int = 1) -> np.ndarray:
+    """
+    Instantes de muestreo expresados en días desde el inicio.
+
+    Args:
+        dias: Días simulados
+        muestras_por_dia: Muestras por día (1 = diario, 24 = horario)
+
+    Returns:
+        np.ndarray de dias × muestras_por_dia valores (0, 1/m, 2/m, ...)
+
+    Raises:
+        ValueError: Si muestras_por_dia no es positivo
+    """
+    if muestras_por_dia <= 0:
+        raise ValueError("muestras_por_dia debe ser mayor que 0")
+    return np.arange(dias * muestras_por_dia) / muestras_por_dia
+
+
+def serie_humedad_riego(
+    t: np.ndarray,
+    frecuencia_riego: float,
+    humedad_min: float,
+    humedad_max: float,
+    ruido: np.ndarray,
+    ajuste_riego: float = -5.0,
+    margen: float = 5.0
+) -> np.ndarray:
+    """
+    Humedad con riego periódico y secado lineal hasta el siguiente riego.
+
+    En el instante del riego la humedad vale humedad_max + ajuste_riego;
+    después baja linealmente desde humedad_max hacia humedad_min.
+
+    Args:
+        t: Instantes en días (ver eje_temporal)
+        frecuencia_riego: Días entre riegos
+        humedad_min: Humedad mínima óptima (%)
+        humedad_max: Humedad máxima óptima (%)
+        ruido: Ruido a sumar (mismo tamaño que t)
+        ajuste_riego: Desplazamiento del valor en el instante de riego
+        margen: Margen permitido fuera del rango óptimo antes de recortar
+
+    Returns:
+        np.ndarray con la humedad (%)
+    """
+    desde_riego = np.mod(t, frecuencia_riego)
+    base = humedad_max - (humedad_max - humedad_min) * (desde_riego / frecuencia_riego)
+    base = np.where(desde_riego == 0, humedad_max + ajuste_riego, base)
+    return np.clip(base + ruido, humedad_min - margen, humedad_max + margen)
+
+
+def serie_senoidal(
+    t: np.ndarray,
+    promedio: float,
+    amplitud: float,
+    periodo_dias: float,
+    ruido: np.ndarray,
+    limites: Optional[Tuple[float, float]] = None
+) -> np.ndarray:
+    """
+    Serie periódica: promedio + amplitud·sin(2π·t/periodo) + ruido.
+
+    Args:
+        t: Instantes en días
+        promedio: Valor medio
+        amplitud: Amplitud de la variación
+        periodo_dias: Periodo en días (7 = semanal, 30 = mensual)
+        ruido: Ruido a sumar (mismo tamaño que t)
+        limites: (min, max) para recortar, o None para no recortar
+
+    Returns:
+        np.ndarray con la serie
+    """
+    serie = promedio + np.sin(t * 2 * np.pi / periodo_dias) * amplitud + ruido
+    if limites is not None:
+        np.clip(serie, limites[0], limites[1], out=serie)
+    return serie
+
+
+def sintetizar_humedad(
+    planta: Any,
+    dias: int,
+    rng: np.random.Generator,
+    muestras_por_dia: int = 1,
+    decimales: Optional[int] = 2
+) -> np.ndarray:
+    """
+    Humedad (riego y secado gradual) de una planta.
+
+    Args:
+        planta: PlantaConfig con el rango de humedad y la frecuencia de riego
+        dias: Días simulados
+        rng: Generador de NumPy
+        muestras_por_dia: Muestras por día
+        decimales: Decimales de redondeo (None = sin redondear)
+
+    Returns:
+        np.ndarray con dias × muestras_por_dia valores (%)
+    """
+    t = eje_temporal(dias, muestras_por_dia)
+    ruido = rng.normal(0, planta.humedad_desviacion, t.size)
+    humedad = serie_humedad_riego(t, planta.frecuencia_riego_dias, planta.humedad_min,
+                                  planta.humedad_max, ruido)
+    if decimales is not None:
+        humedad = np.round(humedad, decimales)
+    return humedad
+
+
+def sintetizar_ambiente(
+    planta: Any,
+    dias: int,
+    rng: np.random.Generator,
+    muestras_por_dia: int = 1,
+    limitar: bool = True,
+    decimales: Optional[int] = 2
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Temperatura (ciclo semanal) y luz (ciclo mensual) de una planta.
+
+    Args:
+        planta: PlantaConfig con los rangos de temperatura y luz
+        dias: Días simulados
+        rng: Generador de NumPy (se sortea primero la temperatura y luego la luz)
+        muestras_por_dia: Muestras por día
+        limitar: Si True, recorta a ±2 °C y ±5 % de los rangos óptimos
+        decimales: Decimales de redondeo (None = sin redondear)
+
+    Returns:
+        Tupla (temperatura, luz)
+    """
+    t = eje_temporal(dias, muestras_por_dia)
+    temp_rango = (planta.temperatura_max - planta.temperatura_min) / 2
+    luz_rango = (planta.luz_max - planta.luz_min) / 2
+    ruido_temperatura = rng.normal(0, temp_rango * 0.2, t.size)
+    ruido_luz = rng.normal(0, luz_rango * 0.15, t.size)
+
+    temperatura = serie_senoidal(
+        t, (planta.temperatura_min + planta.temperatura_max) / 2, temp_rango * 0.6, 7,
+        ruido_temperatura,
+        (planta.temperatura_min - 2, planta.temperatura_max + 2) if limitar else None,
+    )
+    luz = serie_senoidal(
+        t, (planta.luz_min + planta.luz_max) / 2, luz_rango * 0.5, 30,
+        ruido_luz,
+        (planta.luz_min - 5, planta.luz_max + 5) if limitar else None,
+    )
+    if decimales is not None:
+        temperatura, luz = np.round(temperatura, decimales), np.round(luz, decimales)
+    return temperatura, luz
+
+
+def sintetizar_series_planta(
+    planta: Any,
+    dias: int = 30,
+    semilla: Optional[int] = None,
+    muestras_por_dia: int = 1,
+    rng: Optional[np.random.Generator] = None,
+    decimales: Optional[int] = 2
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simula humedad, temperatura y luz realistas para una planta.
+
+    Args:
+        planta: PlantaConfig con los rangos óptimos de la planta
+        dias: Días simulados
+        semilla: Semilla (se usa el flujo propio de la planta, ver simulacion_rng)
+        muestras_por_dia: Muestras por día (1 = diario, 24 = horario)
+        rng: Generador a usar en lugar del de la planta
+        decimales: Decimales de redondeo (None = sin redondear)
+
+    Returns:
+        Tupla (humedad, temperatura, luz) de arrays con dias × muestras_por_dia valores
+    """
+    if rng is None:
+        rng = generador_planta(planta.nombre, semilla)
+    humedad = sintetizar_humedad(planta, dias, rng, muestras_por_dia, decimales)
+    temperatura, luz = sintetizar_ambiente(planta, dias, rng, muestras_por_dia,
+                                           decimales=decimales)
+    return humedad, temperatura, luz
+
+
+def sintetizar_humedad_flota(
+    plantas: Sequence[Any],
+    dias: int = 30,
+    semilla: Optional[int] = None,
+    muestras_por_dia: int = 1
+) -> np.ndarray:
+    """
+    Humedad simulada de muchas plantas, como una matriz.
+
+    Cada fila coincide con la humedad que mostraría el dashboard de esa
+    planta (sintetizar_series_planta) para la misma semilla.
+
+    Args:
+        plantas: Lista de PlantaConfig
+        dias: Días simulados
+        semilla: Semilla (cada planta usa su propio flujo)
+        muestras_por_dia: Muestras por día
+
+    Returns:
+        np.ndarray (plantas, dias × muestras_por_dia)
+    """
+    matriz = np.empty((len(plantas), dias * muestras_por_dia))
+    for i, planta in enumerate(plantas):
+        matriz[i] = sintetizar_humedad(planta, dias, generador_planta(planta.nombre, semilla),
+                                       muestras_por_dia)
+    return matriz
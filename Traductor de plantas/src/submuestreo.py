@@ -0,0 +1,182 @@
+"""
+Submuestreo de series largas para dibujarlas sin perder su forma.
+
+Este módulo proporciona:
+- lttb(): Largest-Triangle-Three-Buckets (conserva la forma visual)
+- min_max(): mínimo y máximo de cada tramo (conserva todos los extremos)
+- submuestrear(): elige el método y no toca las series que ya caben
+- presupuesto_puntos(): puntos que caben en el ancho de un gráfico
+
+Una línea no puede mostrar más detalle que píxeles tiene su gráfico: con
+meses de lecturas por minuto, matplotlib dibuja cientos de miles de puntos
+que terminan uno encima de otro. Aquí cada serie se reduce al número de
+píxeles horizontales del gráfico antes de dibujarla, así que el tiempo de
+dibujo deja de depender de la longitud del historial.
+
+Ejemplo:
+    >>> x = np.arange(500_000)
+    >>> x_red, y_red = submuestrear(x, humedad_por_minuto, 1200)
+    >>> len(x_red)
+    1200
+"""
+
+from typing import Any, Tuple
+
+import numpy as np
+
+
+METODOS = ('lttb', 'min_max')
+
+
+def _como_arrays(x: Any, y: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Convierte x e y en arrays float64 del mismo tamaño."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if x.shape != y.shape or x.ndim != 1:
+        raise ValueError("x e y deben ser series 1-D del mismo tamaño")
+    return x, y
+
+
+def lttb(x: Any, y: Any, puntos: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce una serie con Largest-Triangle-Three-Buckets.
+
+    El primer y el último punto se conservan; el resto de la serie se
+    divide en `puntos - 2` tramos y de cada uno se elige el punto que forma
+    el triángulo de mayor área con el punto elegido en el tramo anterior y
+    con la media del tramo siguiente. Los picos y valles aislados forman
+    triángulos grandes, así que sobreviven al submuestreo.
+
+    Si la serie tiene NaN (lecturas faltantes) se reduce con min_max: un
+    NaN se propagaría por las sumas acumuladas y todas las áreas de su
+    tramo y de los siguientes serían NaN, así que argmax elegiría siempre
+    el primer punto y los picos se perderían.
+
+    Args:
+        x: Posiciones (crecientes)
+        y: Valores
+        puntos: Puntos de la serie resultante (mínimo 3)
+
+    Returns:
+        Tupla (x, y) con `puntos` valores (o la serie original si ya es más
+        corta; con NaN, el resultado de min_max)
+
+    Raises:
+        ValueError: Si puntos < 3 o x e y no tienen el mismo tamaño
+    """
+    x, y = _como_arrays(x, y)
+    if puntos < 3:
+        raise ValueError("lttb necesita al menos 3 puntos")
+    n = len(x)
+    if n <= puntos:
+        return x, y
+    if np.isnan(y).any():
+        return min_max(x, y, puntos)
+
+    # Bordes de los tramos interiores (el primer y el último punto van aparte)
+    bordes = np.linspace(1, n - 1, puntos - 1).astype(np.int64)
+    # Medias de cada tramo, calculadas de una vez con sumas acumuladas
+    suma_x = np.concatenate(([0.0], np.cumsum(x)))
+    suma_y = np.concatenate(([0.0], np.cumsum(y)))
+    tamanos = np.diff(bordes)
+    media_x = (suma_x[bordes[1:]] - suma_x[bordes[:-1]]) / tamanos
+    media_y = (suma_y[bordes[1:]] - suma_y[bordes[:-1]]) / tamanos
+    # El "tramo siguiente" del último tramo es el último punto
+    media_x = np.append(media_x[1:], x[-1])
+    media_y = np.append(media_y[1:], y[-1])
+
+    indices = np.empty(puntos, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    anterior = 0
+    # Cada elección depende de la anterior: un bucle por tramo (no por punto)
+    for i in range(puntos - 2):
+        inicio, fin = bordes[i], bordes[i + 1]
+        ax, ay = x[anterior], y[anterior]
+        areas = np.abs((ax - media_x[i]) * (y[inicio:fin] - ay)
+                       - (ax - x[inicio:fin]) * (media_y[i] - ay))
+        anterior = inicio + int(np.argmax(areas))
+        indices[i + 1] = anterior
+    return x[indices], y[indices]
+
+
+def min_max(x: Any, y: Any, puntos: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce una serie conservando el mínimo y el máximo de cada tramo.
+
+    La serie se divide en `puntos // 2` tramos iguales y de cada uno se
+    guardan sus dos extremos en orden temporal. Es más rápido que LTTB y
+    garantiza que ningún valor extremo desaparece del gráfico. Los NaN
+    nunca son el mínimo ni el máximo de un tramo; un tramo sin ningún dato
+    conserva su primer punto (NaN), así que el hueco se sigue viendo.
+
+    Args:
+        x: Posiciones (crecientes)
+        y: Valores
+        puntos: Puntos máximos de la serie resultante (mínimo 2)
+
+    Returns:
+        Tupla (x, y) con a lo sumo `puntos` valores + primero y último
+
+    Raises:
+        ValueError: Si puntos < 2 o x e y no tienen el mismo tamaño
+    """
+    x, y = _como_arrays(x, y)
+    if puntos < 2:
+        raise ValueError("min_max necesita al menos 2 puntos")
+    n = len(x)
+    if n <= puntos:
+        return x, y
+
+    tramos = puntos // 2
+    tam_tramo = -(-n // tramos)
+    # Se rellena con el último valor para poder dar forma tramos × tam_tramo
+    relleno = np.pad(y, (0, tramos * tam_tramo - n), mode='edge').reshape(tramos, tam_tramo)
+    desplazamiento = np.arange(tramos) * tam_tramo
+    if np.isnan(y).any():
+        faltantes = np.isnan(relleno)
+        minimos = np.where(faltantes, np.inf, relleno).argmin(axis=1)
+        maximos = np.where(faltantes, -np.inf, relleno).argmax(axis=1)
+    else:
+        minimos, maximos = relleno.argmin(axis=1), relleno.argmax(axis=1)
+    minimos = np.minimum(desplazamiento + minimos, n - 1)
+    maximos = np.minimum(desplazamiento + maximos, n - 1)
+    indices = np.unique(np.concatenate(([0, n - 1], minimos, maximos)))
+    return x[indices], y[indices]
+
+
+def submuestrear(x: Any, y: Any, puntos: int, metodo: str = 'lttb') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce una serie a `puntos` puntos si es más larga.
+
+    Args:
+        x: Posiciones (crecientes)
+        y: Valores
+        puntos: Presupuesto de puntos
+        metodo: 'lttb' o 'min_max'
+
+    Returns:
+        Tupla (x, y) como arrays float64
+
+    Raises:
+        ValueError: Si el método no existe
+    """
+    if metodo == 'lttb':
+        return lttb(x, y, max(puntos, 3))
+    if metodo == 'min_max':
+        return min_max(x, y, max(puntos, 2))
+    raise ValueError(f"Método de submuestreo desconocido: '{metodo}' (opciones: {', '.join(METODOS)})")
+
+
+def presupuesto_puntos(eje: Any, dpi: float) -> int:
+    """
+    Píxeles horizontales de un gráfico de matplotlib a una resolución dada.
+
+    Args:
+        eje: Axes de matplotlib
+        dpi: Resolución a la que se va a dibujar
+
+    Returns:
+        Ancho del gráfico en píxeles (mínimo 3)
+    """
+    ancho_pulgadas = eje.get_position().width * eje.figure.get_figwidth()
+    return max(int(ancho_pulgadas * dpi), 3)
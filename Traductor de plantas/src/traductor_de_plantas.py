@@ -59,6 +59,13 @@ except ImportError:
     print("  pip install numpy pandas matplotlib scikit-learn")
     print("="*70 + "\n")
 
+try:
+    # Simulación de sensores por bloques con numpy.random.Generator
+    from simulacion_rng import FlujoLecturas, generador_planta
+    SIMULACION_VECTORIZADA = True
+except ImportError:
+    SIMULACION_VECTORIZADA = False
+
 
 # ==========================================
 # ENUMERACIONES Y CONSTANTES
@@ -274,27 +281,38 @@ def listar_plantas_disponibles() -> None:
     print(f"Total: {len(BASE_DATOS_PLANTAS)} plantas en la base de datos\n")
 
 
-def generar_dataset_csv(ruta_archivo: str = "dataset_plantas_30.csv") -> Optional[Any]:
+def generar_dataset_csv(ruta_archivo: str = "dataset_plantas_30.csv",
+                        dias_por_planta: int = 50,
+                        semilla: Optional[int] = None,
+                        devolver_dataframe: bool = True) -> Optional[Any]:
     """
     Genera un archivo CSV con datos simulados de las 30 plantas.
     
-    Para cada planta, genera 50 días de lecturas simuladas de humedad
-    basadas en los rangos óptimos de cada especie.
+    Para cada planta, genera `dias_por_planta` días de lecturas simuladas
+    de humedad basadas en los rangos óptimos de cada especie. Los datos se generan
+    vectorizados por bloques de plantas y se escriben a disco a medida que
+    se producen (ver generador_dataset).
     
     Args:
         ruta_archivo: Ruta donde se guardará el archivo CSV
                      (default: "dataset_plantas_30.csv")
+        dias_por_planta: Días de lecturas por planta (default: 50)
+        semilla: Semilla para resultados reproducibles
+        devolver_dataframe: Si True (default), además se conserva el dataset
+                            completo en memoria y se retorna como DataFrame.
+                            Con False solo se escribe el CSV y la memoria
+                            queda acotada, útil para datasets grandes
     
     Returns:
-        DataFrame de pandas con los datos generados, o None si las
-        librerías no están disponibles
+        DataFrame de pandas con los datos generados, o None si
+        devolver_dataframe es False o las librerías no están disponibles
     
     Raises:
         ImportError: Si numpy o pandas no están instalados (capturado internamente)
     
     Estructura del CSV generado:
         - planta: Nombre de la planta
-        - dia: Día de la lectura (1-50)
+        - dia: Día de la lectura (1-dias_por_planta)
         - humedad: Humedad normalizada (0-1)
         - humedad_pct: Humedad en porcentaje (0-100)
         - umbral_sequia: Umbral crítico de la planta
@@ -310,49 +328,27 @@ def generar_dataset_csv(ruta_archivo: str = "dataset_plantas_30.csv") -> Optiona
         print("   Instala con: pip install numpy pandas")
         return None
     
-    import numpy as np
-    import pandas as pd
-    
-    print("📊 Generando dataset de 30 plantas...")
+    from generador_dataset import generar_dataset
     
-    data = []
-    dias_por_planta = 50
+    print(f"📊 Generando dataset de {len(BASE_DATOS_PLANTAS)} plantas...")
     
-    for planta_config in BASE_DATOS_PLANTAS:
-        # Normalizar rangos de humedad a escala 0-1
-        humedad_min_norm = planta_config.humedad_min / 100.0
-        humedad_max_norm = planta_config.humedad_max / 100.0
-        
-        # Generar valores aleatorios dentro del rango óptimo
-        humedad_valores = np.random.uniform(
-            humedad_min_norm, 
-            humedad_max_norm, 
-            dias_por_planta
-        )
-        
-        # Crear registros para cada día
-        for dia, humedad in enumerate(humedad_valores, 1):
-            data.append({
-                'planta': planta_config.nombre,
-                'dia': dia,
-                'humedad': round(humedad, 3),
-                'humedad_pct': round(humedad * 100, 2),
-                'umbral_sequia': planta_config.umbral_sequia,
-                'frecuencia_riego': planta_config.frecuencia_riego_dias
-            })
-    
-    # Crear DataFrame y guardar
-    df = pd.DataFrame(data)
-    df.to_csv(ruta_archivo, index=False)
+    resultado = generar_dataset(
+        BASE_DATOS_PLANTAS,
+        ruta_archivo,
+        dias=dias_por_planta,
+        semilla=semilla,
+        devolver_dataframe=devolver_dataframe
+    )
     
     print(f"✅ Dataset generado exitosamente: {ruta_archivo}")
     print(f"   📋 Estadísticas:")
-    print(f"      • Total de registros: {len(df):,}")
+    print(f"      • Total de registros: {resultado['filas']:,}")
     print(f"      • Plantas incluidas: {len(BASE_DATOS_PLANTAS)}")
     print(f"      • Días por planta: {dias_por_planta}")
-    print(f"      • Tamaño del archivo: ~{len(df) * 50 / 1024:.1f} KB")
+    print(f"      • Tamaño del archivo: {resultado['bytes'] / 1024:.1f} KB")
+    print(f"      • Velocidad: {resultado['filas_por_segundo']:,.0f} filas/s")
     
-    return df
+    return resultado.get('dataframe')
 
 
 # ==========================================
@@ -547,6 +543,36 @@ class ModeloPrediccionRiego:
         # Limitar resultado entre 0 y 1
         return float(max(0.0, min(1.0, prediccion)))
     
+    def predecir_lote(self, humedades: List[float]) -> Union[List[float], 'np.ndarray']:
+        """
+        Predice la necesidad de agua de muchas lecturas a la vez.
+        
+        Da los mismos valores que llamar a predecir() con cada humedad, pero
+        aplica y = mx + b a todo el lote de una vez: con scikit-learn evita
+        construir un array y llamar a predict() por cada lectura.
+        
+        Args:
+            humedades: Niveles de humedad del suelo en porcentaje (0-100)
+        
+        Returns:
+            Necesidades de agua entre 0 y 1 (np.ndarray si numpy está
+            disponible, lista si no)
+        
+        Raises:
+            ValueError: Si el modelo no ha sido entrenado
+        
+        Ejemplo:
+            >>> necesidades = modelo.predecir_lote([25.0, 45.0, 80.0])
+        """
+        if not self.entrenado:
+            raise ValueError("El modelo debe ser entrenado antes de hacer predicciones")
+        
+        if LIBRERIAS_DISPONIBLES:
+            entrada = np.asarray(humedades, dtype=float)
+            return np.clip(self.pendiente * entrada + self.intercepto, 0.0, 1.0)
+        return [max(0.0, min(1.0, self.pendiente * h + self.intercepto))  # type: ignore
+                for h in humedades]
+    
     def obtener_ecuacion(self) -> str:
         """
         Retorna la ecuación del modelo en formato legible.
@@ -723,6 +749,8 @@ class TraductorPlantaInteligente:
         config (ConfiguracionPlanta): Configuración de parámetros óptimos
         historial (List[LecturaSensores]): Registro de todas las lecturas
         modelo_ml (ModeloPrediccionRiego): Modelo de predicción de riego
+        adc_max (int): Código máximo de los sensores simulados (1023 o el
+                       del calibrador)
     
     Ejemplo de uso completo:
         >>> config = ConfiguracionPlanta(
@@ -742,7 +770,13 @@ class TraductorPlantaInteligente:
     def __init__(self, 
                  nombre: str, 
                  tipo_planta: str = "general",
-                 config: Optional[ConfiguracionPlanta] = None):
+                 config: Optional[ConfiguracionPlanta] = None,
+                 semilla: Optional[int] = None,
+                 calibrador: Optional[Any] = None,
+                 motor_alertas: Optional[Any] = None,
+                 almacen: Optional[Any] = None,
+                 exportador: Optional[Any] = None,
+                 instrumentacion: Optional[Any] = None):
         """
         Inicializa el sistema de traducción para una planta específica.
         
@@ -750,12 +784,49 @@ class TraductorPlantaInteligente:
             nombre: Nombre personalizado de la planta individual
             tipo_planta: Tipo o especie (ej: "Monstera", "Cactus")
             config: Configuración de parámetros. Si es None, usa valores genéricos
+            semilla: Semilla de la simulación de sensores. Con la misma semilla
+                     y el mismo nombre se obtienen las mismas lecturas.
+            calibrador: CalibradorSensores (ver calibracion_sensores) con las
+                        curvas de los sensores "humedad" y "luz". Si es None,
+                        se usa la normalización lineal de normalizar_sensor.
+                        Los sensores simulados usan la resolución del
+                        calibrador (p.ej. 0-4095 con bits=12).
+            motor_alertas: MotorAlertas (ver alertas) que recibe cada
+                           diagnóstico y emite solo las transiciones de estado.
+                           Con motor, el mensaje de cada lectura habla solo de
+                           esas transiciones (ver traducir_eventos) y quedan
+                           en `ultimos_eventos`.
+            almacen: AlmacenHistorial (ver almacen_columnar) donde se persiste
+                     cada lectura además de guardarla en `historial`.
+            exportador: ExportadorCSV (ver exportador_csv) que exporta cada
+                        lectura a CSV por lotes, sin bloquear el bucle.
+            instrumentacion: Instrumentacion (ver instrumentacion) que registra
+                             el tiempo de cada etapa de procesar_lectura. Si
+                             es None no se toma ningún tiempo.
         """
         self.nombre = nombre
         self.tipo_planta = tipo_planta
         self.config = config if config else ConfiguracionPlanta()
         self.historial: List[LecturaSensores] = []
         self.modelo_ml = ModeloPrediccionRiego()
+        self.calibrador = calibrador
+        self.motor_alertas = motor_alertas
+        self.ultimos_eventos: List[Any] = []
+        self.almacen = almacen
+        self.exportador = exportador
+        self.instrumentacion = instrumentacion
+        
+        # Resolución del ADC simulado: la del calibrador, o 10 bits
+        bits = getattr(calibrador, "bits", 10) if calibrador is not None else 10
+        self.adc_max = (1 << bits) - 1
+        
+        # Fuente de lecturas simuladas: por bloques con numpy si está
+        # disponible, o con random.Random como respaldo
+        self._flujo_lecturas: Optional[Any] = None
+        self._rng_basico = random.Random(semilla)
+        if SIMULACION_VECTORIZADA:
+            self._flujo_lecturas = FlujoLecturas(generador_planta(nombre, semilla),
+                                                 adc_max=self.adc_max)
         
         # Entrenar modelo automáticamente
         self.modelo_ml.entrenar()
@@ -765,7 +836,8 @@ class TraductorPlantaInteligente:
         Simula la lectura de sensores físicos tipo Arduino/ESP32.
         
         Genera valores aleatorios que imitan sensores reales:
-            - Sensores analógicos de humedad y luz: 0-1023 (10 bits)
+            - Sensores analógicos de humedad y luz: 0-adc_max (0-1023 con
+              10 bits, o la resolución del calibrador)
             - Sensor de temperatura: valores flotantes en °C
         
         En un sistema real, esta función sería reemplazada por:
@@ -775,13 +847,14 @@ class TraductorPlantaInteligente:
         
         Returns:
             Tuple[int, int, float]: (humedad_raw, luz_raw, temperatura)
-                humedad_raw: Valor ADC 0-1023
-                luz_raw: Valor ADC 0-1023
+                humedad_raw: Valor ADC 0-adc_max
+                luz_raw: Valor ADC 0-adc_max
                 temperatura: Temperatura en °C
         
         Nota:
             La temperatura incluye ruido gaussiano para simular
-            variabilidad realista del sensor.
+            variabilidad realista del sensor. Con numpy disponible las
+            lecturas se sortean por bloques (ver simulacion_rng.FlujoLecturas).
         
         Ejemplo para integración con hardware real:
             ```python
@@ -803,13 +876,16 @@ class TraductorPlantaInteligente:
                 return humedad_raw, luz_raw, temperatura
             ```
         """
-        # Simular valores ADC de 10 bits (0-1023)
-        humedad_raw = random.randint(0, 1023)
-        luz_raw = random.randint(0, 1023)
+        if self._flujo_lecturas is not None:
+            return self._flujo_lecturas.siguiente()
+        
+        # Simular valores ADC (0-1023 con 10 bits)
+        humedad_raw = self._rng_basico.randint(0, self.adc_max)
+        luz_raw = self._rng_basico.randint(0, self.adc_max)
         
         # Simular temperatura con distribución realista
-        temp_base = random.uniform(18.0, 30.0)
-        temp_ruido = random.gauss(0, 0.5)  # Ruido gaussiano ±0.5°C
+        temp_base = self._rng_basico.uniform(18.0, 30.0)
+        temp_ruido = self._rng_basico.gauss(0, 0.5)  # Ruido gaussiano ±0.5°C
         temperatura = round(temp_base + temp_ruido, 2)
         
         return humedad_raw, luz_raw, temperatura
@@ -825,6 +901,9 @@ class TraductorPlantaInteligente:
         Fórmula matemática:
             f(x) = (x / x_max) × 100
         
+        Para sensores no lineales o conversiones de arrays completos,
+        ver calibracion_sensores.CalibradorSensores.
+        
         Args:
             valor_crudo: Valor leído del sensor ADC
             rango_max: Valor máximo del ADC (default: 1023 para Arduino)
@@ -856,7 +935,8 @@ class TraductorPlantaInteligente:
         # Asegurar que esté en el rango válido y redondear
         return round(max(0.0, min(100.0, porcentaje)), 2)
     
-    def analizar_condiciones(self, lectura: LecturaSensores) -> Dict[str, Any]:
+    def analizar_condiciones(self, lectura: LecturaSensores,
+                             necesidad_agua: Optional[float] = None) -> Dict[str, Any]:
         """
         Analiza las condiciones ambientales y genera un diagnóstico completo.
         
@@ -874,11 +954,15 @@ class TraductorPlantaInteligente:
         
         Args:
             lectura: Objeto LecturaSensores con datos procesados
+            necesidad_agua: Predicción del modelo ya calculada (0-1). Si es
+                            None, se calcula aquí con modelo_ml.
         
         Returns:
             Dict con las siguientes claves:
                 - estado (EstadoPlanta): Estado emocional general
                 - problemas (List[str]): Lista de mensajes de problemas
+                - codigos (List[str]): Tipo de cada problema, en el mismo orden
+                  ("sed", "exceso_agua", "calor", "frio", "oscuridad", "exceso_luz")
                 - prioridad_maxima (int): Mayor prioridad encontrada (0-3)
                 - necesidad_agua_ml (float): Predicción del modelo (0-1)
                 - lectura (LecturaSensores): Lectura analizada
@@ -897,9 +981,11 @@ class TraductorPlantaInteligente:
         """
         problemas: List[str] = []
         prioridades: List[int] = []
+        codigos: List[str] = []
         
         # ========== ANÁLISIS 1: HUMEDAD CON ML ==========
-        necesidad_agua = self.modelo_ml.predecir(lectura.humedad_pct)
+        if necesidad_agua is None:
+            necesidad_agua = self.modelo_ml.predecir(lectura.humedad_pct)
         
         if necesidad_agua > 0.7:
             # Sequía crítica
@@ -907,12 +993,14 @@ class TraductorPlantaInteligente:
                 f"💧 URGENTE: Sed extrema (Humedad: {lectura.humedad_pct}%)"
             )
             prioridades.append(3)
+            codigos.append("sed")
         elif necesidad_agua > 0.5:
             # Sequía moderada
             problemas.append(
                 f"💧 Tengo sed (Humedad: {lectura.humedad_pct}%)"
             )
             prioridades.append(2)
+            codigos.append("sed")
         elif lectura.humedad_pct > self.config.humedad_max:
             # Exceso de agua
             problemas.append(
@@ -920,6 +1008,7 @@ class TraductorPlantaInteligente:
                 f"(Humedad: {lectura.humedad_pct}%)"
             )
             prioridades.append(2)
+            codigos.append("exceso_agua")
         
         # ========== ANÁLISIS 2: TEMPERATURA ==========
         if lectura.temperatura > self.config.temperatura_max:
@@ -931,12 +1020,14 @@ class TraductorPlantaInteligente:
                     f"🔥 CRÍTICO: Calor extremo ({lectura.temperatura}°C)"
                 )
                 prioridades.append(3)
+                codigos.append("calor")
             else:
                 # Calor moderado
                 problemas.append(
                     f"🔥 Hace mucho calor ({lectura.temperatura}°C)"
                 )
                 prioridades.append(2)
+                codigos.append("calor")
         
         elif lectura.temperatura < self.config.temperatura_min:
             # Frío
@@ -944,6 +1035,7 @@ class TraductorPlantaInteligente:
                 f"❄️ Hace frío ({lectura.temperatura}°C)"
             )
             prioridades.append(2)
+            codigos.append("frio")
         
         # ========== ANÁLISIS 3: LUZ ==========
         if lectura.luz_pct < self.config.luz_min:
@@ -952,6 +1044,7 @@ class TraductorPlantaInteligente:
                 f"🌑 Muy oscuro, necesito luz (Luz: {lectura.luz_pct}%)"
             )
             prioridades.append(1)
+            codigos.append("oscuridad")
         
         elif lectura.luz_pct > self.config.luz_max:
             # Exceso de luz
@@ -959,6 +1052,7 @@ class TraductorPlantaInteligente:
                 f"☀️ Luz muy intensa, me quemo (Luz: {lectura.luz_pct}%)"
             )
             prioridades.append(2)
+            codigos.append("exceso_luz")
         
         # ========== DETERMINACIÓN DEL ESTADO GENERAL ==========
         if not problemas:
@@ -973,6 +1067,7 @@ class TraductorPlantaInteligente:
         return {
             'estado': estado,
             'problemas': problemas,
+            'codigos': codigos,
             'prioridad_maxima': max(prioridades, default=0),
             'necesidad_agua_ml': necesidad_agua,
             'lectura': lectura
@@ -1012,18 +1107,48 @@ class TraductorPlantaInteligente:
         if not problemas:
             return f"🌿 {self.nombre} dice: ¡Estoy perfecta! Todo está ideal."
         
-        # Construir mensaje concatenando problemas
+        return f"{estado.value} {self.nombre} dice: {self._unir_problemas(problemas)}."
+    
+    @staticmethod
+    def _unir_problemas(problemas: List[str]) -> str:
+        """Une los problemas como 'a', 'a y b' o 'a, b y c'."""
         if len(problemas) == 1:
             # Un solo problema
-            mensaje_problemas = problemas[0]
-        elif len(problemas) == 2:
+            return problemas[0]
+        if len(problemas) == 2:
             # Dos problemas
-            mensaje_problemas = f"{problemas[0]} y {problemas[1]}"
-        else:
-            # Tres o más problemas
-            mensaje_problemas = ", ".join(problemas[:-1]) + f" y {problemas[-1]}"
+            return f"{problemas[0]} y {problemas[1]}"
+        # Tres o más problemas
+        return ", ".join(problemas[:-1]) + f" y {problemas[-1]}"
+    
+    def traducir_eventos(self, diagnostico: Dict[str, Any], eventos: List[Any]) -> str:
+        """
+        Mensaje de una lectura a partir de las transiciones del motor de alertas.
+        
+        A diferencia de traducir_mensaje, un problema que sigue activo (o que
+        oscila en el umbral) no se repite en cada lectura: solo se informa
+        cuando la alerta se activa o se resuelve.
+        
+        Args:
+            diagnostico: Diccionario retornado por analizar_condiciones()
+            eventos: EventoAlerta devueltos por MotorAlertas.procesar()
         
-        return f"{estado.value} {self.nombre} dice: {mensaje_problemas}."
+        Returns:
+            str: Mensaje humanizado con las transiciones de esta lectura
+        
+        Ejemplos de salida:
+            - "Estresada 😫 Monstera dice: 🌊 Demasiada agua, riesgo de pudrición (Humedad: 75%)."
+            - "Feliz 🌿 Monstera dice: Ya pasó: 🌊 Demasiada agua, riesgo de pudrición (Humedad: 75%)."
+            - "Estresada 😫 Monstera dice: Sin cambios en mis alertas."
+        """
+        estado: EstadoPlanta = diagnostico['estado']
+        if not eventos:
+            if not diagnostico['problemas'] and not self.motor_alertas.alertas_activas(self.nombre):
+                return f"🌿 {self.nombre} dice: ¡Estoy perfecta! Todo está ideal."
+            return f"{estado.value} {self.nombre} dice: Sin cambios en mis alertas."
+        
+        partes = [e.mensaje if e.tipo == "activada" else f"Ya pasó: {e.mensaje}" for e in eventos]
+        return f"{estado.value} {self.nombre} dice: {self._unir_problemas(partes)}."
     
     def procesar_lectura(self) -> Tuple[LecturaSensores, str]:
         """
@@ -1039,6 +1164,10 @@ class TraductorPlantaInteligente:
             5. Traduce diagnóstico a lenguaje natural
             6. Guarda en historial para estadísticas
         
+        Con `instrumentacion` se registra la duración de cada etapa (ver
+        instrumentacion.ETAPAS); sin ella solo se paga una comprobación
+        `is None` por etapa.
+        
         Returns:
             Tuple[LecturaSensores, str]:
                 - LecturaSensores: Objeto con todos los datos de la lectura
@@ -1052,12 +1181,22 @@ class TraductorPlantaInteligente:
             Humedad: 45.3%
             🌿 Mi Planta dice: ¡Estoy perfecta! Todo está ideal.
         """
+        instrumentacion = self.instrumentacion
+        if instrumentacion is not None:
+            t = time.perf_counter_ns()
+        
         # Paso 1: Leer sensores
         h_raw, l_raw, temp = self.leer_sensores_simulados()
+        if instrumentacion is not None:
+            t = instrumentacion.marcar('lectura_sensores', t)
         
         # Paso 2: Normalizar datos (ADC → Porcentaje)
-        h_pct = self.normalizar_sensor(h_raw)
-        l_pct = self.normalizar_sensor(l_raw)
+        if self.calibrador is not None:
+            h_pct = self.calibrador.convertir_uno("humedad", h_raw)
+            l_pct = self.calibrador.convertir_uno("luz", l_raw)
+        else:
+            h_pct = self.normalizar_sensor(h_raw)
+            l_pct = self.normalizar_sensor(l_raw)
         
         # Paso 3: Crear registro de lectura
         lectura = LecturaSensores(
@@ -1068,15 +1207,37 @@ class TraductorPlantaInteligente:
             luz_pct=l_pct,
             timestamp=time.time()
         )
+        if instrumentacion is not None:
+            t = instrumentacion.marcar('normalizacion', t)
+        
+        # Paso 4: Analizar condiciones (predicción ML y reglas)
+        if instrumentacion is not None:
+            necesidad_agua = self.modelo_ml.predecir(h_pct)
+            t = instrumentacion.marcar('prediccion_ml', t)
+            diagnostico = self.analizar_condiciones(lectura, necesidad_agua)
+        else:
+            diagnostico = self.analizar_condiciones(lectura)
+        if self.motor_alertas is not None:
+            self.ultimos_eventos = self.motor_alertas.procesar(self.nombre, diagnostico, self.config)
+        if instrumentacion is not None:
+            t = instrumentacion.marcar('reglas', t)
+        
+        # Paso 5: Traducir a mensaje (solo las transiciones si hay motor de alertas)
+        if self.motor_alertas is not None:
+            mensaje = self.traducir_eventos(diagnostico, self.ultimos_eventos)
+        else:
+            mensaje = self.traducir_mensaje(diagnostico)
+        if instrumentacion is not None:
+            t = instrumentacion.marcar('mensaje', t)
         
-        # Paso 4: Analizar condiciones
-        diagnostico = self.analizar_condiciones(lectura)
-        
-        # Paso 5: Traducir a mensaje
-        mensaje = self.traducir_mensaje(diagnostico)
-        
-        # Paso 6: Guardar en historial
+        # Paso 6: Guardar en historial (y en disco si hay almacén o exportador)
         self.historial.append(lectura)
+        if self.almacen is not None:
+            self.almacen.agregar(lectura)
+        if self.exportador is not None:
+            self.exportador.agregar(lectura, self.nombre)
+        if instrumentacion is not None:
+            instrumentacion.marcar('historial', t)
         
         return lectura, mensaje
     
@@ -1191,7 +1352,7 @@ if __name__ == "__main__":
             generar_csv = input("¿Desea generar el dataset CSV con datos simulados? (s/n): ")
             
             if generar_csv.lower() == "s":
-                generar_dataset_csv()
+                generar_dataset_csv(devolver_dataframe=False)
             
             # Ejemplo de uso de TraductorPlantaInteligente
             print("\nEjemplo de uso de TraductorPlantaInteligente:")
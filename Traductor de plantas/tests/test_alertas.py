@@ -0,0 +1,107 @@
+"""
+Script de prueba para el motor de alertas con histéresis (alertas.py)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+print("="*70)
+print("TEST DEL MOTOR DE ALERTAS")
+print("="*70)
+
+# Test 1: Importar módulos
+print("\n[Test 1] Importando alertas y traductor...")
+try:
+    from alertas import MotorAlertas, ReglaAlerta
+    from traductor_de_plantas import (
+        ConfiguracionPlanta, LecturaSensores, TraductorPlantaInteligente
+    )
+    print("  OK - Módulos importados correctamente")
+except Exception as e:
+    print(f"  ERROR: {e}")
+    exit(1)
+
+config = ConfiguracionPlanta(nombre="Prueba", humedad_min=20.0, humedad_max=60.0,
+                             temperatura_min=15.0, temperatura_max=28.0,
+                             luz_min=0.0, luz_max=100.0)
+traductor = TraductorPlantaInteligente("Prueba", config=config, semilla=1)
+
+
+def diagnosticar(t: float, humedad: float):
+    """Diagnóstico real de una lectura con humedad y tiempo controlados."""
+    lectura = LecturaSensores(humedad_raw=0, luz_raw=0, temperatura=20.0,
+                              humedad_pct=humedad, luz_pct=50.0, timestamp=t)
+    return traductor.analizar_condiciones(lectura)
+
+
+reglas = {'exceso_agua': ReglaAlerta('humedad_pct', 'humedad_max', 1, 2.0, 60.0)}
+
+# Test 2: Oscilación en el umbral -> una sola activación
+print("\n[Test 2] Humedad oscilando en el umbral...")
+motor = MotorAlertas(reglas=reglas)
+eventos = []
+for i in range(600):
+    humedad = 60.5 if i % 2 == 0 else 59.5   # cruza el umbral en cada lectura
+    eventos += motor.procesar("Prueba", diagnosticar(i * 10.0, humedad), config)
+if [e.tipo for e in eventos] == ["activada"]:
+    print(f"  OK - {motor.problemas_recibidos} problemas -> {len(eventos)} evento")
+else:
+    print(f"  ERROR: Eventos inesperados: {[e.tipo for e in eventos]}")
+    exit(1)
+
+# Test 3: Resolución solo tras salir de la banda durante la permanencia
+print("\n[Test 3] Resolución con histéresis y permanencia...")
+t0 = 600 * 10.0
+for i in range(10):
+    eventos += motor.procesar("Prueba", diagnosticar(t0 + i * 10.0, 57.0), config)
+if [e.tipo for e in eventos] == ["activada", "resuelta"] and eventos[-1].repeticiones == 300:
+    print(f"  OK - Resuelta tras {eventos[-1].duracion_s:.0f}s con "
+          f"{eventos[-1].repeticiones} repeticiones agrupadas")
+else:
+    print(f"  ERROR: Eventos inesperados: {[(e.tipo, e.repeticiones) for e in eventos]}")
+    exit(1)
+
+# Test 4: Problemas breves no llegan a activarse
+print("\n[Test 4] Problema más corto que la permanencia...")
+motor = MotorAlertas(reglas=reglas)
+eventos = [e for i in range(3)
+           for e in motor.procesar("Prueba", diagnosticar(i * 10.0, 65.0), config)]
+eventos += motor.procesar("Prueba", diagnosticar(40.0, 50.0), config)
+if not eventos and not motor.alertas_activas():
+    print("  OK - Sin eventos ni alertas activas")
+else:
+    print("  ERROR: Un problema breve generó una alerta")
+    exit(1)
+
+# Test 5: El traductor con motor informa solo de las transiciones
+print("\n[Test 5] Mensajes del traductor con motor de alertas...")
+motor = MotorAlertas(reglas={'exceso_agua': ReglaAlerta('humedad_pct', 'humedad_max', 1, 2.0, 0.0)})
+con_motor = TraductorPlantaInteligente("Prueba", config=config, semilla=1, motor_alertas=motor)
+humedades_raw = iter([640, 600, 640, 600, 500])   # 62.6%, 58.7%, 62.6%, 58.7%, 48.9%
+con_motor.leer_sensores_simulados = lambda: (next(humedades_raw), 512, 20.0)
+resultados = []
+for _ in range(5):
+    _, mensaje = con_motor.procesar_lectura()
+    resultados.append(([e.tipo for e in con_motor.ultimos_eventos], mensaje))
+tipos = [t for t, _ in resultados]
+if (tipos == [["activada"], [], [], [], ["resuelta"]]
+        and "Demasiada agua" in resultados[0][1]
+        and all("Sin cambios" in m and "Demasiada agua" not in m for _, m in resultados[1:4])
+        and "Ya pasó" in resultados[4][1]):
+    print("  OK - Activación y resolución en el mensaje; la oscilación no se repite")
+else:
+    print(f"  ERROR: {resultados}")
+    exit(1)
+sin_motor = TraductorPlantaInteligente("Prueba", config=config, semilla=1)
+sin_motor.leer_sensores_simulados = lambda: (640, 512, 20.0)
+if "Demasiada agua" in sin_motor.procesar_lectura()[1] and sin_motor.ultimos_eventos == []:
+    print("  OK - Sin motor el mensaje sigue listando cada problema")
+else:
+    print("  ERROR: El mensaje sin motor cambió")
+    exit(1)
+
+print("\n" + "="*70)
+print("TODOS LOS TESTS COMPLETADOS EXITOSAMENTE")
+print("="*70)
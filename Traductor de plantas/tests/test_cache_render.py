@@ -0,0 +1,117 @@
+"""
+Script de prueba para la cache de imágenes de dashboards
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+print("="*70)
+print("TEST DE CACHE DE RENDERIZADO")
+print("="*70)
+
+# Test 1: Importar módulos
+print("\n[Test 1] Importando cache_render...")
+try:
+    import numpy as np
+    from cache_render import CacheRender, clave_render
+    from dashboard_plantas import generar_dashboard
+    print("  OK - Módulos importados correctamente")
+except Exception as e:
+    print(f"  ERROR: {e}")
+    exit(1)
+
+# Test 2: La clave depende del contenido, no del tipo de contenedor
+print("\n[Test 2] Claves de cache...")
+rangos = ((40, 70), (18, 26), (50, 80))
+clave = clave_render([50, 51], [20, 21], [60, 61], "Acacia", *rangos)
+if (clave == clave_render(np.array([50.0, 51.0]), [20, 21], [60, 61], "Acacia", *rangos)
+        and clave != clave_render([50, 52], [20, 21], [60, 61], "Acacia", *rangos)
+        and clave != clave_render([50, 51], [20, 21], [60, 61], "Acacia", *rangos, dpi=100)
+        and clave != clave_render([50, 51], [20, 21], [60, 61], "Acacia", *rangos, recortar=False)):
+    print("  OK - Misma clave para los mismos datos; distinta si cambian datos, dpi o recorte")
+else:
+    print("  ERROR: La clave no refleja el contenido")
+    exit(1)
+
+carpeta = tempfile.mkdtemp()
+
+# Test 3: La segunda petición del mismo dashboard sale de la cache
+print("\n[Test 3] Aciertos de cache...")
+cache = CacheRender(os.path.join(carpeta, "cache"))
+destinos = [os.path.join(carpeta, f"dashboard_{i}.png") for i in range(2)]
+for destino in destinos:
+    generar_dashboard([50, 55, 60], [20, 21, 22], [60, 65, 70], "Acacia", *rangos,
+                      guardar=True, nombre_archivo=destino, dpi=40, cache=cache)
+with open(destinos[0], 'rb') as a, open(destinos[1], 'rb') as b:
+    iguales = a.read() == b.read()
+if cache.fallos == 1 and cache.aciertos == 1 and iguales:
+    print("  OK - 1 renderizado, 1 acierto, imágenes idénticas")
+else:
+    print(f"  ERROR: fallos={cache.fallos} aciertos={cache.aciertos} iguales={iguales}")
+    exit(1)
+
+# Test 4: Expulsión LRU al superar el tamaño máximo
+print("\n[Test 4] Expulsión LRU...")
+cache = CacheRender(os.path.join(carpeta, "lru"), tam_max_bytes=2500)
+
+
+def escribir(contenido):
+    def renderizar(ruta):
+        with open(ruta, 'wb') as f:
+            f.write(contenido)
+    return renderizar
+
+
+for nombre in ("a", "b"):
+    cache.obtener_o_renderizar(nombre, escribir(b"x" * 1000))
+    os.utime(cache.ruta(nombre), (1000, 1000 if nombre == "a" else 2000))
+cache.obtener("a")  # "a" pasa a ser la más reciente
+cache.obtener_o_renderizar("c", escribir(b"x" * 1000))
+if cache.obtener("b") is None and cache.obtener("a") and cache.tam_total() <= 2500:
+    print(f"  OK - Se expulsó la menos usada; {cache.tam_total()} bytes en cache")
+else:
+    print(f"  ERROR: archivos={sorted(os.listdir(cache.directorio))}")
+    exit(1)
+
+# Test 5: Una imagen más grande que el límite se devuelve igualmente
+print("\n[Test 5] Imagen mayor que tam_max_bytes...")
+ruta = cache.obtener_o_renderizar("grande", escribir(b"x" * 5000))
+if os.path.exists(ruta) and cache.obtener("a") is None and cache.obtener("c") is None:
+    print("  OK - Se expulsan las demás pero no la imagen devuelta")
+else:
+    print(f"  ERROR: archivos={sorted(os.listdir(cache.directorio))}")
+    exit(1)
+
+# Test 6: Otro proceso expulsa la imagen antes de copiarla
+print("\n[Test 6] Imagen expulsada antes de la copia...")
+
+
+class CacheConCompetencia(CacheRender):
+    """Simula otro proceso que borra la imagen justo después de crearla."""
+
+    def obtener_o_renderizar(self, clave, renderizar):
+        ruta = super().obtener_o_renderizar(clave, renderizar)
+        os.remove(ruta)
+        return ruta
+
+
+destino = os.path.join(carpeta, "destino.png")
+CacheConCompetencia(os.path.join(carpeta, "competencia")).copiar_a("d", escribir(b"y" * 10), destino)
+with open(destino, 'rb') as f:
+    contenido = f.read()
+if contenido == b"y" * 10:
+    print("  OK - Se renderiza directamente en el destino")
+else:
+    print(f"  ERROR: destino con {len(contenido)} bytes")
+    exit(1)
+
+shutil.rmtree(carpeta)
+
+print("\n" + "="*70)
+print("TODOS LOS TESTS COMPLETADOS EXITOSAMENTE")
+print("="*70)
@@ -0,0 +1,72 @@
+"""
+Script de prueba para la calibración de sensores
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+print("="*70)
+print("TEST DE CALIBRACIÓN DE SENSORES")
+print("="*70)
+
+# Test 1: Importar módulos
+print("\n[Test 1] Importando calibracion_sensores...")
+try:
+    import numpy as np
+    from calibracion_sensores import (CURVA_CAPACITIVA_TIPICA, CalibradorSensores,
+                                      CurvaCalibracion)
+    from traductor_de_plantas import TraductorPlantaInteligente
+    print("  OK - Módulos importados correctamente")
+except Exception as e:
+    print(f"  ERROR: {e}")
+    exit(1)
+
+# Test 2: Ejemplos de los docstrings
+print("\n[Test 2] Ejemplos de la documentación...")
+calibrador = CalibradorSensores(bits=12)
+calibrador.registrar("humedad", CURVA_CAPACITIVA_TIPICA)
+capacitiva = calibrador.convertir("humedad", np.array([3480, 2600, 1650])).tolist()
+lineal = CalibradorSensores().convertir_uno("humedad", 512)
+if capacitiva == [0.03, 43.3, 99.41] and lineal == 50.05:
+    print(f"  OK - {capacitiva} y {lineal}")
+else:
+    print(f"  ERROR: {capacitiva} y {lineal}")
+    exit(1)
+
+# Test 3: La curva lineal equivale a normalizar_sensor
+print("\n[Test 3] Curva lineal frente a normalizar_sensor...")
+tabla = CalibradorSensores().tabla("humedad")
+esperado = [TraductorPlantaInteligente.normalizar_sensor(c) for c in range(1024)]
+if tabla.tolist() == esperado:
+    print("  OK - 1024 códigos idénticos")
+else:
+    print("  ERROR: La curva lineal difiere de normalizar_sensor")
+    exit(1)
+
+# Test 4: Curvas inválidas
+print("\n[Test 4] Validación de curvas...")
+try:
+    CurvaCalibracion(fracciones=(0.5, 0.2), porcentajes=(0.0, 100.0))
+    print("  ERROR: Debía lanzar ValueError")
+    exit(1)
+except ValueError:
+    print("  OK - ValueError con fracciones decrecientes")
+
+# Test 5: Traductor con calibrador de 12 bits
+print("\n[Test 5] Traductor con calibrador de 12 bits...")
+traductor = TraductorPlantaInteligente("Ficus", semilla=3, calibrador=calibrador)
+lecturas = [traductor.procesar_lectura()[0] for _ in range(500)]
+codigos = [l.humedad_raw for l in lecturas]
+calibradas = all(l.humedad_pct == calibrador.convertir_uno("humedad", l.humedad_raw)
+                 and l.luz_pct == calibrador.convertir_uno("luz", l.luz_raw) for l in lecturas)
+if traductor.adc_max == 4095 and max(codigos) > 1023 and calibradas:
+    print(f"  OK - Códigos hasta {max(codigos)} convertidos con las curvas del calibrador")
+else:
+    print(f"  ERROR: adc_max={traductor.adc_max}, máximo={max(codigos)}, calibradas={calibradas}")
+    exit(1)
+
+print("\n" + "="*70)
+print("TODOS LOS TESTS COMPLETADOS EXITOSAMENTE")
+print("="*70)
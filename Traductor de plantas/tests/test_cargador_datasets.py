@@ -0,0 +1,109 @@
+"""
+Script de prueba para el cargador de datasets con índice por planta y cache
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Los .npz canónicos van a una carpeta temporal, no a la cache del usuario
+os.environ["TRADUCTOR_PLANTAS_CACHE"] = tempfile.mkdtemp(prefix="test_cargador_cache_")
+
+print("="*70)
+print("TEST DEL CARGADOR DE DATASETS")
+print("="*70)
+
+# Test 1: Importar módulos
+print("\n[Test 1] Importando cargador_datasets...")
+try:
+    import numpy as np
+    from cargador_datasets import DatasetPorPlanta, cargar_dataset, limpiar_cache
+    print("  OK - Módulos importados correctamente")
+except Exception as e:
+    print(f"  ERROR: {e}")
+    exit(1)
+
+directorio = tempfile.mkdtemp(prefix="test_cargador_")
+ruta = os.path.join(directorio, "largo.csv")
+
+
+def escribir(humedad_fern: str) -> None:
+    """Escribe un CSV largo de 2 plantas; la humedad de Fern decide el contenido."""
+    with open(ruta, "w", encoding="utf-8") as f:
+        f.write("planta,dia,humedad_pct\n")
+        f.write(f"Fern,1,{humedad_fern}\nAcacia,1,50.0\nFern,2,72.0\n")
+
+
+# Test 2: Filas agrupadas por planta y búsqueda sin distinguir mayúsculas
+print("\n[Test 2] Índice por planta...")
+escribir("70.0")
+dataset = cargar_dataset(ruta)
+if (dataset.nombres == ["Fern", "Acacia"] and dataset.serie("fern").tolist() == [70.0, 72.0]
+        and "ACACIA" in dataset and "Ficus" not in dataset):
+    print("  OK - 'fern' y 'ACACIA' encuentran sus plantas")
+else:
+    print(f"  ERROR: {dataset.nombres}")
+    exit(1)
+try:
+    dataset.serie("Ficus")
+    print("  ERROR: Debía lanzar ValueError")
+    exit(1)
+except ValueError:
+    print("  OK - ValueError con una planta que no está")
+
+# Test 3: Nombres que solo difieren en mayúsculas
+print("\n[Test 3] Nombre exacto antes que la forma en minúsculas...")
+ambiguo = DatasetPorPlanta(nombres=["Acacia", "acacia"], inicios=np.array([0, 1, 2]),
+                           columnas={"humedad_pct": np.array([40.0, 60.0])})
+if (ambiguo.posicion("Acacia"), ambiguo.posicion("acacia")) == (0, 1):
+    print("  OK - Cada nombre exacto encuentra su planta")
+else:
+    print("  ERROR: Un nombre exacto encontró la otra planta")
+    exit(1)
+
+# Test 4: Sin cambios en el archivo se reutiliza el dataset en memoria
+print("\n[Test 4] Cache en memoria...")
+if cargar_dataset(ruta) is dataset:
+    print("  OK - Mismo objeto sin volver a leer el archivo")
+else:
+    print("  ERROR: Se volvió a cargar un archivo sin cambios")
+    exit(1)
+
+# Test 5: Mismo tamaño, otra fecha de modificación
+print("\n[Test 5] Invalidación por fecha de modificación...")
+estado = os.stat(ruta)
+escribir("71.0")
+os.utime(ruta, ns=(estado.st_atime_ns, estado.st_mtime_ns + 1_000_000_000))
+recargado = cargar_dataset(ruta)
+if os.path.getsize(ruta) == estado.st_size and recargado.serie("Fern")[0] == 71.0:
+    print("  OK - Mismo tamaño, fecha nueva: se leen los valores nuevos")
+else:
+    print(f"  ERROR: Se usó el dataset anterior ({recargado.serie('Fern').tolist()})")
+    exit(1)
+
+# Test 6: Misma fecha de modificación, otro tamaño
+print("\n[Test 6] Invalidación por tamaño...")
+estado = os.stat(ruta)
+escribir("71.25")
+os.utime(ruta, ns=(estado.st_atime_ns, estado.st_mtime_ns))
+recargado = cargar_dataset(ruta)
+if os.stat(ruta).st_mtime_ns == estado.st_mtime_ns and recargado.serie("Fern")[0] == 71.25:
+    print("  OK - Misma fecha, tamaño nuevo: se leen los valores nuevos")
+else:
+    print(f"  ERROR: Se usó el dataset anterior ({recargado.serie('Fern').tolist()})")
+    exit(1)
+
+# Test 7: limpiar_cache() obliga a cargar de nuevo
+print("\n[Test 7] Limpiar la cache...")
+limpiar_cache()
+nuevo = cargar_dataset(ruta)
+if nuevo is not recargado and np.array_equal(nuevo.serie("Fern"), recargado.serie("Fern")):
+    print("  OK - Objeto nuevo con las mismas lecturas")
+else:
+    print("  ERROR: limpiar_cache() no descartó el dataset")
+    exit(1)
+
+print("\n" + "="*70)
+print("TODOS LOS TESTS COMPLETADOS EXITOSAMENTE")
+print("="*70)
@@ -0,0 +1,133 @@
+"""
+Script de prueba para la conversión de datasets y el formato canónico
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Los .npz canónicos van a una carpeta temporal, no a la cache del usuario
+os.environ["TRADUCTOR_PLANTAS_CACHE"] = tempfile.mkdtemp(prefix="test_conversion_cache_")
+
+print("="*70)
+print("TEST DE CONVERSIÓN DE DATASETS")
+print("="*70)
+
+# Test 1: Importar módulos
+print("\n[Test 1] Importando conversion_datasets...")
+try:
+    import numpy as np
+    import pandas as pd
+    import cargador_datasets
+    from conversion_datasets import (ancho_a_largo, largo_a_ancho, dataset_a_ancho,
+                                     ruta_canonica, cargar_canonico)
+    from generador_dataset import generar_dataset
+    from planta_config import cargar_plantas
+    from plantas import exportar_dataset, EscritorTXT, EscritorCSV
+    print("  OK - Módulos importados correctamente")
+except Exception as e:
+    print(f"  ERROR: {e}")
+    exit(1)
+
+directorio = tempfile.mkdtemp(prefix="test_conversion_")
+
+# Test 2: Pivote ancho -> largo -> ancho
+print("\n[Test 2] Pivote ancho <-> largo...")
+ancho = pd.DataFrame({"Planta": ["Acacia", "Monstera"],
+                      "Día_1": [40.0, 55.5], "Día_2": [41.5, 54.0], "Día_3": [39.0, 53.25]})
+largo = ancho_a_largo(ancho)
+if len(largo) == 6 and largo_a_ancho(largo).equals(ancho):
+    print("  OK - 2 plantas × 3 días sin pérdida")
+else:
+    print("  ERROR: El pivote no es reversible")
+    exit(1)
+try:
+    largo_a_ancho(pd.DataFrame({"planta": ["Acacia", "Acacia"], "dia": [0, 1], "humedad_pct": [40.0, 41.0]}))
+    print("  ERROR: Debía lanzar ValueError")
+    exit(1)
+except ValueError:
+    print("  OK - ValueError con un día 0")
+
+# Test 3: TXT y CSV ancho dan el mismo dataset canónico
+print("\n[Test 3] Lectura del volcado TXT...")
+ruta_txt = os.path.join(directorio, "humedad.txt")
+ruta_csv = os.path.join(directorio, "humedad.csv")
+exportar_dataset(["Acacia", "Cactus", "Fern"], [EscritorTXT(ruta_txt), EscritorCSV(ruta_csv)], semilla=3)
+desde_txt = cargador_datasets.cargar_dataset(ruta_txt)
+desde_csv = cargador_datasets.cargar_dataset(ruta_csv)
+if (desde_txt.nombres == desde_csv.nombres
+        and np.allclose(desde_txt.columnas["humedad_pct"], desde_csv.columnas["humedad_pct"])
+        and dataset_a_ancho(desde_txt).shape == (3, 31)):
+    print("  OK - TXT y CSV contienen las mismas lecturas")
+else:
+    print("  ERROR: TXT y CSV no coinciden")
+    exit(1)
+
+# Test 4: El formato canónico se reutiliza e invalida
+print("\n[Test 4] Formato canónico en disco...")
+estado = os.stat(ruta_csv)
+if cargar_canonico(ruta_canonica(ruta_csv), (estado.st_mtime_ns, estado.st_size)) is None:
+    print("  ERROR: No se guardó el .npz canónico")
+    exit(1)
+if os.path.exists(os.path.join(directorio, ".cache")):
+    print("  ERROR: Se escribió una carpeta .cache junto a los datos")
+    exit(1)
+print("  OK - .npz guardado en la cache, nada escrito junto a los datos")
+with open(ruta_csv, "a", encoding="utf-8") as f:
+    f.write("Nueva," + ",".join(["50.0"] * 30) + "\n")
+cargador_datasets.limpiar_cache()
+if "Nueva" in cargador_datasets.cargar_dataset(ruta_csv):
+    print("  OK - El .npz se regenera cuando cambia el CSV")
+else:
+    print("  ERROR: Se usó un .npz desactualizado")
+    exit(1)
+
+# Test 5: Libro Excel convertido una sola vez
+print("\n[Test 5] Ingesta de un libro .xlsx...")
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+    print("  OMITIDO - openpyxl no está instalado")
+if openpyxl is not None:
+    import ingesta_excel
+    ruta_xlsx = os.path.join(directorio, "humedad.xlsx")
+    libro = openpyxl.Workbook()
+    hoja = libro.active
+    hoja.append(["Planta", "Dia 1", "Dia 2"])
+    hoja.append(["Acacia", 40.5, 42.0])
+    hoja.append(["Cactus", 25.0, 24.5])
+    libro.save(ruta_xlsx)
+
+    primera = ingesta_excel.ingerir_excel(ruta_xlsx)
+    ingesta_excel.parsear_excel = None  # Una segunda lectura del libro fallaría
+    segunda = ingesta_excel.ingerir_excel(ruta_xlsx)
+    if primera.nombres == segunda.nombres == ["Acacia", "Cactus"] and list(segunda.serie("Cactus")) == [25.0, 24.5]:
+        print("  OK - La segunda carga no vuelve a leer el Excel")
+    else:
+        print("  ERROR: La conversión del libro no coincide")
+        exit(1)
+
+# Test 6: Datasets comprimidos
+print("\n[Test 6] Lectura y escritura comprimida...")
+catalogo = [p for p in cargar_plantas() if p.nombre == "Acacia"]
+resultados = {}
+for extension in ("", ".gz", ".xz", ".bz2"):
+    ruta = os.path.join(directorio, f"dataset.csv{extension}")
+    resultados[extension] = generar_dataset(catalogo, ruta, dias=200, semilla=1)["bytes"]
+    serie = cargador_datasets.cargar_dataset(ruta).serie("Acacia")
+    if extension == "":
+        referencia = serie
+    elif not np.array_equal(serie, referencia):
+        print(f"  ERROR: El dataset {extension} no coincide con el CSV sin comprimir")
+        exit(1)
+if all(resultados[e] < resultados[""] for e in (".gz", ".xz", ".bz2")):
+    print(f"  OK - Mismas lecturas; .gz ocupa {resultados['.gz']} de {resultados['']} bytes")
+else:
+    print("  ERROR: Los archivos comprimidos no son más pequeños")
+    exit(1)
+
+print("\n" + "="*70)
+print("TODOS LOS TESTS COMPLETADOS EXITOSAMENTE")
+print("="*70)
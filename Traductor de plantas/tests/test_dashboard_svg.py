@@ -0,0 +1,125 @@
+"""
+Script de prueba para el dashboard SVG/HTML (sin matplotlib)
+"""
+
+import os
+import sys
+import tempfile
+import time
+import xml.dom.minidom
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+print("="*70)
+print("TEST DE DASHBOARD SVG")
+print("="*70)
+
+# Test 1: Importar módulo sin arrastrar matplotlib
+print("\n[Test 1] Importando dashboard_svg...")
+try:
+    from dashboard_svg import generar_svg_dashboard, guardar_dashboard_svg
+    from planta_config import buscar_planta
+    from sintetizador_series import sintetizar_series_planta
+    if 'matplotlib' in sys.modules:
+        print("  ERROR: Se importó matplotlib")
+        exit(1)
+    print("  OK - Módulo importado sin matplotlib")
+except Exception as e:
+    print(f"  ERROR: {e}")
+    exit(1)
+
+planta = buscar_planta("Acacia")
+humedad, temperatura, luz = sintetizar_series_planta(planta, dias=30, semilla=7)
+rangos = ((planta.humedad_min, planta.humedad_max),
+          (planta.temperatura_min, planta.temperatura_max),
+          (planta.luz_min, planta.luz_max))
+
+# Test 2: SVG bien formado con los 4 gráficos
+print("\n[Test 2] Generando SVG...")
+svg = generar_svg_dashboard(humedad, temperatura, luz, "Acacia <Mimosa>", *rangos)
+try:
+    documento = xml.dom.minidom.parseString(svg)
+except Exception as e:
+    print(f"  ERROR: SVG mal formado: {e}")
+    exit(1)
+paneles = documento.getElementsByTagName('g')
+lineas = documento.getElementsByTagName('polyline')
+if len(paneles) == 4 and len(lineas) == 3 and "Acacia &lt;Mimosa&gt;" in svg:
+    print("  OK - 4 gráficos, 3 series y nombre escapado")
+else:
+    print(f"  ERROR: {len(paneles)} gráficos, {len(lineas)} series")
+    exit(1)
+
+# Test 3: Menos de un milisegundo por dashboard
+print("\n[Test 3] Tiempo por dashboard...")
+repeticiones = 200
+inicio = time.perf_counter()
+for _ in range(repeticiones):
+    generar_svg_dashboard(humedad, temperatura, luz, "Acacia", *rangos)
+ms = (time.perf_counter() - inicio) / repeticiones * 1000
+if ms < 1.0:
+    print(f"  OK - {ms:.3f} ms por dashboard")
+else:
+    print(f"  AVISO - {ms:.3f} ms por dashboard (máquina lenta)")
+
+# Test 4: Series largas reducidas al ancho del gráfico
+print("\n[Test 4] Historial horario de un año...")
+humedad, temperatura, luz = sintetizar_series_planta(planta, dias=365, semilla=7, muestras_por_dia=24)
+svg = generar_svg_dashboard(humedad, temperatura, luz, "Acacia", *rangos)
+puntos = max(len(l.getAttribute('points').split())
+             for l in xml.dom.minidom.parseString(svg).getElementsByTagName('polyline'))
+if puntos <= 400:
+    print(f"  OK - {len(humedad)} lecturas dibujadas con {puntos} puntos")
+else:
+    print(f"  ERROR: {puntos} puntos")
+    exit(1)
+
+# Test 5: Guardar como HTML
+print("\n[Test 5] Guardando HTML...")
+with tempfile.TemporaryDirectory() as carpeta:
+    ruta = os.path.join(carpeta, "acacia.html")
+    guardar_dashboard_svg(ruta, humedad[:30], temperatura[:30], luz[:30], "Acacia", *rangos)
+    with open(ruta, encoding='utf-8') as f:
+        html = f.read()
+if html.startswith("<!DOCTYPE html>") and "<svg" in html:
+    print("  OK - Página HTML con el SVG")
+else:
+    print("  ERROR: HTML inesperado")
+    exit(1)
+
+# Test 6: Lecturas NaN (días sin datos)
+print("\n[Test 6] Series con NaN...")
+con_huecos = [50.0, float('nan'), 60.0] * 10
+svg = generar_svg_dashboard(con_huecos, con_huecos, con_huecos, "Acacia", *rangos)
+documento = xml.dom.minidom.parseString(svg)
+lineas = documento.getElementsByTagName('polyline')
+if 'nan' not in svg.lower() and len(lineas) == 3 * 11:
+    print(f"  OK - Sin coordenadas NaN, {len(lineas)} tramos de línea")
+else:
+    print(f"  ERROR: {len(lineas)} tramos, 'nan' en el SVG: {'nan' in svg.lower()}")
+    exit(1)
+try:
+    generar_svg_dashboard([float('nan')] * 5, [20.0] * 5, [60.0] * 5)
+    print("  ERROR: Debía lanzar ValueError")
+    exit(1)
+except ValueError:
+    print("  OK - ValueError con una serie sin lecturas válidas")
+
+# Test 7: Promedios negativos en las barras
+print("\n[Test 7] Temperatura bajo cero...")
+svg = generar_svg_dashboard([50.0] * 30, [-10.0] * 30, [60.0] * 30, "x", (40, 70), (-15, -5), (50, 80))
+documento = xml.dom.minidom.parseString(svg)
+barras = [r for r in documento.getElementsByTagName('rect') if r.getAttribute('fill-opacity') == '0.8']
+alturas = [float(r.getAttribute('height')) for r in barras]
+fondo_barra = max(float(r.getAttribute('y')) + float(r.getAttribute('height')) for r in barras)
+textos = [t for t in documento.getElementsByTagName('text') if t.firstChild and t.firstChild.data == '-10.0']
+if (len(barras) == 9 and min(alturas) >= 0 and len(textos) == 2
+        and max(float(t.getAttribute('y')) for t in textos) > fondo_barra - 1):
+    print("  OK - Barras hacia abajo con altura positiva y su valor visible")
+else:
+    print(f"  ERROR: Alturas {sorted(alturas)[:3]}")
+    exit(1)
+
+print("\n" + "="*70)
+print("TODOS LOS TESTS COMPLETADOS EXITOSAMENTE")
+print("="*70)
@@ -0,0 +1,101 @@
+"""
+Script de prueba para el dashboard en vivo (buffers circulares y blitting)
+"""
+
+import os
+import sys
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+print("="*70)
+print("TEST DE DASHBOARD EN VIVO")
+print("="*70)
+
+# Test 1: Importar módulo
+print("\n[Test 1] Importando dashboard_vivo...")
+try:
+    from dashboard_vivo import BufferCircular, DashboardVivo, monitorear_en_vivo
+    from instrumentacion import Instrumentacion
+    from planta_config import cargar_plantas
+    from traductor_de_plantas import LecturaSensores, TraductorPlantaInteligente
+    print("  OK - Módulo importado correctamente")
+except Exception as e:
+    print(f"  ERROR: {e}")
+    exit(1)
+
+# Test 2: Buffer circular
+print("\n[Test 2] Buffer circular...")
+buffer = BufferCircular(4)
+for valor in range(10):
+    buffer.agregar(valor)
+if buffer.valores().tolist() == [6, 7, 8, 9] and buffer.ultimo() == 9 and len(buffer) == 4:
+    print("  OK - Conserva las 4 lecturas más recientes en orden")
+else:
+    print(f"  ERROR: {buffer.valores().tolist()}")
+    exit(1)
+
+# Test 3: Solo se redibujan las plantas con lecturas nuevas
+print("\n[Test 3] Redibujado parcial...")
+plantas = cargar_plantas()[:4]
+dashboard = DashboardVivo(plantas, capacidad=50, fps_max=1000)
+dashboard.actualizar()  # Dibujo completo inicial
+lectura = LecturaSensores(500, 600, 22.5, humedad_pct=48.0, luz_pct=61.0)
+dashboard.agregar(lectura, plantas[2].nombre)
+pendientes = set(dashboard._pendientes)
+dibujado = dashboard.actualizar(forzar=True)
+linea = dashboard._artistas[2]['humedad']
+if pendientes == {2} and dibujado and linea.get_ydata().tolist() == [48.0] and not dashboard.actualizar():
+    print("  OK - Se redibujó solo la planta que recibió la lectura")
+else:
+    print(f"  ERROR: pendientes={pendientes}, dibujado={dibujado}")
+    exit(1)
+
+# Test 4: Límite de redibujados por segundo
+print("\n[Test 4] Límite de fps...")
+dashboard.fps_max = 0.001
+dashboard.agregar(lectura, plantas[0].nombre)
+if not dashboard.actualizar() and dashboard.actualizar(forzar=True):
+    print("  OK - Las lecturas se acumulan hasta el siguiente redibujado")
+else:
+    print("  ERROR: No se respetó fps_max")
+    exit(1)
+
+# Test 5: Planta desconocida
+print("\n[Test 5] Planta desconocida...")
+try:
+    dashboard.agregar(lectura, "No Existe")
+    print("  ERROR: Debía lanzar ValueError")
+    exit(1)
+except ValueError:
+    print("  OK - ValueError")
+
+# Test 6: Sin plantas pendientes no cuenta como redibujado
+print("\n[Test 6] Redibujados...")
+redibujados = dashboard.redibujados
+dashboard._pintar([])
+if dashboard.redibujados == redibujados:
+    print("  OK - Pintar una lista vacía no cuenta")
+else:
+    print("  ERROR: Se contó un redibujado sin gráficos")
+    exit(1)
+dashboard.cerrar()
+
+# Test 7: El monitoreo recorta el historial de los traductores
+print("\n[Test 7] Historial acotado en monitorear_en_vivo...")
+traductores = [TraductorPlantaInteligente(p.nombre, config=p, semilla=i, instrumentacion=Instrumentacion())
+               for i, p in enumerate(plantas[:2])]
+vivo = monitorear_en_vivo(traductores, lecturas_por_segundo=1e6, duracion_s=0.5,
+                          capacidad=20, max_historial=25)
+vivo.cerrar()
+largos = [len(t.historial) for t in traductores]
+procesadas = [t.instrumentacion.histogramas['historial'].total for t in traductores]
+if all(n >= 50 for n in procesadas) and all(25 <= n < 50 for n in largos) and vivo.redibujados > 0:
+    print(f"  OK - {procesadas} lecturas procesadas, historial recortado a {largos}")
+else:
+    print(f"  ERROR: {procesadas} lecturas procesadas, historial de {largos}")
+    exit(1)
+
+print("\n" + "="*70)
+print("TODOS LOS TESTS COMPLETADOS EXITOSAMENTE")
+print("="*70)
@@ -0,0 +1,68 @@
+"""
+Script de prueba para la clasificación vectorizada de estados de salud
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+print("="*70)
+print("TEST DE ESTADOS DE SALUD")
+print("="*70)
+
+# Test 1: Importar módulo
+print("\n[Test 1] Importando estados_planta...")
+try:
+    import numpy as np
+    from estados_planta import (calcular_distribucion_estados,
+                                calcular_distribucion_estados_flota, clasificar_estados,
+                                desviacion_rango, orden_por_estado)
+    print("  OK - Módulo importado correctamente")
+except Exception as e:
+    print(f"  ERROR: {e}")
+    exit(1)
+
+# Test 2: Una planta, mismos resultados que la versión con bucles
+print("\n[Test 2] Distribución de una planta...")
+estados = calcular_distribucion_estados(
+    [50, 30, 30, 70], [20, 20, 30, 26], [60, 60, 90, 50],
+    (40, 70), (18, 26), (50, 80)
+)
+if estados == {'Óptimo': 2, 'Aceptable': 1, 'Crítico': 1}:
+    print(f"  OK - {estados} (límites inclusivos)")
+else:
+    print(f"  ERROR: {estados}")
+    exit(1)
+
+# Test 3: Flota con rangos por planta y datos faltantes
+print("\n[Test 3] Distribución de la flota...")
+humedad = np.array([[50.0, 30.0, np.nan], [25.0, 25.0, 25.0]])
+temperatura = np.full((2, 3), 22.0)
+luz = np.full((2, 3), 60.0)
+conteos = calcular_distribucion_estados_flota(
+    humedad, temperatura, luz,
+    (np.array([40, 20]), np.array([70, 30])), (18, 26), (50, 80)
+)
+if conteos.tolist() == [[1, 1, 0], [3, 0, 0]] and clasificar_estados(
+        humedad, temperatura, luz, (40, 70), (18, 26), (50, 80))[0, 2] == -1:
+    print("  OK - Rangos por planta aplicados y días sin dato descartados")
+else:
+    print(f"  ERROR: {conteos.tolist()}")
+    exit(1)
+
+# Test 4: Desviación normalizada y orden de la flota
+print("\n[Test 4] Desviación respecto al rango y orden por estado...")
+humedad = np.array([[30.0, 50.0, 80.0], [50.0, 50.0, 50.0], [10.0, 10.0, np.nan]])
+desviacion = desviacion_rango(humedad, np.array([40, 40, 20]), np.array([60, 60, 30]))
+esperado = [[-0.5, 0.0, 1.0], [0.0, 0.0, 0.0], [-1.0, -1.0]]
+if (np.allclose(desviacion[:2], esperado[:2]) and np.allclose(desviacion[2, :2], esperado[2])
+        and np.isnan(desviacion[2, 2]) and orden_por_estado(desviacion).tolist() == [1, 0, 2]):
+    print("  OK - Desviación en anchos de rango; la planta sana primero")
+else:
+    print(f"  ERROR: {desviacion.tolist()} orden={orden_por_estado(desviacion).tolist()}")
+    exit(1)
+
+print("\n" + "="*70)
+print("TODOS LOS TESTS COMPLETADOS EXITOSAMENTE")
+print("="*70)
@@ -0,0 +1,94 @@
+"""
+Script de prueba para el generador de datasets por bloques y generar_dataset_csv
+"""
+
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+print("="*70)
+print("TEST DEL GENERADOR DE DATASETS")
+print("="*70)
+
+# Test 1: Importar módulos
+print("\n[Test 1] Importando generador_dataset...")
+try:
+    import pandas as pd
+    from generador_dataset import COLUMNAS_DATASET, ampliar_catalogo, generar_dataset
+    from traductor_de_plantas import BASE_DATOS_PLANTAS, generar_dataset_csv
+    print("  OK - Módulos importados correctamente")
+except Exception as e:
+    print(f"  ERROR: {e}")
+    exit(1)
+
+directorio = tempfile.mkdtemp(prefix="test_generador_")
+
+# Test 2: Con devolver_dataframe=False solo se escribe el CSV
+print("\n[Test 2] generar_dataset_csv sin DataFrame...")
+ruta = os.path.join(directorio, "dataset.csv")
+with redirect_stdout(StringIO()):
+    resultado = generar_dataset_csv(ruta, dias_por_planta=5, semilla=3, devolver_dataframe=False)
+escrito = pd.read_csv(ruta)
+if (resultado is None and list(escrito.columns) == COLUMNAS_DATASET
+        and len(escrito) == len(BASE_DATOS_PLANTAS) * 5):
+    print(f"  OK - {len(escrito)} filas en disco, nada retenido en memoria")
+else:
+    print(f"  ERROR: resultado={type(resultado)}, {len(escrito)} filas")
+    exit(1)
+
+# Test 3: Por defecto devuelve el DataFrame, igual que lo que se escribió
+print("\n[Test 3] generar_dataset_csv con DataFrame...")
+with redirect_stdout(StringIO()):
+    df = generar_dataset_csv(ruta, dias_por_planta=5, semilla=3)
+if df is not None and df.equals(escrito) and df["humedad_pct"].between(0, 100).all():
+    print("  OK - DataFrame idéntico al CSV y con la misma semilla")
+else:
+    print("  ERROR: El DataFrame no coincide con el CSV")
+    exit(1)
+
+# Test 4: El tamaño de bloque no cambia el resultado
+print("\n[Test 4] Bloques de distinto tamaño...")
+a = generar_dataset(BASE_DATOS_PLANTAS, os.path.join(directorio, "a.csv.gz"), dias=4,
+                    especies=75, especies_por_bloque=7, semilla=9, devolver_dataframe=True)
+b = generar_dataset(BASE_DATOS_PLANTAS, os.path.join(directorio, "b.csv"), dias=4,
+                    especies=75, especies_por_bloque=1000, semilla=9, devolver_dataframe=True)
+if a["filas"] == 300 and a["dataframe"].equals(b["dataframe"]) and "dataframe" not in generar_dataset(
+        BASE_DATOS_PLANTAS, os.path.join(directorio, "c.csv"), dias=4, semilla=9):
+    print("  OK - Mismas 300 filas con bloques de 7 y de 1000 especies")
+else:
+    print("  ERROR: El resultado depende del tamaño de bloque")
+    exit(1)
+
+# Test 5: Nombres únicos al ampliar el catálogo
+print("\n[Test 5] Ampliar catálogo...")
+nombres = ampliar_catalogo(BASE_DATOS_PLANTAS, len(BASE_DATOS_PLANTAS) * 2 + 1)["nombre"]
+if len(set(nombres)) == len(nombres) and nombres[len(BASE_DATOS_PLANTAS)].endswith(" #2"):
+    print(f"  OK - {len(nombres)} especies con nombre único")
+else:
+    print("  ERROR: Nombres repetidos")
+    exit(1)
+try:
+    ampliar_catalogo([], 10)
+    print("  ERROR: Debía lanzar ValueError")
+    exit(1)
+except ValueError:
+    print("  OK - ValueError al pedir especies de un catálogo vacío")
+
+# Test 6: Un catálogo vacío escribe un CSV vacío, como antes
+print("\n[Test 6] Dataset de un catálogo vacío...")
+ruta_vacia = os.path.join(directorio, "vacio.csv")
+vacio = generar_dataset([], ruta_vacia, dias=4, devolver_dataframe=True)
+if (vacio["filas"] == 0 and vacio["dataframe"].empty
+        and list(pd.read_csv(ruta_vacia).columns) == COLUMNAS_DATASET):
+    print("  OK - CSV con solo la cabecera y DataFrame vacío")
+else:
+    print(f"  ERROR: {vacio}")
+    exit(1)
+
+print("\n" + "="*70)
+print("TODOS LOS TESTS COMPLETADOS EXITOSAMENTE")
+print("="*70)
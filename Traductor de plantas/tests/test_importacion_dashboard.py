@@ -0,0 +1,48 @@
+"""
+Script de prueba para la importación perezosa de matplotlib en dashboard_plantas
+"""
+
+import os
+import subprocess
+import sys
+
+RUTA_SRC = os.path.join(os.path.dirname(__file__), '..', 'src')
+
+print("="*70)
+print("TEST DE IMPORTACIÓN DEL DASHBOARD")
+print("="*70)
+
+
+def modulos_cargados(codigo: str) -> str:
+    """Ejecuta `codigo` en un proceso limpio con src en sys.path y devuelve su salida."""
+    salida = subprocess.run([sys.executable, "-c", "import sys; sys.path.insert(0, sys.argv[1]); " + codigo,
+                             RUTA_SRC], capture_output=True, text=True)
+    if salida.returncode != 0:
+        print(f"  ERROR: {salida.stderr.strip()[-300:]}")
+        exit(1)
+    return salida.stdout.strip()
+
+
+# Test 1: Importar dashboard_plantas no carga matplotlib
+print("\n[Test 1] Importando dashboard_plantas sin matplotlib...")
+if modulos_cargados("from dashboard_plantas import calcular_distribucion_estados; "
+                    "print('matplotlib' in sys.modules)") == "False":
+    print("  OK - matplotlib se carga solo al dibujar")
+else:
+    print("  ERROR: Importar dashboard_plantas cargó matplotlib")
+    exit(1)
+
+# Test 2: obtener_pyplot lo carga (con Agg si no hay pantalla) una sola vez
+print("\n[Test 2] obtener_pyplot...")
+if modulos_cargados("import os; os.environ.pop('DISPLAY', None); os.environ.pop('WAYLAND_DISPLAY', None); "
+                    "os.environ.pop('MPLBACKEND', None); "
+                    "from dashboard_plantas import obtener_pyplot; plt = obtener_pyplot(); "
+                    "print(plt is obtener_pyplot(), plt.get_backend().lower())") == "True agg":
+    print("  OK - pyplot con Agg, reutilizado en cada llamada")
+else:
+    print("  ERROR: Backend o módulo inesperados")
+    exit(1)
+
+print("\n" + "="*70)
+print("TODOS LOS TESTS COMPLETADOS EXITOSAMENTE")
+print("="*70)
@@ -0,0 +1,153 @@
+"""
+Script de prueba para la ingesta de libros Excel al formato canónico
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Los .npz canónicos van a una carpeta temporal, no a la cache del usuario
+os.environ["TRADUCTOR_PLANTAS_CACHE"] = tempfile.mkdtemp(prefix="test_ingesta_cache_")
+
+print("="*70)
+print("TEST DE INGESTA DE EXCEL")
+print("="*70)
+
+# Test 1: Importar módulos
+print("\n[Test 1] Importando ingesta_excel...")
+try:
+    import openpyxl
+    import ingesta_excel
+    from conversion_datasets import VARIABLE_CACHE
+    print("  OK - Módulos importados correctamente")
+except ImportError as e:
+    print(f"  OMITIDO - {e}")
+    exit(0)
+except Exception as e:
+    print(f"  ERROR: {e}")
+    exit(1)
+
+directorio = tempfile.mkdtemp(prefix="test_ingesta_")
+parsear_original = ingesta_excel.parsear_excel
+
+
+def crear_libro(ruta: str, filas) -> None:
+    """Guarda las filas (cabecera incluida) en la primera hoja de un libro."""
+    libro = openpyxl.Workbook()
+    for fila in filas:
+        libro.active.append(fila)
+    libro.save(ruta)
+
+
+def sin_parsear(ruta):
+    raise AssertionError(f"Se volvió a leer el libro '{ruta}'")
+
+
+# Test 2: Libro ancho (una fila por planta)
+print("\n[Test 2] Libro ancho...")
+ruta_ancho = os.path.join(directorio, "ancho.xlsx")
+crear_libro(ruta_ancho, [["Planta", "Dia 1", "Día 2", "Día_3"],
+                         ["Acacia", 40.5, 42.0, 41.0], ["Cactus", 25.0, 24.5, 26.0]])
+ancho = ingesta_excel.ingerir_excel(ruta_ancho)
+if (ancho.nombres == ["Acacia", "Cactus"] and ancho.serie("Cactus").tolist() == [25.0, 24.5, 26.0]
+        and ancho.columnas["dia"].tolist() == [1, 2, 3, 1, 2, 3]):
+    print("  OK - 2 plantas × 3 días con las tres formas de cabecera")
+else:
+    print(f"  ERROR: {ancho.nombres} {ancho.columnas}")
+    exit(1)
+
+# Test 3: Libro largo (una fila por planta y día)
+print("\n[Test 3] Libro largo...")
+ruta_largo = os.path.join(directorio, "largo.xlsx")
+crear_libro(ruta_largo, [["Planta", "Dia", "Humedad_pct"],
+                         ["Fern", 1, 70.5], ["Acacia", 1, 50.0], ["Fern", 2, 71.0]])
+largo = ingesta_excel.ingerir_excel(ruta_largo)
+if (largo.nombres == ["Fern", "Acacia"] and largo.serie("Fern").tolist() == [70.5, 71.0]
+        and largo.columnas["dia"].dtype.kind == "i"):
+    print("  OK - Filas agrupadas por planta y 'dia' como entero")
+else:
+    print(f"  ERROR: {largo.nombres} {largo.columnas}")
+    exit(1)
+
+# Test 4: Un renombrado reutiliza la conversión (clave = hash del contenido)
+print("\n[Test 4] Libro renombrado...")
+renombrado = os.path.join(directorio, "renombrado.xlsx")
+os.rename(ruta_ancho, renombrado)
+ingesta_excel.parsear_excel = sin_parsear
+try:
+    reutilizado = ingesta_excel.ingerir_excel(renombrado)
+finally:
+    ingesta_excel.parsear_excel = parsear_original
+if reutilizado.nombres == ancho.nombres and reutilizado.serie("Acacia").tolist() == [40.5, 42.0, 41.0]:
+    print("  OK - Se cargó el .npz existente sin abrir el libro")
+else:
+    print("  ERROR: La conversión reutilizada no coincide")
+    exit(1)
+
+# Test 5: Un libro con otro contenido se vuelve a convertir
+print("\n[Test 5] Libro modificado...")
+estado = os.stat(renombrado)
+crear_libro(renombrado, [["Planta", "Dia 1", "Dia 2"], ["Ficus", 55.0, 56.0]])
+os.utime(renombrado, ns=(estado.st_atime_ns, estado.st_mtime_ns + 1_000_000_000))
+modificado = ingesta_excel.ingerir_excel(renombrado)
+if modificado.nombres == ["Ficus"] and modificado.serie("Ficus").tolist() == [55.0, 56.0]:
+    print("  OK - Nuevo hash, nueva conversión")
+else:
+    print(f"  ERROR: Se usó la conversión anterior ({modificado.nombres})")
+    exit(1)
+
+# Test 6: El manifiesto conserva lo que otro proceso escribió mientras tanto
+print("\n[Test 6] Manifiesto compartido...")
+ruta_manifiesto = os.path.join(os.environ[VARIABLE_CACHE], ingesta_excel.ARCHIVO_MANIFIESTO)
+hash_original = ingesta_excel.hash_archivo
+
+
+def hash_con_competencia(ruta):
+    """Otro proceso añade su libro al manifiesto mientras este calcula el hash."""
+    with open(ruta_manifiesto, encoding="utf-8") as f:
+        manifiesto = json.load(f)
+    manifiesto["/otro/proceso.xlsx"] = {"sha256": "0" * 64, "mtime_ns": 1, "tamano": 1}
+    with open(ruta_manifiesto, "w", encoding="utf-8") as f:
+        json.dump(manifiesto, f)
+    return hash_original(ruta)
+
+
+ruta_nuevo = os.path.join(directorio, "nuevo.xlsx")
+shutil.copyfile(ruta_largo, ruta_nuevo)
+ingesta_excel.hash_archivo = hash_con_competencia
+try:
+    ingesta_excel.ingerir_excel(ruta_nuevo)
+finally:
+    ingesta_excel.hash_archivo = hash_original
+with open(ruta_manifiesto, encoding="utf-8") as f:
+    entradas = json.load(f)
+if {"/otro/proceso.xlsx", os.path.abspath(ruta_nuevo), os.path.abspath(ruta_largo)} <= set(entradas):
+    print(f"  OK - {len(entradas)} entradas, ninguna perdida")
+else:
+    print(f"  ERROR: Entradas {sorted(entradas)}")
+    exit(1)
+
+# Test 7: Una cache que no se puede escribir no impide cargar el libro
+print("\n[Test 7] Cache no escribible...")
+bloqueo = os.path.join(directorio, "no_es_carpeta")
+open(bloqueo, "w").close()
+os.environ[VARIABLE_CACHE] = os.path.join(bloqueo, "cache")
+try:
+    with redirect_stdout(StringIO()) as salida:
+        sin_cache = ingesta_excel.ingerir_excel(ruta_largo)
+finally:
+    os.environ[VARIABLE_CACHE] = os.path.dirname(ruta_manifiesto)
+if sin_cache.nombres == ["Fern", "Acacia"] and "⚠️" in salida.getvalue():
+    print("  OK - Aviso y libro parseado igualmente")
+else:
+    print(f"  ERROR: {sin_cache.nombres}, salida: {salida.getvalue()!r}")
+    exit(1)
+
+print("\n" + "="*70)
+print("TODOS LOS TESTS COMPLETADOS EXITOSAMENTE")
+print("="*70)
@@ -0,0 +1,78 @@
+"""
+Script de prueba para la instrumentación de procesar_lectura
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+print("="*70)
+print("TEST DE INSTRUMENTACIÓN")
+print("="*70)
+
+# Test 1: Importar módulos
+print("\n[Test 1] Importando instrumentacion...")
+try:
+    from instrumentacion import ETAPAS, Histograma, Instrumentacion
+    from traductor_de_plantas import TraductorPlantaInteligente
+    print("  OK - Módulos importados correctamente")
+except Exception as e:
+    print(f"  ERROR: {e}")
+    exit(1)
+
+# Test 2: Percentiles del histograma (1..1000 µs)
+print("\n[Test 2] Percentiles del histograma...")
+h = Histograma()
+for us in range(1, 1001):
+    h.registrar(us * 1000)
+p50, p99 = h.percentil(50) / 1000, h.percentil(99) / 1000
+if h.total == 1000 and abs(p50 - 500) < 500 * 0.2 and abs(p99 - 990) < 990 * 0.2 \
+        and h.percentil(100) == h.maximo_ns and h.media_ns() == 500_500:
+    print(f"  OK - p50={p50:.0f}µs, p99={p99:.0f}µs (dentro del ancho de cubeta)")
+else:
+    print(f"  ERROR: p50={p50}, p99={p99}")
+    exit(1)
+try:
+    h.percentil(101)
+    print("  ERROR: Debía lanzar ValueError")
+    exit(1)
+except ValueError:
+    print("  OK - ValueError con percentil fuera de rango")
+
+# Test 3: Todas las etapas se registran en cada lectura
+print("\n[Test 3] Etapas de procesar_lectura...")
+instrumentacion = Instrumentacion()
+traductor = TraductorPlantaInteligente("Ficus", semilla=1, instrumentacion=instrumentacion)
+for _ in range(200):
+    traductor.procesar_lectura()
+resumen = instrumentacion.resumen()
+if list(resumen) == list(ETAPAS) and all(e['n'] == 200 for e in resumen.values()):
+    print(f"  OK - {len(ETAPAS)} etapas con 200 mediciones cada una")
+    instrumentacion.imprimir_resumen()
+else:
+    print(f"  ERROR: {resumen}")
+    exit(1)
+
+# Test 4: Instrumentar no cambia los resultados
+print("\n[Test 4] Mismos mensajes con y sin instrumentación...")
+a = TraductorPlantaInteligente("Ficus", semilla=7)
+b = TraductorPlantaInteligente("Ficus", semilla=7, instrumentacion=Instrumentacion())
+if all(a.procesar_lectura()[1] == b.procesar_lectura()[1] for _ in range(100)):
+    print("  OK - 100 mensajes idénticos")
+else:
+    print("  ERROR: Los mensajes difieren")
+    exit(1)
+
+# Test 5: Reiniciar
+print("\n[Test 5] Reiniciar...")
+instrumentacion.reiniciar()
+if instrumentacion.resumen() == {}:
+    print("  OK - Sin mediciones tras reiniciar")
+else:
+    print("  ERROR: Quedaron mediciones")
+    exit(1)
+
+print("\n" + "="*70)
+print("TODOS LOS TESTS COMPLETADOS EXITOSAMENTE")
+print("="*70)
@@ -0,0 +1,86 @@
+"""
+Script de prueba para el mapa de calor de la flota y la matriz plantas × días
+"""
+
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Los .npz canónicos van a una carpeta temporal, no a la cache del usuario
+os.environ["TRADUCTOR_PLANTAS_CACHE"] = tempfile.mkdtemp(prefix="test_mapa_flota_cache_")
+
+print("="*70)
+print("TEST DEL MAPA DE LA FLOTA")
+print("="*70)
+
+# Test 1: Importar módulos
+print("\n[Test 1] Importando dashboard_plantas...")
+try:
+    import numpy as np
+    import pandas as pd
+    from cargador_datasets import cargar_dataset_largo
+    from dashboard_plantas import generar_mapa_flota
+    from estados_planta import contar_siempre_en_rango, desviacion_rango, orden_por_estado
+    print("  OK - Módulos importados correctamente")
+except Exception as e:
+    print(f"  ERROR: {e}")
+    exit(1)
+
+directorio = tempfile.mkdtemp(prefix="test_mapa_flota_")
+
+# Test 2: Matriz plantas × lecturas con plantas incompletas
+print("\n[Test 2] DatasetPorPlanta.matriz...")
+ruta = os.path.join(directorio, "largo.csv")
+pd.DataFrame({
+    "planta": ["Fern", "Acacia", "Fern", "Acacia", "Acacia"],
+    "dia": [1, 1, 2, 2, 3],
+    "humedad_pct": [70.0, 50.0, 72.0, 55.0, 60.0],
+}).to_csv(ruta, index=False)
+matriz = cargar_dataset_largo(ruta).matriz()
+if (matriz.shape == (2, 3) and matriz[0, :2].tolist() == [70.0, 72.0]
+        and np.isnan(matriz[0, 2]) and matriz[1].tolist() == [50.0, 55.0, 60.0]):
+    print("  OK - Filas en orden de aparición, la planta corta rellenada con NaN")
+else:
+    print(f"  ERROR: {matriz.tolist()}")
+    exit(1)
+
+# Test 3: Orden por estado, sin importar el signo de la desviación
+print("\n[Test 3] Orden con empates y días sin dato...")
+desviacion = desviacion_rango(
+    np.array([[39.0, 50.0], [80.0, 50.0], [44.0, 50.0], [50.0, np.nan], [50.0, 50.0]]),
+    40, 60)
+# 0: un poco seca, 1: muy húmeda, 2: sana, 3: sana pero sin un día, 4: sana
+if orden_por_estado(desviacion).tolist() == [2, 4, 3, 0, 1]:
+    print("  OK - La poco seca antes que la muy húmeda; días sin dato después de los completos")
+else:
+    print(f"  ERROR: {orden_por_estado(desviacion).tolist()}")
+    exit(1)
+if contar_siempre_en_rango(desviacion) == 2:
+    print("  OK - La planta con un día sin dato no cuenta como siempre en rango")
+else:
+    print(f"  ERROR: {contar_siempre_en_rango(desviacion)} plantas siempre en rango")
+    exit(1)
+
+# Test 4: Guardar el mapa de una flota con NaN
+print("\n[Test 4] Generando el mapa...")
+humedad = np.vstack([matriz, [[45.0, 46.0, 47.0]]])
+destino = os.path.join(directorio, "mapa.png")
+generar_mapa_flota(humedad, np.array([60, 40, 40]), np.array([80, 70, 70]),
+                   nombres=["Fern", "Acacia", "Ficus"], guardar=True, nombre_archivo=destino, dpi=40)
+if os.path.getsize(destino) > 0:
+    print("  OK - Imagen guardada")
+else:
+    print("  ERROR: Imagen vacía")
+    exit(1)
+try:
+    generar_mapa_flota(np.array([50.0, 60.0]), 40, 70, guardar=True, nombre_archivo=destino)
+    print("  ERROR: Debía lanzar ValueError")
+    exit(1)
+except ValueError:
+    print("  OK - ValueError con una serie 1-D")
+
+print("\n" + "="*70)
+print("TODOS LOS TESTS COMPLETADOS EXITOSAMENTE")
+print("="*70)
@@ -0,0 +1,219 @@
+"""
+Script de prueba para la persistencia del historial de lecturas
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+print("="*70)
+print("TEST DE PERSISTENCIA DEL HISTORIAL")
+print("="*70)
+
+# Test 1: Importar módulos
+print("\n[Test 1] Importando almacen_columnar y traductor...")
+try:
+    import numpy as np
+    from almacen_columnar import AlmacenHistorial
+    from exportador_csv import ExportadorCSV
+    from registro_binario import (EscritorRegistro, iterar_bloques, leer_registro, resumen_registro,
+                                  resumen_registro_archivo, TIPO_REGISTRO)
+    from traductor_de_plantas import TraductorPlantaInteligente
+    print("  OK - Módulos importados correctamente")
+except Exception as e:
+    print(f"  ERROR: {e}")
+    exit(1)
+
+directorio = tempfile.mkdtemp(prefix="test_persistencia_")
+
+# Test 2: Escritura por lotes desde el traductor
+print("\n[Test 2] Guardando lecturas del traductor por lotes...")
+ruta_almacen = os.path.join(directorio, "almacen")
+almacen = AlmacenHistorial(ruta_almacen, tam_lote=64)
+traductor = TraductorPlantaInteligente("Monstera", semilla=5, almacen=almacen)
+for _ in range(300):
+    traductor.procesar_lectura()
+if almacen.filas == 256 and len(almacen) == 300:
+    print("  OK - 256 filas en disco y 44 pendientes en el lote")
+else:
+    print(f"  ERROR: filas={almacen.filas}, total={len(almacen)}")
+    exit(1)
+almacen.cerrar()
+
+# Test 3: Reapertura con np.memmap
+print("\n[Test 3] Reabriendo el almacén...")
+columnas = AlmacenHistorial(ruta_almacen).columnas()
+esperado = np.array([l.humedad_pct for l in traductor.historial], dtype=np.float32)
+if isinstance(columnas["humedad_pct"], np.memmap) and np.array_equal(columnas["humedad_pct"], esperado):
+    print(f"  OK - {len(esperado)} lecturas recuperadas sin copia")
+else:
+    print("  ERROR: Las lecturas recuperadas no coinciden")
+    exit(1)
+
+# Test 4: Bytes sin confirmar se descartan al reabrir
+print("\n[Test 4] Recuperación tras escritura interrumpida...")
+with open(os.path.join(ruta_almacen, "timestamp.f8"), "ab") as f:
+    f.write(b"\x00" * 24)
+reabierto = AlmacenHistorial(ruta_almacen)
+if reabierto.filas == 300 and len(reabierto.columna("timestamp")) == 300:
+    print("  OK - Columnas recortadas al último estado confirmado")
+else:
+    print("  ERROR: El almacén quedó inconsistente")
+    exit(1)
+
+# Test 5: Registro binario de ancho fijo
+print("\n[Test 5] Registro binario de lecturas...")
+ruta_registro = os.path.join(directorio, "lecturas.reg")
+with EscritorRegistro(ruta_registro, tam_lote=100) as escritor:
+    for lectura in traductor.historial:
+        escritor.escribir(lectura)
+registros = leer_registro(ruta_registro)
+resumen = resumen_registro(registros)
+esperado = max(l.humedad_pct for l in traductor.historial)
+if (TIPO_REGISTRO.itemsize == 16 and len(registros) == 300
+        and abs(resumen["humedad"]["maximo"] - esperado) < 0.01):
+    print(f"  OK - {len(registros)} registros de 16 bytes, "
+          f"humedad máx {resumen['humedad']['maximo']:.2f}%")
+else:
+    print("  ERROR: El registro binario no coincide con el historial")
+    exit(1)
+
+# Test 6: Registro binario comprimido, anexado en dos sesiones
+print("\n[Test 6] Registro binario comprimido...")
+for extension in (".gz", ".xz", ".bz2"):
+    ruta_comprimida = os.path.join(directorio, f"lecturas.reg{extension}")
+    with EscritorRegistro(ruta_comprimida, tam_lote=64) as escritor:
+        for lectura in traductor.historial[:120]:
+            escritor.escribir(lectura)
+    with EscritorRegistro(ruta_comprimida, tam_lote=64) as escritor:
+        escritor.escribir_lote(registros[120:])
+    # Un tamaño de bloque que no divide el total deja un último bloque corto
+    bloques = list(iterar_bloques(ruta_comprimida, tam_bloque=7))
+    leidos = np.concatenate(bloques)
+    if not (np.array_equal(leidos, registros) and max(len(b) for b in bloques) == 7
+            and np.array_equal(leer_registro(ruta_comprimida), registros)):
+        print(f"  ERROR: El registro {extension} no coincide con el original")
+        exit(1)
+    por_bloques = resumen_registro_archivo(ruta_comprimida, tam_bloque=7)
+    if por_bloques["total"] != 300 or not all(
+            np.isclose(por_bloques[v][e], resumen[v][e])
+            for v in ("humedad", "temperatura", "luz") for e in ("promedio", "minimo", "maximo")):
+        print(f"  ERROR: El resumen del registro {extension} no coincide")
+        exit(1)
+    if os.path.getsize(ruta_comprimida) >= os.path.getsize(ruta_registro):
+        print(f"  ERROR: El registro {extension} no ocupa menos que el original")
+        exit(1)
+print("  OK - .gz, .xz y .bz2: 300 registros anexados en dos sesiones, leídos por bloques "
+      "y con el mismo resumen")
+
+# Test 7: Exportación CSV por lotes en segundo plano
+print("\n[Test 7] Exportador CSV con buffer...")
+ruta_csv = os.path.join(directorio, "lecturas.csv")
+exportador = ExportadorCSV(ruta_csv, tam_lote=1000, intervalo_s=60)
+for lectura in traductor.historial:
+    exportador.agregar(lectura, traductor.nombre)
+sin_volcar = exportador.filas_escritas == 0 and exportador.pendientes == 300
+exportador.cerrar()
+with open(ruta_csv, encoding="utf-8") as f:
+    lineas = f.read().splitlines()
+if sin_volcar and len(lineas) == 301 and exportador.escrituras == 1:
+    print("  OK - 300 lecturas escritas con una sola escritura al cerrar")
+else:
+    print(f"  ERROR: {len(lineas) - 1} filas en {exportador.escrituras} escrituras")
+    exit(1)
+
+# Test 8: Una escritura fallida no pierde filas ni detiene el hilo
+print("\n[Test 8] Exportador CSV con una escritura fallida...")
+
+
+class ArchivoQueFalla:
+    """Archivo que falla en la primera escritura y delega el resto."""
+
+    def __init__(self, archivo):
+        self.archivo = archivo
+        self.fallos = 1
+
+    def write(self, texto):
+        if self.fallos:
+            self.fallos -= 1
+            raise OSError("disco lleno (simulado)")
+        return self.archivo.write(texto)
+
+    def __getattr__(self, nombre):
+        return getattr(self.archivo, nombre)
+
+
+ruta_csv = os.path.join(directorio, "lecturas_fallo.csv")
+exportador = ExportadorCSV(ruta_csv, tam_lote=100, intervalo_s=0.05)
+exportador._archivo = ArchivoQueFalla(exportador._archivo)
+lecturas = traductor.historial[:250]
+for lectura in lecturas[:100]:
+    exportador.agregar(lectura, traductor.nombre)
+time.sleep(0.3)  # El hilo intenta volcar, falla y reintenta
+for lectura in lecturas[100:]:
+    exportador.agregar(lectura, traductor.nombre)
+hilo_vivo = exportador._hilo.is_alive()
+exportador.cerrar()
+with open(ruta_csv, encoding="utf-8") as f:
+    lineas = f.read().splitlines()[1:]
+esperadas = [f"{l.timestamp:.3f}" for l in lecturas]
+if hilo_vivo and [linea.split(",")[0] for linea in lineas] == esperadas:
+    print("  OK - 250 filas escritas en orden tras el fallo; el hilo siguió vivo")
+else:
+    print(f"  ERROR: {len(lineas)} filas, hilo vivo: {hilo_vivo}")
+    exit(1)
+
+# Test 9: Ninguna fila aceptada se pierde al cerrar con hilos agregando
+print("\n[Test 9] Cerrar el exportador mientras otros hilos agregan...")
+ruta_csv = os.path.join(directorio, "lecturas_concurrentes.csv")
+exportador = ExportadorCSV(ruta_csv, tam_lote=50, intervalo_s=0.01)
+aceptadas = [0] * 4
+
+
+def agregar_sin_parar(indice):
+    """Agrega lecturas hasta que el exportador se cierra."""
+    while True:
+        try:
+            exportador.agregar(traductor.historial[0], traductor.nombre)
+        except ValueError:
+            return
+        aceptadas[indice] += 1
+
+
+hilos = [threading.Thread(target=agregar_sin_parar, args=(i,)) for i in range(4)]
+for hilo in hilos:
+    hilo.start()
+time.sleep(0.1)
+exportador.cerrar()
+for hilo in hilos:
+    hilo.join()
+with open(ruta_csv, encoding="utf-8") as f:
+    escritas = len(f.read().splitlines()) - 1
+if sum(aceptadas) > 0 and escritas == sum(aceptadas) == exportador.filas_escritas:
+    print(f"  OK - {escritas} filas aceptadas y escritas; las siguientes reciben ValueError")
+else:
+    print(f"  ERROR: {sum(aceptadas)} aceptadas, {escritas} escritas")
+    exit(1)
+
+# Test 10: Filas pendientes con el archivo ya cerrado no se descartan
+print("\n[Test 10] Volcado con el archivo cerrado...")
+exportador._buffer.append("fila perdida\n")
+try:
+    exportador.flush()
+    print("  ERROR: Debía lanzar ValueError")
+    exit(1)
+except ValueError:
+    pass
+if exportador.pendientes == 1:
+    print("  OK - ValueError y la fila sigue en el buffer")
+else:
+    print("  ERROR: La fila se descartó")
+    exit(1)
+
+print("\n" + "="*70)
+print("TODOS LOS TESTS COMPLETADOS EXITOSAMENTE")
+print("="*70)
@@ -0,0 +1,123 @@
+"""
+Script de prueba para la generación por bloques y los escritores del dataset
+"""
+
+import csv
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+print("="*70)
+print("TEST DE ESCRITORES DEL DATASET")
+print("="*70)
+
+# Test 1: Importar módulos
+print("\n[Test 1] Importando plantas...")
+try:
+    import numpy as np
+    from plantas import (EscritorCSV, EscritorTXT, VistaPrevia, exportar_dataset,
+                         generar_lecturas_humedad, generar_matriz_humedad, ruta_dataset)
+    print("  OK - Módulos importados correctamente")
+except Exception as e:
+    print(f"  ERROR: {e}")
+    exit(1)
+
+directorio = tempfile.mkdtemp(prefix="test_plantas_")
+nombres = ["Acacia", "Cactus", "Fern", "Monstera", "Ficus"]
+
+# Test 2: Los escritores reciben los mismos datos que generar_matriz_humedad
+print("\n[Test 2] Exportar en bloques de 2 plantas...")
+ruta_txt = os.path.join(directorio, "humedad.txt")
+ruta_csv = os.path.join(directorio, "humedad.csv")
+with redirect_stdout(StringIO()) as salida:
+    total = exportar_dataset(nombres, [EscritorTXT(ruta_txt), EscritorCSV(ruta_csv),
+                                       VistaPrevia(plantas=3, dias=4)],
+                             dias=12, semilla=5, plantas_por_bloque=2)
+matriz = generar_matriz_humedad(nombres, 12, semilla=5, plantas_por_bloque=2)
+with open(ruta_csv, newline='') as f:
+    filas = list(csv.reader(f))
+with open(ruta_txt) as f:
+    numeradas = [linea for linea in f if linea[:4].strip().isdigit()]
+if (total == 60 and filas[0] == ['Planta'] + [f'Día_{i}' for i in range(1, 13)]
+        and [fila[0] for fila in filas[1:]] == nombres
+        and np.allclose([[float(v) for v in fila[1:]] for fila in filas[1:]], matriz)
+        and [int(linea.split('.')[0]) for linea in numeradas] == [1, 2, 3, 4, 5]):
+    print("  OK - CSV idéntico a generar_matriz_humedad y TXT numerado del 1 al 5")
+else:
+    print(f"  ERROR: {total} lecturas, {len(filas)} filas CSV, {len(numeradas)} líneas TXT")
+    exit(1)
+if salida.getvalue().count("Primeros 4 días") == 3:
+    print("  OK - Vista previa de 3 plantas repartidas en 2 bloques")
+else:
+    print(f"  ERROR: Vista previa inesperada:\n{salida.getvalue()}")
+    exit(1)
+
+# Test 3: Un escritor que falla no deja archivos abiertos
+print("\n[Test 3] Fallo en mitad de la exportación...")
+
+
+class EscritorQueFalla:
+    """Falla al recibir el segundo bloque."""
+
+    def __init__(self):
+        self.bloques = 0
+
+    def iniciar(self, total_plantas, dias):
+        pass
+
+    def escribir_bloque(self, inicio, nombres, matriz):
+        self.bloques += 1
+        if self.bloques == 2:
+            raise RuntimeError("disco lleno")
+
+    def finalizar(self):
+        pass
+
+
+txt, csv_ = EscritorTXT(os.path.join(directorio, "a.txt")), EscritorCSV(os.path.join(directorio, "a.csv"))
+try:
+    exportar_dataset(nombres, [txt, csv_, EscritorQueFalla()], dias=5, semilla=1, plantas_por_bloque=2)
+    print("  ERROR: Debía propagar el error")
+    exit(1)
+except RuntimeError:
+    pass
+if txt._archivo is None and csv_._archivo is None:
+    print("  OK - El error se propaga y los dos archivos quedan cerrados")
+else:
+    print("  ERROR: Quedaron archivos abiertos")
+    exit(1)
+
+# Test 4: generar_lecturas_humedad respeta los días pedidos
+print("\n[Test 4] Lecturas de una planta...")
+lecturas = generar_lecturas_humedad("Acacia", dias=7, semilla=5)
+if len(lecturas) == 7 and np.allclose(lecturas, generar_matriz_humedad(["Acacia"], 7, semilla=5)[0]):
+    print("  OK - 7 lecturas")
+else:
+    print(f"  ERROR: {len(lecturas)} lecturas")
+    exit(1)
+
+# Test 5: Menos días que la vista previa y nombres por defecto según los días
+print("\n[Test 5] Exportar 5 días con los escritores por defecto...")
+anterior = os.getcwd()
+os.chdir(directorio)
+try:
+    txt, csv_ = EscritorTXT(), EscritorCSV()
+    with redirect_stdout(StringIO()) as salida:
+        exportar_dataset(nombres[:2], [txt, csv_, VistaPrevia()], dias=5, semilla=1)
+finally:
+    os.chdir(anterior)
+if (txt.ruta == ruta_dataset(5, 'txt') == 'plantas_humedad_5dias.txt'
+        and os.path.exists(os.path.join(directorio, csv_.ruta))
+        and salida.getvalue().count("Los 5 días") == 2 and "-5 días" not in salida.getvalue()):
+    print(f"  OK - {txt.ruta} y {csv_.ruta}; la vista previa muestra los 5 días")
+else:
+    print(f"  ERROR: rutas {txt.ruta}, {csv_.ruta}; salida:\n{salida.getvalue()}")
+    exit(1)
+
+print("\n" + "="*70)
+print("TODOS LOS TESTS COMPLETADOS EXITOSAMENTE")
+print("="*70)
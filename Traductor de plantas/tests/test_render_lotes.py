@@ -0,0 +1,113 @@
+"""
+Script de prueba para el renderizado de dashboards por lotes
+"""
+
+import importlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+print("="*70)
+print("TEST DE RENDERIZADO POR LOTES")
+print("="*70)
+
+# Test 1: Importar módulo
+print("\n[Test 1] Importando render_lotes...")
+try:
+    from render_lotes import (MODULOS_DIBUJO, _fecha_dependencias, renderizar_lote, ruta_dashboard,
+                              seleccionar_plantas)
+    print("  OK - Módulo importado correctamente")
+except Exception as e:
+    print(f"  ERROR: {e}")
+    exit(1)
+
+carpeta = tempfile.mkdtemp(prefix="test_render_lotes_")
+plantas = seleccionar_plantas(limite=3)
+
+
+def resumen(resultados):
+    """(renderizados, omitidos, errores) de un lote."""
+    errores = [r.error for r in resultados if r.error]
+    return (sum(1 for r in resultados if not r.omitido and not r.error),
+            sum(1 for r in resultados if r.omitido), errores)
+
+
+# Test 2: Lote con 2 procesos
+print("\n[Test 2] Lote de 3 plantas con 2 procesos...")
+resultados = renderizar_lote(plantas, carpeta, dias=10, dpi=30, semilla=1, procesos=2)
+renderizados, omitidos, errores = resumen(resultados)
+pngs = sorted(f for f in os.listdir(carpeta) if f.endswith(".png"))
+if renderizados == 3 and not errores and len(pngs) == 3:
+    print(f"  OK - {len(pngs)} imágenes generadas")
+else:
+    print(f"  ERROR: renderizados={renderizados}, errores={errores}, archivos={pngs}")
+    exit(1)
+
+# Test 3: Segunda ejecución con los mismos parámetros
+print("\n[Test 3] Segunda ejecución sin cambios...")
+renderizados, omitidos, errores = resumen(
+    renderizar_lote(plantas, carpeta, dias=10, dpi=30, semilla=1, procesos=2))
+if renderizados == 0 and omitidos == 3:
+    print("  OK - Las 3 imágenes se omiten (al día)")
+else:
+    print(f"  ERROR: renderizados={renderizados}, omitidos={omitidos}")
+    exit(1)
+
+# Test 4: Otros parámetros invalidan las imágenes
+print("\n[Test 4] Cambiar dpi, días o semilla...")
+cambios = [dict(dias=10, dpi=40, semilla=1), dict(dias=12, dpi=40, semilla=1),
+           dict(dias=12, dpi=40, semilla=2)]
+for parametros in cambios:
+    renderizados, omitidos, errores = resumen(
+        renderizar_lote(plantas, carpeta, procesos=1, **parametros))
+    if renderizados != 3 or omitidos != 0:
+        print(f"  ERROR: {parametros}: renderizados={renderizados}, omitidos={omitidos}")
+        exit(1)
+print("  OK - Cada cambio de parámetros vuelve a renderizar las 3 imágenes")
+
+# Test 5: --forzar
+print("\n[Test 5] Forzar...")
+renderizados, omitidos, errores = resumen(
+    renderizar_lote(plantas, carpeta, dias=12, dpi=40, semilla=2, procesos=2, forzar=True))
+if renderizados == 3 and omitidos == 0:
+    print("  OK - Se renderizan aunque estén al día")
+else:
+    print(f"  ERROR: renderizados={renderizados}, omitidos={omitidos}")
+    exit(1)
+
+# Test 6: Cualquier módulo del dibujo cuenta para la fecha de las dependencias
+print("\n[Test 6] Dependencias del dibujo...")
+fecha = _fecha_dependencias()
+atrasados = [m for m in MODULOS_DIBUJO if os.path.getmtime(importlib.import_module(m).__file__) > fecha]
+if not atrasados and "submuestreo" in MODULOS_DIBUJO and "estilo_dashboard" in MODULOS_DIBUJO:
+    print(f"  OK - {len(MODULOS_DIBUJO)} módulos vigilados")
+else:
+    print(f"  ERROR: Módulos no considerados: {atrasados}")
+    exit(1)
+
+# Test 7: Una imagen de otra versión del diseño se vuelve a renderizar
+print("\n[Test 7] Cambio de VERSION_LAYOUT...")
+ruta_parametros = ruta_dashboard(carpeta, plantas[0].nombre) + ".json"
+with open(ruta_parametros, encoding="utf-8") as f:
+    guardados = json.load(f)
+guardados["version_layout"] -= 1
+with open(ruta_parametros, "w", encoding="utf-8") as f:
+    json.dump(guardados, f)
+renderizados, omitidos, errores = resumen(
+    renderizar_lote(plantas, carpeta, dias=12, dpi=40, semilla=2, procesos=1))
+if renderizados == 1 and omitidos == 2:
+    print("  OK - Solo se renderiza la imagen del diseño anterior")
+else:
+    print(f"  ERROR: renderizados={renderizados}, omitidos={omitidos}")
+    exit(1)
+
+shutil.rmtree(carpeta)
+
+print("\n" + "="*70)
+print("TODOS LOS TESTS COMPLETADOS EXITOSAMENTE")
+print("="*70)
@@ -0,0 +1,87 @@
+"""
+Script de prueba para RenderizadorDashboard (figura reutilizada entre plantas)
+"""
+
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+print("="*70)
+print("TEST DEL RENDERIZADOR DE DASHBOARD")
+print("="*70)
+
+# Test 1: Importar módulos
+print("\n[Test 1] Importando dashboard_plantas...")
+try:
+    import numpy as np
+    from dashboard_plantas import RenderizadorDashboard
+    print("  OK - Módulos importados correctamente")
+except Exception as e:
+    print(f"  ERROR: {e}")
+    exit(1)
+
+rng = np.random.default_rng(3)
+renderizador = RenderizadorDashboard(figsize=(8, 5))
+ax1 = renderizador._ejes[0]
+
+
+def etiquetas_dentro(renderizador) -> bool:
+    """True si ninguna etiqueta del eje Y de humedad se sale de la figura."""
+    renderizador.fig.canvas.draw()
+    cajas = [t.get_window_extent() for t in ax1.get_yticklabels() if t.get_text()]
+    return bool(cajas) and min(c.x0 for c in cajas) >= 0
+
+
+# Test 2: Textos de la planta y leyenda del promedio
+print("\n[Test 2] Actualizar con una planta...")
+humedad = rng.uniform(45, 65, 30)
+renderizador.actualizar(humedad, rng.uniform(18, 26, 30), rng.uniform(50, 80, 30), "Acacia")
+textos = [t.get_text() for t in ax1.get_legend().get_texts()]
+if (renderizador._titulo.get_text() == 'Dashboard de Monitoreo: Acacia'
+        and f'Promedio: {humedad.mean():.1f}%' in textos and etiquetas_dentro(renderizador)):
+    print(f"  OK - Título y leyenda actualizados: {textos}")
+else:
+    print(f"  ERROR: Leyenda {textos}")
+    exit(1)
+
+# Test 3: Rangos parecidos reutilizan el espaciado
+print("\n[Test 3] Planta con etiquetas iguales...")
+izquierda = ax1.get_position().x0
+renderizador.actualizar(rng.uniform(45, 65, 30), rng.uniform(18, 26, 30), rng.uniform(50, 80, 30), "Ficus")
+if ax1.get_position().x0 == izquierda:
+    print("  OK - Mismo espaciado sin recalcular")
+else:
+    print("  ERROR: El espaciado cambió con las mismas etiquetas")
+    exit(1)
+
+# Test 4: Etiquetas más anchas recalculan el espaciado
+print("\n[Test 4] Planta con etiquetas más anchas...")
+renderizador.actualizar(rng.uniform(45000, 65000, 30), rng.uniform(18, 26, 30),
+                        rng.uniform(50, 80, 30), "Sensor mal calibrado", humedad_optima=(40000, 70000))
+if ax1.get_position().x0 > izquierda and etiquetas_dentro(renderizador):
+    print(f"  OK - Margen izquierdo de {izquierda:.3f} a {ax1.get_position().x0:.3f}, "
+          f"etiquetas dentro de la figura")
+else:
+    print("  ERROR: Las etiquetas se salen de la figura")
+    exit(1)
+
+# Test 5: Guardar sin recortar conserva el tamaño de la figura
+print("\n[Test 5] Guardar sin recortar...")
+with tempfile.TemporaryDirectory() as carpeta:
+    ruta = os.path.join(carpeta, "dashboard.png")
+    renderizador.guardar(ruta, dpi=40, recortar=False)
+    alto, ancho = renderizador._plt.imread(ruta).shape[:2]
+    tamano = (ancho, alto)
+renderizador.cerrar()
+if tamano == (320, 200):
+    print(f"  OK - Imagen de {tamano[0]}×{tamano[1]} px")
+else:
+    print(f"  ERROR: Tamaño {tamano}")
+    exit(1)
+
+print("\n" + "="*70)
+print("TODOS LOS TESTS COMPLETADOS EXITOSAMENTE")
+print("="*70)
@@ -0,0 +1,81 @@
+"""
+Script de prueba para el submuestreo de series largas
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+print("="*70)
+print("TEST DE SUBMUESTREO")
+print("="*70)
+
+# Test 1: Importar módulo
+print("\n[Test 1] Importando submuestreo...")
+try:
+    import numpy as np
+    from submuestreo import lttb, min_max, submuestrear
+    print("  OK - Módulo importado correctamente")
+except Exception as e:
+    print(f"  ERROR: {e}")
+    exit(1)
+
+rng = np.random.default_rng(0)
+x = np.arange(100_000)
+y = 50 + rng.normal(0, 2, x.size)
+y[31_337] = 95.0   # pico aislado
+y[70_001] = 5.0    # valle aislado
+
+# Test 2: Las series cortas no se tocan
+print("\n[Test 2] Series que ya caben...")
+xr, yr = submuestrear(x[:30], y[:30], 500)
+if len(xr) == 30 and np.array_equal(yr, y[:30]):
+    print("  OK - 30 puntos con presupuesto 500 se devuelven intactos")
+else:
+    print(f"  ERROR: {len(xr)} puntos")
+    exit(1)
+
+# Test 3: LTTB respeta el presupuesto, los extremos y el orden
+print("\n[Test 3] LTTB...")
+xr, yr = lttb(x, y, 800)
+if (len(xr) == 800 and xr[0] == 0 and xr[-1] == x[-1] and np.all(np.diff(xr) > 0)
+        and yr.max() == 95.0 and yr.min() == 5.0):
+    print("  OK - 800 puntos, ordenados, con el pico y el valle")
+else:
+    print(f"  ERROR: {len(xr)} puntos, max={yr.max()}, min={yr.min()}")
+    exit(1)
+
+# Test 4: min/max conserva el mínimo y el máximo de cada tramo
+print("\n[Test 4] Mínimo/máximo por tramos...")
+xr, yr = min_max(x, y, 800)
+if len(xr) <= 802 and np.all(np.diff(xr) > 0) and yr.max() == y.max() and yr.min() == y.min():
+    print(f"  OK - {len(xr)} puntos con los extremos globales")
+else:
+    print(f"  ERROR: {len(xr)} puntos")
+    exit(1)
+
+# Test 5: Método desconocido
+print("\n[Test 5] Método desconocido...")
+try:
+    submuestrear(x, y, 100, metodo='media')
+    print("  ERROR: Debía lanzar ValueError")
+    exit(1)
+except ValueError:
+    print("  OK - ValueError")
+
+# Test 6: Lecturas faltantes (NaN)
+print("\n[Test 6] Series con NaN...")
+con_huecos = y.copy()
+con_huecos[1000:1010] = np.nan       # hueco corto
+con_huecos[50_000:52_000] = np.nan   # hueco de varios tramos
+for nombre, (xr, yr) in (("lttb", lttb(x, con_huecos, 800)), ("min_max", min_max(x, con_huecos, 800))):
+    if np.nanmax(yr) == 95.0 and np.nanmin(yr) == 5.0 and np.isnan(yr).any() and len(xr) <= 802:
+        print(f"  OK - {nombre}: pico y valle conservados, el hueco largo sigue visible")
+    else:
+        print(f"  ERROR: {nombre}: max={np.nanmax(yr)}, min={np.nanmin(yr)}")
+        exit(1)
+
+print("\n" + "="*70)
+print("TODOS LOS TESTS COMPLETADOS EXITOSAMENTE")
+print("="*70)
@@ -0,0 +1,96 @@
+"""
+Script de prueba para los benchmarks (suite y memoria) y predecir_lote
+"""
+
+import os
+import sys
+from contextlib import redirect_stdout
+from io import StringIO
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+print("="*70)
+print("TEST DE LA SUITE DE BENCHMARKS")
+print("="*70)
+
+# Test 1: Importar módulos
+print("\n[Test 1] Importando suite...")
+try:
+    import numpy as np
+    from suite import Caso, comparar, medir, _leer_umbrales
+    from bench_memoria import main as main_memoria, medir_memoria
+    from traductor_de_plantas import ModeloPrediccionRiego
+    print("  OK - Módulos importados correctamente")
+except Exception as e:
+    print(f"  ERROR: {e}")
+    exit(1)
+
+# Test 2: predecir_lote coincide con predecir
+print("\n[Test 2] predecir_lote...")
+modelo = ModeloPrediccionRiego().entrenar()
+humedades = np.linspace(0, 100, 501)
+lote = modelo.predecir_lote(humedades)
+if np.allclose(lote, [modelo.predecir(h) for h in humedades]) and lote.min() >= 0 and lote.max() <= 1:
+    print("  OK - 501 predicciones idénticas a predecir(), dentro de [0, 1]")
+else:
+    print("  ERROR: predecir_lote difiere de predecir")
+    exit(1)
+try:
+    ModeloPrediccionRiego().predecir_lote([50.0])
+    print("  ERROR: Debía lanzar ValueError")
+    exit(1)
+except ValueError:
+    print("  OK - ValueError sin entrenar")
+
+# Test 3: medir() con preparación fuera del cronómetro
+print("\n[Test 3] Medir un caso...")
+llamadas = []
+r = medir(Caso("suma", lambda: sum(range(1000)), unidades=1000,
+               preparar=lambda: llamadas.append(1)), repeticiones=7)
+if len(llamadas) == 7 and r["repeticiones"] == 7 and 0 < r["minimo_s"] <= r["mediana_s"]:
+    print(f"  OK - 7 repeticiones, {r['mediana_por_unidad_us'] * 1000:.1f} ns por unidad")
+else:
+    print(f"  ERROR: {r}")
+    exit(1)
+
+# Test 4: Comparación con la base y umbrales por caso
+print("\n[Test 4] Comparar con la base...")
+base = {"resultados": {"a": {"minimo_s": 1.0}, "b": {"minimo_s": 1.0}, "c": {"minimo_s": 1.0}}}
+actual = {"resultados": {"a": {"minimo_s": 1.1}, "b": {"minimo_s": 1.4},
+                         "c": {"minimo_s": 1.4}, "nuevo": {"minimo_s": 5.0}}}
+filas = {f["caso"]: f for f in comparar(actual, base, 0.25, _leer_umbrales(["c=0.5"]))}
+if (set(filas) == {"a", "b", "c"} and not filas["a"]["regresion"]
+        and filas["b"]["regresion"] and not filas["c"]["regresion"]):
+    print("  OK - +10% tolerado, +40% regresión, +40% tolerado con umbral propio de 50%")
+else:
+    print(f"  ERROR: {filas}")
+    exit(1)
+
+# Test 5: Memoria retenida por lectura (historial)
+print("\n[Test 5] Benchmark de memoria...")
+r = medir_memoria(plantas=4, lecturas=4000, ventana=1000, calentamiento=10, top=5)
+sitios = " ".join(s for s, _, _ in r["sitios"])
+historial = r["bytes_historial_por_lectura"]
+if 150 < r["bytes_por_lectura"] < 400 and "LecturaSensores(" in sitios and 150 < historial <= r["bytes_por_lectura"]:
+    print(f"  OK - {r['bytes_por_lectura']:.0f} B por lectura, {historial:.0f} B retenidos por historial")
+else:
+    print(f"  ERROR: {r['bytes_por_lectura']:.0f} B por lectura ({historial:.0f} B de historial), "
+          f"sitios: {r['sitios']}")
+    exit(1)
+
+# Test 6: historial falla por defecto y solo pasa si se permite
+print("\n[Test 6] historial sin límite en CI...")
+argumentos = ["--plantas", "4", "--lecturas", "4000", "--ventana", "1000", "--max-bytes-por-lectura", "60"]
+with redirect_stdout(StringIO()) as salida:
+    sin_permiso = main_memoria(argumentos)
+    con_permiso = main_memoria(argumentos + ["--permitir-historial"])
+if sin_permiso == 1 and con_permiso == 0 and "historial crece sin límite" in salida.getvalue():
+    print("  OK - Falla sin --permitir-historial y pasa con él")
+else:
+    print(f"  ERROR: códigos {sin_permiso} y {con_permiso}")
+    exit(1)
+
+print("\n" + "="*70)
+print("TODOS LOS TESTS COMPLETADOS EXITOSAMENTE")
+print("="*70)